@@ -11,6 +11,8 @@ from psycopg_pool import AsyncConnectionPool
 
 from .settings import settings
 from app.core.logger import logger
+from app.core.metrics import count_db_query
+from app.core.tracing import NOOP_SCOPE, SpanKind, current_span, trace_span
 
 
 # 전역 커넥션 풀
@@ -67,6 +69,17 @@ async def close_db_pool():
         logger.info("App DB 커넥션 풀 종료")
 
 
+def _db_span(operation: str, sql: str, use_app_db: bool):
+    """쿼리 헬퍼 span (샘플링된 요청에서만 기록, 커넥션 획득 대기 시간 포함)"""
+    if current_span() is None:
+        return NOOP_SCOPE
+    return trace_span(f"db.{operation}", SpanKind.CLIENT, {
+        "db.system": "postgresql",
+        "db.namespace": "app" if use_app_db else "admin",
+        "db.statement": sql,
+    })
+
+
 @asynccontextmanager
 async def get_connection(use_app_db: bool = False) -> AsyncGenerator[psycopg.AsyncConnection, None]:
     """커넥션 풀에서 연결 획득"""
@@ -98,11 +111,14 @@ async def query(
     Returns:
         결과 딕셔너리 리스트
     """
-    async with get_connection(use_app_db) as conn:
-        async with conn.cursor() as cur:
-            await cur.execute(sql, params or {})
-            rows = await cur.fetchall()
-            return list(rows) if rows else []
+    count_db_query()
+    with _db_span("query", sql, use_app_db) as span:
+        async with get_connection(use_app_db) as conn:
+            async with conn.cursor() as cur:
+                await cur.execute(sql, params or {})
+                rows = await cur.fetchall()
+                span.set_attribute("db.rows", len(rows))
+                return list(rows) if rows else []
 
 
 async def query_one(
@@ -121,11 +137,13 @@ async def query_one(
     Returns:
         결과 딕셔너리 또는 None
     """
-    async with get_connection(use_app_db) as conn:
-        async with conn.cursor() as cur:
-            await cur.execute(sql, params or {})
-            row = await cur.fetchone()
-            return dict(row) if row else None
+    count_db_query()
+    with _db_span("query_one", sql, use_app_db):
+        async with get_connection(use_app_db) as conn:
+            async with conn.cursor() as cur:
+                await cur.execute(sql, params or {})
+                row = await cur.fetchone()
+                return dict(row) if row else None
 
 
 async def execute(
@@ -144,11 +162,14 @@ async def execute(
     Returns:
         영향받은 행 수
     """
-    async with get_connection(use_app_db) as conn:
-        async with conn.cursor() as cur:
-            await cur.execute(sql, params or {})
-            await conn.commit()
-            return cur.rowcount
+    count_db_query()
+    with _db_span("execute", sql, use_app_db) as span:
+        async with get_connection(use_app_db) as conn:
+            async with conn.cursor() as cur:
+                await cur.execute(sql, params or {})
+                await conn.commit()
+                span.set_attribute("db.rows", cur.rowcount)
+                return cur.rowcount
 
 
 async def execute_returning(
@@ -167,11 +188,13 @@ async def execute_returning(
     Returns:
         RETURNING 결과 딕셔너리
     """
-    async with get_connection(use_app_db) as conn:
-        async with conn.cursor() as cur:
-            await cur.execute(sql, params or {})
-            await conn.commit()
-            row = await cur.fetchone()
-            return dict(row) if row else None
+    count_db_query()
+    with _db_span("execute_returning", sql, use_app_db):
+        async with get_connection(use_app_db) as conn:
+            async with conn.cursor() as cur:
+                await cur.execute(sql, params or {})
+                await conn.commit()
+                row = await cur.fetchone()
+                return dict(row) if row else None
 
 
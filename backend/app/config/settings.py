@@ -76,6 +76,102 @@ class Settings(BaseSettings):
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 60
     REFRESH_TOKEN_EXPIRE_DAYS: int = 7
     
+    # 응답 압축 설정
+    COMPRESSION_ENABLED: bool = True
+    COMPRESSION_MIN_SIZE: int = 1024  # 바이트, 미만 응답은 압축하지 않음
+    COMPRESSION_GZIP_LEVEL: int = 6  # 1(빠름) ~ 9(최대 압축)
+    COMPRESSION_BROTLI_QUALITY: int = 4  # 0 ~ 11, brotli 패키지 설치 시에만 사용
+    COMPRESSION_EXCLUDE_PATHS: str = "/uploads"
+    
+    @property
+    def compression_exclude_paths_list(self) -> List[str]:
+        """압축 제외 경로 리스트 반환"""
+        return [path.strip() for path in self.COMPRESSION_EXCLUDE_PATHS.split(",") if path.strip()]
+    
+    # 업로드 저장 방식
+    # legacy: {folder}/{timestamp}_{uuid8}.{ext}
+    # cas: objects/{sha256 샤딩}/{sha256}.{ext} (중복 제거, immutable URL)
+    UPLOAD_STORAGE_MODE: str = "legacy"
+    
+    # 업로드 정적 서빙 설정 (/uploads)
+    UPLOADS_DEFAULT_MAX_AGE: int = 3600  # immutable 이름이 아닌 파일의 캐시 시간 (초)
+    UPLOADS_MEMORY_CACHE_BYTES: int = 32 * 1024 * 1024  # 소형 파일 LRU 전체 용량
+    UPLOADS_MEMORY_CACHE_FILE_SIZE: int = 64 * 1024  # LRU 대상 파일 최대 크기
+    
+    # 업로드 이미지 파생본 설정 (thumbnail / medium / WebP)
+    IMAGE_DERIVATIVES_ENABLED: bool = True
+    IMAGE_WORKERS: int = 2  # 이미지 처리 프로세스 풀 크기
+    IMAGE_WEBP_QUALITY: int = 80
+    IMAGE_JPEG_QUALITY: int = 85
+
+    # 통합 검색 인덱스 설정
+    SEARCH_INDEX_ENABLED: bool = True  # 생성/수정/삭제 시 검색 문서 증분 갱신
+    SEARCH_SYNC_ENABLED: bool = True  # 회원/문의 검색 문서 주기 동기화 (앱 서비스가 쓰는 행, updated_at 기준)
+    SEARCH_SYNC_INTERVAL: int = 60  # 주기 동기화 간격 (초)
+    SEARCH_SYNC_LAG_SECONDS: int = 5  # 최근 N초 이내 수정분은 다음 회차에 반영 (늦게 커밋되는 트랜잭션 대비)
+    
+    # 상태 스케줄러 설정 (챌린지/공지사항 상태 컬럼 갱신)
+    STATUS_SCHEDULER_ENABLED: bool = True
+    STATUS_SCHEDULER_MAX_INTERVAL: int = 300  # 경계가 없어도 전체 재계산하는 최대 간격 (초)
+    STATUS_SCHEDULER_LOCK_TTL: int = 60  # 리더 락 TTL (초), TTL/3 마다 연장
+
+    # 챌린지 통계 (증분 집계)
+    CHALLENGE_ANALYTICS_REFRESH_INTERVAL: int = 60  # 조회 시 증분 집계 최소 간격 (초)
+    CHALLENGE_ANALYTICS_WATERMARK_LAG: int = 30  # 최근 N초 이내 행은 다음 회차에 집계 (늦은 커밋 누락 방지)
+
+    # PUSH 발송 엔진
+    PUSH_PROVIDER: str = "fake"  # 발송 프로바이더 (fake: 실제 발송 없음)
+    PUSH_BATCH_SIZE: int = 500  # 프로바이더 1회 호출 토큰 수 (프로바이더 최대값 이하로 적용)
+    PUSH_CONCURRENCY: int = 4  # 발송 워커 수 (동시 프로바이더 호출 수)
+    PUSH_RATE_LIMIT: int = 1000  # 프로바이더별 초당 발송 한도 (0 이면 제한 없음)
+    PUSH_MAX_RETRIES: int = 3  # 일시 오류 토큰 재시도 횟수
+    PUSH_RETRY_BACKOFF: float = 1.0  # 재시도 기본 대기 (초, 재시도마다 2배)
+    PUSH_SCHEDULER_ENABLED: bool = True  # 조건/예약 PUSH 스케줄러 실행 여부
+    PUSH_SEND_WINDOW_MINUTES: int = 60  # 발송 시각 이후 이 시간 안에서만 발송 (지연 발송 방지)
+    PUSH_SCHEDULE_JITTER_SECONDS: int = 30  # 같은 시각 예약 분산용 캠페인별 고정 지터 최대값 (초)
+
+    # 역할/API 권한 검사 (권한 매트릭스)
+    PERMISSION_ENFORCEMENT: str = "log"  # off: 검사 안 함 / log: 거부 대상 로그만 / enforce: 403
+    PERMISSION_BYPASS_ROLES: str = "super_admin"  # 검사를 생략하는 토큰 role (콤마 구분)
+    PERMISSION_RELOAD_INTERVAL: int = 300  # 변경 알림 누락 대비 재컴파일 간격 (초)
+    
+    @property
+    def permission_bypass_roles_list(self) -> List[str]:
+        """권한 검사 생략 role 리스트 반환"""
+        return [role.strip() for role in self.PERMISSION_BYPASS_ROLES.split(",") if role.strip()]
+
+    # 애플리케이션 로깅 (app/core/logger.py)
+    LOG_LEVEL: str = "DEBUG"  # 로거 레벨 (미만 호출은 레코드 생성 없이 반환)
+    LOG_JSON: bool = False  # JSON 한 줄 형식 출력 (로그 수집기용)
+    LOG_QUEUE_SIZE: int = 10000  # 백그라운드 쓰기 대기 레코드 최대 수 (초과 시 ERROR 미만 레코드는 버림)
+
+    # 접속/개인정보 접근 로그 월별 파티션
+    LOG_PARTITION_ENABLED: bool = True  # 파티션 생성/보관 기간 경과분 내보내기 스케줄러 실행 여부
+    LOG_PARTITION_INTERVAL: int = 21600  # 파티션 관리 실행 간격 (초)
+    LOG_PARTITION_PREMAKE_MONTHS: int = 3  # 미리 만들어 둘 파티션 개월 수 (이번 달 제외)
+    LOG_RETENTION_MONTHS: int = 24  # DB 보관 개월 수 (지난 파티션은 파일로 내보낸 뒤 삭제, 0 이면 삭제 안 함)
+    LOG_ARCHIVE_DIR: str = "archives/logs"  # 내보낸 파티션 파일(csv.gz) 저장 경로
+
+    # 요청 추적 (app/core/tracing.py)
+    TRACING_ENABLED: bool = False  # 요청/DB/Redis/인증 span 기록 여부
+    TRACING_SAMPLE_RATIO: float = 0.01  # traceparent 없는 요청의 샘플링 비율 (0.0 ~ 1.0)
+    TRACING_EXPORTER: str = "file"  # file: TRACING_FILE_PATH 에 추가 / otlp: TRACING_OTLP_ENDPOINT 로 전송
+    TRACING_FILE_PATH: str = "logs/traces.jsonl"  # file 내보내기 경로 (OTLP/JSON, 배치당 한 줄)
+    TRACING_OTLP_ENDPOINT: str = "http://localhost:4318"  # OTLP/HTTP collector 주소 (/v1/traces 로 전송)
+    TRACING_SERVICE_NAME: str = "oni-care-admin"  # span resource 의 service.name
+
+    # Prometheus 메트릭 (app/core/metrics.py, GET /metrics)
+    METRICS_ENABLED: bool = True  # /metrics 노출 및 커넥션 풀 통계 수집 여부
+    METRICS_TOKEN: str = ""  # /metrics 요청에 Authorization: Bearer <토큰> 필요 (DEBUG 가 아니면 미지정 시 /metrics 404)
+    METRICS_MULTIPROC_DIR: str = ""  # 멀티 워커 집계용 디렉토리 (prometheus_client multiprocess 모드, 시작 전 비워야 함)
+    METRICS_POOL_INTERVAL: int = 15  # 커넥션 풀 통계 수집 간격 (초)
+
+    # 준비 상태 점검 / 종료 드레인 (app/services/health_service.py)
+    HEALTH_CHECK_TIMEOUT: float = 1.0  # 준비 상태 점검 항목별 제한 시간 (초, 커넥션 획득/SELECT 1/PING)
+    HEALTH_CACHE_SECONDS: float = 1.0  # 준비 상태 점검 결과 재사용 시간 (초)
+    DRAIN_DELAY_SECONDS: int = 15  # SIGTERM 후 준비 상태 실패로 요청을 받으며 기다리는 시간 (로드밸런서 제외 대기)
+    DRAIN_TIMEOUT_SECONDS: int = 10  # 종료 시 진행 중 요청 완료 대기 최대 시간 (초)
+    
     # CORS 설정
     CORS_ORIGINS: str = "http://localhost:3000,http://localhost:3001,http://127.0.0.1:3000,http://127.0.0.1:3001"
     
@@ -2,11 +2,25 @@
 # 로깅 설정
 # ============================================
 # 일별 로테이션 및 포맷 설정
+# - 호출 스레드(이벤트 루프)는 레코드를 큐에 넣기만 함 (QueueHandler)
+# - 포맷/콘솔·파일 쓰기는 백그라운드 스레드에서 처리 (QueueListener)
+# - 요청 ID(request_id_var)는 큐에 넣을 때 레코드에 복사 (요청 컨텍스트는 호출 스레드에만 있음)
+# - LOG_JSON=true 면 JSON 한 줄 형식 (수집기용, 샘플링된 요청은 trace_id 포함)
 
+import atexit
+import json
 import logging
+import queue
 import sys
-from datetime import datetime
+import time
+from contextvars import ContextVar
+from datetime import datetime, timedelta
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
+from typing import Dict, Optional
+
+from app.config.settings import settings
+from app.core.tracing import current_span
 
 
 # 로그 디렉토리 생성
@@ -14,68 +28,177 @@ LOG_DIR = Path(__file__).parent.parent.parent / "logs"
 LOG_DIR.mkdir(exist_ok=True)
 
 # 로그 포맷 설정
-LOG_FORMAT = "[%(asctime)s] %(levelname)s [%(name)s:%(lineno)d] - %(message)s"
+LOG_FORMAT = "[%(asctime)s] %(levelname)s [%(name)s:%(lineno)d] [%(request_id)s] - %(message)s"
 DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
 
+# 현재 요청 ID (app/middleware/request_context.py 에서 설정, 요청 밖에서는 "-")
+request_id_var: ContextVar[str] = ContextVar("request_id", default="-")
+
 
 class DailyRotatingHandler(logging.FileHandler):
-    """일별 로테이션 핸들러"""
-    
+    """일별 로테이션 핸들러 (다음 자정 시각과 레코드 시각만 비교)"""
+
     def __init__(self, log_dir: Path, prefix: str = "app"):
         self.log_dir = log_dir
         self.prefix = prefix
         self.current_date = datetime.now().strftime("%Y-%m-%d")
-        
+        self.next_rollover = self._next_midnight()
+
         log_file = self._get_log_filename()
         super().__init__(log_file, encoding="utf-8")
-    
+
     def _get_log_filename(self) -> Path:
         """현재 날짜 기반 로그 파일명 반환"""
         return self.log_dir / f"{self.prefix}_{self.current_date}.log"
-    
+
+    @staticmethod
+    def _next_midnight() -> float:
+        tomorrow = datetime.now().date() + timedelta(days=1)
+        return datetime.combine(tomorrow, datetime.min.time()).timestamp()
+
     def emit(self, record):
-        """로그 기록 시 날짜 변경 확인"""
-        today = datetime.now().strftime("%Y-%m-%d")
-        
-        if today != self.current_date:
-            self.current_date = today
+        """로그 기록 시 날짜 변경 확인 (자정 이후 첫 레코드에서만 파일 교체)"""
+        if record.created >= self.next_rollover:
+            self.current_date = datetime.fromtimestamp(record.created).strftime("%Y-%m-%d")
+            self.next_rollover = self._next_midnight()
             self.close()
             self.baseFilename = str(self._get_log_filename())
             self.stream = self._open()
-        
+
         super().emit(record)
 
 
-def setup_logger(name: str = "oni_care") -> logging.Logger:
-    """로거 설정 및 반환"""
-    logger = logging.getLogger(name)
-    logger.setLevel(logging.DEBUG)
-    
-    # 기존 핸들러 제거
-    logger.handlers.clear()
-    
+class JsonFormatter(logging.Formatter):
+    """JSON 한 줄 포맷 (time, level, logger, line, request_id, message, trace_id, exc_info)"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "time": self.formatTime(record, DATE_FORMAT),
+            "level": record.levelname,
+            "logger": record.name,
+            "line": record.lineno,
+            "request_id": getattr(record, "request_id", "-"),
+            "message": record.getMessage(),
+        }
+        trace_id = getattr(record, "trace_id", None)
+        if trace_id:
+            entry["trace_id"] = trace_id
+        if record.exc_info:
+            entry["exc_info"] = self.formatException(record.exc_info)
+        return json.dumps(entry, ensure_ascii=False, default=str)
+
+
+class _AsyncQueueHandler(QueueHandler):
+    """
+    큐 입력 핸들러 (호출 스레드)
+
+    기본 QueueHandler.prepare 는 호출 스레드에서 메시지를 포맷하므로,
+    요청 ID / trace ID 만 붙이고 포맷은 리스너 스레드로 미룬다. (같은 프로세스 안이라 exc_info 도 그대로 전달 가능)
+    큐는 잠금 비용이 작은 SimpleQueue 를 쓰고, 대기 레코드가 max_pending 이상이면
+    ERROR 미만 레코드는 버리고 건수만 센다.
+    """
+
+    def __init__(self, log_queue: queue.SimpleQueue, max_pending: int):
+        super().__init__(log_queue)
+        self.max_pending = max_pending
+        self.dropped = 0
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record.request_id = request_id_var.get()
+        span = current_span()
+        record.trace_id = span.trace_id if span is not None else None
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        if record.levelno < logging.ERROR and self.queue.qsize() >= self.max_pending:
+            self.dropped += 1
+            return
+        self.queue.put_nowait(record)
+
+
+class _YieldingQueueListener(QueueListener):
+    """
+    로그 쓰기 스레드
+
+    레코드 1건을 쓸 때마다 GIL 을 양보해, 밀린 레코드를 처리하는 동안에도
+    이벤트 루프 스레드가 GIL 전환 주기(5ms)만큼 기다리지 않도록 한다.
+    """
+
+    def handle(self, record: logging.LogRecord) -> None:
+        super().handle(record)
+        time.sleep(0)
+
+
+_listener: Optional[QueueListener] = None
+_queue_handler: Optional[_AsyncQueueHandler] = None
+
+
+def _build_handlers() -> list:
+    """실제 출력 핸들러 (리스너 스레드에서 실행)"""
+    # request_id 가 없는 레코드(큐를 거치지 않은 경우)도 포맷되도록 기본값 지정
+    formatter = (
+        JsonFormatter() if settings.LOG_JSON
+        else logging.Formatter(LOG_FORMAT, DATE_FORMAT, defaults={"request_id": "-"})
+    )
+
     # 콘솔 핸들러
     console_handler = logging.StreamHandler(sys.stdout)
     console_handler.setLevel(logging.INFO)
-    console_handler.setFormatter(logging.Formatter(LOG_FORMAT, DATE_FORMAT))
-    logger.addHandler(console_handler)
-    
+    console_handler.setFormatter(formatter)
+
     # 파일 핸들러 (일별 로테이션)
     file_handler = DailyRotatingHandler(LOG_DIR, prefix="app")
     file_handler.setLevel(logging.DEBUG)
-    file_handler.setFormatter(logging.Formatter(LOG_FORMAT, DATE_FORMAT))
-    logger.addHandler(file_handler)
-    
+    file_handler.setFormatter(formatter)
+
     # 에러 전용 파일 핸들러
     error_handler = DailyRotatingHandler(LOG_DIR, prefix="error")
     error_handler.setLevel(logging.ERROR)
-    error_handler.setFormatter(logging.Formatter(LOG_FORMAT, DATE_FORMAT))
-    logger.addHandler(error_handler)
-    
+    error_handler.setFormatter(formatter)
+
+    return [console_handler, file_handler, error_handler]
+
+
+def setup_logger(name: str = "oni_care") -> logging.Logger:
+    """로거 설정 및 반환 (큐 핸들러 + 백그라운드 리스너 시작)"""
+    global _listener, _queue_handler
+
+    logger = logging.getLogger(name)
+    # 레벨 미만 호출은 레코드 생성 전에 반환 (logger.debug("... %s", value) 형태는 포맷 비용도 없음)
+    logger.setLevel(settings.LOG_LEVEL.upper())
+
+    # 기존 핸들러 제거
+    logger.handlers.clear()
+    if _listener is not None:
+        _listener.stop()
+
+    _queue_handler = _AsyncQueueHandler(queue.SimpleQueue(), settings.LOG_QUEUE_SIZE)
+    logger.addHandler(_queue_handler)
+
+    _listener = _YieldingQueueListener(_queue_handler.queue, *_build_handlers(), respect_handler_level=True)
+    _listener.start()
+
     return logger
 
 
-# 전역 로거 인스턴스
-logger = setup_logger()
+def shutdown_logging() -> None:
+    """큐에 남은 레코드를 모두 쓰고 리스너 종료 (lifespan 종료 / 프로세스 종료 시)"""
+    global _listener
+    if _listener is None:
+        return
+    _listener.stop()
+    for handler in _listener.handlers:
+        handler.close()
+    _listener = None
+
 
+def log_queue_stats() -> Dict[str, int]:
+    """로그 큐 상태 (대기 레코드 수, 버린 레코드 수)"""
+    if _queue_handler is None:
+        return {"pending": 0, "dropped": 0}
+    return {"pending": _queue_handler.queue.qsize(), "dropped": _queue_handler.dropped}
 
+
+# 전역 로거 인스턴스
+logger = setup_logger()
+atexit.register(shutdown_logging)
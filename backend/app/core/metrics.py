@@ -0,0 +1,178 @@
+# ============================================
+# Prometheus 메트릭 정의
+# ============================================
+# 프로세스 내 집계 (prometheus_client) → GET /metrics 로 노출
+# - 요청 지연 시간/요청 수 (라우트 템플릿별), 요청별 DB 쿼리 수
+# - DB 커넥션 풀 상태 (Admin / App / AppDatabaseManager)
+# - Redis 명령 지연 시간/오류 수 (TokenStore), 캐시 적중/미스
+#
+# 멀티 워커 (uvicorn --workers N):
+#   METRICS_MULTIPROC_DIR 를 지정하면 prometheus_client multiprocess 모드로 동작한다.
+#   워커마다 이 디렉토리에 mmap 파일로 기록하고, /metrics 는 어느 워커가 받든 전체 합계를 반환.
+#   서버 시작 전에 디렉토리를 비워야 한다 (이전 실행의 값이 남지 않도록).
+
+import os
+import time
+from contextvars import ContextVar
+from typing import List, Optional
+
+from app.config.settings import settings
+
+# prometheus_client 는 import 시점에 PROMETHEUS_MULTIPROC_DIR 을 읽으므로 먼저 설정
+# (.env 값은 settings 에만 있고 os.environ 에는 없음)
+if settings.METRICS_MULTIPROC_DIR:
+    os.makedirs(settings.METRICS_MULTIPROC_DIR, exist_ok=True)
+    os.environ.setdefault("PROMETHEUS_MULTIPROC_DIR", settings.METRICS_MULTIPROC_DIR)
+
+from prometheus_client import (  # noqa: E402
+    CONTENT_TYPE_LATEST,
+    REGISTRY,
+    CollectorRegistry,
+    Counter,
+    Gauge,
+    Histogram,
+    generate_latest,
+    multiprocess,
+)
+
+
+MULTIPROCESS = "PROMETHEUS_MULTIPROC_DIR" in os.environ
+
+
+# ============================================
+# HTTP 요청
+# ============================================
+
+HTTP_REQUEST_DURATION = Histogram(
+    "http_request_duration_seconds",
+    "요청 처리 시간 (라우트 템플릿별)",
+    ["method", "route"],
+    buckets=(0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0),
+)
+HTTP_REQUESTS = Counter(
+    "http_requests",
+    "요청 수 (라우트 템플릿/상태 코드별)",
+    ["method", "route", "status"],
+)
+DB_QUERIES = Counter(
+    "db_queries",
+    "DB 쿼리 헬퍼 호출 수 (요청 라우트별)",
+    ["method", "route"],
+)
+
+# 현재 요청의 DB 쿼리 수 (MetricsMiddleware 에서 설정, 요청 밖에서는 None)
+request_queries_var: ContextVar[Optional[List[int]]] = ContextVar("request_queries", default=None)
+
+
+def count_db_query() -> None:
+    """현재 요청의 DB 쿼리 수 증가 (app/config/database.py 쿼리 헬퍼에서 호출)"""
+    counter = request_queries_var.get()
+    if counter is not None:
+        counter[0] += 1
+
+
+# ============================================
+# DB 커넥션 풀 (MetricsCollector 가 주기적으로 갱신)
+# ============================================
+
+DB_POOL_CONNECTIONS = Gauge(
+    "db_pool_connections",
+    "커넥션 풀 연결 수 (state=size: 열린 연결, available: 유휴 연결, max: 최대)",
+    ["pool", "state"],
+    multiprocess_mode="livesum",
+)
+DB_POOL_WAITING = Gauge(
+    "db_pool_requests_waiting",
+    "커넥션 획득 대기 중인 요청 수",
+    ["pool"],
+    multiprocess_mode="livesum",
+)
+DB_POOL_REQUESTS = Counter(
+    "db_pool_requests",
+    "커넥션 획득 요청 수",
+    ["pool"],
+)
+DB_POOL_WAIT_SECONDS = Counter(
+    "db_pool_wait_seconds",
+    "커넥션 획득 대기 시간 합계 (대기한 요청만)",
+    ["pool"],
+)
+DB_POOL_ERRORS = Counter(
+    "db_pool_errors",
+    "커넥션 풀 오류 수 (kind=request: 획득 실패/타임아웃, connect: 연결 실패, lost: 끊긴 연결)",
+    ["pool", "kind"],
+)
+
+
+# ============================================
+# Redis / 캐시
+# ============================================
+
+REDIS_COMMAND_DURATION = Histogram(
+    "redis_command_duration_seconds",
+    "Redis 명령 지연 시간 (TokenStore 작업별)",
+    ["operation"],
+    buckets=(0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 1.0),
+)
+REDIS_ERRORS = Counter(
+    "redis_errors",
+    "Redis 명령 오류 수 (TokenStore 작업별)",
+    ["operation"],
+)
+CACHE_REQUESTS = Counter(
+    "cache_requests",
+    "캐시 조회 수 (result=hit/miss, 적중률 = hit / 전체)",
+    ["cache", "result"],
+)
+
+
+class _RedisTimer:
+    __slots__ = ("operation", "started")
+
+    def __init__(self, operation: str):
+        self.operation = operation
+        self.started = 0.0
+
+    def __enter__(self) -> None:
+        self.started = time.perf_counter()
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        REDIS_COMMAND_DURATION.labels(self.operation).observe(time.perf_counter() - self.started)
+        if exc_type is not None:
+            REDIS_ERRORS.labels(self.operation).inc()
+
+
+def observe_redis(operation: str) -> _RedisTimer:
+    """
+    Redis 명령 시간/오류 기록 (with 문, 예외는 그대로 전달)
+
+    사용 예:
+        with observe_redis("get_refresh_token"):
+            return await redis.get(key)
+    """
+    return _RedisTimer(operation)
+
+
+def record_cache(cache: str, hit: bool) -> None:
+    """캐시 적중/미스 기록"""
+    CACHE_REQUESTS.labels(cache, "hit" if hit else "miss").inc()
+
+
+# ============================================
+# 출력
+# ============================================
+
+def render_metrics() -> bytes:
+    """Prometheus 텍스트 형식 (multiprocess 모드면 모든 워커 합계)"""
+    if MULTIPROCESS:
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+        return generate_latest(registry)
+    return generate_latest(REGISTRY)
+
+
+def mark_process_dead() -> None:
+    """워커 종료 시 livesum 게이지에서 현재 프로세스 제외"""
+    if MULTIPROCESS:
+        multiprocess.mark_process_dead(os.getpid())
+
@@ -9,6 +9,8 @@ from datetime import timedelta
 from app.config.redis import get_redis
 from app.config.settings import settings
 from app.core.logger import logger
+from app.core.metrics import observe_redis
+from app.core.tracing import SpanKind, traced
 
 
 class TokenStore:
@@ -17,8 +19,12 @@ class TokenStore:
     # Redis 키 프리픽스
     REFRESH_TOKEN_PREFIX = "refresh_token:"
     BLACKLIST_PREFIX = "blacklist:"
+
+    # span 속성 (요청 추적)
+    _SPAN_ATTRIBUTES = {"db.system": "redis"}
     
     @classmethod
+    @traced("redis.token_store.store_refresh_token", SpanKind.CLIENT, _SPAN_ATTRIBUTES)
     async def store_refresh_token(
         cls, 
         user_id: str, 
@@ -41,11 +47,12 @@ class TokenStore:
             key = f"{cls.REFRESH_TOKEN_PREFIX}{user_id}"
             expires = expires_days or settings.REFRESH_TOKEN_EXPIRE_DAYS
             
-            await redis.setex(
-                key,
-                timedelta(days=expires),
-                refresh_token
-            )
+            with observe_redis("store_refresh_token"):
+                await redis.setex(
+                    key,
+                    timedelta(days=expires),
+                    refresh_token
+                )
             logger.debug(f"리프레시 토큰 저장: user_id={user_id}")
             return True
         except Exception as e:
@@ -53,6 +60,7 @@ class TokenStore:
             return False
     
     @classmethod
+    @traced("redis.token_store.get_refresh_token", SpanKind.CLIENT, _SPAN_ATTRIBUTES)
     async def get_refresh_token(cls, user_id: str) -> Optional[str]:
         """
         리프레시 토큰 조회
@@ -66,12 +74,14 @@ class TokenStore:
         try:
             redis = await get_redis()
             key = f"{cls.REFRESH_TOKEN_PREFIX}{user_id}"
-            return await redis.get(key)
+            with observe_redis("get_refresh_token"):
+                return await redis.get(key)
         except Exception as e:
             logger.error(f"리프레시 토큰 조회 실패: {str(e)}")
             return None
     
     @classmethod
+    @traced("redis.token_store.delete_refresh_token", SpanKind.CLIENT, _SPAN_ATTRIBUTES)
     async def delete_refresh_token(cls, user_id: str) -> bool:
         """
         리프레시 토큰 삭제 (로그아웃)
@@ -85,7 +95,8 @@ class TokenStore:
         try:
             redis = await get_redis()
             key = f"{cls.REFRESH_TOKEN_PREFIX}{user_id}"
-            await redis.delete(key)
+            with observe_redis("delete_refresh_token"):
+                await redis.delete(key)
             logger.debug(f"리프레시 토큰 삭제: user_id={user_id}")
             return True
         except Exception as e:
@@ -93,6 +104,7 @@ class TokenStore:
             return False
     
     @classmethod
+    @traced("redis.token_store.add_to_blacklist", SpanKind.CLIENT, _SPAN_ATTRIBUTES)
     async def add_to_blacklist(
         cls, 
         token: str, 
@@ -113,11 +125,12 @@ class TokenStore:
             key = f"{cls.BLACKLIST_PREFIX}{token}"
             expires = expires_minutes or settings.ACCESS_TOKEN_EXPIRE_MINUTES
             
-            await redis.setex(
-                key,
-                timedelta(minutes=expires),
-                "1"
-            )
+            with observe_redis("add_to_blacklist"):
+                await redis.setex(
+                    key,
+                    timedelta(minutes=expires),
+                    "1"
+                )
             logger.debug("토큰 블랙리스트 추가")
             return True
         except Exception as e:
@@ -125,6 +138,7 @@ class TokenStore:
             return False
     
     @classmethod
+    @traced("redis.token_store.is_blacklisted", SpanKind.CLIENT, _SPAN_ATTRIBUTES)
     async def is_blacklisted(cls, token: str) -> bool:
         """
         토큰이 블랙리스트에 있는지 확인
@@ -138,7 +152,8 @@ class TokenStore:
         try:
             redis = await get_redis()
             key = f"{cls.BLACKLIST_PREFIX}{token}"
-            return await redis.exists(key) > 0
+            with observe_redis("is_blacklisted"):
+                return await redis.exists(key) > 0
         except Exception as e:
             logger.error(f"블랙리스트 확인 실패: {str(e)}")
             return False
@@ -0,0 +1,430 @@
+# ============================================
+# 요청 추적 (Tracing)
+# ============================================
+# 요청 단위 span 과 하위 span(DB 쿼리, Redis, 인증 암호 연산) 시간 기록
+# - W3C traceparent 헤더로 상위 trace 이어받기 (프론트/게이트웨이 → 백엔드)
+# - 샘플링: 상위 trace 의 sampled 플래그를 따르고, 없으면 TRACING_SAMPLE_RATIO 확률
+# - 샘플링되지 않은 요청의 하위 span 은 ContextVar 조회 1회 후 바로 반환 (no-op)
+# - 끝난 span 은 큐에 넣고 백그라운드 스레드가 OTLP/JSON 형식으로 묶어 내보냄
+#   - file : TRACING_FILE_PATH 에 한 줄씩 추가 (collector otlpjsonfile receiver 로 읽을 수 있음)
+#   - otlp : TRACING_OTLP_ENDPOINT 의 /v1/traces 로 POST (OTLP/HTTP JSON)
+#
+# 사용 예:
+#     with trace_span("catalog.rebuild") as span:
+#         span.set_attribute("catalog.items", len(items))
+#
+#     @traced("auth.verify_password")
+#     def verify_password(...): ...
+
+import asyncio
+import json
+import logging
+import queue
+import random
+import threading
+import time
+import urllib.request
+from contextvars import ContextVar
+from functools import wraps
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+from app.config.settings import settings
+
+
+# logger 모듈이 이 모듈을 import 하므로 이름으로 가져온다
+_log = logging.getLogger("oni_care")
+
+# 백그라운드 내보내기 설정
+EXPORT_BATCH_SIZE = 512
+EXPORT_INTERVAL_SECONDS = 5.0
+MAX_PENDING_SPANS = 20000
+# 속성 문자열 최대 길이 (db.statement 등)
+MAX_ATTRIBUTE_LENGTH = 1024
+
+
+class SpanKind:
+    """OTLP span kind 값"""
+    INTERNAL = 1
+    SERVER = 2
+    CLIENT = 3
+
+
+# OTLP status code
+STATUS_UNSET = 0
+STATUS_OK = 1
+STATUS_ERROR = 2
+
+
+class Span:
+    """기록 중인 span (샘플링된 요청에서만 생성)"""
+
+    __slots__ = (
+        "trace_id", "span_id", "parent_id", "name", "kind",
+        "start_ns", "end_ns", "attributes", "status", "status_message",
+    )
+
+    is_recording = True
+
+    def __init__(
+        self,
+        name: str,
+        kind: int,
+        trace_id: str,
+        parent_id: Optional[str],
+        attributes: Optional[Dict[str, Any]] = None,
+    ):
+        self.trace_id = trace_id
+        self.span_id = f"{random.getrandbits(64):016x}"
+        self.parent_id = parent_id
+        self.name = name
+        self.kind = kind
+        self.start_ns = time.time_ns()
+        self.end_ns = 0
+        self.attributes = dict(attributes) if attributes else {}
+        self.status = STATUS_UNSET
+        self.status_message = ""
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        self.attributes[key] = value
+
+    def set_error(self, message: str) -> None:
+        self.status = STATUS_ERROR
+        self.status_message = message
+
+    def record_exception(self, exc: BaseException) -> None:
+        self.attributes["exception.type"] = type(exc).__name__
+        self.set_error(str(exc))
+
+
+class _NoopSpan:
+    """샘플링되지 않은 요청용 span (아무것도 기록하지 않음)"""
+
+    __slots__ = ()
+
+    is_recording = False
+    trace_id = None
+    span_id = None
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        pass
+
+    def set_error(self, message: str) -> None:
+        pass
+
+    def record_exception(self, exc: BaseException) -> None:
+        pass
+
+
+NOOP_SPAN = _NoopSpan()
+
+# 현재 span (요청 span 또는 하위 span)
+_current_span: ContextVar[Optional[Span]] = ContextVar("current_span", default=None)
+
+
+class _SpanScope:
+    """span 활성화 컨텍스트 (with 블록 동안 현재 span 으로 설정, 종료 시 내보내기)"""
+
+    __slots__ = ("span", "token")
+
+    def __init__(self, span: Span):
+        self.span = span
+        self.token = None
+
+    def __enter__(self) -> Span:
+        self.token = _current_span.set(self.span)
+        return self.span
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        _current_span.reset(self.token)
+        if exc is not None and not isinstance(exc, asyncio.CancelledError):
+            self.span.record_exception(exc)
+        self.span.end_ns = time.time_ns()
+        if _processor is not None:
+            _processor.submit(self.span)
+
+
+class _NoopScope:
+    __slots__ = ()
+
+    def __enter__(self) -> _NoopSpan:
+        return NOOP_SPAN
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        pass
+
+
+NOOP_SCOPE = _NoopScope()
+
+
+def current_span() -> Optional[Span]:
+    """현재 기록 중인 span (없거나 샘플링되지 않았으면 None)"""
+    return _current_span.get()
+
+
+def trace_span(name: str, kind: int = SpanKind.INTERNAL, attributes: Optional[Dict[str, Any]] = None):
+    """
+    하위 span 시작 (with 문)
+
+    현재 요청이 샘플링되지 않았으면 no-op 컨텍스트를 반환한다.
+    """
+    parent = _current_span.get()
+    if parent is None:
+        return NOOP_SCOPE
+    return _SpanScope(Span(name, kind, parent.trace_id, parent.span_id, attributes))
+
+
+def parse_traceparent(value: Optional[str]) -> Optional[tuple]:
+    """
+    W3C traceparent 파싱
+
+    Returns:
+        (trace_id, parent_span_id, sampled) 또는 None (형식 오류)
+    """
+    if not value:
+        return None
+    parts = value.strip().split("-")
+    if len(parts) < 4 or len(parts[0]) != 2 or parts[0] == "ff":
+        return None
+    trace_id, parent_id, flags = parts[1].lower(), parts[2].lower(), parts[3]
+    if len(trace_id) != 32 or len(parent_id) != 16 or len(flags) != 2:
+        return None
+    try:
+        if int(trace_id, 16) == 0 or int(parent_id, 16) == 0:
+            return None
+        sampled = bool(int(flags, 16) & 0x01)
+    except ValueError:
+        return None
+    return trace_id, parent_id, sampled
+
+
+def start_trace(
+    name: str,
+    traceparent: Optional[str] = None,
+    kind: int = SpanKind.SERVER,
+    attributes: Optional[Dict[str, Any]] = None,
+):
+    """
+    최상위 span 시작 (요청 / 백그라운드 작업)
+
+    - traceparent 가 유효하면 상위 trace 를 이어받고 sampled 플래그를 따른다
+    - 없으면 TRACING_SAMPLE_RATIO 확률로 새 trace 를 시작한다
+    - 추적이 꺼져 있거나 샘플링되지 않으면 no-op 컨텍스트
+    """
+    if _processor is None:
+        return NOOP_SCOPE
+
+    parent = parse_traceparent(traceparent)
+    if parent is not None:
+        trace_id, parent_id, sampled = parent
+        if not sampled:
+            return NOOP_SCOPE
+    else:
+        if random.random() >= settings.TRACING_SAMPLE_RATIO:
+            return NOOP_SCOPE
+        trace_id, parent_id = f"{random.getrandbits(128):032x}", None
+
+    return _SpanScope(Span(name, kind, trace_id, parent_id, attributes))
+
+
+def traced(name: str, kind: int = SpanKind.INTERNAL, attributes: Optional[Dict[str, Any]] = None):
+    """
+    함수 실행을 하위 span 으로 기록하는 데코레이터 (동기/비동기 함수 모두 가능)
+
+    사용 예:
+        @staticmethod
+        @traced("auth.verify_password")
+        def verify_password(...): ...
+    """
+    def decorator(func: Callable) -> Callable:
+        if asyncio.iscoroutinefunction(func):
+            @wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                with trace_span(name, kind, attributes):
+                    return await func(*args, **kwargs)
+            return async_wrapper
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            with trace_span(name, kind, attributes):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+# ============================================
+# 내보내기 (OTLP/JSON)
+# ============================================
+
+def _attribute_value(value: Any) -> Dict[str, Any]:
+    if isinstance(value, bool):
+        return {"boolValue": value}
+    if isinstance(value, int):
+        return {"intValue": str(value)}
+    if isinstance(value, float):
+        return {"doubleValue": value}
+    return {"stringValue": str(value)[:MAX_ATTRIBUTE_LENGTH]}
+
+
+def _attributes(values: Dict[str, Any]) -> List[Dict[str, Any]]:
+    return [{"key": key, "value": _attribute_value(value)} for key, value in values.items() if value is not None]
+
+
+def encode_spans(spans: List[Span]) -> bytes:
+    """span 목록 → OTLP/JSON ExportTraceServiceRequest"""
+    encoded = []
+    for span in spans:
+        item = {
+            "traceId": span.trace_id,
+            "spanId": span.span_id,
+            "name": span.name,
+            "kind": span.kind,
+            "startTimeUnixNano": str(span.start_ns),
+            "endTimeUnixNano": str(span.end_ns),
+            "attributes": _attributes(span.attributes),
+            "status": {"code": span.status},
+        }
+        if span.parent_id:
+            item["parentSpanId"] = span.parent_id
+        if span.status_message:
+            item["status"]["message"] = span.status_message[:MAX_ATTRIBUTE_LENGTH]
+        encoded.append(item)
+
+    payload = {
+        "resourceSpans": [{
+            "resource": {"attributes": _attributes({"service.name": settings.TRACING_SERVICE_NAME})},
+            "scopeSpans": [{"scope": {"name": "app.core.tracing"}, "spans": encoded}],
+        }]
+    }
+    return json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+class FileSpanExporter:
+    """파일 내보내기 (배치당 OTLP/JSON 한 줄)"""
+
+    def __init__(self, path: str):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+    def export(self, payload: bytes) -> None:
+        with open(self.path, "ab") as f:
+            f.write(payload + b"\n")
+
+
+class OtlpHttpSpanExporter:
+    """OTLP/HTTP JSON 내보내기 (로컬 collector)"""
+
+    def __init__(self, endpoint: str, timeout: float = 5.0):
+        self.url = endpoint.rstrip("/") + "/v1/traces"
+        self.timeout = timeout
+
+    def export(self, payload: bytes) -> None:
+        request = urllib.request.Request(
+            self.url, data=payload, method="POST", headers={"Content-Type": "application/json"},
+        )
+        with urllib.request.urlopen(request, timeout=self.timeout) as response:
+            response.read()
+
+
+class _BatchSpanProcessor:
+    """끝난 span 을 모아 백그라운드 스레드에서 내보냄 (대기 span 이 많으면 버림)"""
+
+    _STOP = object()
+
+    def __init__(self, exporter):
+        self.exporter = exporter
+        self.queue: queue.SimpleQueue = queue.SimpleQueue()
+        self.exported = 0
+        self.dropped = 0
+        self.failed = 0
+        self._thread = threading.Thread(target=self._run, name="span_exporter", daemon=True)
+        self._thread.start()
+
+    def submit(self, span: Span) -> None:
+        if self.queue.qsize() >= MAX_PENDING_SPANS:
+            self.dropped += 1
+            return
+        self.queue.put_nowait(span)
+
+    def shutdown(self, timeout: float = 10.0) -> None:
+        self.queue.put_nowait(self._STOP)
+        self._thread.join(timeout)
+
+    def _run(self) -> None:
+        stopping = False
+        while not stopping:
+            try:
+                item = self.queue.get(timeout=EXPORT_INTERVAL_SECONDS)
+            except queue.Empty:
+                continue
+            batch = []
+            while True:
+                if item is self._STOP:
+                    stopping = True
+                    break
+                batch.append(item)
+                if len(batch) >= EXPORT_BATCH_SIZE:
+                    break
+                try:
+                    item = self.queue.get_nowait()
+                except queue.Empty:
+                    break
+            if batch:
+                self._export(batch)
+
+    def _export(self, batch: List[Span]) -> None:
+        try:
+            self.exporter.export(encode_spans(batch))
+            self.exported += len(batch)
+        except Exception as e:
+            # 연속 실패 시 첫 실패만 기록
+            if not self.failed:
+                _log.warning(f"span 내보내기 실패 ({len(batch)}건 버림): {str(e)}")
+            self.failed += len(batch)
+            return
+        if self.failed:
+            _log.info(f"span 내보내기 재개 (실패 누적 {self.failed}건)")
+            self.failed = 0
+
+
+_processor: Optional[_BatchSpanProcessor] = None
+
+
+def setup_tracing() -> None:
+    """추적 시작 (lifespan 시작 시, TRACING_ENABLED 인 경우만)"""
+    global _processor
+    if not settings.TRACING_ENABLED or _processor is not None:
+        return
+
+    if settings.TRACING_EXPORTER == "otlp":
+        exporter = OtlpHttpSpanExporter(settings.TRACING_OTLP_ENDPOINT)
+        target = exporter.url
+    else:
+        exporter = FileSpanExporter(settings.TRACING_FILE_PATH)
+        target = str(exporter.path)
+    _processor = _BatchSpanProcessor(exporter)
+    _log.info(
+        f"요청 추적 시작 (exporter={settings.TRACING_EXPORTER}, target={target}, "
+        f"sample_ratio={settings.TRACING_SAMPLE_RATIO})"
+    )
+
+
+def shutdown_tracing() -> None:
+    """남은 span 을 내보내고 추적 종료 (lifespan 종료 시)"""
+    global _processor
+    if _processor is None:
+        return
+    processor, _processor = _processor, None
+    processor.shutdown()
+
+
+def tracing_stats() -> Dict[str, int]:
+    """추적 상태 (대기/내보낸/버린/실패 span 수)"""
+    if _processor is None:
+        return {"pending": 0, "exported": 0, "dropped": 0, "failed": 0}
+    return {
+        "pending": _processor.queue.qsize(),
+        "exported": _processor.exported,
+        "dropped": _processor.dropped,
+        "failed": _processor.failed,
+    }
@@ -18,6 +18,11 @@ class AppDatabaseManager:
     def __init__(self):
         self._async_pool: Optional[AsyncConnectionPool] = None
 
+    @property
+    def async_pool(self) -> Optional[AsyncConnectionPool]:
+        """비동기 커넥션 풀 (초기화 전에는 None)"""
+        return self._async_pool
+
     @property
     def conninfo(self) -> str:
         """커넥션 문자열"""
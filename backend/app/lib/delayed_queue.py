@@ -0,0 +1,111 @@
+"""
+파일: app/lib/delayed_queue.py
+설명: Redis ZSET 기반 지연 작업 큐
+  - member = 작업 키, score = 실행 시각 (epoch 초)
+  - 재시작해도 예약이 Redis 에 남아 있어 다시 적재할 필요 없음
+  - claim: 현재 score 가 조회 시점과 같을 때만 다음 실행 시각으로 옮기거나 제거 (Lua CAS)
+    → 같은 예약을 두 워커가 동시에 가져가도 한 쪽만 성공
+  - 큐 깊이 / 지연(가장 오래 밀린 작업) 통계 제공
+"""
+import time
+from typing import Dict, List, Optional, Set, Tuple
+
+from app.config.redis import get_redis
+
+
+# 현재 score 가 기대값과 같을 때만 다음 시각으로 이동 (ARGV[2] 가 빈 문자열이면 제거)
+_CLAIM_SCRIPT = """
+local current = redis.call('ZSCORE', KEYS[1], ARGV[1])
+if not current or tonumber(current) ~= tonumber(ARGV[2]) then
+    return 0
+end
+if ARGV[3] == '' then
+    redis.call('ZREM', KEYS[1], ARGV[1])
+else
+    redis.call('ZADD', KEYS[1], ARGV[3], ARGV[1])
+end
+return 1
+"""
+
+
+class DelayedQueue:
+    """
+    Redis 지연 작업 큐
+
+    사용:
+        queue = DelayedQueue("push_schedule")
+        await queue.schedule(push_id, fire_at)
+        for member, score in await queue.due():
+            if await queue.claim(member, score, next_at):
+                ...실행...
+    """
+
+    KEY_PREFIX = "delayed:"
+
+    def __init__(self, name: str):
+        self.key = f"{self.KEY_PREFIX}{name}"
+
+    async def schedule(self, member: str, at: float, only_if_absent: bool = False) -> bool:
+        """
+        예약 등록/변경
+
+        Args:
+            only_if_absent: True 면 기존 예약을 유지 (재적재 시 사용)
+
+        Returns:
+            새로 추가되었는지 여부
+        """
+        redis = await get_redis()
+        return bool(await redis.zadd(self.key, {member: at}, nx=only_if_absent))
+
+    async def remove(self, *members: str) -> int:
+        if not members:
+            return 0
+        redis = await get_redis()
+        return await redis.zrem(self.key, *members)
+
+    async def members(self) -> Set[str]:
+        redis = await get_redis()
+        return set(await redis.zrange(self.key, 0, -1))
+
+    async def due(self, now: Optional[float] = None, limit: int = 100) -> List[Tuple[str, float]]:
+        """실행 시각이 지난 작업 (오래된 순)"""
+        redis = await get_redis()
+        now = time.time() if now is None else now
+        return await redis.zrangebyscore(self.key, "-inf", now, start=0, num=limit, withscores=True)
+
+    async def next_at(self) -> Optional[float]:
+        """가장 가까운 실행 시각"""
+        redis = await get_redis()
+        head = await redis.zrange(self.key, 0, 0, withscores=True)
+        return head[0][1] if head else None
+
+    async def claim(self, member: str, score: float, next_at: Optional[float]) -> bool:
+        """
+        작업 가져가기 (score 가 그대로일 때만 next_at 으로 이동, None 이면 제거)
+
+        Returns:
+            가져간 경우 True (다른 워커가 먼저 가져갔거나 예약이 변경되면 False)
+        """
+        redis = await get_redis()
+        claimed = await redis.eval(
+            _CLAIM_SCRIPT, 1, self.key, member, repr(score), "" if next_at is None else repr(next_at)
+        )
+        return bool(claimed)
+
+    async def stats(self, now: Optional[float] = None) -> Dict[str, Optional[float]]:
+        """큐 통계 (depth: 전체 예약 수, due: 실행 대기 수, lag_seconds: 가장 오래 밀린 작업 지연)"""
+        redis = await get_redis()
+        now = time.time() if now is None else now
+        async with redis.pipeline(transaction=False) as pipe:
+            pipe.zcard(self.key)
+            pipe.zcount(self.key, "-inf", now)
+            pipe.zrange(self.key, 0, 0, withscores=True)
+            depth, due, head = await pipe.execute()
+        oldest = head[0][1] if head else None
+        return {
+            "depth": depth,
+            "due": due,
+            "lag_seconds": round(now - oldest, 3) if oldest is not None and oldest <= now else 0.0,
+            "next_at": oldest,
+        }
@@ -0,0 +1,93 @@
+"""
+파일: app/lib/leader_lock.py
+설명: Redis 기반 리더 선출 락
+  - 여러 워커/인스턴스 중 하나만 주기 작업(스케줄러)을 실행하도록 보장
+  - SET NX PX 로 획득, 소유자 토큰을 확인하는 Lua 스크립트로 연장/해제
+  - 리더 프로세스가 죽으면 TTL 만료 후 다른 인스턴스가 이어받음
+
+Redis에 연결할 수 없으면 fallback 값으로 리더 여부를 결정한다.
+(작업이 멱등이라 중복 실행돼도 안전한 경우 True)
+"""
+import os
+import socket
+import uuid
+
+from app.config.redis import get_redis
+from app.core.logger import logger
+
+
+# 소유자 토큰이 같을 때만 TTL 연장
+_RENEW_SCRIPT = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    return redis.call('PEXPIRE', KEYS[1], ARGV[2])
+end
+return 0
+"""
+
+# 소유자 토큰이 같을 때만 삭제
+_RELEASE_SCRIPT = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    return redis.call('DEL', KEYS[1])
+end
+return 0
+"""
+
+
+class LeaderLock:
+    """
+    Redis 리더 락
+
+    사용:
+        lock = LeaderLock("status_scheduler", ttl_seconds=60)
+        if await lock.acquire():   # 주기마다 호출 (획득 또는 연장)
+            ...리더 작업...
+        await lock.release()
+    """
+
+    KEY_PREFIX = "leader:"
+
+    def __init__(self, name: str, ttl_seconds: int = 60, fallback: bool = True):
+        """
+        Args:
+            name: 락 이름 (작업 단위)
+            ttl_seconds: 락 유지 시간 (이 시간 안에 다시 acquire 해야 리더 유지)
+            fallback: Redis 오류 시 리더로 간주할지 여부
+        """
+        self.key = f"{self.KEY_PREFIX}{name}"
+        self.ttl_ms = ttl_seconds * 1000
+        self.fallback = fallback
+        self.token = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+        self.is_leader = False
+        self._owned = False  # Redis 키를 실제로 보유 중인지 (fallback 리더와 구분)
+
+    async def acquire(self) -> bool:
+        """리더 락 획득 시도 (이미 리더면 TTL 연장), 리더 여부 반환"""
+        try:
+            redis = await get_redis()
+            if self._owned:
+                renewed = await redis.eval(_RENEW_SCRIPT, 1, self.key, self.token, self.ttl_ms)
+                if renewed:
+                    self.is_leader = True
+                    return True
+                logger.warning(f"리더 락 상실: {self.key}")
+            acquired = bool(await redis.set(self.key, self.token, nx=True, px=self.ttl_ms))
+            if acquired and not self._owned:
+                logger.info(f"리더 락 획득: {self.key} ({self.token})")
+            self._owned = self.is_leader = acquired
+        except Exception as e:
+            if self.is_leader != self.fallback:
+                logger.warning(f"리더 락 확인 실패 (fallback={self.fallback}): {self.key} - {str(e)}")
+            self.is_leader = self.fallback
+        return self.is_leader
+
+    async def release(self) -> None:
+        """보유 중인 리더 락 해제 (종료 시 다른 인스턴스가 즉시 이어받도록)"""
+        owned = self._owned
+        self._owned = self.is_leader = False
+        if not owned:
+            return
+        try:
+            redis = await get_redis()
+            await redis.eval(_RELEASE_SCRIPT, 1, self.key, self.token)
+        except Exception as e:
+            logger.warning(f"리더 락 해제 실패: {self.key} - {str(e)}")
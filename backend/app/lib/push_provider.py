@@ -0,0 +1,174 @@
+"""
+파일: app/lib/push_provider.py
+설명: 푸시 발송 프로바이더 인터페이스
+  - PushProvider.send_batch(tokens, message) 로 한 번에 여러 토큰 발송 (배치 호출)
+  - 결과는 토큰별로 성공 / 재시도 가능 실패 / 영구 실패(무효 토큰) 로 구분
+  - 프로바이더별 초당 발송 한도는 RateLimiter(토큰 버킷)로 제한
+  - 로컬/테스트용 FakePushProvider 기본 제공
+
+새 프로바이더는 PushProvider 를 상속해 register_push_provider 로 등록하고
+PUSH_PROVIDER 설정으로 선택한다.
+"""
+import asyncio
+import random
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional
+
+from app.config.settings import settings
+from app.core.logger import logger
+
+
+@dataclass
+class PushMessage:
+    """발송 메시지 (캠페인 단위로 동일)"""
+    title: str
+    body: Optional[str] = None
+    link_url: Optional[str] = None
+    data: Dict[str, Any] = field(default_factory=dict)
+
+
+@dataclass
+class PushBatchResult:
+    """배치 발송 결과 (토큰 목록)"""
+    sent: List[str] = field(default_factory=list)
+    retryable: List[str] = field(default_factory=list)  # 일시 오류 (재시도 대상)
+    invalid: List[str] = field(default_factory=list)  # 만료/해지 토큰 (재시도 안 함)
+
+
+class PushProviderError(Exception):
+    """배치 전체 실패 (네트워크 오류 등, 배치 전체 재시도)"""
+
+
+class PushProvider:
+    """푸시 프로바이더 기본 클래스"""
+
+    name = "base"
+    # 1회 호출 최대 토큰 수
+    max_batch_size = 500
+
+    async def send_batch(self, tokens: List[str], message: PushMessage) -> PushBatchResult:
+        raise NotImplementedError
+
+    async def close(self) -> None:
+        """연결 자원 정리 (필요한 프로바이더만 구현)"""
+
+
+class FakePushProvider(PushProvider):
+    """
+    로컬/테스트용 프로바이더 (실제 발송 없음)
+
+    - 발송 토큰 수만 기록하고 latency 만큼 대기
+    - invalid_prefix 로 시작하는 토큰은 무효 처리
+    - failure_rate 비율로 일시 오류 발생 (재시도 경로 확인용)
+    """
+
+    name = "fake"
+
+    def __init__(
+        self,
+        latency: float = 0.0,
+        failure_rate: float = 0.0,
+        invalid_prefix: str = "invalid",
+        max_batch_size: int = 500
+    ):
+        self.latency = latency
+        self.failure_rate = failure_rate
+        self.invalid_prefix = invalid_prefix
+        self.max_batch_size = max_batch_size
+        self.calls = 0
+        self.delivered = 0
+
+    async def send_batch(self, tokens: List[str], message: PushMessage) -> PushBatchResult:
+        self.calls += 1
+        if self.latency:
+            await asyncio.sleep(self.latency)
+
+        result = PushBatchResult()
+        for token in tokens:
+            if token.startswith(self.invalid_prefix):
+                result.invalid.append(token)
+            elif self.failure_rate and random.random() < self.failure_rate:
+                result.retryable.append(token)
+            else:
+                result.sent.append(token)
+        self.delivered += len(result.sent)
+        return result
+
+
+class RateLimiter:
+    """
+    토큰 버킷 (초당 rate 건, 최대 burst 건 누적)
+
+    여러 발송 워커가 하나의 인스턴스를 공유한다. (프로세스 단위 한도)
+    """
+
+    def __init__(self, rate: float, burst: Optional[float] = None):
+        self.rate = rate
+        self.capacity = burst if burst is not None else rate
+        self._tokens = self.capacity
+        self._updated_at = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self, amount: float = 1) -> None:
+        """
+        amount 건 발송 허용될 때까지 대기 (rate <= 0 이면 제한 없음)
+
+        버킷 용량보다 큰 요청도 전체 건수를 차감한다. 잔량이 음수가 되면 그만큼
+        채워질 때까지 잠금을 잡은 채 대기하므로, 배치 크기가 한도보다 커도 평균 발송
+        속도는 rate 를 넘지 않는다.
+        """
+        if self.rate <= 0:
+            return
+        async with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated_at) * self.rate)
+            self._updated_at = now
+            self._tokens -= amount
+            if self._tokens < 0:
+                await asyncio.sleep(-self._tokens / self.rate)
+
+
+# ============================================
+# 프로바이더 등록 / 조회
+# ============================================
+
+_PROVIDER_FACTORIES: Dict[str, Callable[[], PushProvider]] = {
+    "fake": FakePushProvider,
+}
+_providers: Dict[str, PushProvider] = {}
+_rate_limiters: Dict[str, RateLimiter] = {}
+
+
+def register_push_provider(name: str, factory: Callable[[], PushProvider]) -> None:
+    """프로바이더 등록 (PUSH_PROVIDER 값으로 선택)"""
+    _PROVIDER_FACTORIES[name] = factory
+
+
+def get_push_provider(name: Optional[str] = None) -> PushProvider:
+    """프로바이더 싱글톤 반환"""
+    name = name or settings.PUSH_PROVIDER
+    if name not in _providers:
+        if name not in _PROVIDER_FACTORIES:
+            raise ValueError(f"등록되지 않은 푸시 프로바이더입니다: {name}")
+        _providers[name] = _PROVIDER_FACTORIES[name]()
+        logger.info(f"푸시 프로바이더 초기화: {name}")
+    return _providers[name]
+
+
+def get_rate_limiter(name: Optional[str] = None) -> RateLimiter:
+    """프로바이더별 발송 한도 (PUSH_RATE_LIMIT 건/초)"""
+    name = name or settings.PUSH_PROVIDER
+    if name not in _rate_limiters:
+        _rate_limiters[name] = RateLimiter(settings.PUSH_RATE_LIMIT)
+    return _rate_limiters[name]
+
+
+async def close_push_providers() -> None:
+    """프로바이더 자원 정리 (lifespan 종료 시)"""
+    for provider in _providers.values():
+        try:
+            await provider.close()
+        except Exception as e:
+            logger.warning(f"푸시 프로바이더 종료 실패: {provider.name} - {str(e)}")
+    _providers.clear()
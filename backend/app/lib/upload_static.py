@@ -0,0 +1,211 @@
+"""
+파일: app/lib/upload_static.py
+설명: 업로드 파일 정적 서빙 (/uploads)
+  - 변경되지 않는 파일명은 Cache-Control: immutable, 그 외는 짧은 캐시
+  - 콘텐츠 주소 오브젝트(objects/)는 SHA-256을 강한 ETag로 사용
+  - Range 요청 / 304 검증은 FileResponse 처리를 그대로 활용
+  - 서버가 http.response.pathsend 확장을 지원하면 zero-copy 전송
+  - 작은 파일은 메모리 LRU에 보관하여 디스크 I/O 생략
+"""
+import asyncio
+import mimetypes
+import os
+import re
+import threading
+from collections import OrderedDict
+from email.utils import formatdate
+from hashlib import md5
+from typing import Optional, Tuple
+
+from starlette.datastructures import Headers
+from starlette.exceptions import HTTPException
+from starlette.responses import FileResponse, Response
+from starlette.staticfiles import NotModifiedResponse, StaticFiles
+from starlette.types import Receive, Scope, Send
+
+from app.core.metrics import record_cache
+
+
+# 1년 (초)
+IMMUTABLE_MAX_AGE = 365 * 24 * 60 * 60
+# 변경되지 않는 파일명 패턴
+#   - objects/ab/cd/{sha256}[__variant].ext (콘텐츠 주소 저장소)
+#   - {YYYYmmddHHMMSS}_{uuid8}[__variant].ext (업로드마다 새 이름 생성)
+_OBJECT_NAME = re.compile(r"^([0-9a-f]{64})(__[a-z]+)?\.[a-z0-9]+$")
+_UNIQUE_NAME = re.compile(r"^\d{14}_[0-9a-f]{8}(__[a-z]+)?\.[a-z0-9]+$")
+
+
+class SmallFileLRU:
+    """
+    작은 파일 내용 LRU 캐시 (스레드 안전)
+
+    키에 mtime/size를 포함하므로 파일이 바뀌면 자연히 미스가 된다.
+    """
+
+    def __init__(self, max_bytes: int, max_file_size: int):
+        self.max_bytes = max_bytes
+        self.max_file_size = max_file_size
+        self._items: "OrderedDict[Tuple[str, int, int], bytes]" = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Tuple[str, int, int]) -> Optional[bytes]:
+        with self._lock:
+            data = self._items.get(key)
+            if data is None:
+                self.misses += 1
+                return None
+            self._items.move_to_end(key)
+            self.hits += 1
+            return data
+
+    def put(self, key: Tuple[str, int, int], data: bytes) -> None:
+        if len(data) > self.max_file_size or self.max_bytes <= 0:
+            return
+        with self._lock:
+            if key in self._items:
+                return
+            self._items[key] = data
+            self._size += len(data)
+            while self._size > self.max_bytes and self._items:
+                _, evicted = self._items.popitem(last=False)
+                self._size -= len(evicted)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._items.clear()
+            self._size = 0
+
+    @property
+    def size(self) -> int:
+        return self._size
+
+
+class _CachedBodyResponse(Response):
+    """
+    메모리 캐시 본문 응답
+
+    StaticFiles.file_response 는 동기 메서드이므로, 본문은 전송 직전에 읽는다.
+    (캐시 미스 시 파일 읽기는 스레드풀에서 수행하여 이벤트 루프를 막지 않음)
+    """
+
+    def __init__(self, static: "UploadStaticFiles", full_path, stat_result: os.stat_result, **kwargs):
+        super().__init__(**kwargs)
+        self.static = static
+        self.full_path = full_path
+        self.stat_result = stat_result
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        self.body = await self.static._read_cached(self.full_path, self.stat_result)
+        self.headers["content-length"] = str(len(self.body))
+        await super().__call__(scope, receive, send)
+
+
+class UploadStaticFiles(StaticFiles):
+    """
+    업로드 디렉토리 전용 StaticFiles
+
+    사용 예:
+        app.mount("/uploads", UploadStaticFiles(directory=str(uploads_dir)), name="uploads")
+    """
+
+    def __init__(
+        self,
+        *args,
+        default_max_age: int = 3600,
+        cache_max_bytes: int = 32 * 1024 * 1024,
+        cache_max_file_size: int = 64 * 1024,
+        **kwargs,
+    ):
+        super().__init__(*args, **kwargs)
+        self.default_max_age = default_max_age
+        self.cache = SmallFileLRU(cache_max_bytes, cache_max_file_size)
+
+    async def get_response(self, path: str, scope: Scope) -> Response:
+        # 숨김 파일(업로드 임시 파일 .xxx.part 등)은 서빙하지 않음
+        if any(part.startswith(".") for part in path.replace("\\", "/").split("/") if part):
+            raise HTTPException(status_code=404)
+        return await super().get_response(path, scope)
+
+    def cache_control_for(self, filename: str) -> str:
+        """파일명 기준 Cache-Control 값"""
+        if _OBJECT_NAME.match(filename) or _UNIQUE_NAME.match(filename):
+            return f"public, max-age={IMMUTABLE_MAX_AGE}, immutable"
+        return f"public, max-age={self.default_max_age}"
+
+    @staticmethod
+    def strong_etag_for(filename: str) -> Optional[str]:
+        """콘텐츠 주소 오브젝트 원본은 해시를 ETag로 사용"""
+        match = _OBJECT_NAME.match(filename)
+        if match and not match.group(2):
+            return f'"{match.group(1)}"'
+        return None
+
+    def file_response(
+        self,
+        full_path,
+        stat_result: os.stat_result,
+        scope: Scope,
+        status_code: int = 200,
+    ) -> Response:
+        request_headers = Headers(scope=scope)
+        filename = os.path.basename(full_path)
+
+        # 작은 파일은 메모리 캐시에서 응답 (Range 요청은 FileResponse가 처리)
+        if (
+            stat_result.st_size <= self.cache.max_file_size
+            and "range" not in request_headers
+        ):
+            headers = self._stat_headers(filename, stat_result)
+            # 본문을 읽기 전에 재검증하여 304는 캐시 조회도 생략
+            if self.is_not_modified(Headers(headers), request_headers):
+                return NotModifiedResponse(Headers(headers))
+            return _CachedBodyResponse(
+                self,
+                full_path,
+                stat_result,
+                status_code=status_code,
+                media_type=mimetypes.guess_type(filename)[0] or "text/plain",
+                headers=headers,
+            )
+
+        response = FileResponse(full_path, status_code=status_code, stat_result=stat_result)
+        response.headers["Cache-Control"] = self.cache_control_for(filename)
+        strong_etag = self.strong_etag_for(filename)
+        if strong_etag:
+            response.headers["ETag"] = strong_etag
+
+        if self.is_not_modified(response.headers, request_headers):
+            return NotModifiedResponse(response.headers)
+        return response
+
+    def _stat_headers(self, filename: str, stat_result: os.stat_result) -> dict:
+        """FileResponse와 동일한 규칙의 ETag/Last-Modified + 캐시 헤더"""
+        etag = self.strong_etag_for(filename)
+        if etag is None:
+            etag_base = f"{stat_result.st_mtime}-{stat_result.st_size}"
+            etag = f'"{md5(etag_base.encode(), usedforsecurity=False).hexdigest()}"'
+        return {
+            "etag": etag,
+            "last-modified": formatdate(stat_result.st_mtime, usegmt=True),
+            "cache-control": self.cache_control_for(filename),
+            "accept-ranges": "bytes",
+        }
+
+    async def _read_cached(self, full_path, stat_result: os.stat_result) -> bytes:
+        """LRU 캐시 조회, 미스 시 파일을 읽어 적재"""
+        key = (str(full_path), stat_result.st_mtime_ns, stat_result.st_size)
+        data = self.cache.get(key)
+        record_cache("uploads", data is not None)
+        if data is None:
+            # cache_max_file_size 이하의 작은 파일만 이 경로로 읽음
+            data = await asyncio.to_thread(self._read_file, full_path)
+            self.cache.put(key, data)
+        return data
+
+    @staticmethod
+    def _read_file(full_path) -> bytes:
+        with open(full_path, "rb") as f:
+            return f.read()
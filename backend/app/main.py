@@ -3,20 +3,40 @@
 # ============================================
 # OniCare Admin Backend
 
+import secrets
 from contextlib import asynccontextmanager
 from pathlib import Path
-from fastapi import FastAPI, Request, status
+from fastapi import FastAPI, Request, Response, status
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, PlainTextResponse
 from fastapi.exceptions import RequestValidationError
-from fastapi.staticfiles import StaticFiles
 
 from app.config.settings import settings
 from app.config.database import create_db_pool, create_app_db_pool, close_db_pool
 from app.config.redis import create_redis_client, close_redis_client
 from app.core.exceptions import AppException
-from app.core.logger import logger
+from app.core.logger import logger, shutdown_logging
+from app.core.metrics import CONTENT_TYPE_LATEST, render_metrics
+from app.core.tracing import setup_tracing, shutdown_tracing
 from app.lib.app_db import app_db_manager
+from app.lib.push_provider import close_push_providers
+from app.lib.upload_static import UploadStaticFiles
+from app.middleware.compression import CompressionMiddleware
+from app.middleware.drain import DrainMiddleware
+from app.middleware.metrics import MetricsMiddleware
+from app.middleware.request_context import RequestContextMiddleware
+from app.middleware.tracing import TracingMiddleware
+from app.services.image_service import shutdown_executor as shutdown_image_executor
+from app.services.search_service import SearchService
+from app.services.status_scheduler import StatusScheduler
+from app.services.push_scheduler import PushScheduler
+from app.services.log_partition_scheduler import LogPartitionScheduler
+from app.services.search_sync_scheduler import SearchSyncScheduler
+from app.services.push_dispatch_service import PushDispatchService
+from app.services.permission_service import PermissionService
+from app.services.menu_service import MenuService
+from app.services.health_service import HealthService
+from app.services.metrics_collector import MetricsCollector
 
 # 라우터 임포트
 from app.routers import (
@@ -55,14 +75,25 @@ from app.routers import (
     coupon_master_router,
     cafe_menus_router,
     inquiries_router,
+    search_router,
 )
 
 
+async def stop_background_jobs() -> None:
+    """스케줄러 중지 + 리더 락 반환 (드레인 시작 시 / lifespan 종료 시, 중복 호출 가능)"""
+    await StatusScheduler.stop()
+    await PushScheduler.stop()
+    await LogPartitionScheduler.stop()
+    await SearchSyncScheduler.stop()
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """애플리케이션 라이프사이클 관리"""
     # 시작 시 실행
     logger.info(f"🚀 {settings.APP_NAME} 서버 시작 중...")
+    # 요청 추적 (TRACING_ENABLED 인 경우 span 내보내기 스레드 시작)
+    setup_tracing()
     
     # DB 커넥션 풀 생성
     await create_db_pool()
@@ -77,16 +108,49 @@ async def lifespan(app: FastAPI):
     except Exception as e:
         logger.warning(f"Redis 연결 실패 (계속 진행): {str(e)}")
     
+    # 챌린지/공지사항 상태 스케줄러 (Redis 리더 락 보유 인스턴스만 실행)
+    StatusScheduler.start()
+    # PUSH 예약 스케줄러 (Redis 리더 락 보유 인스턴스만 발송)
+    PushScheduler.start()
+    # 로그 월별 파티션 생성 / 보관 기간 경과분 내보내기 (Redis 리더 락 보유 인스턴스만 실행)
+    LogPartitionScheduler.start()
+    # 회원/문의 검색 문서 주기 동기화 (Redis 리더 락 보유 인스턴스만 실행)
+    SearchSyncScheduler.start()
+    # 역할/API 권한 매트릭스 로드 + 변경 알림 구독
+    await PermissionService.start(app.routes)
+    # 역할별 메뉴 트리 적재 (권한 변경 알림으로 갱신)
+    await MenuService.start()
+    # 커넥션 풀 메트릭 수집 (/metrics)
+    MetricsCollector.start()
+    # SIGTERM 시 드레인 (준비 상태 실패 → DRAIN_DELAY_SECONDS 대기 → uvicorn 종료 처리)
+    HealthService.install_signal_handler(stop_background_jobs)
+    
     logger.info(f"✅ 서버 준비 완료: http://{settings.HOST}:{settings.PORT}")
     
     yield
     
     # 종료 시 실행
     logger.info("🛑 서버 종료 중...")
+    HealthService.mark_draining()
+    await stop_background_jobs()
+    # 진행 중 요청 완료 대기 (커넥션 풀 종료 전)
+    await HealthService.wait_idle(settings.DRAIN_TIMEOUT_SECONDS)
+    await PermissionService.stop()
+    await MetricsCollector.stop()
+    # 진행 중인 PUSH 발송 중단 (진행 상황 기록)
+    await PushDispatchService.drain()
+    await close_push_providers()
+    # 진행 중인 검색 색인 갱신 대기 (커넥션 풀 종료 전)
+    await SearchService.drain()
     await close_db_pool()
     await app_db_manager.close()
     await close_redis_client()
+    shutdown_image_executor()
     logger.info("👋 서버 종료 완료")
+    # 남은 span 내보내기
+    shutdown_tracing()
+    # 큐에 남은 로그 기록 후 로그 쓰기 스레드 종료 (마지막에 호출)
+    shutdown_logging()
 
 
 # FastAPI 앱 생성
@@ -131,6 +195,32 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# 응답 압축 미들웨어 (gzip / brotli)
+# 가장 바깥에 위치하도록 마지막에 등록 - 보안 헤더/CORS 처리 후 본문 압축
+if settings.COMPRESSION_ENABLED:
+    app.add_middleware(
+        CompressionMiddleware,
+        minimum_size=settings.COMPRESSION_MIN_SIZE,
+        gzip_level=settings.COMPRESSION_GZIP_LEVEL,
+        brotli_quality=settings.COMPRESSION_BROTLI_QUALITY,
+        exclude_paths=settings.compression_exclude_paths_list,
+    )
+
+# 요청 메트릭 미들웨어 (라우트별 지연 시간/요청 수/DB 쿼리 수)
+if settings.METRICS_ENABLED:
+    app.add_middleware(MetricsMiddleware)
+
+# 요청 추적 미들웨어 (TRACING_ENABLED, 샘플링된 요청만 span 기록)
+# 요청 ID 미들웨어 바로 안쪽 - span 에 요청 ID 기록, 압축/CORS 시간 포함
+app.add_middleware(TracingMiddleware)
+
+# 드레인 미들웨어 (진행 중 요청 수, 드레인 중 Connection: close)
+app.add_middleware(DrainMiddleware)
+
+# 요청 ID 미들웨어 (로그 request_id / X-Request-ID 응답 헤더)
+# 미들웨어 처리 중 로그에도 요청 ID가 붙도록 가장 바깥에 등록
+app.add_middleware(RequestContextMiddleware)
+
 
 # 전역 예외 핸들러
 @app.exception_handler(AppException)
@@ -190,7 +280,9 @@ async def global_exception_handler(request: Request, exc: Exception):
 # 헬스체크
 @app.get("/", tags=["Health"])
 async def root():
-    """루트 경로 - ALB 헬스체크용"""
+    """루트 경로 - ALB 헬스체크용 (드레인 중에는 503 - 새 요청이 다른 인스턴스로 가도록)"""
+    if HealthService.is_draining():
+        return JSONResponse(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, content={"status": "draining"})
     return {"status": "ok"}
 
 
@@ -200,6 +292,37 @@ async def health_check():
     return {"status": "healthy", "service": settings.APP_NAME}
 
 
+@app.get("/health/live", tags=["Health"])
+async def liveness():
+    """생존 확인 (프로세스/이벤트 루프 응답 여부만, 의존성 점검 없음)"""
+    return {"status": "alive"}
+
+
+@app.get("/health/ready", tags=["Health"])
+async def readiness():
+    """준비 상태 확인 (커넥션 풀 SELECT 1, Redis PING / 실패·드레인 중 503)"""
+    result = await HealthService.readiness()
+    return JSONResponse(
+        status_code=status.HTTP_200_OK if result["ready"] else status.HTTP_503_SERVICE_UNAVAILABLE,
+        content={"status": result["status"], "checks": result["checks"]},
+    )
+
+
+@app.get("/metrics", tags=["Health"], include_in_schema=False)
+async def metrics(request: Request):
+    """Prometheus 메트릭 (METRICS_TOKEN Bearer 토큰 필요, DEBUG 에서만 토큰 없이 허용)"""
+    # 운영 환경에서 토큰 없이 라우트/풀 내부 정보가 노출되지 않도록 토큰 미지정 시 비활성
+    if not settings.METRICS_ENABLED or not (settings.METRICS_TOKEN or settings.DEBUG):
+        return PlainTextResponse("metrics disabled", status_code=status.HTTP_404_NOT_FOUND)
+    if settings.METRICS_TOKEN and not secrets.compare_digest(
+        request.headers.get("authorization", ""), f"Bearer {settings.METRICS_TOKEN}"
+    ):
+        return PlainTextResponse("unauthorized", status_code=status.HTTP_401_UNAUTHORIZED)
+    # 이 워커의 풀 통계는 응답 직전 값으로 갱신
+    MetricsCollector.collect()
+    return Response(content=render_metrics(), media_type=CONTENT_TYPE_LATEST)
+
+
 # 라우터 등록
 app.include_router(auth_router)
 app.include_router(admin_users_router)
@@ -236,11 +359,21 @@ app.include_router(coupons_router)
 app.include_router(coupon_master_router)
 app.include_router(cafe_menus_router)
 app.include_router(inquiries_router)
+app.include_router(search_router)
 
 # 정적 파일 서빙 (업로드된 이미지)
 uploads_dir = Path(__file__).parent.parent / "uploads"
 uploads_dir.mkdir(parents=True, exist_ok=True)
-app.mount("/uploads", StaticFiles(directory=str(uploads_dir)), name="uploads")
+app.mount(
+    "/uploads",
+    UploadStaticFiles(
+        directory=str(uploads_dir),
+        default_max_age=settings.UPLOADS_DEFAULT_MAX_AGE,
+        cache_max_bytes=settings.UPLOADS_MEMORY_CACHE_BYTES,
+        cache_max_file_size=settings.UPLOADS_MEMORY_CACHE_FILE_SIZE,
+    ),
+    name="uploads",
+)
 
 
 # 개발용 실행
@@ -2,13 +2,15 @@
 # 인증 미들웨어
 # ============================================
 # JWT 토큰 검증 및 사용자 정보 추출
+# 인증 후 역할/API 권한 매트릭스로 현재 라우트 인가 (PERMISSION_ENFORCEMENT)
 
 from typing import Optional
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 
 from app.services.auth_service import AuthService
 from app.core.token_store import TokenStore
+from app.services.permission_service import PermissionService
 from app.models.auth import TokenPayload
 from app.core.logger import logger
 
@@ -18,6 +20,7 @@ security = HTTPBearer(auto_error=False)
 
 
 async def get_current_user(
+    request: Request,
     credentials: HTTPAuthorizationCredentials = Depends(security)
 ) -> TokenPayload:
     """
@@ -26,7 +29,7 @@ async def get_current_user(
     인증이 필수인 엔드포인트에서 사용
     
     Raises:
-        HTTPException: 인증 실패 시 401
+        HTTPException: 인증 실패 시 401, 권한 없음(enforce 모드) 시 403
     """
     if not credentials:
         raise HTTPException(
@@ -51,6 +54,9 @@ async def get_current_user(
             detail={"error": "AUTH_ERROR", "message": "유효하지 않은 토큰입니다."}
         )
     
+    # 라우트 권한 확인 (메모리 매트릭스 조회)
+    PermissionService.authorize(request, payload)
+    
     return payload
 
 
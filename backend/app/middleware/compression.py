@@ -0,0 +1,281 @@
+# ============================================
+# 응답 압축 미들웨어
+# ============================================
+# Accept-Encoding 협상 기반 gzip / brotli 압축
+# - 최소 크기 미만 응답은 압축하지 않음
+# - 이미 압축된 이미지(/uploads) 및 Content-Encoding 지정 응답 제외
+# - StreamingResponse는 청크 단위로 압축하여 전체 버퍼링 없이 전송
+
+import zlib
+from typing import Iterable, Optional
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+try:
+    import brotli  # 선택 의존성: 설치 시 br 인코딩 활성화
+except ImportError:  # pragma: no cover
+    brotli = None
+
+
+# 압축하지 않는 Content-Type 접두사 (이미 압축된 포맷)
+NON_COMPRESSIBLE_TYPES = (
+    "image/",
+    "video/",
+    "audio/",
+    "application/zip",
+    "application/gzip",
+    "application/x-gzip",
+    "application/pdf",
+    "application/octet-stream",
+)
+
+
+def parse_accept_encoding(header_value: str) -> dict:
+    """
+    Accept-Encoding 헤더 파싱
+
+    Returns:
+        {인코딩: q값} 딕셔너리 (예: {"gzip": 1.0, "br": 0.8})
+    """
+    encodings = {}
+    for part in header_value.split(","):
+        part = part.strip()
+        if not part:
+            continue
+        name, _, params = part.partition(";")
+        q = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                q = float(params[2:])
+            except ValueError:
+                q = 0.0
+        encodings[name.strip().lower()] = q
+    return encodings
+
+
+def select_encoding(header_value: str, brotli_enabled: bool = True) -> Optional[str]:
+    """
+    클라이언트가 허용한 인코딩 중 사용할 인코딩 선택
+
+    br(설치된 경우) > gzip 순으로 우선하며, q=0 은 거부로 간주한다.
+    """
+    if not header_value:
+        return None
+    encodings = parse_accept_encoding(header_value)
+    wildcard = encodings.get("*", 0.0)
+
+    if brotli_enabled and brotli is not None and encodings.get("br", wildcard) > 0:
+        return "br"
+    if encodings.get("gzip", wildcard) > 0:
+        return "gzip"
+    return None
+
+
+class _GzipCompressor:
+    """gzip 스트리밍 압축기"""
+
+    def __init__(self, level: int):
+        # wbits=16+MAX_WBITS → gzip 헤더/트레일러 포함
+        self._compressor = zlib.compressobj(level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.compress(data)
+
+    def flush(self) -> bytes:
+        # 청크 경계마다 SYNC_FLUSH 하여 클라이언트가 즉시 디코딩 가능하도록 함
+        return self._compressor.flush(zlib.Z_SYNC_FLUSH)
+
+    def finish(self) -> bytes:
+        return self._compressor.flush(zlib.Z_FINISH)
+
+
+class _BrotliCompressor:
+    """brotli 스트리밍 압축기"""
+
+    def __init__(self, quality: int):
+        self._compressor = brotli.Compressor(quality=quality)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.process(data)
+
+    def flush(self) -> bytes:
+        return self._compressor.flush()
+
+    def finish(self) -> bytes:
+        return self._compressor.finish()
+
+
+class CompressionMiddleware:
+    """
+    gzip / brotli 응답 압축 미들웨어 (순수 ASGI)
+
+    BaseHTTPMiddleware는 응답 본문을 한 번 더 감싸기 때문에
+    스트리밍 압축을 위해 ASGI 메시지 단위로 직접 처리한다.
+
+    사용 예:
+        app.add_middleware(
+            CompressionMiddleware,
+            minimum_size=1024,
+            gzip_level=6,
+            exclude_paths=("/uploads",),
+        )
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        minimum_size: int = 1024,
+        gzip_level: int = 6,
+        brotli_quality: int = 4,
+        brotli_enabled: bool = True,
+        exclude_paths: Iterable[str] = ("/uploads",),
+    ):
+        self.app = app
+        self.minimum_size = minimum_size
+        self.gzip_level = gzip_level
+        self.brotli_quality = brotli_quality
+        self.brotli_enabled = brotli_enabled
+        self.exclude_paths = tuple(exclude_paths)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or self._is_excluded(scope.get("path", "")):
+            await self.app(scope, receive, send)
+            return
+
+        encoding = select_encoding(
+            Headers(scope=scope).get("accept-encoding", ""),
+            brotli_enabled=self.brotli_enabled,
+        )
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        responder = _CompressionResponder(
+            self.app,
+            encoding=encoding,
+            minimum_size=self.minimum_size,
+            level=self.brotli_quality if encoding == "br" else self.gzip_level,
+        )
+        await responder(scope, receive, send)
+
+    def _is_excluded(self, path: str) -> bool:
+        """압축 제외 경로 여부"""
+        return any(
+            path == prefix or path.startswith(prefix.rstrip("/") + "/")
+            for prefix in self.exclude_paths
+        )
+
+
+class _CompressionResponder:
+    """단일 요청의 응답 메시지를 가로채 압축하는 래퍼"""
+
+    def __init__(self, app: ASGIApp, encoding: str, minimum_size: int, level: int):
+        self.app = app
+        self.encoding = encoding
+        self.minimum_size = minimum_size
+        self.level = level
+        self.send: Send = None
+        self.initial_message: Optional[Message] = None
+        self.started = False
+        self.passthrough = False
+        self.compressor = None
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        self.send = send
+        await self.app(scope, receive, self.send_with_compression)
+
+    def _new_compressor(self):
+        if self.encoding == "br":
+            return _BrotliCompressor(self.level)
+        return _GzipCompressor(self.level)
+
+    def _should_skip(self, headers: Headers) -> bool:
+        """응답 헤더 기준 압축 제외 여부"""
+        if "content-encoding" in headers:
+            return True
+        content_type = headers.get("content-type", "").lower()
+        if content_type.startswith(NON_COMPRESSIBLE_TYPES):
+            return True
+        content_length = headers.get("content-length")
+        if content_length is not None and content_length.isdigit():
+            if int(content_length) < self.minimum_size:
+                return True
+        return False
+
+    def _apply_encoding_headers(self, message: Message, content_length: Optional[int]) -> None:
+        headers = MutableHeaders(raw=message["headers"])
+        headers["Content-Encoding"] = self.encoding
+        headers.add_vary_header("Accept-Encoding")
+        if content_length is None:
+            del headers["Content-Length"]
+        else:
+            headers["Content-Length"] = str(content_length)
+        # 본문이 바뀌므로 강한 ETag는 약한 ETag로 변환
+        etag = headers.get("etag")
+        if etag and not etag.startswith("W/"):
+            headers["ETag"] = f"W/{etag}"
+
+    async def send_with_compression(self, message: Message) -> None:
+        message_type = message["type"]
+
+        if message_type == "http.response.start":
+            # 본문 첫 청크를 보고 압축 여부를 결정하기 위해 보류
+            self.initial_message = message
+            self.passthrough = self._should_skip(Headers(raw=message["headers"]))
+            return
+
+        if message_type != "http.response.body":
+            # pathsend / zerocopy 등 본문 외 전송: 보류한 시작 메시지를 원본 그대로 먼저 전송
+            if not self.started and self.initial_message is not None:
+                self.started = True
+                self.passthrough = True
+                await self.send(self.initial_message)
+            await self.send(message)
+            return
+
+        if self.passthrough:
+            if not self.started:
+                self.started = True
+                await self.send(self.initial_message)
+            await self.send(message)
+            return
+
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+
+        if not self.started:
+            self.started = True
+
+            if not more_body:
+                # 단일 본문 응답: 임계값 미만이면 원본 전송
+                if len(body) < self.minimum_size:
+                    await self.send(self.initial_message)
+                    await self.send(message)
+                    return
+
+                compressor = self._new_compressor()
+                compressed = compressor.compress(body) + compressor.finish()
+                self._apply_encoding_headers(self.initial_message, len(compressed))
+                await self.send(self.initial_message)
+                await self.send({"type": "http.response.body", "body": compressed})
+                return
+
+            # 스트리밍 응답: 전체 길이를 알 수 없으므로 청크 단위 압축
+            self.compressor = self._new_compressor()
+            self._apply_encoding_headers(self.initial_message, None)
+            await self.send(self.initial_message)
+
+        chunk = self.compressor.compress(body) if body else b""
+        if more_body:
+            chunk += self.compressor.flush()
+        else:
+            chunk += self.compressor.finish()
+
+        await self.send({
+            "type": "http.response.body",
+            "body": chunk,
+            "more_body": more_body,
+        })
+
@@ -0,0 +1,34 @@
+# ============================================
+# 드레인 미들웨어
+# ============================================
+# 진행 중 요청 수를 세고 (종료 시 완료 대기용), 드레인 중에는 응답에 Connection: close 를 붙여
+# 로드밸런서의 keep-alive 연결이 다른 인스턴스로 옮겨가도록 한다. (app/services/health_service.py)
+# - 순수 ASGI 미들웨어
+
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.services.health_service import HealthService
+
+
+class DrainMiddleware:
+    """진행 중 요청 추적 / 드레인 중 연결 종료 미들웨어"""
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        async def send_with_connection(message: Message) -> None:
+            if message["type"] == "http.response.start" and HealthService.is_draining():
+                MutableHeaders(scope=message)["connection"] = "close"
+            await send(message)
+
+        HealthService.request_started()
+        try:
+            await self.app(scope, receive, send_with_connection)
+        finally:
+            HealthService.request_finished()
@@ -0,0 +1,54 @@
+# ============================================
+# 요청 메트릭 미들웨어
+# ============================================
+# 요청마다 처리 시간/상태 코드/DB 쿼리 수를 라우트 템플릿 라벨로 기록 (app/core/metrics.py)
+# - 라우트 템플릿(/api/v1/members/{member_id}) 기준이라 경로 값별로 시계열이 늘지 않음
+# - 매칭되지 않은 경로(404 스캔 등)는 route="unmatched" 하나로 묶음
+# - 순수 ASGI 미들웨어
+
+import time
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.metrics import (
+    DB_QUERIES,
+    HTTP_REQUEST_DURATION,
+    HTTP_REQUESTS,
+    request_queries_var,
+)
+
+
+class MetricsMiddleware:
+    """요청 메트릭 미들웨어"""
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status_code = 500
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        queries = [0]
+        token = request_queries_var.set(queries)
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            elapsed = time.perf_counter() - started
+            request_queries_var.reset(token)
+
+            method = scope["method"]
+            route = getattr(scope.get("route"), "path", None) or "unmatched"
+            HTTP_REQUEST_DURATION.labels(method, route).observe(elapsed)
+            HTTP_REQUESTS.labels(method, route, str(status_code)).inc()
+            if queries[0]:
+                DB_QUERIES.labels(method, route).inc(queries[0])
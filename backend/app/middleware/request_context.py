@@ -0,0 +1,58 @@
+# ============================================
+# 요청 컨텍스트 미들웨어
+# ============================================
+# 요청마다 요청 ID를 정해 로그 레코드(request_id)와 응답 헤더(X-Request-ID)에 싣는다.
+# - 클라이언트/프록시가 보낸 X-Request-ID 가 있으면 그대로 사용 (형식이 안전한 경우만)
+# - 없으면 새로 생성 (uuid4 hex)
+# - 순수 ASGI 미들웨어 (BaseHTTPMiddleware 의 태스크/스트림 오버헤드 없음)
+
+import re
+import uuid
+
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.logger import request_id_var
+
+
+REQUEST_ID_HEADER = "x-request-id"
+
+# 외부에서 받은 요청 ID 허용 형식 (로그 인젝션 방지)
+_VALID_REQUEST_ID = re.compile(r"^[A-Za-z0-9._\-]{1,64}$")
+
+
+def resolve_request_id(scope: Scope) -> str:
+    """요청 헤더의 X-Request-ID (유효한 경우) 또는 새 ID"""
+    for name, value in scope.get("headers", ()):
+        if name == b"x-request-id":
+            candidate = value.decode("latin-1")
+            if _VALID_REQUEST_ID.match(candidate):
+                return candidate
+            break
+    return uuid.uuid4().hex
+
+
+class RequestContextMiddleware:
+    """요청 ID 설정 미들웨어"""
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        request_id = resolve_request_id(scope)
+        scope.setdefault("state", {})["request_id"] = request_id
+        token = request_id_var.set(request_id)
+
+        async def send_with_request_id(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                MutableHeaders(scope=message)[REQUEST_ID_HEADER] = request_id
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_request_id)
+        finally:
+            request_id_var.reset(token)
@@ -0,0 +1,59 @@
+# ============================================
+# 요청 추적 미들웨어
+# ============================================
+# 요청마다 최상위 span(SERVER) 을 시작하고 끝날 때 라우트/상태 코드를 기록한다.
+# - 샘플링되지 않은 요청은 span 없이 그대로 전달 (app/core/tracing.py)
+# - 하위 span(DB/Redis/인증)은 이 span 의 자식으로 기록됨
+# - RequestContextMiddleware 안쪽에 등록 (request.id 속성으로 로그의 요청 ID와 연결)
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.logger import request_id_var
+from app.core.tracing import SpanKind, start_trace
+
+
+class TracingMiddleware:
+    """요청 span 미들웨어"""
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        traceparent = None
+        for name, value in scope.get("headers", ()):
+            if name == b"traceparent":
+                traceparent = value.decode("latin-1")
+                break
+
+        method = scope["method"]
+        with start_trace(method, traceparent, SpanKind.SERVER) as span:
+            if not span.is_recording:
+                await self.app(scope, receive, send)
+                return
+
+            status_code = 500
+
+            async def send_with_status(message: Message) -> None:
+                nonlocal status_code
+                if message["type"] == "http.response.start":
+                    status_code = message["status"]
+                await send(message)
+
+            try:
+                await self.app(scope, receive, send_with_status)
+            finally:
+                # 라우트 템플릿 (/api/v1/members/{member_id}) 으로 이름 지정 - 경로 값별로 흩어지지 않도록
+                route = scope.get("route")
+                route_path = getattr(route, "path", None)
+                span.name = f"{method} {route_path}" if route_path else method
+                span.set_attribute("http.request.method", method)
+                span.set_attribute("http.route", route_path)
+                span.set_attribute("url.path", scope.get("path"))
+                span.set_attribute("http.response.status_code", status_code)
+                span.set_attribute("request.id", request_id_var.get())
+                if status_code >= 500:
+                    span.set_error(f"HTTP {status_code}")
@@ -73,6 +73,7 @@ class ContentResponse(BaseModel):
     thumbnail_url: Optional[str] = None
     category_id: Optional[int] = None
     category_name: Optional[str] = None
+    category_ids: List[int] = Field(default_factory=list)
     category_names: List[str] = Field(default_factory=list)
     tags: List[str] = Field(default_factory=list)
     visibility_scope: List[str] = Field(default_factory=lambda: ['all'])
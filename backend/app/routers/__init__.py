@@ -36,6 +36,7 @@ from .coupons import router as coupons_router
 from .coupon_master import router as coupon_master_router
 from .cafe_menus import router as cafe_menus_router
 from .inquiries import router as inquiries_router
+from .search import router as search_router
 
 __all__ = [
     'auth_router', 
@@ -73,5 +74,6 @@ __all__ = [
     'coupon_master_router',
     'cafe_menus_router',
     'inquiries_router',
+    'search_router',
 ]
 
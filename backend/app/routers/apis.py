@@ -10,6 +10,7 @@ from app.config.database import query, query_one, execute_returning, execute
 from app.models.common import ApiResponse
 from app.middleware.auth import get_current_user
 from app.core.logger import logger
+from app.services.permission_service import PermissionService
 
 
 router = APIRouter(prefix="/api/v1/admin/apis", tags=["Admin APIs"])
@@ -149,6 +150,7 @@ async def create_api(
             }
         )
         
+        await PermissionService.notify_changed("create_api")
         return ApiResponse(success=True, data=result)
     except HTTPException:
         raise
@@ -214,6 +216,7 @@ async def update_api(
                 detail={"error": "NOT_FOUND", "message": "API를 찾을 수 없습니다."}
             )
         
+        await PermissionService.notify_changed("update_api")
         return ApiResponse(success=True, data=result)
     except HTTPException:
         raise
@@ -245,6 +248,7 @@ async def delete_api(
                 detail={"error": "NOT_FOUND", "message": "API를 찾을 수 없습니다."}
             )
         
+        await PermissionService.notify_changed("delete_api")
         return ApiResponse(success=True, data={"message": "삭제되었습니다."})
     except HTTPException:
         raise
@@ -14,6 +14,7 @@ from app.models.challenge import (
     QuizUpdateRequest,
 )
 from app.services.challenge_service import ChallengeService, QuizService
+from app.services.challenge_analytics_service import ChallengeAnalyticsService
 
 router = APIRouter(
     prefix="/api/v1/challenges",
@@ -125,6 +126,38 @@ async def delete_challenges(
     return {"message": f"{deleted_count}개의 챌린지가 삭제되었습니다.", "count": deleted_count}
 
 
+# ============================================
+# 챌린지 통계 API
+# ============================================
+
+@router.get("/{challenge_id}/analytics/timeseries", summary="챌린지 일자별 참여/인증 통계")
+async def get_challenge_timeseries(
+    challenge_id: str,
+    date_from: Optional[date] = Query(None, description="조회 시작일 (기본: 운영 시작일)"),
+    date_to: Optional[date] = Query(None, description="조회 종료일 (기본: 운영 종료일 또는 오늘)"),
+    service: ChallengeAnalyticsService = Depends()
+):
+    """일자별 참여자 수, 누적 참여자 수, 인증 건수, 인증 회원 수, 인증률을 조회합니다."""
+    return await service.get_timeseries(challenge_id, date_from=date_from, date_to=date_to)
+
+
+@router.get("/{challenge_id}/analytics/funnel", summary="챌린지 참여 퍼널 통계")
+async def get_challenge_funnel(
+    challenge_id: str,
+    service: ChallengeAnalyticsService = Depends()
+):
+    """참여 → 인증 → 목표 절반 달성 → 목표 달성 퍼널과 스탬프 분포를 조회합니다."""
+    return await service.get_funnel(challenge_id)
+
+
+@router.post("/analytics/refresh", summary="챌린지 통계 증분 집계 실행")
+async def refresh_challenge_analytics(
+    service: ChallengeAnalyticsService = Depends()
+):
+    """마지막 집계 이후 참여/인증 기록을 통계에 반영합니다."""
+    return await service.refresh()
+
+
 # ============================================
 # 퀴즈 관리 API
 # ============================================
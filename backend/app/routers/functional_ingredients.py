@@ -4,12 +4,18 @@
 # 기능성 성분 CRUD 및 기능성 매핑
 
 from typing import Optional, List
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, Depends, HTTPException, status, Query, UploadFile, File, Form
 from pydantic import BaseModel
 
 from app.lib.app_db import app_db_manager
 from app.middleware.auth import get_current_user
+from app.core.exceptions import ValidationError
 from app.core.logger import logger
+from app.services.catalog_import_service import CatalogImportService
+from app.services.mapping_service import MappingService, INGREDIENT_FUNCTIONALITIES
+from app.services.search_service import SearchService
+from app.services.supplement_search_index import SupplementSearchIndex
+from app.utils.search_filter import search_pattern, contains_pattern, ilike_condition
 
 
 router = APIRouter(prefix="/api/v1/admin/functional-ingredients", tags=["Functional Ingredients"])
@@ -83,36 +89,35 @@ async def get_functional_ingredients(
         params = []
 
         if ingredient_code:
-            conditions.append("fi.ingredient_code ILIKE %s")
-            params.append(f"%{ingredient_code}%")
+            conditions.append(ilike_condition("fi.ingredient_code", "%s"))
+            params.append(search_pattern(ingredient_code))
 
         if internal_name:
-            conditions.append("fi.internal_name ILIKE %s")
-            params.append(f"%{internal_name}%")
+            conditions.append(ilike_condition("fi.internal_name", "%s"))
+            params.append(search_pattern(internal_name))
 
         if external_name:
-            conditions.append("fi.external_name ILIKE %s")
-            params.append(f"%{external_name}%")
+            conditions.append(ilike_condition("fi.external_name", "%s"))
+            params.append(search_pattern(external_name))
 
         if indicator_component:
-            conditions.append("fi.indicator_component ILIKE %s")
-            params.append(f"%{indicator_component}%")
+            conditions.append(ilike_condition("fi.indicator_component", "%s"))
+            params.append(search_pattern(indicator_component))
 
+        # 기능성 내용/코드는 비정규화 검색 문서에서 조회 (app/services/supplement_search_index.py)
         if functionality_content:
-            conditions.append("""EXISTS (
-                SELECT 1 FROM public.ingredient_functionality_mapping ifm
-                JOIN public.functionality_contents fc ON ifm.functionality_id = fc.id
-                WHERE ifm.ingredient_id = fi.id AND fc.content ILIKE %s
+            conditions.append("""fi.id IN (
+                SELECT fsd.ingredient_id FROM public.functional_ingredient_search_documents fsd
+                WHERE fsd.functionality_texts ILIKE %s
             )""")
-            params.append(f"%{functionality_content}%")
+            params.append(contains_pattern(functionality_content))
 
         if functionality_code:
-            conditions.append("""EXISTS (
-                SELECT 1 FROM public.ingredient_functionality_mapping ifm
-                JOIN public.functionality_contents fc ON ifm.functionality_id = fc.id
-                WHERE ifm.ingredient_id = fi.id AND fc.functionality_code ILIKE %s
+            conditions.append("""fi.id IN (
+                SELECT fsd.ingredient_id FROM public.functional_ingredient_search_documents fsd
+                WHERE fsd.functionality_codes ILIKE %s
             )""")
-            params.append(f"%{functionality_code}%")
+            params.append(contains_pattern(functionality_code))
 
         where_clause = f"WHERE {' AND '.join(conditions)}" if conditions else ""
 
@@ -230,6 +235,7 @@ async def create_functional_ingredient(
                 row = await cur.fetchone()
                 await conn.commit()
 
+        SearchService.schedule_sync("functional_ingredient", [row['id']])
         return {"success": True, "data": {"id": row['id'], "ingredient_code": new_code}}
     except HTTPException:
         raise
@@ -238,6 +244,28 @@ async def create_functional_ingredient(
         raise HTTPException(status_code=500, detail={"error": "INTERNAL_ERROR", "message": "서버 오류가 발생했습니다."})
 
 
+@router.post("/import")
+async def import_functional_ingredients(
+    file: UploadFile = File(...),
+    dry_run: bool = Form(default=False),
+    current_user=Depends(get_current_user)
+):
+    """
+    기능성 성분 일괄 등록 (CSV / XLSX)
+
+    성분코드(ingredient_code)가 같은 성분은 수정, 코드가 없으면 코드를 새로 할당해 등록.
+    오류 행은 건너뛰고 행 번호별 사유를 errors 로 반환한다. dry_run=true 면 검증만 수행.
+    """
+    try:
+        report = await CatalogImportService.import_upload(file, "functional_ingredient", dry_run=dry_run)
+        return {"success": True, "data": report}
+    except ValidationError as e:
+        raise HTTPException(status_code=400, detail={"error": e.error_code, "message": e.message})
+    except Exception as e:
+        logger.error(f"기능성 성분 일괄 등록 오류: {str(e)}", exc_info=True)
+        raise HTTPException(status_code=500, detail={"error": "INTERNAL_ERROR", "message": "서버 오류가 발생했습니다."})
+
+
 @router.put("/{ingredient_id}")
 async def update_functional_ingredient(
     ingredient_id: int,
@@ -281,11 +309,15 @@ async def update_functional_ingredient(
                     ]
                 )
                 row = await cur.fetchone()
+                if row:
+                    # 성분명이 영양제 검색 문서에 포함되므로 함께 갱신
+                    await SupplementSearchIndex.refresh_ingredients(cur, [ingredient_id])
                 await conn.commit()
 
         if not row:
             raise HTTPException(status_code=404, detail={"error": "NOT_FOUND", "message": "기능성 성분을 찾을 수 없습니다."})
 
+        SearchService.schedule_sync("functional_ingredient", [row['id']])
         return {"success": True, "data": {"id": row['id']}}
     except HTTPException:
         raise
@@ -308,12 +340,16 @@ async def delete_functional_ingredients(
         
         async with app_db_manager.get_async_conn() as conn:
             async with conn.cursor() as cur:
+                affected_products = await SupplementSearchIndex.products_containing(cur, body.ids)
                 await cur.execute(
                     f"DELETE FROM public.functional_ingredients WHERE id IN ({placeholders})",
                     body.ids
                 )
+                await SupplementSearchIndex.refresh_products(cur, affected_products)
                 await conn.commit()
 
+        SearchService.schedule_sync("functional_ingredient", body.ids)
+
         return {"success": True, "data": {"deleted": len(body.ids)}}
     except HTTPException:
         raise
@@ -360,28 +396,18 @@ async def save_ingredient_functionalities(
     body: SaveFunctionalitiesRequest,
     current_user=Depends(get_current_user)
 ):
-    """기능성 성분에 기능성 매핑"""
+    """기능성 성분에 기능성 매핑 (요청 목록과 현재 매핑의 차이만 반영)"""
     try:
         async with app_db_manager.get_async_conn() as conn:
             async with conn.cursor() as cur:
-                # 기존 매핑 삭제
-                await cur.execute(
-                    "DELETE FROM public.ingredient_functionality_mapping WHERE ingredient_id = %s",
-                    [ingredient_id]
+                counts = await MappingService.sync(
+                    cur, INGREDIENT_FUNCTIONALITIES, ingredient_id,
+                    [{"functionality_id": func_id} for func_id in body.functionality_ids]
                 )
-
-                # 새 매핑 추가
-                for func_id in body.functionality_ids:
-                    await cur.execute(
-                        """INSERT INTO public.ingredient_functionality_mapping 
-                            (ingredient_id, functionality_id)
-                        VALUES (%s, %s)""",
-                        [ingredient_id, func_id]
-                    )
-
+                await SupplementSearchIndex.refresh_ingredients(cur, [ingredient_id])
                 await conn.commit()
 
-        return {"success": True, "data": {"message": "기능성 매핑이 저장되었습니다."}}
+        return {"success": True, "data": {"message": "기능성 매핑이 저장되었습니다.", **counts}}
     except Exception as e:
         logger.error(f"기능성 매핑 저장 오류: {str(e)}", exc_info=True)
         raise HTTPException(status_code=500, detail={"error": "INTERNAL_ERROR", "message": "서버 오류가 발생했습니다."})
@@ -398,18 +424,15 @@ async def delete_ingredient_functionalities(
         if not body.functionality_ids:
             raise HTTPException(status_code=400, detail={"error": "VALIDATION_ERROR", "message": "삭제할 항목을 선택해주세요."})
 
-        placeholders = ", ".join(["%s" for _ in body.functionality_ids])
-
         async with app_db_manager.get_async_conn() as conn:
             async with conn.cursor() as cur:
-                await cur.execute(
-                    f"""DELETE FROM public.ingredient_functionality_mapping 
-                        WHERE ingredient_id = %s AND functionality_id IN ({placeholders})""",
-                    [ingredient_id] + body.functionality_ids
+                deleted = await MappingService.remove(
+                    cur, INGREDIENT_FUNCTIONALITIES, ingredient_id, body.functionality_ids
                 )
+                await SupplementSearchIndex.refresh_ingredients(cur, [ingredient_id])
                 await conn.commit()
 
-        return {"success": True, "data": {"deleted": len(body.functionality_ids)}}
+        return {"success": True, "data": {"deleted": deleted}}
     except HTTPException:
         raise
     except Exception as e:
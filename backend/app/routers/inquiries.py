@@ -11,7 +11,9 @@ from app.config.database import query, query_one, execute_returning
 from app.models.common import ApiResponse
 from app.middleware.auth import get_current_user
 from app.core.logger import logger
+from app.services.search_service import SearchService
 from app.utils.masking import mask_email, mask_name as mask_name_global, mask_user_id
+from app.utils.search_filter import search_pattern, ilike_condition
 
 
 router = APIRouter(prefix="/api/v1/admin/inquiries", tags=["Inquiries"])
@@ -89,8 +91,8 @@ async def get_inquiries(
         
         # 문의 내용 검색
         if content:
-            conditions.append("i.content ILIKE %(content)s")
-            params["content"] = f"%{content}%"
+            conditions.append(ilike_condition("i.content", "%(content)s"))
+            params["content"] = search_pattern(content)
         
         # 처리상태 필터 (answered, pending)
         if status:
@@ -334,6 +336,7 @@ async def answer_inquiry(
                 detail={"error": "NOT_FOUND", "message": "문의를 찾을 수 없습니다."}
             )
         
+        SearchService.schedule_sync("inquiry", [inquiry_id])
         return ApiResponse(success=True, data=result)
     except HTTPException:
         raise
@@ -2,14 +2,20 @@
 # 로그 API 라우터
 # ============================================
 # 접속 로그, 개인정보 접근 로그
+# 로그 테이블은 login_at 월별 파티션 (schema.sql 39) - 기간 조건은 반열린 구간으로 전달해 해당 월 파티션만 조회
 
-from typing import Optional
+import base64
+import binascii
+from datetime import date, datetime, timedelta
+from typing import Any, Dict, List, Optional
+from uuid import UUID
 from fastapi import APIRouter, Depends, HTTPException, status, Query
 
 from app.config.database import query, query_one
 from app.middleware.auth import get_current_user
 from app.core.logger import logger
 from app.utils.masking import mask_user_id, mask_name
+from app.utils.search_filter import search_pattern, ilike_condition
 
 
 def _mask_log_records(records):
@@ -22,6 +28,48 @@ def _mask_log_records(records):
     return records
 
 
+def _add_time_conditions(
+    conditions: List[str],
+    params: Dict[str, Any],
+    login_from: Optional[str],
+    login_to: Optional[str],
+    cursor: Optional[str],
+) -> Optional[str]:
+    """
+    로그인 기간 조건 추가 / 키셋 커서 조건 반환
+
+    - login_from ~ login_to (일 단위, 종료일 포함) → login_at >= 시작 AND login_at < 종료일 + 1일
+    - cursor: 이전 페이지 마지막 행 (login_at, id) 이후 (OFFSET 없이 다음 페이지)
+      전체 개수에는 적용하지 않도록 conditions 에 넣지 않고 반환 (데이터 조회에만 사용)
+    """
+    try:
+        if login_from:
+            params["login_from"] = datetime.combine(date.fromisoformat(login_from[:10]), datetime.min.time())
+            conditions.append("login_at >= %(login_from)s")
+        if login_to:
+            params["login_to"] = datetime.combine(date.fromisoformat(login_to[:10]) + timedelta(days=1), datetime.min.time())
+            conditions.append("login_at < %(login_to)s")
+        if cursor:
+            login_at, row_id = base64.urlsafe_b64decode(cursor.encode()).decode().split("|", 1)
+            params["cursor_at"] = datetime.fromisoformat(login_at)
+            params["cursor_id"] = str(UUID(row_id))
+            return "(login_at, id) < (%(cursor_at)s, %(cursor_id)s::uuid)"
+        return None
+    except (ValueError, binascii.Error, UnicodeDecodeError):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail={"error": "VALIDATION_ERROR", "message": "조회 기간 또는 커서 형식이 올바르지 않습니다."}
+        )
+
+
+def _next_cursor(records: List[Dict[str, Any]], limit: int) -> Optional[str]:
+    """다음 페이지 커서 (마지막 행의 login_at, id), 마지막 페이지면 None"""
+    if len(records) < limit:
+        return None
+    last = records[-1]
+    return base64.urlsafe_b64encode(f"{last['login_at'].isoformat()}|{last['id']}".encode()).decode()
+
+
 router = APIRouter(prefix="/api/v1/admin/logs", tags=["Logs"])
 
 
@@ -34,6 +82,7 @@ async def get_access_logs(
     login_to: Optional[str] = Query(None, description="로그인 종료일"),
     page: int = Query(1, ge=1, description="페이지"),
     limit: int = Query(20, ge=1, le=100, description="페이지 크기"),
+    cursor: Optional[str] = Query(None, description="다음 페이지 커서 (지정 시 page 대신 사용)"),
     current_user=Depends(get_current_user)
 ):
     """
@@ -44,26 +93,22 @@ async def get_access_logs(
         params = {}
         
         if user_id:
-            conditions.append("user_id ILIKE %(user_id)s")
-            params["user_id"] = f"%{user_id}%"
+            conditions.append(ilike_condition("user_id", "%(user_id)s"))
+            params["user_id"] = search_pattern(user_id)
         
         if user_name:
-            conditions.append("user_name ILIKE %(user_name)s")
-            params["user_name"] = f"%{user_name}%"
+            conditions.append(ilike_condition("user_name", "%(user_name)s"))
+            params["user_name"] = search_pattern(user_name)
         
         if device_type:
-            conditions.append("device_type ILIKE %(device_type)s")
-            params["device_type"] = f"%{device_type}%"
+            conditions.append(ilike_condition("device_type", "%(device_type)s"))
+            params["device_type"] = search_pattern(device_type)
         
-        if login_from:
-            conditions.append("login_at >= %(login_from)s::timestamp")
-            params["login_from"] = login_from
-        
-        if login_to:
-            conditions.append("login_at <= %(login_to)s::timestamp + interval '1 day'")
-            params["login_to"] = login_to
+        cursor_condition = _add_time_conditions(conditions, params, login_from, login_to, cursor)
         
         where_clause = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+        data_conditions = conditions + [cursor_condition] if cursor_condition else conditions
+        data_where_clause = f"WHERE {' AND '.join(data_conditions)}" if data_conditions else ""
         
         # 전체 개수 조회
         count_sql = f"SELECT COUNT(*) as count FROM public.admin_access_logs {where_clause}"
@@ -71,7 +116,7 @@ async def get_access_logs(
         total = int(count_result.get("count", 0)) if count_result else 0
         
         # 데이터 조회
-        offset = (page - 1) * limit
+        offset = 0 if cursor else (page - 1) * limit
         params["limit"] = limit
         params["offset"] = offset
         
@@ -79,12 +124,13 @@ async def get_access_logs(
             SELECT id, user_id, user_name, device_type, os, browser,
                    ip_address, login_at, logout_at, created_at
             FROM public.admin_access_logs
-            {where_clause}
-            ORDER BY login_at DESC
+            {data_where_clause}
+            ORDER BY login_at DESC, id DESC
             LIMIT %(limit)s OFFSET %(offset)s
         """
         
         data = await query(data_sql, params)
+        next_cursor = _next_cursor(data, limit)
 
         # 응답 직전 개인정보 마스킹 (정보 누출 취약점 대응)
         data = _mask_log_records(data)
@@ -96,9 +142,12 @@ async def get_access_logs(
                 "page": page,
                 "limit": limit,
                 "total": total,
-                "total_pages": (total + limit - 1) // limit if limit > 0 else 0
+                "total_pages": (total + limit - 1) // limit if limit > 0 else 0,
+                "next_cursor": next_cursor
             }
         }
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"접속 로그 조회 오류: {str(e)}", exc_info=True)
         raise HTTPException(
@@ -118,6 +167,7 @@ async def get_personal_info_logs(
     login_to: Optional[str] = Query(None, description="로그인 종료일"),
     page: int = Query(1, ge=1, description="페이지"),
     limit: int = Query(20, ge=1, le=100, description="페이지 크기"),
+    cursor: Optional[str] = Query(None, description="다음 페이지 커서 (지정 시 page 대신 사용)"),
     current_user=Depends(get_current_user)
 ):
     """
@@ -128,34 +178,30 @@ async def get_personal_info_logs(
         params = {}
         
         if user_id:
-            conditions.append("user_id ILIKE %(user_id)s")
-            params["user_id"] = f"%{user_id}%"
+            conditions.append(ilike_condition("user_id", "%(user_id)s"))
+            params["user_id"] = search_pattern(user_id)
         
         if user_name:
-            conditions.append("user_name ILIKE %(user_name)s")
-            params["user_name"] = f"%{user_name}%"
+            conditions.append(ilike_condition("user_name", "%(user_name)s"))
+            params["user_name"] = search_pattern(user_name)
         
         if business_code:
-            conditions.append("business_code ILIKE %(business_code)s")
-            params["business_code"] = f"%{business_code}%"
+            conditions.append(ilike_condition("business_code", "%(business_code)s"))
+            params["business_code"] = search_pattern(business_code)
         
         if survey_id:
-            conditions.append("survey_id ILIKE %(survey_id)s")
-            params["survey_id"] = f"%{survey_id}%"
+            conditions.append(ilike_condition("survey_id", "%(survey_id)s"))
+            params["survey_id"] = search_pattern(survey_id)
         
         if device_type:
-            conditions.append("device_type ILIKE %(device_type)s")
-            params["device_type"] = f"%{device_type}%"
-        
-        if login_from:
-            conditions.append("login_at >= %(login_from)s::timestamp")
-            params["login_from"] = login_from
+            conditions.append(ilike_condition("device_type", "%(device_type)s"))
+            params["device_type"] = search_pattern(device_type)
         
-        if login_to:
-            conditions.append("login_at <= %(login_to)s::timestamp + interval '1 day'")
-            params["login_to"] = login_to
+        cursor_condition = _add_time_conditions(conditions, params, login_from, login_to, cursor)
         
         where_clause = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+        data_conditions = conditions + [cursor_condition] if cursor_condition else conditions
+        data_where_clause = f"WHERE {' AND '.join(data_conditions)}" if data_conditions else ""
         
         # 전체 개수 조회
         count_sql = f"SELECT COUNT(*) as count FROM public.personal_info_access_logs {where_clause}"
@@ -163,7 +209,7 @@ async def get_personal_info_logs(
         total = int(count_result.get("count", 0)) if count_result else 0
         
         # 데이터 조회
-        offset = (page - 1) * limit
+        offset = 0 if cursor else (page - 1) * limit
         params["limit"] = limit
         params["offset"] = offset
         
@@ -171,12 +217,13 @@ async def get_personal_info_logs(
             SELECT id, user_id, user_name, business_code, survey_id,
                    device_type, os, browser, ip_address, login_at, logout_at, created_at
             FROM public.personal_info_access_logs
-            {where_clause}
-            ORDER BY login_at DESC
+            {data_where_clause}
+            ORDER BY login_at DESC, id DESC
             LIMIT %(limit)s OFFSET %(offset)s
         """
         
         data = await query(data_sql, params)
+        next_cursor = _next_cursor(data, limit)
 
         # 응답 직전 개인정보 마스킹 (정보 누출 취약점 대응)
         data = _mask_log_records(data)
@@ -188,9 +235,12 @@ async def get_personal_info_logs(
                 "page": page,
                 "limit": limit,
                 "total": total,
-                "total_pages": (total + limit - 1) // limit if limit > 0 else 0
+                "total_pages": (total + limit - 1) // limit if limit > 0 else 0,
+                "next_cursor": next_cursor
             }
         }
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"개인정보 접근 로그 조회 오류: {str(e)}", exc_info=True)
         raise HTTPException(
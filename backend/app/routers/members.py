@@ -10,6 +10,7 @@ from app.config.database import query, query_one
 from app.models.common import ApiResponse
 from app.middleware.auth import get_current_user
 from app.core.logger import logger
+from app.utils.search_filter import search_pattern, ilike_condition
 
 
 router = APIRouter(prefix="/api/v1/members", tags=["Members"])
@@ -98,12 +99,12 @@ async def get_members(
         params = {}
         
         if name:
-            conditions.append("name ILIKE %(name)s")
-            params["name"] = f"%{name}%"
+            conditions.append(ilike_condition("name", "%(name)s"))
+            params["name"] = search_pattern(name)
         
         if id:
-            conditions.append("email ILIKE %(email)s")
-            params["email"] = f"%{id}%"
+            conditions.append(ilike_condition("email", "%(email)s"))
+            params["email"] = search_pattern(id)
         
         # 생년월일 조건
         if birth_year:
@@ -140,12 +141,12 @@ async def get_members(
             # 숫자만 추출해서 검색
             import re
             clean_phone = re.sub(r'\D', '', phone)
-            conditions.append("phone ILIKE %(phone)s")
-            params["phone"] = f"%{clean_phone}%"
+            conditions.append(ilike_condition("phone", "%(phone)s"))
+            params["phone"] = search_pattern(clean_phone)
         
         if business_code:
-            conditions.append("business_code ILIKE %(business_code)s")
-            params["business_code"] = f"%{business_code}%"
+            conditions.append(ilike_condition("business_code", "%(business_code)s"))
+            params["business_code"] = search_pattern(business_code)
         
         if created_from:
             conditions.append("created_at >= %(created_from)s")
@@ -1,42 +1,23 @@
 # ============================================
 # 어드민 메뉴 API 라우터
 # ============================================
-# 메뉴 CRUD
+# 메뉴 CRUD + 현재 관리자 메뉴 트리(역할별 사전 계산) + 노출 순서 일괄 변경
 
-from typing import Optional, List, Dict, Any
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from typing import Optional
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status, Query
 
 from app.config.database import query, query_one, execute_returning, execute
 from app.models.common import ApiResponse
 from app.middleware.auth import get_current_user
 from app.core.logger import logger
+from app.core.metrics import record_cache
+from app.services.menu_service import MenuService, build_menu_tree
+from app.services.permission_service import PermissionService
 
 
 router = APIRouter(prefix="/api/v1/admin/menus", tags=["Menus"])
 
 
-def build_menu_tree(menus: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-    """메뉴를 트리 구조로 변환"""
-    menu_map = {}
-    roots = []
-    
-    # 모든 메뉴를 맵에 저장
-    for menu in menus:
-        menu_map[menu["id"]] = {**menu, "children": []}
-    
-    # 트리 구조 생성
-    for menu in menus:
-        menu_node = menu_map[menu["id"]]
-        if menu["parent_id"] is None:
-            roots.append(menu_node)
-        else:
-            parent = menu_map.get(menu["parent_id"])
-            if parent:
-                parent["children"].append(menu_node)
-    
-    return roots
-
-
 @router.get("")
 async def get_menus(
     parent_id: Optional[str] = Query(None, description="상위 메뉴 ID"),
@@ -90,6 +71,30 @@ async def get_menus(
         )
 
 
+@router.get("/me")
+async def get_my_menus(
+    request: Request,
+    current_user=Depends(get_current_user)
+):
+    """
+    현재 관리자 메뉴 트리 (역할별 읽기 권한 메뉴, 사전 인코딩 본문 + ETag)
+    """
+    try:
+        body, etag = await MenuService.get_tree(current_user)
+        headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+        not_modified = etag in request.headers.get("if-none-match", "")
+        record_cache("menu_tree_etag", not_modified)
+        if not_modified:
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+        return Response(content=body, media_type="application/json", headers=headers)
+    except Exception as e:
+        logger.error(f"메뉴 트리 조회 오류: {str(e)}", exc_info=True)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail={"error": "FETCH_ERROR", "message": "메뉴 조회 중 오류가 발생했습니다."}
+        )
+
+
 @router.get("/{menu_id}")
 async def get_menu(
     menu_id: int,
@@ -192,6 +197,7 @@ async def create_menu(
             }
         )
         
+        await PermissionService.notify_changed("create_menu")
         return ApiResponse(success=True, data=result)
     except HTTPException:
         raise
@@ -203,6 +209,54 @@ async def create_menu(
         )
 
 
+@router.put("/sort-order")
+async def update_menu_sort_order(
+    body: dict,
+    current_user=Depends(get_current_user)
+):
+    """
+    메뉴 노출 순서 일괄 변경 (단일 UPDATE)
+
+    body: {"items": [{"id": 메뉴 ID, "sort_order": 순서}, ...]}
+    """
+    try:
+        items = body.get("items")
+        if not isinstance(items, list) or not items:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail={"error": "VALIDATION_ERROR", "message": "변경할 메뉴 목록은 필수입니다."}
+            )
+        try:
+            orders = {int(item["id"]): int(item["sort_order"]) for item in items}
+        except (KeyError, TypeError, ValueError):
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail={"error": "VALIDATION_ERROR", "message": "id, sort_order 는 숫자여야 합니다."}
+            )
+        
+        affected = await execute(
+            """
+            UPDATE public.admin_menus AS m
+            SET sort_order = u.sort_order, updated_at = NOW()
+            FROM unnest(%(ids)s::int[], %(orders)s::int[]) AS u(id, sort_order)
+            WHERE m.id = u.id AND m.sort_order IS DISTINCT FROM u.sort_order
+            """,
+            {"ids": list(orders.keys()), "orders": list(orders.values())}
+        )
+        
+        if affected:
+            await PermissionService.notify_changed("update_menu_sort_order")
+        return ApiResponse(success=True, data={"updated": affected})
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"메뉴 순서 변경 오류: {str(e)}", exc_info=True)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail={"error": "UPDATE_ERROR", "message": "메뉴 순서 변경 중 오류가 발생했습니다."}
+        )
+
+
 @router.put("/{menu_id}")
 async def update_menu(
     menu_id: int,
@@ -261,6 +315,7 @@ async def update_menu(
                 detail={"error": "NOT_FOUND", "message": "메뉴를 찾을 수 없습니다."}
             )
         
+        await PermissionService.notify_changed("update_menu")
         return ApiResponse(success=True, data=result)
     except HTTPException:
         raise
@@ -292,6 +347,7 @@ async def delete_menu(
                 detail={"error": "NOT_FOUND", "message": "메뉴를 찾을 수 없습니다."}
             )
         
+        await PermissionService.notify_changed("delete_menu")
         return ApiResponse(success=True, data={"message": "삭제되었습니다."})
     except HTTPException:
         raise
@@ -7,33 +7,21 @@ from typing import Optional
 from fastapi import APIRouter, Depends, HTTPException, Query
 from fastapi import status as http_status
 
-from app.config.database import query, query_one, execute_returning, execute
+from app.config.database import query, query_one, execute
+from app.core.decorators import transaction_context
 from app.models.common import ApiResponse
 from app.middleware.auth import get_current_user
 from app.core.logger import logger
+from app.services.search_service import SearchService
+from app.services.status_service import StatusService
 from app.utils.validators import validate_image_url
 
 
 router = APIRouter(prefix="/api/v1/admin/notices", tags=["Notices"])
 
 
-def calculate_status(notice: dict) -> str:
-    """공지 상태 계산"""
-    from datetime import date
-    
-    if not notice.get("is_active"):
-        return "ended"
-    
-    today = date.today()
-    start_date = notice.get("start_date")
-    end_date = notice.get("end_date")
-    
-    if start_date and today < start_date:
-        return "scheduled"
-    if end_date and today > end_date:
-        return "ended"
-    
-    return "active"
+# 상태 필터 별칭 (화면 필터 값 → 저장 상태값)
+STATUS_ALIASES = {"before": "scheduled"}
 
 
 @router.get("")
@@ -75,6 +63,13 @@ async def get_notices(
             conditions.append("created_at <= %(created_to)s")
             params["created_to"] = created_to + " 23:59:59"
         
+        # 상태 필터 (저장 상태 컬럼, app/services/status_service.py 에서 갱신)
+        if status:
+            statuses = [STATUS_ALIASES.get(value.strip(), value.strip()) for value in status.split(",") if value.strip()]
+            if statuses:
+                conditions.append("status = ANY(%(statuses)s::text[])")
+                params["statuses"] = statuses
+        
         if visibility_scope:
             conditions.append("%(visibility_scope)s = ANY(visibility_scope)")
             params["visibility_scope"] = visibility_scope
@@ -86,7 +81,7 @@ async def get_notices(
         where_clause = f"WHERE {' AND '.join(conditions)}" if conditions else ""
         
         # 정렬 검증
-        allowed_sort_fields = ["title", "created_at", "updated_at", "is_active", "start_date", "end_date"]
+        allowed_sort_fields = ["title", "created_at", "updated_at", "is_active", "start_date", "end_date", "status"]
         safe_field = sort_field if sort_field in allowed_sort_fields else "created_at"
         safe_direction = "ASC" if sort_direction.upper() == "ASC" else "DESC"
         
@@ -109,7 +104,7 @@ async def get_notices(
                    COALESCE(visibility_scope, ARRAY['all']) as visibility_scope,
                    COALESCE(company_codes, ARRAY[]::TEXT[]) as company_codes,
                    COALESCE(store_visible, false) as store_visible,
-                   start_date, end_date,
+                   start_date, end_date, status,
                    is_active, created_at, updated_at
             FROM notices
             {where_clause}
@@ -120,17 +115,9 @@ async def get_notices(
             use_app_db=True
         )
         
-        # 상태 계산 추가
-        formatted_notices = []
-        for notice in notices:
-            formatted_notices.append({
-                **notice,
-                "status": calculate_status(notice)
-            })
-        
         return {
             "success": True,
-            "data": formatted_notices,
+            "data": notices,
             "pagination": {
                 "page": page,
                 "limit": actual_page_size,
@@ -161,7 +148,7 @@ async def get_notice(
                    COALESCE(visibility_scope, ARRAY['all']) as visibility_scope,
                    COALESCE(company_codes, ARRAY[]::TEXT[]) as company_codes,
                    COALESCE(store_visible, false) as store_visible,
-                   start_date, end_date,
+                   start_date, end_date, status,
                    is_active, created_at, updated_at
             FROM notices 
             WHERE id = %(notice_id)s
@@ -176,8 +163,6 @@ async def get_notice(
                 detail={"error": "NOT_FOUND", "message": "공지사항을 찾을 수 없습니다."}
             )
         
-        notice["status"] = calculate_status(notice)
-        
         return ApiResponse(success=True, data=notice)
     except HTTPException:
         raise
@@ -214,28 +199,34 @@ async def create_notice(
                 detail={"error": "VALIDATION_ERROR", "message": "제목을 입력해주세요."}
             )
         
-        result = await execute_returning(
-            """
-            INSERT INTO notices (title, content, image_url, visibility_scope, company_codes, 
-                                store_visible, start_date, end_date, is_active)
-            VALUES (%(title)s, %(content)s, %(image_url)s, %(visibility_scope)s, %(company_codes)s,
-                    %(store_visible)s, %(start_date)s, %(end_date)s, %(is_active)s)
-            RETURNING id
-            """,
-            {
-                "title": title.strip(),
-                "content": content.strip() if content else None,
-                "image_url": image_url,
-                "visibility_scope": visibility_scope,
-                "company_codes": company_codes,
-                "store_visible": store_visible,
-                "start_date": start_date,
-                "end_date": end_date,
-                "is_active": is_active
-            },
-            use_app_db=True
-        )
-        
+        # 등록 + 상태 저장 (같은 트랜잭션)
+        async with transaction_context(use_app_db=True) as conn:
+            async with conn.cursor() as cur:
+                await cur.execute(
+                    """
+                    INSERT INTO notices (title, content, image_url, visibility_scope, company_codes, 
+                                        store_visible, start_date, end_date, is_active)
+                    VALUES (%(title)s, %(content)s, %(image_url)s, %(visibility_scope)s, %(company_codes)s,
+                            %(store_visible)s, %(start_date)s, %(end_date)s, %(is_active)s)
+                    RETURNING id
+                    """,
+                    {
+                        "title": title.strip(),
+                        "content": content.strip() if content else None,
+                        "image_url": image_url,
+                        "visibility_scope": visibility_scope,
+                        "company_codes": company_codes,
+                        "store_visible": store_visible,
+                        "start_date": start_date,
+                        "end_date": end_date,
+                        "is_active": is_active
+                    }
+                )
+                result = await cur.fetchone()
+                status_changes = await StatusService.refresh(cur, "notice", [result["id"]])
+        
+        await StatusService.publish("notice", status_changes)
+        SearchService.schedule_sync("notice", [result.get("id")])
         return ApiResponse(success=True, data={"id": result.get("id")})
     except HTTPException:
         raise
@@ -288,16 +279,26 @@ async def update_notice(
         
         update_fields.append("updated_at = NOW()")
         
-        result = await execute_returning(
-            f"""
-            UPDATE notices
-            SET {', '.join(update_fields)}
-            WHERE id = %(notice_id)s
-            RETURNING *
-            """,
-            params,
-            use_app_db=True
-        )
+        # 수정 + 상태 저장 (같은 트랜잭션)
+        status_changes = []
+        async with transaction_context(use_app_db=True) as conn:
+            async with conn.cursor() as cur:
+                await cur.execute(
+                    f"""
+                    UPDATE notices
+                    SET {', '.join(update_fields)}
+                    WHERE id = %(notice_id)s
+                    RETURNING *
+                    """,
+                    params
+                )
+                result = await cur.fetchone()
+                if result:
+                    status_changes = await StatusService.refresh(cur, "notice", [notice_id])
+                    for change in status_changes:
+                        result["status"] = change["to"]
+        
+        await StatusService.publish("notice", status_changes)
         
         if not result:
             raise HTTPException(
@@ -305,6 +306,7 @@ async def update_notice(
                 detail={"error": "NOT_FOUND", "message": "공지사항을 찾을 수 없습니다."}
             )
         
+        SearchService.schedule_sync("notice", [notice_id])
         return ApiResponse(success=True, data=result)
     except HTTPException:
         raise
@@ -340,6 +342,7 @@ async def batch_delete_notices(
             use_app_db=True
         )
         
+        SearchService.schedule_sync("notice", ids)
         return ApiResponse(success=True, data={"deleted_count": affected})
     except HTTPException:
         raise
@@ -372,6 +375,7 @@ async def delete_notice(
                 detail={"error": "NOT_FOUND", "message": "공지사항을 찾을 수 없습니다."}
             )
         
+        SearchService.schedule_sync("notice", [notice_id])
         return ApiResponse(success=True, data={"message": "삭제되었습니다."})
     except HTTPException:
         raise
@@ -10,7 +10,10 @@ from fastapi import status as http_status
 from app.config.database import query, query_one, execute_returning, execute
 from app.models.common import ApiResponse
 from app.middleware.auth import get_current_user
+from app.core.exceptions import AppException
 from app.core.logger import logger
+from app.services.push_dispatch_service import PushDispatchService
+from app.services.push_scheduler import PushScheduler
 from app.utils.validators import validate_link_url
 
 
@@ -224,6 +227,23 @@ async def get_target_companies(
         )
 
 
+@router.get("/scheduler/status")
+async def get_push_scheduler_status(
+    current_user=Depends(get_current_user)
+):
+    """
+    PUSH 예약 스케줄러 상태 (예약 큐 깊이, 실행 대기 수, 지연)
+    """
+    try:
+        return ApiResponse(success=True, data=await PushScheduler.stats())
+    except Exception as e:
+        logger.error(f"PUSH 스케줄러 상태 조회 오류: {str(e)}", exc_info=True)
+        raise HTTPException(
+            status_code=http_status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail={"error": "INTERNAL_ERROR", "message": "서버 오류가 발생했습니다."}
+        )
+
+
 @router.get("/{push_id}")
 async def get_push_notification(
     push_id: str,
@@ -354,6 +374,9 @@ async def create_push_notification(
             use_app_db=True
         )
         
+        # 발송 시각 예약
+        await PushScheduler.reschedule(result.get("id"))
+        
         return ApiResponse(success=True, data={"id": result.get("id")})
     except HTTPException:
         raise
@@ -475,6 +498,10 @@ async def update_push_notification(
                 detail={"error": "NOT_FOUND", "message": "푸시 알림을 찾을 수 없습니다."}
             )
         
+        # 발송 시각/사용여부/발송유형 변경 시 해당 캠페인만 재예약
+        if body.keys() & {"send_type", "send_type_detail", "send_time", "is_active"}:
+            await PushScheduler.reschedule(push_id)
+        
         return ApiResponse(success=True, data=result)
     except HTTPException:
         raise
@@ -507,6 +534,8 @@ async def delete_push_notification(
                 detail={"error": "NOT_FOUND", "message": "푸시 알림을 찾을 수 없습니다."}
             )
         
+        await PushScheduler.unschedule([push_id])
+        
         return ApiResponse(success=True, data={"message": "삭제되었습니다."})
     except HTTPException:
         raise
@@ -541,6 +570,8 @@ async def batch_delete_push_notifications(
             use_app_db=True
         )
         
+        await PushScheduler.unschedule(ids)
+        
         return ApiResponse(success=True, data={"deleted_count": affected})
     except HTTPException:
         raise
@@ -551,3 +582,95 @@ async def batch_delete_push_notifications(
             detail={"error": "INTERNAL_ERROR", "message": "서버 오류가 발생했습니다."}
         )
 
+
+# ============================================
+# PUSH 발송
+# ============================================
+
+@router.post("/{push_id}/dispatch", status_code=http_status.HTTP_202_ACCEPTED)
+async def dispatch_push_notification(
+    push_id: str,
+    current_user=Depends(get_current_user)
+):
+    """
+    PUSH 알림 발송 시작 (백그라운드 발송, 진행 상황은 발송 이력 조회)
+    """
+    try:
+        requested_by = current_user.name if current_user else ""
+        dispatch = await PushDispatchService.dispatch_campaign(push_id, requested_by=requested_by)
+        return ApiResponse(success=True, data=dispatch)
+    except AppException:
+        raise
+    except Exception as e:
+        logger.error(f"PUSH 발송 시작 오류: {str(e)}", exc_info=True)
+        raise HTTPException(
+            status_code=http_status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail={"error": "INTERNAL_ERROR", "message": "서버 오류가 발생했습니다."}
+        )
+
+
+@router.get("/{push_id}/dispatches")
+async def get_push_dispatches(
+    push_id: str,
+    limit: int = Query(20, ge=1, le=100, description="조회 개수"),
+    current_user=Depends(get_current_user)
+):
+    """
+    PUSH 알림 발송 이력 조회 (최신순)
+    """
+    try:
+        dispatches = await PushDispatchService.list_dispatches(push_id, limit=limit)
+        return ApiResponse(success=True, data=dispatches)
+    except Exception as e:
+        logger.error(f"PUSH 발송 이력 조회 오류: {str(e)}", exc_info=True)
+        raise HTTPException(
+            status_code=http_status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail={"error": "INTERNAL_ERROR", "message": "서버 오류가 발생했습니다."}
+        )
+
+
+@router.get("/dispatches/{dispatch_id}")
+async def get_push_dispatch(
+    dispatch_id: str,
+    current_user=Depends(get_current_user)
+):
+    """
+    PUSH 발송 진행 상황 조회
+    """
+    try:
+        dispatch = await PushDispatchService.get_dispatch(dispatch_id)
+        return ApiResponse(success=True, data=dispatch)
+    except AppException:
+        raise
+    except Exception as e:
+        logger.error(f"PUSH 발송 진행 상황 조회 오류: {str(e)}", exc_info=True)
+        raise HTTPException(
+            status_code=http_status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail={"error": "INTERNAL_ERROR", "message": "서버 오류가 발생했습니다."}
+        )
+
+
+@router.post("/dispatches/{dispatch_id}/cancel")
+async def cancel_push_dispatch(
+    dispatch_id: str,
+    current_user=Depends(get_current_user)
+):
+    """
+    PUSH 발송 취소 (요청을 받은 서버에서 실행 중인 발송만 취소 가능)
+    """
+    try:
+        cancelled = await PushDispatchService.cancel(dispatch_id)
+        if not cancelled:
+            raise HTTPException(
+                status_code=http_status.HTTP_409_CONFLICT,
+                detail={"error": "NOT_RUNNING", "message": "이 서버에서 진행 중인 발송이 아닙니다."}
+            )
+        return ApiResponse(success=True, data=await PushDispatchService.get_dispatch(dispatch_id))
+    except (HTTPException, AppException):
+        raise
+    except Exception as e:
+        logger.error(f"PUSH 발송 취소 오류: {str(e)}", exc_info=True)
+        raise HTTPException(
+            status_code=http_status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail={"error": "INTERNAL_ERROR", "message": "서버 오류가 발생했습니다."}
+        )
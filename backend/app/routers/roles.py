@@ -1,15 +1,17 @@
 # ============================================
 # 역할 관리 API 라우터
 # ============================================
-# 역할 CRUD
+# 역할 CRUD + 역할별 메뉴 권한 / API 권한 / 어드민 회원 매핑
 
 from typing import Optional
 from fastapi import APIRouter, Depends, HTTPException, status, Query
 
-from app.config.database import query, query_one, execute_returning, execute
+from app.config.database import query, query_one, execute_returning, execute, get_connection
 from app.models.common import ApiResponse
 from app.middleware.auth import get_current_user
 from app.core.logger import logger
+from app.services.mapping_service import MappingService, ROLE_APIS, ROLE_MENUS, ROLE_USERS
+from app.services.permission_service import PermissionService
 
 
 router = APIRouter(prefix="/api/v1/admin/roles", tags=["Roles"])
@@ -150,6 +152,7 @@ async def create_role(
             }
         )
         
+        await PermissionService.notify_changed("create_role")
         return ApiResponse(success=True, data=result)
     except HTTPException:
         raise
@@ -217,6 +220,7 @@ async def update_role(
                 detail={"error": "NOT_FOUND", "message": "역할을 찾을 수 없습니다."}
             )
         
+        await PermissionService.notify_changed("update_role")
         return ApiResponse(success=True, data=result)
     except HTTPException:
         raise
@@ -248,6 +252,7 @@ async def delete_role(
                 detail={"error": "NOT_FOUND", "message": "역할을 찾을 수 없습니다."}
             )
         
+        await PermissionService.notify_changed("delete_role")
         return ApiResponse(success=True, data={"message": "삭제되었습니다."})
     except HTTPException:
         raise
@@ -259,3 +264,217 @@ async def delete_role(
         )
 
 
+
+
+# ============================================
+# 역할별 메뉴 권한 / API 권한 / 어드민 회원 매핑
+# ============================================
+
+MENU_PERMISSION_FLAGS = ("can_read", "can_write", "can_update", "can_delete", "can_export", "is_active")
+
+
+@router.get("/{role_id}/menu-permissions")
+async def get_role_menu_permissions(
+    role_id: int,
+    current_user=Depends(get_current_user)
+):
+    """
+    역할 메뉴 권한 조회 (전체 메뉴, 권한 행이 없으면 모두 false)
+    """
+    try:
+        data = await query(
+            """
+            SELECT p.id, %(role_id)s AS role_id, m.id AS menu_id,
+                   m.menu_name, m.menu_path, m.parent_id, m.depth,
+                   COALESCE(p.can_read, false) AS can_read,
+                   COALESCE(p.can_write, false) AS can_write,
+                   COALESCE(p.can_update, false) AS can_update,
+                   COALESCE(p.can_delete, false) AS can_delete,
+                   COALESCE(p.can_export, false) AS can_export,
+                   COALESCE(p.is_active, false) AS is_active,
+                   p.created_at, p.updated_at
+            FROM public.admin_menus m
+            LEFT JOIN public.role_menu_permissions p
+                ON p.menu_id = m.id AND p.role_id = %(role_id)s
+            ORDER BY m.depth, m.sort_order, m.id
+            """,
+            {"role_id": role_id}
+        )
+        return ApiResponse(success=True, data=data)
+    except Exception as e:
+        logger.error(f"역할 메뉴 권한 조회 오류: {str(e)}", exc_info=True)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail={"error": "FETCH_ERROR", "message": "역할 메뉴 권한 조회 중 오류가 발생했습니다."}
+        )
+
+
+@router.put("/{role_id}/menu-permissions")
+async def save_role_menu_permissions(
+    role_id: int,
+    body: dict,
+    current_user=Depends(get_current_user)
+):
+    """
+    역할 메뉴 권한 저장 (permissions 목록으로 교체, 요청과 현재 매핑의 차이만 반영)
+    """
+    try:
+        permissions = body.get("permissions")
+        if not isinstance(permissions, list):
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail={"error": "VALIDATION_ERROR", "message": "permissions 목록은 필수입니다."}
+            )
+
+        async with get_connection() as conn:
+            async with conn.cursor() as cur:
+                counts = await MappingService.sync(
+                    cur, ROLE_MENUS, role_id,
+                    [
+                        {"menu_id": item["menu_id"], **{flag: bool(item.get(flag)) for flag in MENU_PERMISSION_FLAGS}}
+                        for item in permissions
+                    ]
+                )
+                await conn.commit()
+
+        await PermissionService.notify_changed("save_role_menu_permissions")
+        return ApiResponse(success=True, data={"message": "메뉴 권한이 저장되었습니다.", **counts})
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"역할 메뉴 권한 저장 오류: {str(e)}", exc_info=True)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail={"error": "UPDATE_ERROR", "message": "역할 메뉴 권한 저장 중 오류가 발생했습니다."}
+        )
+
+
+@router.get("/{role_id}/api-permissions")
+async def get_role_api_permissions(
+    role_id: int,
+    current_user=Depends(get_current_user)
+):
+    """
+    역할 API 권한 조회 (전체 API + 허용 여부)
+    """
+    try:
+        data = await query(
+            """
+            SELECT a.id AS api_id, a.api_name, a.api_path, a.is_active,
+                   COALESCE(p.is_permitted AND p.is_active, false) AS is_permitted
+            FROM public.admin_apis a
+            LEFT JOIN public.role_api_permissions p
+                ON p.api_id = a.id AND p.role_id = %(role_id)s
+            ORDER BY a.api_path ASC, a.id ASC
+            """,
+            {"role_id": role_id}
+        )
+        return ApiResponse(success=True, data=data)
+    except Exception as e:
+        logger.error(f"역할 API 권한 조회 오류: {str(e)}", exc_info=True)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail={"error": "FETCH_ERROR", "message": "역할 API 권한 조회 중 오류가 발생했습니다."}
+        )
+
+
+@router.put("/{role_id}/api-permissions")
+async def save_role_api_permissions(
+    role_id: int,
+    body: dict,
+    current_user=Depends(get_current_user)
+):
+    """
+    역할 API 권한 저장 (api_ids 에 있는 API 만 허용, 요청과 현재 매핑의 차이만 반영)
+    """
+    try:
+        api_ids = body.get("api_ids")
+        if not isinstance(api_ids, list):
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail={"error": "VALIDATION_ERROR", "message": "api_ids 목록은 필수입니다."}
+            )
+
+        async with get_connection() as conn:
+            async with conn.cursor() as cur:
+                counts = await MappingService.sync(
+                    cur, ROLE_APIS, role_id,
+                    [{"api_id": api_id, "is_permitted": True, "is_active": True} for api_id in api_ids]
+                )
+                await conn.commit()
+
+        await PermissionService.notify_changed("save_role_api_permissions")
+        return ApiResponse(success=True, data={"message": "API 권한이 저장되었습니다.", **counts})
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"역할 API 권한 저장 오류: {str(e)}", exc_info=True)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail={"error": "UPDATE_ERROR", "message": "역할 API 권한 저장 중 오류가 발생했습니다."}
+        )
+
+
+@router.get("/{role_id}/users")
+async def get_role_users(
+    role_id: int,
+    current_user=Depends(get_current_user)
+):
+    """
+    역할 보유 어드민 회원 조회
+    """
+    try:
+        data = await query(
+            """
+            SELECT u.id AS admin_user_id, u.email, u.name, ur.created_at
+            FROM public.admin_user_roles ur
+            JOIN public.admin_users u ON u.id = ur.admin_user_id
+            WHERE ur.role_id = %(role_id)s
+            ORDER BY u.id ASC
+            """,
+            {"role_id": role_id}
+        )
+        return ApiResponse(success=True, data=data)
+    except Exception as e:
+        logger.error(f"역할 회원 조회 오류: {str(e)}", exc_info=True)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail={"error": "FETCH_ERROR", "message": "역할 회원 조회 중 오류가 발생했습니다."}
+        )
+
+
+@router.put("/{role_id}/users")
+async def save_role_users(
+    role_id: int,
+    body: dict,
+    current_user=Depends(get_current_user)
+):
+    """
+    역할 보유 어드민 회원 저장 (admin_user_ids 로 교체)
+    """
+    try:
+        admin_user_ids = body.get("admin_user_ids")
+        if not isinstance(admin_user_ids, list):
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail={"error": "VALIDATION_ERROR", "message": "admin_user_ids 목록은 필수입니다."}
+            )
+
+        async with get_connection() as conn:
+            async with conn.cursor() as cur:
+                counts = await MappingService.sync(
+                    cur, ROLE_USERS, role_id,
+                    [{"admin_user_id": admin_user_id} for admin_user_id in admin_user_ids]
+                )
+                await conn.commit()
+
+        await PermissionService.notify_changed("save_role_users")
+        return ApiResponse(success=True, data={"message": "역할 회원이 저장되었습니다.", **counts})
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"역할 회원 저장 오류: {str(e)}", exc_info=True)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail={"error": "UPDATE_ERROR", "message": "역할 회원 저장 중 오류가 발생했습니다."}
+        )
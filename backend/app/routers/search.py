@@ -0,0 +1,64 @@
+# ============================================
+# 통합 검색 API 라우터
+# ============================================
+# 회원/컨텐츠/영양제/기능성 성분/공지/문의/챌린지 통합 검색 (App DB)
+
+from typing import Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+
+from app.middleware.auth import get_current_user
+from app.core.logger import logger
+from app.services.search_service import SEARCH_SOURCES, SearchService
+
+
+router = APIRouter(prefix="/api/v1/admin/search", tags=["Search"])
+
+
+@router.get("")
+async def search(
+    q: str = Query(..., min_length=1, max_length=100, description="검색어"),
+    types: Optional[str] = Query(None, description="검색 유형 (쉼표 구분, 예: member,content)"),
+    page: int = Query(1, ge=1),
+    page_size: int = Query(20, ge=1, le=100),
+    current_user=Depends(get_current_user)
+):
+    """
+    통합 검색
+
+    결과는 관련도순으로 정렬되며, facets 에는 유형별 전체 일치 건수를 반환한다.
+    """
+    entity_types = None
+    if types:
+        entity_types = [t.strip() for t in types.split(",") if t.strip()]
+        invalid = [t for t in entity_types if t not in SEARCH_SOURCES]
+        if invalid:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail={"error": "VALIDATION_ERROR", "message": f"지원하지 않는 검색 유형입니다: {', '.join(invalid)}"}
+            )
+
+    try:
+        result = await SearchService.search(q, entity_types, page, page_size)
+    except Exception as e:
+        logger.error(f"통합 검색 오류: {str(e)}", exc_info=True)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail={"error": "INTERNAL_ERROR", "message": "서버 오류가 발생했습니다."}
+        )
+
+    total = result["total"]
+    return {
+        "success": True,
+        "data": result["items"],
+        "facets": [
+            {"type": entity_type, "label": source["label"], "count": result["facets"][entity_type]}
+            for entity_type, source in SEARCH_SOURCES.items()
+        ],
+        "pagination": {
+            "page": page,
+            "limit": page_size,
+            "total": total,
+            "total_pages": (total + page_size - 1) // page_size if total > 0 else 0
+        }
+    }
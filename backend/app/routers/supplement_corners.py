@@ -6,8 +6,9 @@
 from typing import Optional, List
 from fastapi import APIRouter, Query, HTTPException, status, Path
 from pydantic import BaseModel, Field
-from app.config.database import query as db_query, query_one, execute, execute_returning
+from app.config.database import query as db_query, query_one, execute, execute_returning, get_connection
 from app.core.logger import logger
+from app.services.mapping_service import MappingService, CORNER_PRODUCTS
 
 router = APIRouter(prefix="/api/v1/admin/supplement-corners", tags=["영양제 코너 관리"])
 
@@ -485,6 +486,8 @@ async def get_corner_products(
 async def add_corner_products(corner_id: int, data: ProductMappingBulk):
     """
     코너에 영양제 일괄 추가
+
+    이미 매핑된 영양제는 건너뛴다. (조회 1회 + INSERT 1회)
     """
     try:
         # 코너 존재 확인
@@ -499,29 +502,17 @@ async def add_corner_products(corner_id: int, data: ProductMappingBulk):
                 detail="코너를 찾을 수 없습니다."
             )
         
-        added_count = 0
-        for product in data.products:
-            # 이미 매핑되어 있는지 확인
-            existing = await query_one(
-                """SELECT id FROM supplement_corner_products 
-                   WHERE corner_id = %(corner_id)s AND product_id = %(product_id)s""",
-                {"corner_id": corner_id, "product_id": product.product_id},
-                use_app_db=True,
-            )
-            
-            if not existing:
-                insert_query = """
-                    INSERT INTO supplement_corner_products (corner_id, product_id, display_order)
-                    VALUES (%(corner_id)s, %(product_id)s, %(display_order)s)
-                """
-                await execute(insert_query, {
-                    "corner_id": corner_id,
-                    "product_id": product.product_id,
-                    "display_order": product.display_order
-                }, use_app_db=True)
-                added_count += 1
-        
-        return {"success": True, "data": {"added_count": added_count}}
+        async with get_connection(use_app_db=True) as conn:
+            async with conn.cursor() as cur:
+                counts = await MappingService.sync(
+                    cur, CORNER_PRODUCTS, corner_id,
+                    [product.model_dump() for product in data.products],
+                    replace=False,
+                    update_existing=False,
+                )
+            await conn.commit()
+        
+        return {"success": True, "data": {"added_count": counts["added"], **counts}}
     except HTTPException:
         raise
     except Exception as e:
@@ -547,16 +538,12 @@ async def remove_corner_products(
                 detail="삭제할 영양제 ID를 지정해주세요."
             )
         
-        delete_query = """
-            DELETE FROM supplement_corner_products 
-            WHERE corner_id = %(corner_id)s AND product_id = ANY(%(product_ids)s)
-        """
-        await execute(delete_query, {
-            "corner_id": corner_id,
-            "product_ids": product_ids
-        }, use_app_db=True)
+        async with get_connection(use_app_db=True) as conn:
+            async with conn.cursor() as cur:
+                deleted_count = await MappingService.remove(cur, CORNER_PRODUCTS, corner_id, product_ids)
+            await conn.commit()
         
-        return {"success": True, "data": {"deleted_count": len(product_ids)}}
+        return {"success": True, "data": {"deleted_count": deleted_count}}
     except HTTPException:
         raise
     except Exception as e:
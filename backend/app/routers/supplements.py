@@ -4,12 +4,18 @@
 # 영양제 CRUD 및 성분/기능성 매핑
 
 from typing import Optional, List
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, Depends, HTTPException, status, Query, UploadFile, File, Form
 from pydantic import BaseModel
 
 from app.lib.app_db import app_db_manager
 from app.middleware.auth import get_current_user
+from app.core.exceptions import ValidationError
 from app.core.logger import logger
+from app.services.catalog_import_service import CatalogImportService
+from app.services.mapping_service import MappingService, PRODUCT_INGREDIENTS
+from app.services.search_service import SearchService
+from app.services.supplement_search_index import SupplementSearchIndex
+from app.utils.search_filter import search_pattern, contains_pattern, ilike_condition
 
 
 router = APIRouter(prefix="/api/v1/admin/supplements", tags=["Supplements"])
@@ -98,32 +104,27 @@ async def get_supplements(
         params = []
 
         if product_name:
-            conditions.append("s.product_name ILIKE %s")
-            params.append(f"%{product_name}%")
+            conditions.append(ilike_condition("s.product_name", "%s"))
+            params.append(search_pattern(product_name))
 
         if report_number:
-            conditions.append("s.product_report_number ILIKE %s")
-            params.append(f"%{report_number}%")
+            conditions.append(ilike_condition("s.product_report_number", "%s"))
+            params.append(search_pattern(report_number))
 
+        # 성분명/기능성은 비정규화 검색 문서에서 조회 (app/services/supplement_search_index.py)
         if ingredient_name:
-            conditions.append("""EXISTS (
-                SELECT 1 FROM public.product_ingredient_mapping pim
-                JOIN public.functional_ingredients fi ON pim.ingredient_id = fi.id
-                WHERE pim.product_id = s.id 
-                AND (fi.internal_name ILIKE %s OR fi.external_name ILIKE %s)
+            conditions.append("""s.id IN (
+                SELECT ssd.product_id FROM public.supplement_search_documents ssd
+                WHERE ssd.ingredient_names ILIKE %s
             )""")
-            params.append(f"%{ingredient_name}%")
-            params.append(f"%{ingredient_name}%")
+            params.append(contains_pattern(ingredient_name))
 
         if functionality:
-            conditions.append("""EXISTS (
-                SELECT 1 FROM public.product_ingredient_mapping pim
-                JOIN public.functional_ingredients fi ON pim.ingredient_id = fi.id
-                JOIN public.ingredient_functionality_mapping ifm ON fi.id = ifm.ingredient_id
-                JOIN public.functionality_contents fc ON ifm.functionality_id = fc.id
-                WHERE pim.product_id = s.id AND fc.content ILIKE %s
+            conditions.append("""s.id IN (
+                SELECT ssd.product_id FROM public.supplement_search_documents ssd
+                WHERE ssd.functionality_texts ILIKE %s
             )""")
-            params.append(f"%{functionality}%")
+            params.append(contains_pattern(functionality))
 
         if default_intake_amount:
             conditions.append("s.default_intake_amount = %s")
@@ -138,8 +139,8 @@ async def get_supplements(
             params.append(product_form)
 
         if manufacturer:
-            conditions.append("s.manufacturer ILIKE %s")
-            params.append(f"%{manufacturer}%")
+            conditions.append(ilike_condition("s.manufacturer", "%s"))
+            params.append(search_pattern(manufacturer))
 
         if is_active == 'Y':
             conditions.append("s.is_active = true")
@@ -262,6 +263,7 @@ async def create_supplement(
                 row = await cur.fetchone()
                 await conn.commit()
 
+        SearchService.schedule_sync("supplement", [row['id']])
         return {"success": True, "data": {"id": row['id']}}
     except HTTPException:
         raise
@@ -270,6 +272,28 @@ async def create_supplement(
         raise HTTPException(status_code=500, detail={"error": "INTERNAL_ERROR", "message": "서버 오류가 발생했습니다."})
 
 
+@router.post("/import")
+async def import_supplements(
+    file: UploadFile = File(...),
+    dry_run: bool = Form(default=False),
+    current_user=Depends(get_current_user)
+):
+    """
+    영양제 일괄 등록 (CSV / XLSX)
+
+    품목제조번호(product_report_number)가 같은 영양제는 수정, 그 외는 신규 등록.
+    오류 행은 건너뛰고 행 번호별 사유를 errors 로 반환한다. dry_run=true 면 검증만 수행.
+    """
+    try:
+        report = await CatalogImportService.import_upload(file, "supplement", dry_run=dry_run)
+        return {"success": True, "data": report}
+    except ValidationError as e:
+        raise HTTPException(status_code=400, detail={"error": e.error_code, "message": e.message})
+    except Exception as e:
+        logger.error(f"영양제 일괄 등록 오류: {str(e)}", exc_info=True)
+        raise HTTPException(status_code=500, detail={"error": "INTERNAL_ERROR", "message": "서버 오류가 발생했습니다."})
+
+
 @router.put("/{supplement_id}")
 async def update_supplement(
     supplement_id: str,
@@ -323,6 +347,7 @@ async def update_supplement(
         if not row:
             raise HTTPException(status_code=404, detail={"error": "NOT_FOUND", "message": "영양제를 찾을 수 없습니다."})
 
+        SearchService.schedule_sync("supplement", [row['id']])
         return {"success": True, "data": {"id": row['id']}}
     except HTTPException:
         raise
@@ -351,6 +376,8 @@ async def delete_supplements(
                 )
                 await conn.commit()
 
+        SearchService.schedule_sync("supplement", body.ids)
+
         return {"success": True, "data": {"deleted": len(body.ids)}}
     except HTTPException:
         raise
@@ -403,28 +430,18 @@ async def save_supplement_ingredients(
     body: SaveIngredientsRequest,
     current_user=Depends(get_current_user)
 ):
-    """영양제 성분 매핑 저장"""
+    """영양제 성분 매핑 저장 (요청 목록과 현재 매핑의 차이만 반영)"""
     try:
         async with app_db_manager.get_async_conn() as conn:
             async with conn.cursor() as cur:
-                # 기존 매핑 삭제
-                await cur.execute(
-                    "DELETE FROM public.product_ingredient_mapping WHERE product_id = %s",
-                    [supplement_id]
+                counts = await MappingService.sync(
+                    cur, PRODUCT_INGREDIENTS, supplement_id,
+                    [ing.model_dump() for ing in body.ingredients]
                 )
-
-                # 새 매핑 추가
-                for ing in body.ingredients:
-                    await cur.execute(
-                        """INSERT INTO public.product_ingredient_mapping 
-                            (product_id, ingredient_id, content_amount, content_unit, display_order)
-                        VALUES (%s, %s, %s, %s, %s)""",
-                        [supplement_id, ing.ingredient_id, ing.content_amount, ing.content_unit, ing.display_order]
-                    )
-
+                await SupplementSearchIndex.refresh_products(cur, [supplement_id])
                 await conn.commit()
 
-        return {"success": True, "data": {"message": "성분 매핑이 저장되었습니다."}}
+        return {"success": True, "data": {"message": "성분 매핑이 저장되었습니다.", **counts}}
     except Exception as e:
         logger.error(f"영양제 성분 저장 오류: {str(e)}", exc_info=True)
         raise HTTPException(status_code=500, detail={"error": "INTERNAL_ERROR", "message": "서버 오류가 발생했습니다."})
@@ -449,6 +466,7 @@ async def delete_supplement_ingredients(
                     f"DELETE FROM public.product_ingredient_mapping WHERE id IN ({placeholders})",
                     body.mapping_ids
                 )
+                await SupplementSearchIndex.refresh_products(cur, [supplement_id])
                 await conn.commit()
 
         return {"success": True, "data": {"deleted": len(body.mapping_ids)}}
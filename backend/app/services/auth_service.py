@@ -13,6 +13,7 @@ from app.config.database import query_one, execute
 from app.core.exceptions import AuthenticationError, ValidationError
 from app.core.logger import logger
 from app.core.token_store import TokenStore
+from app.core.tracing import traced
 from app.models.auth import TokenPayload
 
 
@@ -27,16 +28,19 @@ class AuthService:
     """인증 서비스 클래스"""
     
     @staticmethod
+    @traced("auth.hash_password")
     def hash_password(password: str) -> str:
         """비밀번호 해싱"""
         return pwd_context.hash(password)
     
     @staticmethod
+    @traced("auth.verify_password")
     def verify_password(plain_password: str, hashed_password: str) -> bool:
         """비밀번호 검증"""
         return pwd_context.verify(plain_password, hashed_password)
     
     @staticmethod
+    @traced("auth.create_access_token")
     def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
         """액세스 토큰 생성"""
         to_encode = data.copy()
@@ -50,6 +54,7 @@ class AuthService:
         return jwt.encode(to_encode, settings.TOKEN_SECRET_KEY, algorithm=ALGORITHM)
     
     @staticmethod
+    @traced("auth.create_refresh_token")
     def create_refresh_token(data: dict) -> str:
         """리프레시 토큰 생성"""
         to_encode = data.copy()
@@ -62,6 +67,7 @@ class AuthService:
         return jwt.encode(to_encode, settings.TOKEN_SECRET_KEY, algorithm=ALGORITHM)
     
     @staticmethod
+    @traced("auth.verify_token")
     def verify_token(token: str) -> Optional[TokenPayload]:
         """토큰 검증 및 페이로드 반환"""
         try:
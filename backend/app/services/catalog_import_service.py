@@ -0,0 +1,579 @@
+"""
+파일: app/services/catalog_import_service.py
+설명: 영양제 / 기능성 성분 카탈로그 일괄 등록 (CSV / XLSX)
+  - 파일을 행 단위로 스트리밍 파싱 (전체를 메모리에 올리지 않음)
+  - 배치 단위 검증 → COPY 로 임시 스테이징 테이블 적재 → MERGE 1회로 반영
+  - 기능성 성분 코드는 시퀀스 값을 배치 단위로 한 번에 할당
+  - 행 번호/필드/사유 단위 오류 리포트 (오류 행은 건너뛰고 나머지 반영)
+  - dry_run: DB 반영 없이 검증만 수행
+
+사용처: POST /api/v1/admin/supplements/import, POST /api/v1/admin/functional-ingredients/import,
+        python -m scripts.import_catalog
+"""
+import asyncio
+import csv
+import os
+import re
+import tempfile
+import time
+from datetime import time as dt_time
+from typing import Any, AsyncIterator, Callable, Dict, Iterator, List, Optional, Tuple
+
+from fastapi import UploadFile
+
+from app.core.exceptions import ValidationError
+from app.core.logger import logger
+from app.lib.app_db import app_db_manager
+from app.services.search_service import SearchService
+from app.services.supplement_search_index import SupplementSearchIndex
+
+
+# 배치 크기 (검증 + COPY 단위)
+IMPORT_BATCH_SIZE = 5000
+# 업로드 파일 최대 크기 (100MB)
+MAX_IMPORT_FILE_SIZE = 100 * 1024 * 1024
+# 업로드 수신 청크 크기
+CHUNK_SIZE = 256 * 1024
+# API 응답에 포함할 최대 오류 수
+MAX_REPORTED_ERRORS = 1000
+# 지원 형식
+SUPPORTED_FORMATS = {"csv", "xlsx"}
+
+_TIME_PATTERN = re.compile(r"^([01]\d|2[0-3]):[0-5]\d$")
+_TRUE_VALUES = {"y", "yes", "true", "1", "o", "사용", "노출"}
+_FALSE_VALUES = {"n", "no", "false", "0", "x", "미사용", "미노출"}
+
+
+# ============================================
+# 파일 파싱
+# ============================================
+
+def detect_format(filename: Optional[str]) -> str:
+    """확장자로 파일 형식 판별"""
+    ext = os.path.splitext(filename or "")[1].lower().lstrip(".")
+    if ext not in SUPPORTED_FORMATS:
+        raise ValidationError("CSV 또는 XLSX 파일만 업로드 가능합니다.")
+    return ext
+
+
+def _detect_csv_encoding(path: str) -> str:
+    """UTF-8(BOM 포함) 우선, 실패 시 CP949 (엑셀 한글 CSV 기본 인코딩)"""
+    with open(path, "rb") as f:
+        head = f.read(64 * 1024)
+    try:
+        # 청크 경계에서 잘린 멀티바이트 문자는 무시
+        head.decode("utf-8-sig")
+        return "utf-8-sig"
+    except UnicodeDecodeError as e:
+        if e.start >= len(head) - 3:
+            return "utf-8-sig"
+        return "cp949"
+
+
+def iter_csv_rows(path: str) -> Iterator[List[Any]]:
+    """CSV 행 순회 (첫 행은 헤더)"""
+    with open(path, newline="", encoding=_detect_csv_encoding(path)) as f:
+        for row in csv.reader(f):
+            yield row
+
+
+def iter_xlsx_rows(path: str) -> Iterator[List[Any]]:
+    """XLSX 첫 시트 행 순회 (read_only 모드로 스트리밍)"""
+    try:
+        from openpyxl import load_workbook
+    except ImportError:
+        raise ValidationError("XLSX 파싱 모듈(openpyxl)이 설치되어 있지 않습니다. CSV로 업로드해주세요.")
+
+    workbook = load_workbook(path, read_only=True, data_only=True)
+    try:
+        for row in workbook.active.iter_rows(values_only=True):
+            yield list(row)
+    finally:
+        workbook.close()
+
+
+def _cell_text(value: Any) -> Optional[str]:
+    """셀 값 → 공백 제거 문자열 (빈 값은 None)"""
+    if value is None:
+        return None
+    if isinstance(value, dt_time):
+        return value.strftime("%H:%M")
+    if isinstance(value, float) and value.is_integer():
+        value = int(value)
+    text = str(value).strip()
+    return text or None
+
+
+def _parse_number(value: Optional[str]) -> Optional[float]:
+    if value is None:
+        return None
+    return float(value.replace(",", ""))
+
+
+def _parse_bool(value: Optional[str], default: bool) -> bool:
+    if value is None:
+        return default
+    lowered = value.lower()
+    if lowered in _TRUE_VALUES:
+        return True
+    if lowered in _FALSE_VALUES:
+        return False
+    raise ValueError(value)
+
+
+# ============================================
+# 대상별 정의
+# ============================================
+# columns: (필드명, 허용 헤더 별칭)
+# validate(raw) → (스테이징 행 dict, [(필드, 오류 메시지)])
+# key: 파일 내 중복 판별 및 기존 행 매칭 키 (값이 없으면 항상 신규 등록)
+
+def _validate_supplement(raw: Dict[str, Optional[str]]) -> Tuple[Dict[str, Any], List[Tuple[str, str]]]:
+    errors: List[Tuple[str, str]] = []
+    product_name = raw.get("product_name")
+    if not product_name:
+        errors.append(("product_name", "영양제명을 입력해주세요."))
+    elif len(product_name) > 30:
+        errors.append(("product_name", "영양제명은 30자 이내로 입력해주세요."))
+
+    dosage = None
+    try:
+        dosage = _parse_number(raw.get("dosage"))
+    except ValueError:
+        errors.append(("dosage", "1회 섭취량은 숫자로 입력해주세요."))
+
+    intake_time = raw.get("default_intake_time") or "00:00"
+    if not _TIME_PATTERN.match(intake_time):
+        errors.append(("default_intake_time", "섭취 시간은 HH:MM 형식으로 입력해주세요."))
+
+    is_active = True
+    try:
+        is_active = _parse_bool(raw.get("is_active"), True)
+    except ValueError:
+        errors.append(("is_active", "사용 여부는 Y/N 으로 입력해주세요."))
+
+    row = {
+        "product_report_number": raw.get("product_report_number"),
+        "product_name": product_name,
+        "form_unit": raw.get("product_form") or "정",
+        "single_dose": dosage,
+        "dosage_unit": raw.get("dosage_unit") or "mg",
+        "intake_method": raw.get("intake_method"),
+        "default_intake_time": intake_time,
+        "default_intake_amount": raw.get("default_intake_amount") or "1",
+        "default_intake_unit": raw.get("default_intake_unit") or "정",
+        "manufacturer": raw.get("manufacturer"),
+        "is_active": is_active,
+    }
+    return row, errors
+
+
+def _validate_functional_ingredient(raw: Dict[str, Optional[str]]) -> Tuple[Dict[str, Any], List[Tuple[str, str]]]:
+    errors: List[Tuple[str, str]] = []
+    internal_name = raw.get("internal_name")
+    if not internal_name:
+        errors.append(("internal_name", "내부 성분명을 입력해주세요."))
+    elif len(internal_name) > 30:
+        errors.append(("internal_name", "내부 성분명은 30자 이내로 입력해주세요."))
+
+    intake = {}
+    for field in ("daily_intake_min", "daily_intake_max"):
+        try:
+            intake[field] = _parse_number(raw.get(field))
+        except ValueError:
+            intake[field] = None
+            errors.append((field, "일일 섭취량은 숫자로 입력해주세요."))
+    if (
+        intake["daily_intake_min"] is not None
+        and intake["daily_intake_max"] is not None
+        and intake["daily_intake_min"] > intake["daily_intake_max"]
+    ):
+        errors.append(("daily_intake_max", "최대 섭취량은 최소 섭취량 이상이어야 합니다."))
+
+    flags = {}
+    for field, default in (("is_active", True), ("priority_display", False)):
+        try:
+            flags[field] = _parse_bool(raw.get(field), default)
+        except ValueError:
+            flags[field] = default
+            errors.append((field, "Y/N 으로 입력해주세요."))
+
+    row = {
+        "ingredient_code": raw.get("ingredient_code"),
+        "internal_name": internal_name,
+        "external_name": raw.get("external_name") or internal_name,
+        "indicator_component": raw.get("indicator_component"),
+        "daily_intake_min": intake["daily_intake_min"],
+        "daily_intake_max": intake["daily_intake_max"],
+        "daily_intake_unit": raw.get("daily_intake_unit") or "mg",
+        "display_functionality": raw.get("display_functionality"),
+        "is_active": flags["is_active"],
+        "priority_display": flags["priority_display"],
+    }
+    return row, errors
+
+
+IMPORT_TARGETS: Dict[str, Dict[str, Any]] = {
+    "supplement": {
+        "label": "영양제",
+        "columns": [
+            ("product_report_number", ("product_report_number", "report_number", "품목제조번호", "품목보고번호")),
+            ("product_name", ("product_name", "영양제명", "제품명")),
+            ("product_form", ("product_form", "form_unit", "제형")),
+            ("dosage", ("dosage", "single_dose", "1회 섭취량")),
+            ("dosage_unit", ("dosage_unit", "섭취량 단위")),
+            ("intake_method", ("intake_method", "섭취 방법")),
+            ("default_intake_time", ("default_intake_time", "기본 섭취 시간")),
+            ("default_intake_amount", ("default_intake_amount", "기본 섭취량")),
+            ("default_intake_unit", ("default_intake_unit", "기본 섭취 단위")),
+            ("manufacturer", ("manufacturer", "제조사")),
+            ("is_active", ("is_active", "사용여부", "사용 여부")),
+        ],
+        "required_columns": ["product_name"],
+        "validate": _validate_supplement,
+        "key": "product_report_number",
+        "table": "public.supplement_products_master",
+        "stage_columns": [
+            ("product_report_number", "TEXT"), ("product_name", "TEXT"), ("form_unit", "TEXT"),
+            ("single_dose", "NUMERIC"), ("dosage_unit", "TEXT"), ("intake_method", "TEXT"),
+            ("default_intake_time", "TEXT"), ("default_intake_amount", "TEXT"),
+            ("default_intake_unit", "TEXT"), ("manufacturer", "TEXT"), ("is_active", "BOOLEAN"),
+        ],
+        "search_type": "supplement",
+    },
+    "functional_ingredient": {
+        "label": "기능성 성분",
+        "columns": [
+            ("ingredient_code", ("ingredient_code", "성분코드", "성분 코드")),
+            ("internal_name", ("internal_name", "내부 성분명", "내부성분명")),
+            ("external_name", ("external_name", "외부 성분명", "외부성분명")),
+            ("indicator_component", ("indicator_component", "지표성분", "지표 성분")),
+            ("daily_intake_min", ("daily_intake_min", "일일 섭취량 최소")),
+            ("daily_intake_max", ("daily_intake_max", "일일 섭취량 최대")),
+            ("daily_intake_unit", ("daily_intake_unit", "섭취량 단위")),
+            ("display_functionality", ("display_functionality", "노출 기능성")),
+            ("is_active", ("is_active", "사용여부", "사용 여부")),
+            ("priority_display", ("priority_display", "우선 노출")),
+        ],
+        "required_columns": ["internal_name"],
+        "validate": _validate_functional_ingredient,
+        "key": "ingredient_code",
+        "table": "public.functional_ingredients",
+        "stage_columns": [
+            ("ingredient_code", "TEXT"), ("internal_name", "TEXT"), ("external_name", "TEXT"),
+            ("indicator_component", "TEXT"), ("daily_intake_min", "NUMERIC"), ("daily_intake_max", "NUMERIC"),
+            ("daily_intake_unit", "TEXT"), ("display_functionality", "TEXT"), ("is_active", "BOOLEAN"),
+            ("priority_display", "BOOLEAN"),
+        ],
+        "search_type": "functional_ingredient",
+    },
+}
+
+
+# 스테이징 → 대상 테이블 MERGE (PostgreSQL 15+)
+_MERGE_SQL = {
+    "supplement": """
+        MERGE INTO public.supplement_products_master t
+        USING import_stage s
+        ON s.product_report_number IS NOT NULL AND t.product_report_number = s.product_report_number
+        WHEN MATCHED THEN UPDATE SET
+            product_name = s.product_name,
+            form_unit = s.form_unit,
+            single_dose = s.single_dose,
+            dosage_unit = s.dosage_unit,
+            intake_method = s.intake_method,
+            default_intake_time = s.default_intake_time,
+            default_intake_amount = s.default_intake_amount,
+            default_intake_unit = s.default_intake_unit,
+            manufacturer = s.manufacturer,
+            is_active = s.is_active,
+            updated_at = NOW()
+        WHEN NOT MATCHED THEN INSERT (
+            product_report_number, product_name, form_unit, single_dose, dosage_unit,
+            intake_method, default_intake_time, default_intake_amount, default_intake_unit,
+            manufacturer, is_active
+        ) VALUES (
+            s.product_report_number, s.product_name, s.form_unit, s.single_dose, s.dosage_unit,
+            s.intake_method, s.default_intake_time, s.default_intake_amount, s.default_intake_unit,
+            s.manufacturer, s.is_active
+        )
+    """,
+    "functional_ingredient": """
+        MERGE INTO public.functional_ingredients t
+        USING import_stage s
+        ON t.ingredient_code = s.ingredient_code
+        WHEN MATCHED THEN UPDATE SET
+            internal_name = s.internal_name,
+            external_name = s.external_name,
+            indicator_component = s.indicator_component,
+            daily_intake_min = s.daily_intake_min,
+            daily_intake_max = s.daily_intake_max,
+            daily_intake_unit = s.daily_intake_unit,
+            display_functionality = s.display_functionality,
+            is_active = s.is_active,
+            priority_display = s.priority_display
+        WHEN NOT MATCHED THEN INSERT (
+            ingredient_code, internal_name, external_name, indicator_component,
+            daily_intake_min, daily_intake_max, daily_intake_unit,
+            display_functionality, is_active, priority_display
+        ) VALUES (
+            s.ingredient_code, s.internal_name, s.external_name, s.indicator_component,
+            s.daily_intake_min, s.daily_intake_max, s.daily_intake_unit,
+            s.display_functionality, s.is_active, s.priority_display
+        )
+    """,
+}
+
+
+def _resolve_header(header: List[Any], spec: Dict[str, Any]) -> Dict[int, str]:
+    """헤더 행 → {열 인덱스: 필드명}"""
+    aliases = {}
+    for field, names in spec["columns"]:
+        for name in names:
+            aliases[name.lower().replace(" ", "")] = field
+
+    mapping: Dict[int, str] = {}
+    for index, title in enumerate(header):
+        field = aliases.get((_cell_text(title) or "").lower().replace(" ", ""))
+        if field and field not in mapping.values():
+            mapping[index] = field
+
+    missing = [field for field in spec["required_columns"] if field not in mapping.values()]
+    if missing:
+        raise ValidationError(f"필수 컬럼이 없습니다: {', '.join(missing)}")
+    return mapping
+
+
+class CatalogImportService:
+    """카탈로그 일괄 등록 서비스 (App DB)"""
+
+    @classmethod
+    async def save_upload(cls, file: UploadFile) -> Tuple[str, str]:
+        """
+        업로드 파일을 임시 파일로 청크 저장
+
+        Returns:
+            (임시 파일 경로, 파일 형식) - 호출자가 삭제
+        """
+        file_format = detect_format(file.filename)
+        fd, temp_path = tempfile.mkstemp(suffix=f".{file_format}", prefix="catalog_import_")
+        size = 0
+        try:
+            with os.fdopen(fd, "wb") as out:
+                while True:
+                    chunk = await file.read(CHUNK_SIZE)
+                    if not chunk:
+                        break
+                    size += len(chunk)
+                    if size > MAX_IMPORT_FILE_SIZE:
+                        raise ValidationError(
+                            f"파일 크기는 {MAX_IMPORT_FILE_SIZE // (1024 * 1024)}MB 이하여야 합니다."
+                        )
+                    await asyncio.to_thread(out.write, chunk)
+        except BaseException:
+            os.remove(temp_path)
+            raise
+        return temp_path, file_format
+
+    @classmethod
+    async def import_upload(cls, file: UploadFile, target: str, dry_run: bool = False) -> Dict[str, Any]:
+        """업로드 파일 일괄 등록 (임시 파일 저장 → 등록 → 임시 파일 삭제)"""
+        temp_path, file_format = await cls.save_upload(file)
+        try:
+            return await cls.import_file(temp_path, target, file_format, dry_run=dry_run)
+        finally:
+            os.remove(temp_path)
+
+    @classmethod
+    async def import_file(
+        cls,
+        path: str,
+        target: str,
+        file_format: Optional[str] = None,
+        dry_run: bool = False,
+        batch_size: int = IMPORT_BATCH_SIZE,
+        max_errors: Optional[int] = MAX_REPORTED_ERRORS,
+    ) -> Dict[str, Any]:
+        """
+        카탈로그 파일 일괄 등록
+
+        Args:
+            path: 파일 경로
+            target: "supplement" / "functional_ingredient"
+            file_format: "csv" / "xlsx" (None이면 확장자로 판별)
+            dry_run: True면 검증만 수행
+            batch_size: 검증/COPY 배치 크기
+            max_errors: 리포트에 담을 최대 오류 수 (None이면 전체)
+
+        Returns:
+            {"total_rows", "valid_rows", "error_count", "inserted", "updated", "errors": [...], ...}
+        """
+        spec = IMPORT_TARGETS[target]
+        report: Dict[str, Any] = {
+            "target": target,
+            "dry_run": dry_run,
+            "total_rows": 0,
+            "valid_rows": 0,
+            "error_count": 0,
+            "inserted": 0,
+            "updated": 0,
+            "errors": [],
+        }
+        started = time.perf_counter()
+        batches = cls._validated_batches(path, file_format or detect_format(path), spec, batch_size, report, max_errors)
+
+        if dry_run:
+            async for batch in batches:
+                report["valid_rows"] += len(batch)
+        else:
+            await cls._load(target, spec, batches, report)
+
+        report["elapsed_ms"] = int((time.perf_counter() - started) * 1000)
+        logger.info(
+            f"카탈로그 일괄 등록: target={target}, dry_run={dry_run}, total={report['total_rows']}, "
+            f"inserted={report['inserted']}, updated={report['updated']}, errors={report['error_count']}, "
+            f"elapsed={report['elapsed_ms']}ms"
+        )
+        return report
+
+    # ============================================
+    # 파싱 / 검증
+    # ============================================
+
+    @classmethod
+    async def _validated_batches(
+        cls,
+        path: str,
+        file_format: str,
+        spec: Dict[str, Any],
+        batch_size: int,
+        report: Dict[str, Any],
+        max_errors: Optional[int],
+    ) -> AsyncIterator[List[Dict[str, Any]]]:
+        """파일을 배치 단위로 읽어 검증된 행 목록을 반환 (파싱은 스레드에서 수행)"""
+        rows = iter_xlsx_rows(path) if file_format == "xlsx" else iter_csv_rows(path)
+        header = await asyncio.to_thread(next, rows, None)
+        if header is None:
+            raise ValidationError("빈 파일입니다.")
+        columns = _resolve_header(header, spec)
+
+        validate: Callable = spec["validate"]
+        key_field = spec["key"]
+        seen_keys: Dict[str, int] = {}
+        row_number = 1
+
+        def add_error(number: int, field: str, message: str) -> None:
+            report["error_count"] += 1
+            if max_errors is None or len(report["errors"]) < max_errors:
+                report["errors"].append({"row": number, "field": field, "message": message})
+
+        while True:
+            chunk = await asyncio.to_thread(cls._read_chunk, rows, batch_size)
+            if not chunk:
+                break
+
+            batch: List[Dict[str, Any]] = []
+            for values in chunk:
+                row_number += 1
+                raw = {field: _cell_text(values[index]) for index, field in columns.items() if index < len(values)}
+                if not any(raw.values()):
+                    continue  # 빈 행
+                report["total_rows"] += 1
+
+                row, errors = validate(raw)
+                key = row.get(key_field)
+                if key:
+                    if key in seen_keys:
+                        errors.append((key_field, f"파일 내 중복 ({seen_keys[key]}행과 동일)"))
+                    else:
+                        seen_keys[key] = row_number
+
+                if errors:
+                    for field, message in errors:
+                        add_error(row_number, field, message)
+                    continue
+                batch.append(row)
+
+            if batch:
+                yield batch
+
+    @staticmethod
+    def _read_chunk(rows: Iterator[List[Any]], size: int) -> List[List[Any]]:
+        chunk = []
+        for values in rows:
+            chunk.append(values)
+            if len(chunk) >= size:
+                break
+        return chunk
+
+    # ============================================
+    # DB 적재
+    # ============================================
+
+    @classmethod
+    async def _load(
+        cls,
+        target: str,
+        spec: Dict[str, Any],
+        batches: AsyncIterator[List[Dict[str, Any]]],
+        report: Dict[str, Any],
+    ) -> None:
+        """스테이징 COPY → MERGE (단일 트랜잭션)"""
+        stage_columns = [column for column, _ in spec["stage_columns"]]
+        stage_ddl = ", ".join(f"{column} {pg_type}" for column, pg_type in spec["stage_columns"])
+        key_field = spec["key"]
+
+        async with app_db_manager.get_async_conn() as conn:
+            try:
+                async with conn.cursor() as cur:
+                    await cur.execute(f"CREATE TEMP TABLE import_stage ({stage_ddl}) ON COMMIT DROP")
+
+                    async for batch in batches:
+                        if target == "functional_ingredient":
+                            await cls._assign_ingredient_codes(cur, batch)
+                        async with cur.copy(f"COPY import_stage ({', '.join(stage_columns)}) FROM STDIN") as copy:
+                            for row in batch:
+                                await copy.write_row([row[column] for column in stage_columns])
+                        report["valid_rows"] += len(batch)
+
+                    if report["valid_rows"]:
+                        await cur.execute(f"CREATE INDEX ON import_stage ({key_field})")
+                        await cur.execute("ANALYZE import_stage")
+
+                        # 기존 행과 매칭되는 스테이징 키 수 = 수정 건수
+                        await cur.execute(
+                            f"""SELECT t.id, s.{key_field} AS import_key FROM {spec['table']} t
+                                JOIN import_stage s ON t.{key_field} = s.{key_field}"""
+                        )
+                        matched = await cur.fetchall()
+                        existing_ids = [row["id"] for row in matched]
+                        updated = len({row["import_key"] for row in matched})
+
+                        await cur.execute(_MERGE_SQL[target])
+                        report["updated"] = updated
+                        report["inserted"] = report["valid_rows"] - updated
+
+                        # 성분명이 바뀌었을 수 있으므로 영양제 매핑 검색 문서 갱신
+                        if target == "functional_ingredient" and existing_ids:
+                            await SupplementSearchIndex.refresh_ingredients(cur, existing_ids)
+                await conn.commit()
+            except BaseException:
+                await conn.rollback()
+                raise
+
+        if report["valid_rows"]:
+            SearchService.schedule_rebuild(spec["search_type"])
+
+    @classmethod
+    async def _assign_ingredient_codes(cls, cur, batch: List[Dict[str, Any]]) -> None:
+        """코드가 없는 행에 시퀀스 값을 배치 단위로 할당 (왕복 1회)"""
+        pending = [row for row in batch if not row["ingredient_code"]]
+        if not pending:
+            return
+        await cur.execute(
+            "SELECT nextval('functional_ingredient_code_seq') AS value FROM generate_series(1, %(count)s)",
+            {"count": len(pending)}
+        )
+        values = [row["value"] for row in await cur.fetchall()]
+        for row, value in zip(pending, values):
+            row["ingredient_code"] = f"FI{str(value).zfill(4)}"
@@ -0,0 +1,245 @@
+"""
+파일: app/services/challenge_analytics_service.py
+설명: 챌린지 참여/인증 통계 (증분 집계)
+  - 참여/인증 원천 테이블을 워터마크 이후 행만 배치로 읽어 일자별 집계 테이블에 누적
+  - 집계 반영 + 워터마크 갱신을 한 트랜잭션으로 처리하고 advisory lock 으로 동시 실행 차단
+    (동시에 새로고침해도 같은 행이 두 번 집계되지 않음)
+  - 조회 시 마지막 집계가 CHALLENGE_ANALYTICS_REFRESH_INTERVAL 보다 오래되면 먼저 증분 집계
+
+SQL: sql/challenge_analytics.sql
+테이블 DDL: schema.sql "36. 챌린지 통계 집계 테이블" 참조
+"""
+import math
+import time
+from datetime import date, datetime, timedelta
+from typing import Any, Dict, List, Optional
+
+from app.config.database import get_connection
+from app.config.settings import settings
+from app.core.exceptions import NotFoundError, ValidationError
+from app.core.logger import logger
+from app.utils.sql_loader import get_sql
+
+
+# 배치당 처리 행 수
+REFRESH_BATCH_SIZE = 5000
+# 1회 새로고침에서 처리할 최대 배치 수 (초기 적재 시 요청 지연 방지, 나머지는 다음 회차)
+MAX_BATCHES_PER_REFRESH = 20
+# 시계열 최대 조회 기간 (일)
+MAX_TIMESERIES_DAYS = 366
+
+# 원천별 배치 쿼리 (워터마크 source 키 → 쿼리명)
+SOURCES = {
+    "challenge_participants": "apply_participant_batch",
+    "challenge_verifications": "apply_verification_batch",
+}
+
+
+class ChallengeAnalyticsService:
+    """챌린지 통계 서비스 (App DB 사용)"""
+
+    # 마지막 새로고침 시각 (monotonic, 프로세스 단위)
+    _last_refreshed_at: float = 0.0
+
+    def __init__(self):
+        self.sql = get_sql("challenge_analytics")
+
+    async def refresh(self, max_batches: int = MAX_BATCHES_PER_REFRESH) -> Dict[str, Any]:
+        """
+        증분 집계 실행
+
+        Args:
+            max_batches: 원천별 최대 배치 수
+
+        Returns:
+            {"skipped": 다른 새로고침 진행 중 여부, "processed": {원천: 처리 행 수}}
+        """
+        processed = {source: 0 for source in SOURCES}
+        started = time.perf_counter()
+
+        for source, query_name in SOURCES.items():
+            for _ in range(max_batches):
+                # 배치마다 트랜잭션 (락은 트랜잭션 종료 시 자동 해제)
+                async with get_connection(use_app_db=True) as conn:
+                    async with conn.cursor() as cur:
+                        await cur.execute(self.sql.get("try_lock_refresh"))
+                        if not (await cur.fetchone())["locked"]:
+                            await conn.rollback()
+                            logger.info("챌린지 통계 새로고침 건너뜀 (다른 새로고침 진행 중)")
+                            return {"skipped": True, "processed": processed}
+
+                        # 처음 생성된 워터마크는 NULL (처음부터 집계)
+                        await cur.execute(self.sql.get("get_watermark"), {"source": source})
+                        watermark = await cur.fetchone()
+
+                        await cur.execute(self.sql.get(query_name), {
+                            "last_created_at": watermark["last_created_at"],
+                            "last_id": str(watermark["last_id"]) if watermark["last_id"] else None,
+                            "lag_seconds": settings.CHALLENGE_ANALYTICS_WATERMARK_LAG,
+                            "batch_size": REFRESH_BATCH_SIZE,
+                        })
+                        batch = await cur.fetchone()
+
+                        await cur.execute(self.sql.get("update_watermark"), {
+                            "source": source,
+                            "last_created_at": batch["last_created_at"],
+                            "last_id": str(batch["last_id"]) if batch["last_id"] else None,
+                        })
+                    await conn.commit()
+
+                processed[source] += batch["processed"]
+                if batch["processed"] < REFRESH_BATCH_SIZE:
+                    break
+
+        type(self)._last_refreshed_at = time.monotonic()
+        if any(processed.values()):
+            elapsed_ms = int((time.perf_counter() - started) * 1000)
+            logger.info(f"챌린지 통계 증분 집계: {processed}, elapsed={elapsed_ms}ms")
+        return {"skipped": False, "processed": processed}
+
+    async def refresh_if_stale(self) -> None:
+        """마지막 새로고침이 설정 간격보다 오래되었으면 증분 집계 (조회 API에서 호출)"""
+        if time.monotonic() - self._last_refreshed_at < settings.CHALLENGE_ANALYTICS_REFRESH_INTERVAL:
+            return
+        try:
+            await self.refresh()
+        except Exception as e:
+            # 집계 실패 시에도 기존 집계로 응답
+            logger.error(f"챌린지 통계 증분 집계 오류: {str(e)}", exc_info=True)
+
+    async def get_timeseries(
+        self,
+        challenge_id: str,
+        date_from: Optional[date] = None,
+        date_to: Optional[date] = None
+    ) -> Dict[str, Any]:
+        """
+        일자별 참여/인증 시계열
+
+        기간 미지정 시 운영 시작일 ~ min(운영 종료일, 오늘), 운영 기간이 없으면 최근 30일
+
+        Returns:
+            {"challenge_id", "date_from", "date_to", "as_of", "items": [...]}
+        """
+        challenge = await self._get_challenge(challenge_id)
+        today = date.today()
+        if date_to is None:
+            end = self._as_date(challenge.get("operation_end_date"))
+            date_to = min(end, today) if end else today
+        if date_from is None:
+            start = self._as_date(challenge.get("operation_start_date"))
+            date_from = start if start and start <= date_to else date_to - timedelta(days=29)
+        if date_from > date_to:
+            raise ValidationError("조회 시작일은 종료일보다 이후일 수 없습니다.")
+        if (date_to - date_from).days + 1 > MAX_TIMESERIES_DAYS:
+            raise ValidationError(f"조회 기간은 최대 {MAX_TIMESERIES_DAYS}일입니다.")
+
+        await self.refresh_if_stale()
+
+        async with get_connection(use_app_db=True) as conn:
+            async with conn.cursor() as cur:
+                await cur.execute(self.sql.get("get_timeseries"), {
+                    "challenge_id": challenge_id,
+                    "date_from": date_from,
+                    "date_to": date_to,
+                })
+                rows = await cur.fetchall()
+                as_of = await self._as_of(cur)
+
+        items = []
+        for row in rows:
+            cumulative = int(row["cumulative_participants"])
+            items.append({
+                "date": row["date"],
+                "joined": row["joined"],
+                "cumulative_participants": cumulative,
+                "verifications": row["verifications"],
+                "verified_members": row["verified_members"],
+                # 인증률 = 해당 일 인증 회원 / 누적 참여자
+                "verification_rate": round(row["verified_members"] / cumulative, 4) if cumulative else 0.0,
+            })
+
+        return {
+            "challenge_id": challenge_id,
+            "date_from": date_from,
+            "date_to": date_to,
+            "as_of": as_of,
+            "items": items,
+        }
+
+    async def get_funnel(self, challenge_id: str) -> Dict[str, Any]:
+        """
+        참여 → 1회 이상 인증 → 목표 절반 달성 → 목표 달성 퍼널 + 스탬프(인증 일수) 분포
+
+        Returns:
+            {"challenge_id", "goal_days", "as_of", "steps": [...], "stamp_distribution": [...]}
+        """
+        challenge = await self._get_challenge(challenge_id)
+        goal_days = max(int(challenge.get("goal_days") or 1), 1)
+
+        await self.refresh_if_stale()
+
+        async with get_connection(use_app_db=True) as conn:
+            async with conn.cursor() as cur:
+                await cur.execute(self.sql.get("get_funnel"), {
+                    "challenge_id": challenge_id,
+                    "half_days": math.ceil(goal_days / 2),
+                    "goal_days": goal_days,
+                })
+                funnel = await cur.fetchone()
+                await cur.execute(self.sql.get("get_stamp_distribution"), {"challenge_id": challenge_id})
+                distribution = await cur.fetchall()
+                as_of = await self._as_of(cur)
+
+        participants = int(funnel["participants"])
+        steps = [
+            ("joined", "참여", participants),
+            ("verified", "1회 이상 인증", funnel["verified_members"]),
+            ("half_achieved", "목표 절반 달성", funnel["half_achieved_members"]),
+            ("achieved", "목표 달성", funnel["achieved_members"]),
+        ]
+
+        # 인증 기록이 없는 참여자는 스탬프 0개 구간
+        stamp_distribution = [{"stamps": row["stamps"], "members": row["members"]} for row in distribution]
+        no_stamp = participants - funnel["verified_members"]
+        if no_stamp > 0:
+            stamp_distribution.insert(0, {"stamps": 0, "members": no_stamp})
+
+        return {
+            "challenge_id": challenge_id,
+            "goal_days": goal_days,
+            "as_of": as_of,
+            "steps": [
+                {
+                    "step": step,
+                    "label": label,
+                    "count": count,
+                    "rate": round(count / participants, 4) if participants else 0.0,
+                }
+                for step, label, count in steps
+            ],
+            "stamp_distribution": stamp_distribution,
+        }
+
+    async def _get_challenge(self, challenge_id: str) -> Dict[str, Any]:
+        async with get_connection(use_app_db=True) as conn:
+            async with conn.cursor() as cur:
+                await cur.execute(self.sql.get("get_challenge_goal"), {"challenge_id": challenge_id})
+                challenge = await cur.fetchone()
+        if not challenge:
+            raise NotFoundError(f"챌린지를 찾을 수 없습니다: {challenge_id}")
+        return challenge
+
+    async def _as_of(self, cur) -> Optional[datetime]:
+        """집계 기준 시각 (원천 중 가장 늦게 처리된 워터마크, 아직 처리 전인 원천이 있으면 None)"""
+        await cur.execute(self.sql.get("get_watermarks"))
+        watermarks: List[Dict[str, Any]] = await cur.fetchall()
+        if len(watermarks) < len(SOURCES) or any(row["last_created_at"] is None for row in watermarks):
+            return None
+        return min(row["last_created_at"] for row in watermarks)
+
+    @staticmethod
+    def _as_date(value: Any) -> Optional[date]:
+        if isinstance(value, datetime):
+            return value.date()
+        return value
@@ -10,6 +10,8 @@ from app.core.exceptions import ValidationError, NotFoundError
 from app.utils.sql_loader import get_sql
 from app.utils.validators import validate_image_urls_dict, validate_roulette_segments
 from app.config.database import get_connection
+from app.services.search_service import SearchService
+from app.services.status_service import StatusService
 
 
 class ChallengeService:
@@ -62,6 +64,8 @@ class ChallengeService:
             "title": title,
             "challenge_type": challenge_type,
             "verification_method": verification_method,
+            "visibility_scope": visibility_scope or None,
+            "statuses": status or None,
             "operation_from": operation_from,
             "operation_to": operation_to,
             "recruitment_from": recruitment_from,
@@ -87,21 +91,6 @@ class ChallengeService:
                 await cur.execute(list_query, params)
                 challenges = await cur.fetchall()
         
-        # 공개범위, 상태 필터 적용 (Python에서 처리)
-        if visibility_scope:
-            challenges = [
-                c for c in challenges 
-                if any(scope in (c.get("visibility_scope") or []) for scope in visibility_scope)
-            ]
-            total = len(challenges)
-        
-        if status:
-            challenges = [
-                c for c in challenges 
-                if c.get("status") in status
-            ]
-            total = len(challenges)
-        
         total_pages = (total + limit - 1) // limit
         
         return {
@@ -216,9 +205,13 @@ class ChallengeService:
             async with conn.cursor() as cur:
                 await cur.execute(query, params)
                 result = await cur.fetchone()
+                # 기간 기준 상태 저장 (같은 트랜잭션)
+                status_changes = await StatusService.refresh(cur, "challenge", [result["id"]]) if result else []
             await conn.commit()
         
         challenge_result = dict(result) if result else {}
+        self._apply_status_changes(challenge_result, status_changes)
+        await StatusService.publish("challenge", status_changes)
         
         # 룰렛 인증 방식인 경우 룰렛 설정 저장
         if challenge_result and data.get("verification_method") == "roulette":
@@ -233,6 +226,8 @@ class ChallengeService:
                     created_by=created_by
                 )
         
+        if challenge_result:
+            SearchService.schedule_sync("challenge", [challenge_result["id"]])
         return challenge_result
 
     async def update_challenge(
@@ -306,9 +301,13 @@ class ChallengeService:
             async with conn.cursor() as cur:
                 await cur.execute(query, params)
                 result = await cur.fetchone()
+                # 기간/일시중지 변경 시 상태 저장 (같은 트랜잭션)
+                status_changes = await StatusService.refresh(cur, "challenge", [challenge_id]) if result else []
             await conn.commit()
         
         challenge_result = dict(result) if result else {}
+        self._apply_status_changes(challenge_result, status_changes)
+        await StatusService.publish("challenge", status_changes)
         
         # 룰렛 인증 방식인 경우 룰렛 설정 업데이트
         if challenge_result:
@@ -325,6 +324,8 @@ class ChallengeService:
                         created_by=updated_by
                     )
         
+        if challenge_result:
+            SearchService.schedule_sync("challenge", [challenge_id])
         return challenge_result
 
     async def delete_challenges(
@@ -352,6 +353,7 @@ class ChallengeService:
                 results = await cur.fetchall()
             await conn.commit()
         
+        SearchService.schedule_sync("challenge", [row["id"] for row in results])
         return len(results)
 
     def _validate_challenge_data(
@@ -449,6 +451,13 @@ class ChallengeService:
                 if not steps_settings or not steps_settings.get("target_steps"):
                     raise ValidationError("목표 걸음수를 설정해주세요.")
 
+    @staticmethod
+    def _apply_status_changes(challenge: Dict[str, Any], status_changes: List[Dict[str, Any]]) -> None:
+        """RETURNING 결과에 갱신된 상태 반영"""
+        for change in status_changes:
+            if challenge and str(challenge.get("id")) == change["id"]:
+                challenge["status"] = change["to"]
+
     def _validate_challenge_update(self, existing: Dict[str, Any], data: Dict[str, Any]) -> None:
         """챌린지 수정 시 유효성 검사"""
         # 챌린지 유형 변경 불가
@@ -762,6 +771,8 @@ class QuizService:
         """퀴즈 챌린지 목록 조회"""
         params = {
             "title": title,
+            "visibility_scope": visibility_scope or None,
+            "statuses": status or None,
             "operation_from": operation_from,
             "operation_to": operation_to,
             "recruitment_from": recruitment_from,
@@ -776,22 +787,7 @@ class QuizService:
                 await cur.execute(query, params)
                 challenges = await cur.fetchall()
         
-        # 공개범위, 상태 필터 적용
-        result = [dict(c) for c in challenges]
-        
-        if visibility_scope:
-            result = [
-                c for c in result 
-                if any(scope in (c.get("visibility_scope") or []) for scope in visibility_scope)
-            ]
-        
-        if status:
-            result = [
-                c for c in result 
-                if c.get("challenge_status") in status
-            ]
-        
-        return result
+        return [dict(c) for c in challenges]
 
     def _validate_quiz_data(self, data: Dict[str, Any]) -> None:
         """퀴즈 데이터 유효성 검사"""
@@ -5,11 +5,15 @@
 
 from typing import Optional, List, Dict, Any
 
-from app.config.database import query, query_one, execute_returning, execute
+from app.config.database import query, query_one, execute
+from app.core.decorators import transaction_context
 from app.core.exceptions import ValidationError, NotFoundError
 from app.core.logger import logger
 from app.models.content import ContentCreate, ContentUpdate
+from app.services.mapping_service import MappingService, CONTENT_CATEGORIES
+from app.services.search_service import SearchService
 from app.utils.validators import validate_image_url, validate_image_urls
+from app.utils.search_filter import search_pattern, ilike_condition
 
 
 class ContentService:
@@ -46,17 +50,19 @@ class ContentService:
         params = {}
         
         if title:
-            conditions.append("c.title ILIKE %(title)s")
-            params["title"] = f"%{title}%"
-        
-        if category_id:
-            conditions.append("c.category_id = %(category_id)s")
-            params["category_id"] = category_id
-        
-        # 다중 카테고리 선택 (category_ids)
-        if category_ids and len(category_ids) > 0:
-            conditions.append("c.category_id = ANY(%(category_ids)s)")
-            params["category_ids"] = category_ids
+            conditions.append(ilike_condition("c.title", "%(title)s"))
+            params["title"] = search_pattern(title)
+        
+        # 카테고리 필터 (단일/다중) - 매핑 테이블 기준 (대표 카테고리 외 추가 카테고리 포함)
+        filter_category_ids = list(category_ids or [])
+        if category_id and category_id not in filter_category_ids:
+            filter_category_ids.append(category_id)
+        if filter_category_ids:
+            conditions.append("""c.id IN (
+                SELECT ccm.content_id FROM public.content_category_mapping ccm
+                WHERE ccm.category_id = ANY(%(category_ids)s::int[])
+            )""")
+            params["category_ids"] = filter_category_ids
         
         if tag:
             conditions.append("%(tag)s = ANY(c.tags)")
@@ -108,29 +114,60 @@ class ContentService:
         params["limit"] = page_size
         params["offset"] = offset
         
+        # 페이지 행을 먼저 확정한 뒤 해당 행에 대해서만 카테고리/썸네일 집계 (LATERAL)
         data_sql = f"""
             SELECT 
                 c.id, c.title, c.category_id, cat.category_name,
+                COALESCE(cats.category_ids, '{{}}') as category_ids,
+                COALESCE(cats.category_names, '{{}}') as category_names,
+                COALESCE(c.thumbnail_url, media.media_url) as thumbnail_url,
                 c.tags, c.visibility_scope,
                 c.start_date, c.end_date, c.updated_at, c.updated_by,
                 COALESCE(c.has_quote, false) as has_quote
-            FROM public.contents c
+            FROM (
+                SELECT c.id, c.title, c.category_id, c.thumbnail_url, c.tags, c.visibility_scope,
+                    c.start_date, c.end_date, c.created_at, c.updated_at, c.updated_by, c.has_quote
+                FROM public.contents c
+                {where_clause}
+                ORDER BY {safe_field} {safe_direction}, c.id
+                LIMIT %(limit)s OFFSET %(offset)s
+            ) c
             LEFT JOIN public.content_categories cat ON c.category_id = cat.id
-            {where_clause}
-            ORDER BY {safe_field} {safe_direction}
-            LIMIT %(limit)s OFFSET %(offset)s
+            LEFT JOIN LATERAL (
+                SELECT
+                    array_agg(mc.id ORDER BY mc.display_order, mc.id) as category_ids,
+                    array_agg(mc.category_name ORDER BY mc.display_order, mc.id) as category_names
+                FROM public.content_category_mapping ccm
+                JOIN public.content_categories mc ON ccm.category_id = mc.id
+                WHERE ccm.content_id = c.id
+            ) cats ON true
+            LEFT JOIN LATERAL (
+                SELECT cm.media_url
+                FROM public.content_media cm
+                WHERE cm.content_id = c.id AND cm.media_type IN ('thumbnail', 'image')
+                ORDER BY cm.display_order, cm.created_at
+                LIMIT 1
+            ) media ON true
+            ORDER BY {safe_field} {safe_direction}, c.id
         """
         
         data = await query(data_sql, params, use_app_db=True)
         
-        # 결과 포맷팅
+        # 결과 포맷팅 (매핑이 없는 기존 데이터는 대표 카테고리로 대체)
         formatted_data = []
         for item in data:
+            category_names = item.get("category_names") or []
+            if not category_names and item.get("category_name"):
+                category_names = [item["category_name"]]
+            category_ids = item.get("category_ids") or []
+            if not category_ids and item.get("category_id"):
+                category_ids = [item["category_id"]]
             formatted_data.append({
                 **item,
                 "tags": item.get("tags") or [],
                 "visibility_scope": item.get("visibility_scope") or ["all"],
-                "category_names": [item["category_name"]] if item.get("category_name") else [],
+                "category_ids": category_ids,
+                "category_names": category_names,
             })
         
         return {
@@ -162,9 +199,18 @@ class ContentService:
                      FROM public.content_media cm
                      WHERE cm.content_id = c.id AND cm.media_type = 'image'),
                     '{}'
-                ) as detail_images
+                ) as detail_images,
+                cats.category_ids, cats.category_names
             FROM public.contents c
             LEFT JOIN public.content_categories cat ON c.category_id = cat.id
+            LEFT JOIN LATERAL (
+                SELECT
+                    array_agg(mc.id ORDER BY mc.display_order, mc.id) as category_ids,
+                    array_agg(mc.category_name ORDER BY mc.display_order, mc.id) as category_names
+                FROM public.content_category_mapping ccm
+                JOIN public.content_categories mc ON ccm.category_id = mc.id
+                WHERE ccm.content_id = c.id
+            ) cats ON true
             WHERE c.id = %(content_id)s
         """
         result = await query_one(sql, {"content_id": content_id}, use_app_db=True)
@@ -174,7 +220,10 @@ class ContentService:
             result["visibility_scope"] = result.get("visibility_scope") or ["all"]
             result["company_codes"] = result.get("company_codes") or []
             result["detail_images"] = result.get("detail_images") or []
-            result["category_names"] = [result["category_name"]] if result.get("category_name") else []
+            if not result.get("category_names"):
+                result["category_names"] = [result["category_name"]] if result.get("category_name") else []
+            if not result.get("category_ids"):
+                result["category_ids"] = [result["category_id"]] if result.get("category_id") else []
         
         return result
     
@@ -200,60 +249,52 @@ class ContentService:
         # 첫 번째 카테고리 ID 사용
         category_id = data.category_ids[0] if data.category_ids else None
         
-        result = await execute_returning(
-            """
-            INSERT INTO public.contents (
-                title, content, thumbnail_url, category_id, tags, visibility_scope, company_codes,
-                store_visible, start_date, end_date, has_quote, quote_content, quote_source,
-                is_published, published_at,
-                created_by, updated_by
-            ) VALUES (
-                %(title)s, %(content)s, %(thumbnail_url)s, %(category_id)s, %(tags)s,
-                %(visibility_scope)s, %(company_codes)s, %(store_visible)s, %(start_date)s,
-                %(end_date)s, %(has_quote)s, %(quote_content)s, %(quote_source)s,
-                true, NOW(),
-                %(created_by)s, %(created_by)s
-            )
-            RETURNING id
-            """,
-            {
-                "title": data.title.strip(),
-                "content": data.content,
-                "thumbnail_url": validated_thumbnail,
-                "category_id": category_id,
-                "tags": data.tags,
-                "visibility_scope": data.visibility_scope,
-                "company_codes": data.company_codes,
-                "store_visible": data.is_store_visible or data.store_visible,
-                "start_date": data.start_date,
-                "end_date": data.end_date,
-                "has_quote": data.has_quote,
-                "quote_content": data.quote_content,
-                "quote_source": data.quote_source,
-                "created_by": created_by,
-            },
-            use_app_db=True
-        )
-        
-        content_id = result.get("id")
-        
-        # 상세 이미지 저장 (검증 완료된 URL 사용)
-        if content_id and validated_detail_images:
-            for i, image_url in enumerate(validated_detail_images):
-                await execute(
+        # 컨텐츠 / 상세 이미지 / 카테고리 매핑을 하나의 트랜잭션으로 저장
+        async with transaction_context(use_app_db=True) as conn:
+            async with conn.cursor() as cur:
+                await cur.execute(
                     """
-                    INSERT INTO public.content_media (content_id, media_type, media_url, display_order)
-                    VALUES (%(content_id)s, 'image', %(media_url)s, %(display_order)s)
+                    INSERT INTO public.contents (
+                        title, content, thumbnail_url, category_id, tags, visibility_scope, company_codes,
+                        store_visible, start_date, end_date, has_quote, quote_content, quote_source,
+                        is_published, published_at,
+                        created_by, updated_by
+                    ) VALUES (
+                        %(title)s, %(content)s, %(thumbnail_url)s, %(category_id)s, %(tags)s,
+                        %(visibility_scope)s, %(company_codes)s, %(store_visible)s, %(start_date)s,
+                        %(end_date)s, %(has_quote)s, %(quote_content)s, %(quote_source)s,
+                        true, NOW(),
+                        %(created_by)s, %(created_by)s
+                    )
+                    RETURNING id
                     """,
                     {
-                        "content_id": content_id,
-                        "media_url": image_url,
-                        "display_order": i + 1
-                    },
-                    use_app_db=True
+                        "title": data.title.strip(),
+                        "content": data.content,
+                        "thumbnail_url": validated_thumbnail,
+                        "category_id": category_id,
+                        "tags": data.tags,
+                        "visibility_scope": data.visibility_scope,
+                        "company_codes": data.company_codes,
+                        "store_visible": data.is_store_visible or data.store_visible,
+                        "start_date": data.start_date,
+                        "end_date": data.end_date,
+                        "has_quote": data.has_quote,
+                        "quote_content": data.quote_content,
+                        "quote_source": data.quote_source,
+                        "created_by": created_by,
+                    }
                 )
+                content_id = (await cur.fetchone())["id"]
+                
+                # 상세 이미지 저장 (검증 완료된 URL, 단일 INSERT)
+                await cls._insert_media(cur, content_id, validated_detail_images)
+                
+                if data.category_ids:
+                    await cls._save_categories(cur, content_id, data.category_ids)
         
         logger.info(f"컨텐츠 생성: id={content_id}")
+        SearchService.schedule_sync("content", [content_id])
         return {"id": str(content_id)}
     
     @classmethod
@@ -333,7 +374,17 @@ class ContentService:
             update_fields.append("quote_source = %(quote_source)s")
             params["quote_source"] = data.quote_source
         
-        if not update_fields:
+        validated_detail_images = None
+        if data.detail_images is not None:
+            # 이미지 URL 서버측 검증 (프로세스 검증 누락 취약점 대응)
+            validated_detail_images = validate_image_urls(data.detail_images)
+        
+        # 카테고리 매핑 (category_ids 전달 시 전체 교체, 단일 category_id 만 오면 해당 카테고리로 교체)
+        category_ids = None
+        if data.category_ids or data.category_id is not None:
+            category_ids = data.category_ids or [data.category_id]
+        
+        if not update_fields and validated_detail_images is None and category_ids is None:
             return existing
         
         update_fields.append("updated_by = %(updated_by)s")
@@ -343,39 +394,22 @@ class ContentService:
             UPDATE public.contents
             SET {', '.join(update_fields)}
             WHERE id = %(content_id)s
-            RETURNING id
         """
         
-        await execute_returning(sql, params, use_app_db=True)
-        
-        # 상세 이미지 업데이트 (검증 완료된 URL 사용)
-        if data.detail_images is not None:
-            validated_detail_images = validate_image_urls(data.detail_images)
-            
-            # 기존 이미지 삭제
-            await execute(
-                "DELETE FROM public.content_media WHERE content_id = %(content_id)s AND media_type = 'image'",
-                {"content_id": content_id},
-                use_app_db=True
-            )
-            
-            # 새 이미지 추가
-            if validated_detail_images:
-                for i, image_url in enumerate(validated_detail_images):
-                    await execute(
-                        """
-                        INSERT INTO public.content_media (content_id, media_type, media_url, display_order)
-                        VALUES (%(content_id)s, 'image', %(media_url)s, %(display_order)s)
-                        """,
-                        {
-                            "content_id": content_id,
-                            "media_url": image_url,
-                            "display_order": i + 1
-                        },
-                        use_app_db=True
-                    )
+        # 컨텐츠 / 상세 이미지 / 카테고리 매핑을 하나의 트랜잭션으로 저장
+        async with transaction_context(use_app_db=True) as conn:
+            async with conn.cursor() as cur:
+                await cur.execute(sql, params)
+                
+                # 상세 이미지: 변경분만 반영 (삭제/순서 변경/추가)
+                if validated_detail_images is not None:
+                    await cls._sync_media(cur, content_id, validated_detail_images)
+                
+                if category_ids is not None:
+                    await cls._save_categories(cur, content_id, category_ids)
         
         logger.info(f"컨텐츠 수정: id={content_id}")
+        SearchService.schedule_sync("content", [content_id])
         return await cls.get_by_id(content_id)
     
     @classmethod
@@ -397,6 +431,7 @@ class ContentService:
         
         if affected > 0:
             logger.info(f"컨텐츠 삭제: id={content_id}")
+            SearchService.schedule_sync("content", [content_id])
             return True
         return False
     
@@ -422,6 +457,126 @@ class ContentService:
         )
         
         logger.info(f"컨텐츠 일괄 삭제: {affected}건")
+        SearchService.schedule_sync("content", content_ids)
         return affected
-
-
+    
+    # ============================================
+    # 내부 저장 (호출자 트랜잭션의 커서 사용)
+    # ============================================
+    
+    @classmethod
+    async def _save_categories(cls, cur, content_id: str, category_ids: List[int]) -> None:
+        """
+        컨텐츠 카테고리 매핑 저장 (추가/삭제분만 반영)
+        
+        Args:
+            cur: App DB 커서 (호출자 트랜잭션)
+            content_id: 컨텐츠 ID
+            category_ids: 카테고리 ID 목록 (첫 번째가 대표 카테고리)
+        """
+        await MappingService.sync(
+            cur, CONTENT_CATEGORIES, content_id,
+            [{"category_id": category_id} for category_id in category_ids if category_id]
+        )
+    
+    @classmethod
+    async def _insert_media(
+        cls,
+        cur,
+        content_id: str,
+        media_urls: List[str],
+        display_orders: Optional[List[int]] = None
+    ) -> None:
+        """
+        상세 이미지 일괄 등록 (unnest 단일 INSERT)
+        
+        Args:
+            cur: App DB 커서 (호출자 트랜잭션)
+            content_id: 컨텐츠 ID
+            media_urls: 이미지 URL 목록
+            display_orders: 표시 순서 목록 (생략 시 1부터 순서대로)
+        """
+        if not media_urls:
+            return
+        await cur.execute(
+            """
+            INSERT INTO public.content_media (content_id, media_type, media_url, display_order)
+            SELECT %(content_id)s, 'image', u.media_url, u.display_order
+            FROM unnest(%(media_urls)s::text[], %(display_orders)s::int[]) AS u(media_url, display_order)
+            """,
+            {
+                "content_id": content_id,
+                "media_urls": media_urls,
+                "display_orders": display_orders or list(range(1, len(media_urls) + 1)),
+            }
+        )
+    
+    @classmethod
+    async def _sync_media(cls, cur, content_id: str, media_urls: List[str]) -> Dict[str, int]:
+        """
+        상세 이미지 동기화 (전체 삭제 후 재등록 대신 변경분만 반영)
+        
+        같은 URL의 기존 행은 유지하고 표시 순서만 갱신한다. (중복 URL은 등장 순서대로 대응)
+        조회 1 + 쓰기 최대 3회 (DELETE / UPDATE / INSERT)
+        
+        Args:
+            cur: App DB 커서 (호출자 트랜잭션)
+            content_id: 컨텐츠 ID
+            media_urls: 원하는 이미지 URL 목록 (표시 순서대로)
+        
+        Returns:
+            {"added": n, "removed": n, "reordered": n, "unchanged": n}
+        """
+        await cur.execute(
+            """
+            SELECT id, media_url, display_order FROM public.content_media
+            WHERE content_id = %(content_id)s AND media_type = 'image'
+            ORDER BY display_order, created_at
+            FOR UPDATE
+            """,
+            {"content_id": content_id}
+        )
+        existing: Dict[str, List[Dict[str, Any]]] = {}
+        for row in await cur.fetchall():
+            existing.setdefault(row["media_url"], []).append(row)
+        
+        added_urls, added_orders = [], []
+        reorder_ids, reorder_orders = [], []
+        unchanged = 0
+        for order, media_url in enumerate(media_urls, start=1):
+            rows = existing.get(media_url)
+            if not rows:
+                added_urls.append(media_url)
+                added_orders.append(order)
+                continue
+            row = rows.pop(0)
+            if row["display_order"] != order:
+                reorder_ids.append(str(row["id"]))
+                reorder_orders.append(order)
+            else:
+                unchanged += 1
+        removed_ids = [str(row["id"]) for rows in existing.values() for row in rows]
+        
+        if removed_ids:
+            await cur.execute(
+                "DELETE FROM public.content_media WHERE id = ANY(%(ids)s::uuid[])",
+                {"ids": removed_ids}
+            )
+        if reorder_ids:
+            await cur.execute(
+                """
+                UPDATE public.content_media AS cm
+                SET display_order = u.display_order
+                FROM unnest(%(ids)s::uuid[], %(display_orders)s::int[]) AS u(id, display_order)
+                WHERE cm.id = u.id
+                """,
+                {"ids": reorder_ids, "display_orders": reorder_orders}
+            )
+        await cls._insert_media(cur, content_id, added_urls, added_orders)
+        
+        return {
+            "added": len(added_urls),
+            "removed": len(removed_ids),
+            "reordered": len(reorder_ids),
+            "unchanged": unchanged,
+        }
@@ -0,0 +1,207 @@
+"""
+파일: app/services/health_service.py
+설명: 준비 상태(readiness) 점검 및 종료 시 드레인
+  - 준비 상태: 커넥션 풀별 획득 + SELECT 1, Redis PING (항목별 HEALTH_CHECK_TIMEOUT)
+    결과는 HEALTH_CACHE_SECONDS 동안 재사용 (동시 요청은 점검 1회를 함께 기다림)
+  - 드레인 (SIGTERM):
+    1) 준비 상태 실패(503) + 백그라운드 스케줄러 중지 (리더 락 반환 → 다른 인스턴스가 이어받음)
+    2) DRAIN_DELAY_SECONDS 동안 요청은 계속 처리 (로드밸런서가 대상에서 제외할 시간, 응답은 Connection: close)
+    3) uvicorn 종료 처리로 넘김 (새 연결 거부, 진행 중 요청 완료 대기 → lifespan 종료)
+  - 두 번째 SIGTERM 은 대기 없이 바로 uvicorn 으로 전달
+"""
+import asyncio
+import signal
+import threading
+import time
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+from app.config import database
+from app.config.redis import get_redis
+from app.config.settings import settings
+from app.core.logger import logger
+from app.lib.app_db import app_db_manager
+
+
+class HealthService:
+    """준비 상태 점검 / 드레인 (프로세스 단위 상태)"""
+
+    _draining: bool = False
+    _in_flight: int = 0
+    _idle: Optional[asyncio.Event] = None
+
+    _cached_at: float = 0.0
+    _cached: Optional[Dict[str, Any]] = None
+    _check_lock: Optional[asyncio.Lock] = None
+
+    _loop: Optional[asyncio.AbstractEventLoop] = None
+    _server_handler: Optional[Callable] = None
+    _on_drain: Optional[Callable[[], Awaitable[None]]] = None
+    _drain_task: Optional[asyncio.Task] = None
+
+    # ============================================
+    # 진행 중 요청 (DrainMiddleware 에서 호출)
+    # ============================================
+
+    @classmethod
+    def is_draining(cls) -> bool:
+        return cls._draining
+
+    @classmethod
+    def request_started(cls) -> None:
+        if cls._idle is None:
+            cls._idle = asyncio.Event()
+        cls._in_flight += 1
+        cls._idle.clear()
+
+    @classmethod
+    def request_finished(cls) -> None:
+        cls._in_flight -= 1
+        if cls._in_flight == 0 and cls._idle is not None:
+            cls._idle.set()
+
+    @classmethod
+    async def wait_idle(cls, timeout: float) -> None:
+        """진행 중 요청 완료 대기 (lifespan 종료 시, 커넥션 풀 종료 전 호출)"""
+        if cls._in_flight <= 0 or cls._idle is None:
+            return
+        try:
+            await asyncio.wait_for(cls._idle.wait(), timeout)
+        except asyncio.TimeoutError:
+            logger.warning(f"진행 중 요청 {cls._in_flight}건 종료 대기 시간 초과")
+
+    # ============================================
+    # 준비 상태 점검
+    # ============================================
+
+    @classmethod
+    async def readiness(cls) -> Dict[str, Any]:
+        """
+        준비 상태 (캐시 사용)
+
+        Returns:
+            {"ready": bool, "status": "ready" | "not_ready" | "draining", "checks": {...}}
+        """
+        if cls._draining:
+            return {"ready": False, "status": "draining", "checks": {}}
+
+        if cls._cached is not None and time.monotonic() - cls._cached_at < settings.HEALTH_CACHE_SECONDS:
+            return cls._cached
+
+        if cls._check_lock is None:
+            cls._check_lock = asyncio.Lock()
+        async with cls._check_lock:
+            # 잠금을 기다리는 동안 다른 요청이 점검을 끝냈으면 그 결과 사용
+            if cls._cached is not None and time.monotonic() - cls._cached_at < settings.HEALTH_CACHE_SECONDS:
+                return cls._cached
+
+            pools = {
+                "admin_db": database.db_pool,
+                "app_db": database.app_db_pool,
+                "app_db_manager": app_db_manager.async_pool,
+            }
+            names = [*pools.keys(), "redis"]
+            results = await asyncio.gather(
+                *(cls._check_pool(pool) for pool in pools.values()),
+                cls._check_redis(),
+            )
+            checks = dict(zip(names, results))
+            ready = all(check["ok"] for check in checks.values())
+            result = {"ready": ready, "status": "ready" if ready else "not_ready", "checks": checks}
+
+            if not ready and (cls._cached is None or cls._cached["ready"]):
+                failed = [name for name, check in checks.items() if not check["ok"]]
+                logger.warning(f"준비 상태 점검 실패: {', '.join(failed)}")
+
+            cls._cached, cls._cached_at = result, time.monotonic()
+            return result
+
+    @staticmethod
+    async def _check_pool(pool) -> Dict[str, Any]:
+        """커넥션 풀 점검 (획득 대기 + SELECT 1, 풀이 고갈되면 획득 시간 초과로 실패)"""
+        if pool is None:
+            return {"ok": False, "error": "not_initialized"}
+
+        # pop_stats 는 메트릭 수집기가 사용하므로 현재 값만 읽는다
+        stats = pool.get_stats()
+        result: Dict[str, Any] = {
+            "size": stats.get("pool_size", 0),
+            "available": stats.get("pool_available", 0),
+            "max": stats.get("pool_max", 0),
+            "waiting": stats.get("requests_waiting", 0),
+        }
+        started = time.perf_counter()
+        try:
+            async with pool.connection(timeout=settings.HEALTH_CHECK_TIMEOUT) as conn:
+                await asyncio.wait_for(conn.execute("SELECT 1"), settings.HEALTH_CHECK_TIMEOUT)
+            result["ok"] = True
+        except Exception as e:
+            result["ok"] = False
+            result["error"] = type(e).__name__
+        result["latency_ms"] = round((time.perf_counter() - started) * 1000, 1)
+        return result
+
+    @staticmethod
+    async def _check_redis() -> Dict[str, Any]:
+        started = time.perf_counter()
+        try:
+            redis = await asyncio.wait_for(get_redis(), settings.HEALTH_CHECK_TIMEOUT)
+            await asyncio.wait_for(redis.ping(), settings.HEALTH_CHECK_TIMEOUT)
+            result: Dict[str, Any] = {"ok": True}
+        except Exception as e:
+            result = {"ok": False, "error": type(e).__name__}
+        result["latency_ms"] = round((time.perf_counter() - started) * 1000, 1)
+        return result
+
+    # ============================================
+    # 드레인
+    # ============================================
+
+    @classmethod
+    def install_signal_handler(cls, on_drain: Callable[[], Awaitable[None]]) -> None:
+        """
+        SIGTERM 처리기 설치 (lifespan 시작 시 호출)
+
+        uvicorn 이 설치한 처리기를 감싸서, 드레인 대기 후 원래 처리기를 호출한다.
+        메인 스레드가 아니거나 서버 처리기가 없으면 (테스트/스크립트 실행) 설치하지 않는다.
+        """
+        if threading.current_thread() is not threading.main_thread():
+            return
+        handler = signal.getsignal(signal.SIGTERM)
+        if not callable(handler):
+            return
+        cls._loop = asyncio.get_running_loop()
+        cls._server_handler = handler
+        cls._on_drain = on_drain
+        signal.signal(signal.SIGTERM, cls._handle_sigterm)
+
+    @classmethod
+    def _handle_sigterm(cls, sig, frame) -> None:
+        if cls._draining or cls._loop is None:
+            # 두 번째 신호: 바로 종료 처리
+            cls._server_handler(sig, frame)
+            return
+        cls._loop.call_soon_threadsafe(cls._begin_drain, sig, frame)
+
+    @classmethod
+    def _begin_drain(cls, sig, frame) -> None:
+        logger.info(f"SIGTERM 수신 - {settings.DRAIN_DELAY_SECONDS}초 후 서버 종료 처리")
+        cls.mark_draining()
+        cls._drain_task = asyncio.create_task(cls._drain(sig, frame), name="drain")
+
+    @classmethod
+    def mark_draining(cls) -> None:
+        """드레인 시작 표시 (이후 준비 상태는 draining)"""
+        if not cls._draining:
+            cls._draining = True
+            logger.info(f"드레인 시작 - 진행 중 요청 {cls._in_flight}건")
+
+    @classmethod
+    async def _drain(cls, sig, frame) -> None:
+        try:
+            if cls._on_drain is not None:
+                await cls._on_drain()
+        except Exception as e:
+            logger.error(f"드레인 작업 오류: {str(e)}", exc_info=True)
+        await asyncio.sleep(settings.DRAIN_DELAY_SECONDS)
+        logger.info(f"드레인 대기 완료 - 진행 중 요청 {cls._in_flight}건, 서버 종료 처리 시작")
+        cls._server_handler(sig, frame)
@@ -0,0 +1,221 @@
+# ============================================
+# 이미지 파생본 서비스
+# ============================================
+# 업로드 원본으로부터 리사이즈/WebP 파생본 생성
+# - thumbnail / medium / original 3단계 크기
+# - 각 크기별 원본 포맷 + WebP 버전
+# - CPU 바운드 작업이므로 프로세스 풀 워커에서 실행
+# - 결과는 {stem}.manifest.json 매니페스트로 기록
+
+import asyncio
+import json
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from app.config.settings import settings
+from app.core.logger import logger
+
+try:
+    from PIL import Image, ImageOps
+except ImportError:  # pragma: no cover
+    Image = None
+    ImageOps = None
+
+
+# 파생본 최대 가로 크기 (px) - original은 리사이즈하지 않음
+DERIVATIVE_WIDTHS = {
+    "thumbnail": 320,
+    "medium": 960,
+}
+# 매니페스트 파일 접미사
+MANIFEST_SUFFIX = ".manifest.json"
+# Pillow 저장 포맷 매핑
+_PIL_FORMATS = {"jpg": "JPEG", "jpeg": "JPEG", "png": "PNG", "gif": "GIF", "webp": "WEBP"}
+
+
+# 프로세스 풀 (지연 생성)
+_executor: Optional[ProcessPoolExecutor] = None
+
+
+def get_executor() -> ProcessPoolExecutor:
+    """이미지 처리용 프로세스 풀 반환"""
+    global _executor
+
+    if _executor is None:
+        _executor = ProcessPoolExecutor(max_workers=settings.IMAGE_WORKERS)
+        logger.info(f"이미지 처리 프로세스 풀 생성 (workers={settings.IMAGE_WORKERS})")
+
+    return _executor
+
+
+def shutdown_executor() -> None:
+    """이미지 처리용 프로세스 풀 종료"""
+    global _executor
+
+    if _executor is not None:
+        _executor.shutdown(wait=True, cancel_futures=True)
+        _executor = None
+        logger.info("이미지 처리 프로세스 풀 종료")
+
+
+def manifest_path_for(image_path: Path) -> Path:
+    """원본 이미지의 매니페스트 파일 경로"""
+    return image_path.with_name(f"{image_path.stem}{MANIFEST_SUFFIX}")
+
+
+def _save_variant(image, path: Path, fmt: str, quality: int) -> None:
+    """파생본 저장 (포맷별 옵션 적용)"""
+    if fmt == "JPEG":
+        image.convert("RGB").save(path, fmt, quality=quality, optimize=True, progressive=True)
+    elif fmt == "WEBP":
+        image.save(path, fmt, quality=quality, method=4)
+    elif fmt == "PNG":
+        image.save(path, fmt, optimize=True)
+    else:
+        image.save(path, fmt)
+
+
+def generate_derivatives(src_path: str, webp_quality: int, jpeg_quality: int) -> Dict[str, Any]:
+    """
+    파생본 생성 (프로세스 풀 워커에서 실행되는 동기 함수)
+
+    Args:
+        src_path: 원본 이미지 경로
+        webp_quality: WebP 품질 (0~100)
+        jpeg_quality: JPEG 품질 (0~100)
+
+    Returns:
+        {variant: {"file", "webp", "width", "height"}} 딕셔너리
+        (파일명은 원본과 같은 디렉토리 기준)
+    """
+    src = Path(src_path)
+    ext = src.suffix.lstrip(".").lower()
+    fmt = _PIL_FORMATS.get(ext, "JPEG")
+    variants: Dict[str, Any] = {}
+
+    with Image.open(src) as opened:
+        # 애니메이션 GIF/WebP는 프레임 손실을 피하기 위해 파생본을 만들지 않음
+        if getattr(opened, "is_animated", False):
+            return {
+                "original": {
+                    "file": src.name,
+                    "webp": None,
+                    "width": opened.width,
+                    "height": opened.height,
+                }
+            }
+
+        # EXIF 회전 정보 반영
+        image = ImageOps.exif_transpose(opened)
+        if image.mode not in ("RGB", "RGBA"):
+            image = image.convert("RGBA" if "transparency" in image.info else "RGB")
+
+        # original: 리사이즈 없이 WebP 버전만 생성
+        original_webp = None
+        if fmt != "WEBP":
+            original_webp = f"{src.stem}.webp"
+            _save_variant(image, src.with_name(original_webp), "WEBP", webp_quality)
+        variants["original"] = {
+            "file": src.name,
+            "webp": original_webp or src.name,
+            "width": image.width,
+            "height": image.height,
+        }
+
+        for name, max_width in DERIVATIVE_WIDTHS.items():
+            # 원본이 더 작으면 업스케일하지 않고 원본을 그대로 가리킴
+            if image.width <= max_width:
+                variants[name] = dict(variants["original"])
+                continue
+
+            height = max(1, round(image.height * max_width / image.width))
+            resized = image.resize((max_width, height), Image.LANCZOS)
+
+            file_name = f"{src.stem}__{name}.{ext}"
+            webp_name = f"{src.stem}__{name}.webp"
+            _save_variant(resized, src.with_name(file_name), fmt, jpeg_quality)
+            if fmt != "WEBP":
+                _save_variant(resized, src.with_name(webp_name), "WEBP", webp_quality)
+            else:
+                webp_name = file_name
+
+            variants[name] = {
+                "file": file_name,
+                "webp": webp_name,
+                "width": max_width,
+                "height": height,
+            }
+
+    # 매니페스트 기록
+    manifest = {"source": src.name, "variants": variants}
+    manifest_path_for(src).write_text(json.dumps(manifest, ensure_ascii=False), encoding="utf-8")
+
+    return variants
+
+
+class ImageService:
+    """이미지 파생본 서비스 클래스"""
+
+    @classmethod
+    def is_enabled(cls) -> bool:
+        """파생본 생성 가능 여부 (설정 + Pillow 설치 여부)"""
+        return settings.IMAGE_DERIVATIVES_ENABLED and Image is not None
+
+    @classmethod
+    async def create_derivatives(cls, image_path: Path, url_prefix: str) -> Optional[Dict[str, Any]]:
+        """
+        업로드된 원본의 파생본 생성
+
+        실패해도 업로드 자체는 성공으로 처리하기 위해 예외를 삼키고 None 반환.
+
+        Args:
+            image_path: 원본 이미지 경로
+            url_prefix: 파생본 URL 접두사 (예: /uploads/contents)
+
+        Returns:
+            {variant: {"url", "webp", "width", "height"}} 또는 None
+        """
+        if not cls.is_enabled():
+            return None
+
+        try:
+            loop = asyncio.get_running_loop()
+            variants = await loop.run_in_executor(
+                get_executor(),
+                generate_derivatives,
+                str(image_path),
+                settings.IMAGE_WEBP_QUALITY,
+                settings.IMAGE_JPEG_QUALITY,
+            )
+        except Exception as e:
+            logger.warning(f"이미지 파생본 생성 실패: {image_path} - {str(e)}")
+            return None
+
+        return cls.to_urls(variants, url_prefix)
+
+    @classmethod
+    def to_urls(cls, variants: Dict[str, Any], url_prefix: str) -> Dict[str, Any]:
+        """매니페스트의 파일명을 URL로 변환"""
+        prefix = url_prefix.rstrip("/")
+        return {
+            name: {
+                "url": f"{prefix}/{info['file']}",
+                "webp": f"{prefix}/{info['webp']}" if info.get("webp") else None,
+                "width": info.get("width"),
+                "height": info.get("height"),
+            }
+            for name, info in variants.items()
+        }
+
+    @classmethod
+    def load_manifest(cls, image_path: Path) -> Optional[Dict[str, Any]]:
+        """저장된 매니페스트 조회 (없으면 None)"""
+        path = manifest_path_for(image_path)
+        if not path.exists():
+            return None
+        try:
+            return json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError) as e:
+            logger.warning(f"매니페스트 읽기 실패: {path} - {str(e)}")
+            return None
@@ -0,0 +1,92 @@
+"""
+파일: app/services/log_partition_scheduler.py
+설명: 로그 파티션 스케줄러 (lifespan 백그라운드 태스크)
+  - 리더가 되면, 그리고 LOG_PARTITION_INTERVAL 마다 LogPartitionService.maintain 실행
+    (다음 달 파티션 미리 생성 + 보관 기간 경과 파티션 내보내기)
+  - 여러 워커/인스턴스 중 Redis 리더 락을 가진 하나만 실행
+  - 내보내기가 오래 걸려도 리더 락은 계속 연장되도록 관리 작업은 별도 태스크로 실행
+"""
+import asyncio
+import time
+from typing import Optional
+
+from app.config.settings import settings
+from app.core.logger import logger
+from app.lib.leader_lock import LeaderLock
+from app.services.log_partition_service import LogPartitionService
+
+
+# 리더 락 TTL (초) - 틱마다 연장
+LOCK_TTL_SECONDS = 60
+# 틱 간격 (초)
+TICK_SECONDS = 20
+# 오류 발생 시 재시도 간격 (초)
+RETRY_INTERVAL = 300
+
+
+class LogPartitionScheduler:
+    """로그 파티션 스케줄러 (프로세스당 1개 태스크)"""
+
+    _task: Optional[asyncio.Task] = None
+    _job: Optional[asyncio.Task] = None
+    _lock: Optional[LeaderLock] = None
+    _failed_at: Optional[float] = None
+
+    @classmethod
+    def start(cls) -> None:
+        """스케줄러 시작 (lifespan 시작 시 호출)"""
+        if not settings.LOG_PARTITION_ENABLED or cls._task is not None:
+            return
+        cls._lock = LeaderLock("log_partition_scheduler", ttl_seconds=LOCK_TTL_SECONDS, fallback=False)
+        cls._task = asyncio.create_task(cls._run(), name="log_partition_scheduler")
+        logger.info("로그 파티션 스케줄러 시작")
+
+    @classmethod
+    async def stop(cls) -> None:
+        """스케줄러 중지 + 리더 락 해제 (lifespan 종료 시, 커넥션 풀 종료 전 호출)"""
+        if cls._task is None:
+            return
+        for task in (cls._task, cls._job):
+            if task is not None:
+                task.cancel()
+                try:
+                    await task
+                except (asyncio.CancelledError, Exception):
+                    pass
+        cls._task = cls._job = None
+        if cls._lock is not None:
+            await cls._lock.release()
+        logger.info("로그 파티션 스케줄러 중지")
+
+    @classmethod
+    async def _run(cls) -> None:
+        due_at = 0.0  # 다음 관리 작업 시각 (monotonic)
+        while True:
+            try:
+                was_leader = cls._lock.is_leader
+                if await cls._lock.acquire():
+                    now = time.monotonic()
+                    if not was_leader:
+                        due_at = now
+                    if cls._failed_at is not None:
+                        # 실패 시 LOG_PARTITION_INTERVAL 까지 기다리지 않고 재시도
+                        due_at = min(due_at, cls._failed_at + RETRY_INTERVAL)
+                        cls._failed_at = None
+                    if now >= due_at and (cls._job is None or cls._job.done()):
+                        cls._job = asyncio.create_task(cls._maintain(), name="log_partition_maintain")
+                        due_at = now + settings.LOG_PARTITION_INTERVAL
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"로그 파티션 스케줄러 오류: {str(e)}", exc_info=True)
+            await asyncio.sleep(TICK_SECONDS)
+
+    @classmethod
+    async def _maintain(cls) -> None:
+        try:
+            await LogPartitionService.maintain()
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error(f"로그 파티션 관리 실패: {str(e)}", exc_info=True)
+            cls._failed_at = time.monotonic()
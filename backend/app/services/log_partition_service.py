@@ -0,0 +1,233 @@
+"""
+파일: app/services/log_partition_service.py
+설명: 접속/개인정보 접근 로그 월별 파티션 관리 (Admin DB)
+  - 로그 테이블은 login_at 월별 RANGE 파티션 ({테이블}_pYYYYMM) + 기본 파티션 ({테이블}_default)
+    (전환 DDL: schema.sql "39. 접속/개인정보 접근 로그 월별 파티션" 참조)
+  - 파티션 미리 생성: 이번 달 ~ LOG_PARTITION_PREMAKE_MONTHS 개월 뒤
+    (기본 파티션에 이미 들어온 해당 월 행은 새 파티션으로 옮긴 뒤 연결)
+  - 보관 기간(LOG_RETENTION_MONTHS) 지난 파티션: 분리(DETACH) → LOG_ARCHIVE_DIR 에 csv.gz 로 내보내기 → 삭제
+    (분리만 되고 내보내기 전에 중단된 파티션은 다음 실행에서 이어서 처리)
+  - 실행 주기/리더 선출은 log_partition_scheduler.py, 수동 실행은 scripts/manage_log_partitions.py
+  - 동시 실행은 PostgreSQL advisory lock 으로 차단 (다른 인스턴스/수동 실행 포함)
+"""
+import asyncio
+import gzip
+import os
+from datetime import date
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from app.config.database import get_connection
+from app.config.settings import settings
+from app.core.logger import logger
+
+
+# 파티션 관리 대상 로그 테이블 (public 스키마, 파티션 키 login_at)
+LOG_TABLES = ("admin_access_logs", "personal_info_access_logs")
+
+# pg_try_advisory_lock 키
+ADVISORY_LOCK_KEY = "log_partitions"
+
+# 내보내기 파일 쓰기 단위 (바이트) - gzip 압축은 스레드에서 실행
+ARCHIVE_WRITE_CHUNK = 1024 * 1024
+
+
+def month_start(value: date, offset: int = 0) -> date:
+    """value 가 속한 달 + offset 개월의 1일"""
+    month_index = value.year * 12 + value.month - 1 + offset
+    return date(month_index // 12, month_index % 12 + 1, 1)
+
+
+def partition_name(table: str, month: date) -> str:
+    return f"{table}_p{month:%Y%m}"
+
+
+def partition_month(table: str, name: str) -> Optional[date]:
+    """파티션 이름 → 월 (규칙에 맞지 않으면 None)"""
+    suffix = name[len(table) + 2:] if name.startswith(f"{table}_p") else ""
+    if len(suffix) != 6 or not suffix.isdigit():
+        return None
+    return date(int(suffix[:4]), int(suffix[4:]), 1)
+
+
+class LogPartitionService:
+    """로그 파티션 생성 / 보관 기간 경과분 내보내기"""
+
+    @classmethod
+    async def maintain(cls, today: Optional[date] = None, dry_run: bool = False) -> Optional[Dict[str, Any]]:
+        """
+        파티션 미리 생성 + 보관 기간 경과 파티션 내보내기
+
+        Returns:
+            {"created": [...], "archived": [...]} (다른 곳에서 실행 중이면 None)
+        """
+        today = today or date.today()
+        async with get_connection() as conn:
+            async with conn.cursor() as cur:
+                await cur.execute("SELECT pg_try_advisory_lock(hashtext(%(key)s)) AS locked", {"key": ADVISORY_LOCK_KEY})
+                locked = (await cur.fetchone())["locked"]
+                await conn.commit()
+            if not locked:
+                logger.info("로그 파티션 관리: 다른 곳에서 실행 중 (건너뜀)")
+                return None
+            try:
+                created = await cls._ensure_partitions(conn, today, dry_run)
+                archived = await cls._archive_expired(conn, today, dry_run)
+            finally:
+                await conn.rollback()
+                async with conn.cursor() as cur:
+                    await cur.execute("SELECT pg_advisory_unlock(hashtext(%(key)s))", {"key": ADVISORY_LOCK_KEY})
+                await conn.commit()
+
+        if created or archived:
+            logger.info(f"로그 파티션 관리: 생성 {created}, 내보내기 {[item['partition'] for item in archived]}")
+        return {"created": created, "archived": archived}
+
+    @classmethod
+    async def list_partitions(cls) -> List[Dict[str, Any]]:
+        """로그 테이블 파티션 목록 (연결된 파티션 + 분리된 채 남은 파티션, 예상 행 수 포함)"""
+        async with get_connection() as conn:
+            async with conn.cursor() as cur:
+                rows = []
+                for table in LOG_TABLES:
+                    rows.extend(await cls._partitions(cur, table))
+        return rows
+
+    # ============================================
+    # 파티션 생성
+    # ============================================
+
+    @classmethod
+    async def _ensure_partitions(cls, conn, today: date, dry_run: bool) -> List[str]:
+        created = []
+        months = [month_start(today, offset) for offset in range(settings.LOG_PARTITION_PREMAKE_MONTHS + 1)]
+        async with conn.cursor() as cur:
+            for table in LOG_TABLES:
+                existing = {row["name"] for row in await cls._partitions(cur, table)}
+                for month in months:
+                    name = partition_name(table, month)
+                    if name in existing:
+                        continue
+                    if not dry_run:
+                        await cls._create_partition(cur, table, month)
+                        await conn.commit()
+                    created.append(name)
+        return created
+
+    @staticmethod
+    async def _create_partition(cur, table: str, month: date) -> None:
+        """
+        월 파티션 생성 후 연결
+
+        기본 파티션에 해당 월 행이 있으면 PARTITION OF 로 바로 만들 수 없으므로
+        독립 테이블로 만든 뒤 행을 옮기고 ATTACH 한다. (한 트랜잭션)
+        """
+        name = partition_name(table, month)
+        start, end = month, month_start(month, 1)
+        await cur.execute(
+            f"CREATE TABLE public.{name} (LIKE public.{table} INCLUDING DEFAULTS INCLUDING CONSTRAINTS)"
+        )
+        await cur.execute(
+            f"""
+            WITH moved AS (
+                DELETE FROM public.{table}_default
+                WHERE login_at >= %(start)s AND login_at < %(end)s
+                RETURNING *
+            )
+            INSERT INTO public.{name} SELECT * FROM moved
+            """,
+            {"start": start, "end": end}
+        )
+        if cur.rowcount:
+            logger.info(f"기본 파티션 행 이동: {table}_default → {name} ({cur.rowcount}건)")
+        await cur.execute(
+            f"ALTER TABLE public.{table} ATTACH PARTITION public.{name} "
+            f"FOR VALUES FROM ('{start.isoformat()}') TO ('{end.isoformat()}')"
+        )
+
+    # ============================================
+    # 보관 기간 경과 파티션 내보내기
+    # ============================================
+
+    @classmethod
+    async def _archive_expired(cls, conn, today: date, dry_run: bool) -> List[Dict[str, Any]]:
+        """보관 시작 월 이전 파티션 분리 → csv.gz 내보내기 → 삭제"""
+        if settings.LOG_RETENTION_MONTHS <= 0:
+            return []
+        keep_from = month_start(today, -settings.LOG_RETENTION_MONTHS)
+        archived = []
+        async with conn.cursor() as cur:
+            for table in LOG_TABLES:
+                for partition in await cls._partitions(cur, table):
+                    month = partition_month(table, partition["name"])
+                    if month is None or month >= keep_from:
+                        continue
+                    if dry_run:
+                        archived.append({"partition": partition["name"], "rows": partition["estimated_rows"]})
+                        continue
+                    if partition["attached"]:
+                        await cur.execute(f"ALTER TABLE public.{table} DETACH PARTITION public.{partition['name']}")
+                        await conn.commit()
+                    path, rows = await cls._export(conn, table, partition["name"])
+                    await cur.execute(f"DROP TABLE public.{partition['name']}")
+                    await conn.commit()
+                    archived.append({"partition": partition["name"], "rows": rows, "file": str(path)})
+        return archived
+
+    @staticmethod
+    async def _export(conn, table: str, name: str):
+        """
+        파티션 → {LOG_ARCHIVE_DIR}/{테이블}/{파티션}.csv.gz (헤더 포함)
+
+        임시 파일에 쓴 뒤 이름을 바꾸므로 완성된 파일만 남는다.
+        """
+        directory = Path(settings.LOG_ARCHIVE_DIR) / table
+        directory.mkdir(parents=True, exist_ok=True)
+        path = directory / f"{name}.csv.gz"
+        temp_path = path.with_suffix(".gz.tmp")
+
+        archive = gzip.open(temp_path, "wb", compresslevel=6)
+        try:
+            buffer = bytearray()
+            async with conn.cursor() as cur:
+                async with cur.copy(f"COPY public.{name} TO STDOUT WITH (FORMAT csv, HEADER true)") as copy:
+                    async for data in copy:
+                        buffer += data
+                        if len(buffer) >= ARCHIVE_WRITE_CHUNK:
+                            await asyncio.to_thread(archive.write, bytes(buffer))
+                            buffer.clear()
+                rows = cur.rowcount
+            if buffer:
+                await asyncio.to_thread(archive.write, bytes(buffer))
+            await asyncio.to_thread(archive.close)
+            os.replace(temp_path, path)
+        except BaseException:
+            archive.close()
+            temp_path.unlink(missing_ok=True)
+            raise
+        finally:
+            await conn.rollback()
+        return path, rows
+
+    @staticmethod
+    async def _partitions(cur, table: str) -> List[Dict[str, Any]]:
+        """{테이블}_pYYYYMM 테이블 목록 (attached: 부모에 연결 여부)"""
+        await cur.execute(
+            """
+            SELECT c.relname AS name, (i.inhrelid IS NOT NULL) AS attached,
+                   GREATEST(c.reltuples, 0)::bigint AS estimated_rows
+            FROM pg_class c
+            LEFT JOIN pg_inherits i
+                ON i.inhrelid = c.oid AND i.inhparent = %(parent)s::regclass
+            WHERE c.relnamespace = 'public'::regnamespace
+              AND c.relkind = 'r'
+              AND c.relname LIKE %(pattern)s
+            ORDER BY c.relname
+            """,
+            {"parent": f"public.{table}", "pattern": f"{table}\\_p%"}
+        )
+        rows = await cur.fetchall()
+        return [
+            {"table": table, **row} for row in rows
+            if partition_month(table, row["name"]) is not None
+        ]
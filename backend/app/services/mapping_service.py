@@ -0,0 +1,257 @@
+"""
+파일: app/services/mapping_service.py
+설명: 매핑 테이블 일괄 동기화 (집합 기반)
+  - 원하는 매핑 집합과 현재 집합을 비교해 추가/삭제/변경분만 반영
+  - 추가: INSERT ... SELECT FROM unnest(...) ON CONFLICT DO NOTHING (1회)
+  - 삭제: DELETE ... = ANY(...) (1회)
+  - 속성 변경: UPDATE ... FROM unnest(...) (1회)
+  - 항목 수와 관계없이 왕복 횟수가 일정 (조회 1 + 쓰기 최대 3)
+
+커서를 받아 실행하며 커밋은 호출자가 담당한다. (검색 문서 갱신 등과 같은 트랜잭션)
+중복 삽입 방지용 유니크 인덱스: schema.sql "32. 매핑 테이블 유니크 인덱스" 참조
+"""
+from decimal import Decimal
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+
+class MappingTable:
+    """
+    매핑 테이블 정의
+
+    Args:
+        table: 테이블명
+        owner: (컬럼명, PostgreSQL 타입) - 매핑 소유자 (예: 영양제 ID)
+        key: (컬럼명, PostgreSQL 타입) - 소유자 내 매핑 대상 (예: 성분 ID)
+        attributes: [(컬럼명, PostgreSQL 타입)] - 매핑 속성 (예: 함량, 노출 순서)
+    """
+
+    def __init__(
+        self,
+        table: str,
+        owner: Tuple[str, str],
+        key: Tuple[str, str],
+        attributes: Sequence[Tuple[str, str]] = (),
+    ):
+        self.table = table
+        self.owner_column, self.owner_type = owner
+        self.key_column, self.key_type = key
+        self.attributes = list(attributes)
+
+    @property
+    def attribute_columns(self) -> List[str]:
+        return [column for column, _ in self.attributes]
+
+
+# 영양제 → 기능성 성분 (함량/단위/노출 순서)
+PRODUCT_INGREDIENTS = MappingTable(
+    "public.product_ingredient_mapping",
+    owner=("product_id", "uuid"),
+    key=("ingredient_id", "int"),
+    attributes=[("content_amount", "numeric"), ("content_unit", "text"), ("display_order", "int")],
+)
+
+# 기능성 성분 → 기능성 내용
+INGREDIENT_FUNCTIONALITIES = MappingTable(
+    "public.ingredient_functionality_mapping",
+    owner=("ingredient_id", "int"),
+    key=("functionality_id", "int"),
+)
+
+# 컨텐츠 → 카테고리 (다중 카테고리, 대표 카테고리는 contents.category_id)
+CONTENT_CATEGORIES = MappingTable(
+    "public.content_category_mapping",
+    owner=("content_id", "uuid"),
+    key=("category_id", "int"),
+)
+
+# 영양제 코너 → 영양제 (노출 순서)
+CORNER_PRODUCTS = MappingTable(
+    "supplement_corner_products",
+    owner=("corner_id", "int"),
+    key=("product_id", "uuid"),
+    attributes=[("display_order", "int")],
+)
+
+# 역할 → 허용 API (Admin DB, 권한 매트릭스 원본)
+ROLE_APIS = MappingTable(
+    "public.role_api_permissions",
+    owner=("role_id", "int"),
+    key=("api_id", "int"),
+    attributes=[("is_permitted", "boolean"), ("is_active", "boolean")],
+)
+
+# 역할 → 메뉴 권한 (Admin DB, 역할별 메뉴 트리 원본)
+ROLE_MENUS = MappingTable(
+    "public.role_menu_permissions",
+    owner=("role_id", "int"),
+    key=("menu_id", "int"),
+    attributes=[
+        ("can_read", "boolean"), ("can_write", "boolean"), ("can_update", "boolean"),
+        ("can_delete", "boolean"), ("can_export", "boolean"), ("is_active", "boolean"),
+    ],
+)
+
+# 역할 → 어드민 회원 (Admin DB)
+ROLE_USERS = MappingTable(
+    "public.admin_user_roles",
+    owner=("role_id", "int"),
+    key=("admin_user_id", "int"),
+)
+
+
+def _normalize(value: Any) -> Any:
+    """비교용 값 정규화 (float ↔ numeric 비교 오차 방지)"""
+    if isinstance(value, float):
+        return Decimal(str(value))
+    if isinstance(value, Decimal):
+        return value.normalize()
+    return value
+
+
+class MappingService:
+    """매핑 테이블 집합 기반 동기화"""
+
+    @classmethod
+    async def sync(
+        cls,
+        cur,
+        spec: MappingTable,
+        owner_id: Any,
+        items: Iterable[Dict[str, Any]],
+        replace: bool = True,
+        update_existing: bool = True,
+    ) -> Dict[str, int]:
+        """
+        소유자의 매핑을 원하는 집합으로 동기화
+
+        Args:
+            cur: 커서 (호출자 트랜잭션)
+            spec: 매핑 테이블 정의
+            owner_id: 소유자 ID
+            items: 원하는 매핑 목록 [{key_column: ..., 속성: ...}] (같은 키는 마지막 값 사용)
+            replace: True면 목록에 없는 기존 매핑 삭제, False면 추가만 수행
+            update_existing: 기존 매핑의 속성이 다르면 갱신할지 여부
+
+        Returns:
+            {"added": n, "removed": n, "updated": n, "unchanged": n}
+        """
+        # 키는 비교 가능한 형태로 정규화 (uuid ↔ str 등)
+        desired: Dict[Any, Tuple] = {}
+        for item in items:
+            key = cls._array_value(item[spec.key_column], spec.key_type)
+            desired[key] = tuple(item.get(column) for column in spec.attribute_columns)
+
+        current = await cls._load_current(cur, spec, owner_id)
+
+        added_keys = [key for key in desired if key not in current]
+        removed_keys = [key for key in current if key not in desired] if replace else []
+        changed_keys = []
+        unchanged = 0
+        for key, attrs in desired.items():
+            if key not in current:
+                continue
+            if update_existing and tuple(map(_normalize, attrs)) != tuple(map(_normalize, current[key])):
+                changed_keys.append(key)
+            else:
+                unchanged += 1
+
+        removed = await cls._delete(cur, spec, owner_id, removed_keys)
+        added = await cls._insert(cur, spec, owner_id, [(key, *desired[key]) for key in added_keys])
+        updated = await cls._update(cur, spec, owner_id, [(key, *desired[key]) for key in changed_keys])
+
+        # 동시 요청으로 이미 추가된 행은 ON CONFLICT 로 건너뛰므로 변경 없음으로 집계
+        unchanged += len(added_keys) - added
+
+        return {"added": added, "removed": removed, "updated": updated, "unchanged": unchanged}
+
+    @classmethod
+    async def remove(cls, cur, spec: MappingTable, owner_id: Any, keys: Sequence[Any]) -> int:
+        """소유자의 지정 매핑 삭제 (단일 DELETE), 실제 삭제 건수 반환"""
+        return await cls._delete(cur, spec, owner_id, list(keys))
+
+    # ============================================
+    # 내부 SQL
+    # ============================================
+
+    @classmethod
+    async def _load_current(cls, cur, spec: MappingTable, owner_id: Any) -> Dict[Any, Tuple]:
+        """현재 매핑 조회 (동시 수정 방지를 위해 행 잠금)"""
+        columns = ", ".join([spec.key_column] + spec.attribute_columns)
+        await cur.execute(
+            f"""SELECT {columns} FROM {spec.table}
+                WHERE {spec.owner_column} = %(owner_id)s::{spec.owner_type}
+                FOR UPDATE""",
+            {"owner_id": owner_id}
+        )
+        rows = await cur.fetchall()
+        return {
+            cls._array_value(row[spec.key_column], spec.key_type): tuple(row[column] for column in spec.attribute_columns)
+            for row in rows
+        }
+
+    @classmethod
+    async def _delete(cls, cur, spec: MappingTable, owner_id: Any, keys: List[Any]) -> int:
+        if not keys:
+            return 0
+        await cur.execute(
+            f"""DELETE FROM {spec.table}
+                WHERE {spec.owner_column} = %(owner_id)s::{spec.owner_type}
+                  AND {spec.key_column} = ANY(%(keys)s::{spec.key_type}[])""",
+            {"owner_id": owner_id, "keys": [cls._array_value(key, spec.key_type) for key in keys]}
+        )
+        return cur.rowcount
+
+    @classmethod
+    async def _insert(cls, cur, spec: MappingTable, owner_id: Any, rows: List[Tuple]) -> int:
+        if not rows:
+            return 0
+        params, unnest_args = cls._unnest_params(spec, rows)
+        params["owner_id"] = owner_id
+        columns = ", ".join([spec.owner_column, spec.key_column] + spec.attribute_columns)
+        await cur.execute(
+            f"""INSERT INTO {spec.table} ({columns})
+                SELECT %(owner_id)s::{spec.owner_type}, u.*
+                FROM unnest({unnest_args}) AS u
+                ON CONFLICT DO NOTHING""",
+            params
+        )
+        return cur.rowcount
+
+    @classmethod
+    async def _update(cls, cur, spec: MappingTable, owner_id: Any, rows: List[Tuple]) -> int:
+        if not rows or not spec.attributes:
+            return 0
+        params, unnest_args = cls._unnest_params(spec, rows)
+        params["owner_id"] = owner_id
+        alias_columns = ", ".join([spec.key_column] + spec.attribute_columns)
+        assignments = ", ".join(f"{column} = u.{column}" for column in spec.attribute_columns)
+        await cur.execute(
+            f"""UPDATE {spec.table} AS t
+                SET {assignments}
+                FROM unnest({unnest_args}) AS u({alias_columns})
+                WHERE t.{spec.owner_column} = %(owner_id)s::{spec.owner_type}
+                  AND t.{spec.key_column} = u.{spec.key_column}""",
+            params
+        )
+        return cur.rowcount
+
+    @classmethod
+    def _unnest_params(cls, spec: MappingTable, rows: List[Tuple]) -> Tuple[Dict[str, Any], str]:
+        """행 목록 → 컬럼별 배열 파라미터 + unnest 인자 문자열"""
+        columns = [(spec.key_column, spec.key_type)] + spec.attributes
+        params: Dict[str, Any] = {}
+        args = []
+        for index, (column, pg_type) in enumerate(columns):
+            name = f"col_{index}"
+            params[name] = [cls._array_value(row[index], pg_type) for row in rows]
+            args.append(f"%({name})s::{pg_type}[]")
+        return params, ", ".join(args)
+
+    @staticmethod
+    def _array_value(value: Any, pg_type: str) -> Optional[Any]:
+        """배열 원소 변환 (uuid 등 문자열 캐스팅 대상은 str 로 전달)"""
+        if value is None:
+            return None
+        if pg_type in ("uuid", "text"):
+            return str(value)
+        return value
@@ -0,0 +1,260 @@
+"""
+파일: app/services/menu_service.py
+설명: 어드민 메뉴 트리 (역할별 사전 계산)
+  - admin_menus / role_menu_permissions / admin_user_roles 가 바뀔 때만 트리를 다시 만든다
+    · 역할 조합(관리자가 가진 역할 ID 집합)마다 읽기 권한 메뉴 + 상위 메뉴로 트리 1개
+    · 트리는 응답 본문 그대로 JSON 인코딩해 bytes + ETag 로 보관 (요청 시 직렬화 없음)
+  - 메모리(워커) + Redis(menu_trees 해시) 2단
+    · 변경한 워커가 DB 에서 다시 만들어 Redis 에 통째로 교체(RENAME) 후 권한 변경 알림 발행
+    · 다른 워커는 알림을 받으면 DB 가 아닌 Redis 에서 읽어 교체
+  - 권한 변경 알림 채널은 PermissionService 와 공유 (permission_service.py 참조)
+
+트리 키
+  "*"   : 전체 활성 메뉴 (PERMISSION_BYPASS_ROLES, 역할 미지정 관리자 - enforce 모드 제외)
+  ""    : 빈 트리
+  "1,3" : 역할 ID 조합 (오름차순)
+"""
+import hashlib
+import json
+import time
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+from app.config.database import query
+from app.config.redis import get_redis
+from app.config.settings import settings
+from app.core.logger import logger
+from app.services.permission_service import PermissionService
+
+
+# Redis 해시 (field: tree:{키} → 응답 본문, meta → 관리자/역할 코드별 트리 키)
+REDIS_KEY = "menu_trees"
+
+ALL_KEY = "*"
+EMPTY_KEY = ""
+
+PERMISSION_FLAGS = ("can_read", "can_write", "can_update", "can_delete", "can_export")
+
+_MENU_COLUMNS = "id, menu_name, menu_path, parent_id, depth, sort_order, icon"
+
+
+def build_menu_tree(menus: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """메뉴를 트리 구조로 변환 (입력 순서대로 자식 정렬)"""
+    menu_map = {}
+    roots = []
+
+    # 모든 메뉴를 맵에 저장
+    for menu in menus:
+        menu_map[menu["id"]] = {**menu, "children": []}
+
+    # 트리 구조 생성
+    for menu in menus:
+        menu_node = menu_map[menu["id"]]
+        if menu["parent_id"] is None:
+            roots.append(menu_node)
+        else:
+            parent = menu_map.get(menu["parent_id"])
+            if parent:
+                parent["children"].append(menu_node)
+
+    return roots
+
+
+def encode_tree(tree: List[Dict[str, Any]]) -> bytes:
+    """응답 본문 인코딩 ({"success": true, "data": 트리})"""
+    return json.dumps(
+        {"success": True, "data": tree}, ensure_ascii=False, separators=(",", ":"), default=str
+    ).encode("utf-8")
+
+
+def etag_of(body: bytes) -> str:
+    return '"' + hashlib.sha1(body).hexdigest()[:20] + '"'
+
+
+def role_key(role_ids: Iterable[int]) -> str:
+    return ",".join(str(role_id) for role_id in sorted(set(role_ids)))
+
+
+def compile_trees(
+    menus: List[Dict[str, Any]],
+    permissions: Iterable[Dict[str, Any]],
+    role_keys: Iterable[str],
+) -> Dict[str, bytes]:
+    """
+    역할 조합별 메뉴 트리 본문
+
+    Args:
+        menus: 활성 메뉴 (depth, sort_order, id 순)
+        permissions: [{role_id, menu_id, can_read, ...}] (활성 권한)
+        role_keys: 만들 역할 조합 키 목록
+    """
+    by_role: Dict[int, Dict[int, Dict[str, bool]]] = {}
+    for permission in permissions:
+        flags = by_role.setdefault(permission["role_id"], {}).setdefault(
+            permission["menu_id"], dict.fromkeys(PERMISSION_FLAGS, False)
+        )
+        for flag in PERMISSION_FLAGS:
+            flags[flag] = flags[flag] or bool(permission[flag])
+
+    parent_of = {menu["id"]: menu["parent_id"] for menu in menus}
+    all_flags = dict.fromkeys(PERMISSION_FLAGS, True)
+
+    trees = {
+        ALL_KEY: encode_tree(build_menu_tree([{**menu, "permissions": all_flags} for menu in menus])),
+        EMPTY_KEY: encode_tree([]),
+    }
+    for key in set(role_keys) - {ALL_KEY, EMPTY_KEY}:
+        # 역할 조합의 메뉴별 권한 합집합
+        merged: Dict[int, Dict[str, bool]] = {}
+        for role_id in (int(value) for value in key.split(",")):
+            for menu_id, flags in by_role.get(role_id, {}).items():
+                current = merged.setdefault(menu_id, dict.fromkeys(PERMISSION_FLAGS, False))
+                for flag in PERMISSION_FLAGS:
+                    current[flag] = current[flag] or flags[flag]
+
+        # 읽기 권한 메뉴 + 그 상위 메뉴 (사이드바 경로 유지)
+        visible: Set[int] = set()
+        for menu_id, flags in merged.items():
+            node: Optional[int] = menu_id if flags["can_read"] else None
+            while node is not None and node in parent_of and node not in visible:
+                visible.add(node)
+                node = parent_of[node]
+
+        nodes = [
+            {**menu, "permissions": merged.get(menu["id"], dict.fromkeys(PERMISSION_FLAGS, False))}
+            for menu in menus if menu["id"] in visible
+        ]
+        trees[key] = encode_tree(build_menu_tree(nodes))
+    return trees
+
+
+class MenuService:
+    """역할별 메뉴 트리 캐시 (프로세스 단위, 권한 변경 알림으로 갱신)"""
+
+    # 트리 키 → (본문, ETag)
+    _trees: Dict[str, Tuple[bytes, str]] = {}
+    # admin_user_id → 트리 키, role_code → 트리 키 (관리자 역할 매핑이 없을 때 토큰 role 로 대체)
+    _user_keys: Dict[str, str] = {}
+    _role_code_keys: Dict[str, str] = {}
+    _loaded_at: Optional[float] = None
+
+    @classmethod
+    async def start(cls) -> None:
+        """Redis 에서 트리 적재 (없으면 생성) + 권한 변경 구독 (lifespan 시작 시 호출)"""
+        PermissionService.subscribe(cls._on_permissions_changed)
+        try:
+            if not await cls.load():
+                await cls.rebuild()
+        except Exception as e:
+            # 첫 조회 시 재시도
+            logger.error(f"메뉴 트리 적재 실패: {str(e)}", exc_info=True)
+
+    # ============================================
+    # 조회
+    # ============================================
+
+    @classmethod
+    async def get_tree(cls, user: Any) -> Tuple[bytes, str]:
+        """
+        현재 관리자 메뉴 트리 (본문, ETag)
+
+        역할 매핑이 없으면 enforce 모드에서는 빈 트리, 그 외에는 전체 메뉴
+        """
+        if cls._loaded_at is None:
+            await cls.rebuild()
+
+        if user.role in settings.permission_bypass_roles_list:
+            key = ALL_KEY
+        else:
+            key = cls._user_keys.get(str(user.sub)) or cls._role_code_keys.get(user.role or "")
+            if key is None:
+                key = EMPTY_KEY if settings.PERMISSION_ENFORCEMENT == "enforce" else ALL_KEY
+        return cls._trees.get(key) or cls._trees[EMPTY_KEY]
+
+    # ============================================
+    # 생성 / 적재
+    # ============================================
+
+    @classmethod
+    async def rebuild(cls) -> int:
+        """DB 에서 전체 트리 재생성 → 메모리 교체 + Redis 교체, 생성한 트리 수 반환"""
+        started = time.perf_counter()
+        menus = await query(
+            f"""
+            SELECT {_MENU_COLUMNS}
+            FROM public.admin_menus
+            WHERE is_active = true
+            ORDER BY depth, sort_order, id
+            """
+        )
+        permissions = await query(
+            f"""
+            SELECT p.role_id, p.menu_id, {', '.join(f'p.{flag}' for flag in PERMISSION_FLAGS)}
+            FROM public.role_menu_permissions p
+            JOIN public.roles r ON r.id = p.role_id AND r.is_active = true
+            WHERE p.is_active = true
+            """
+        )
+        roles = await query("SELECT id, role_code FROM public.roles WHERE is_active = true")
+        user_roles = await query(
+            """
+            SELECT ur.admin_user_id, array_agg(ur.role_id ORDER BY ur.role_id) AS role_ids
+            FROM public.admin_user_roles ur
+            JOIN public.roles r ON r.id = ur.role_id AND r.is_active = true
+            GROUP BY ur.admin_user_id
+            """
+        )
+
+        meta = {
+            "users": {str(row["admin_user_id"]): role_key(row["role_ids"]) for row in user_roles},
+            "role_codes": {str(role["role_code"]): str(role["id"]) for role in roles},
+        }
+        bodies = compile_trees(menus, permissions, [*meta["users"].values(), *meta["role_codes"].values()])
+        cls._apply(bodies, meta)
+
+        try:
+            await cls._save(bodies, meta)
+        except Exception as e:
+            logger.warning(f"메뉴 트리 Redis 저장 실패 (메모리만 갱신): {str(e)}")
+
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        logger.info(f"메뉴 트리 생성: {len(bodies)}개 (메뉴 {len(menus)}), {elapsed_ms:.1f}ms")
+        return len(bodies)
+
+    @classmethod
+    async def load(cls) -> bool:
+        """Redis 에서 트리 적재 (없으면 False)"""
+        redis = await get_redis()
+        stored = await redis.hgetall(REDIS_KEY)
+        if not stored or "meta" not in stored:
+            return False
+        bodies = {
+            field[len("tree:"):]: value.encode("utf-8")
+            for field, value in stored.items() if field.startswith("tree:")
+        }
+        cls._apply(bodies, json.loads(stored["meta"]))
+        return True
+
+    @classmethod
+    def _apply(cls, bodies: Dict[str, bytes], meta: Dict[str, Dict[str, str]]) -> None:
+        cls._trees = {key: (body, etag_of(body)) for key, body in bodies.items()}
+        cls._user_keys = meta["users"]
+        cls._role_code_keys = meta["role_codes"]
+        cls._loaded_at = time.time()
+
+    @staticmethod
+    async def _save(bodies: Dict[str, bytes], meta: Dict[str, Dict[str, str]]) -> None:
+        """임시 키에 기록 후 RENAME (읽는 쪽은 항상 완성된 해시만 봄)"""
+        redis = await get_redis()
+        temp_key = f"{REDIS_KEY}:building:{time.time_ns()}"
+        mapping = {f"tree:{key}": body.decode("utf-8") for key, body in bodies.items()}
+        mapping["meta"] = json.dumps(meta, ensure_ascii=False)
+        async with redis.pipeline(transaction=True) as pipe:
+            pipe.hset(temp_key, mapping=mapping)
+            pipe.rename(temp_key, REDIS_KEY)
+            await pipe.execute()
+
+    @classmethod
+    async def _on_permissions_changed(cls, local: bool) -> None:
+        """권한 변경 알림 (이 워커의 변경이면 재생성, 아니면 Redis 에서 적재)"""
+        if local or not await cls.load():
+            await cls.rebuild()
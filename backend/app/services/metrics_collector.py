@@ -0,0 +1,93 @@
+"""
+파일: app/services/metrics_collector.py
+설명: 커넥션 풀 메트릭 수집 (lifespan 백그라운드 태스크)
+  - METRICS_POOL_INTERVAL 마다, 그리고 /metrics 응답 직전에 풀 통계를 메트릭에 반영
+  - 워커마다 자기 풀을 수집 (리더 락 없음) - multiprocess 모드에서 게이지는 살아있는 워커 합계
+  - psycopg_pool pop_stats(): 현재 값(크기/유휴/대기) + 지난 호출 이후 누적치(요청 수/대기 시간/오류)
+"""
+import asyncio
+from typing import Dict, Optional
+
+from app.config import database
+from app.config.settings import settings
+from app.core.logger import logger
+from app.core.metrics import (
+    DB_POOL_CONNECTIONS,
+    DB_POOL_ERRORS,
+    DB_POOL_REQUESTS,
+    DB_POOL_WAIT_SECONDS,
+    DB_POOL_WAITING,
+    mark_process_dead,
+)
+from app.lib.app_db import app_db_manager
+
+
+# pop_stats() 누적치 키 → 오류 종류 라벨
+_ERROR_KEYS = {
+    "requests_errors": "request",
+    "connections_errors": "connect",
+    "connections_lost": "lost",
+}
+
+
+class MetricsCollector:
+    """커넥션 풀 메트릭 수집기 (프로세스당 1개 태스크)"""
+
+    _task: Optional[asyncio.Task] = None
+
+    @staticmethod
+    def _pools() -> Dict[str, object]:
+        return {
+            "admin": database.db_pool,
+            "app": database.app_db_pool,
+            "app_manager": app_db_manager.async_pool,
+        }
+
+    @classmethod
+    def collect(cls) -> None:
+        """현재 워커의 풀 통계를 메트릭에 반영"""
+        for name, pool in cls._pools().items():
+            if pool is None:
+                continue
+            stats = pool.pop_stats()
+            DB_POOL_CONNECTIONS.labels(name, "size").set(stats.get("pool_size", 0))
+            DB_POOL_CONNECTIONS.labels(name, "available").set(stats.get("pool_available", 0))
+            DB_POOL_CONNECTIONS.labels(name, "max").set(stats.get("pool_max", 0))
+            DB_POOL_WAITING.labels(name).set(stats.get("requests_waiting", 0))
+
+            if stats.get("requests_num"):
+                DB_POOL_REQUESTS.labels(name).inc(stats["requests_num"])
+            if stats.get("requests_wait_ms"):
+                DB_POOL_WAIT_SECONDS.labels(name).inc(stats["requests_wait_ms"] / 1000)
+            for key, kind in _ERROR_KEYS.items():
+                if stats.get(key):
+                    DB_POOL_ERRORS.labels(name, kind).inc(stats[key])
+
+    @classmethod
+    def start(cls) -> None:
+        """수집 시작 (lifespan 시작 시, 커넥션 풀 생성 후 호출)"""
+        if not settings.METRICS_ENABLED or cls._task is not None:
+            return
+        cls._task = asyncio.create_task(cls._run(), name="metrics_collector")
+
+    @classmethod
+    async def stop(cls) -> None:
+        """수집 중지 (lifespan 종료 시, 커넥션 풀 종료 전 호출)"""
+        if cls._task is None:
+            return
+        cls._task.cancel()
+        try:
+            await cls._task
+        except (asyncio.CancelledError, Exception):
+            pass
+        cls._task = None
+        mark_process_dead()
+
+    @classmethod
+    async def _run(cls) -> None:
+        while True:
+            try:
+                cls.collect()
+            except Exception as e:
+                logger.error(f"커넥션 풀 메트릭 수집 오류: {str(e)}", exc_info=True)
+            await asyncio.sleep(settings.METRICS_POOL_INTERVAL)
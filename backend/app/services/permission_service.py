@@ -0,0 +1,348 @@
+"""
+파일: app/services/permission_service.py
+설명: 역할/API 권한 매트릭스 (요청 시점 인가)
+  - roles / admin_apis / role_api_permissions / admin_user_roles 를 한 번에 읽어 메모리 매트릭스로 컴파일
+    · 역할마다 비트 1개 할당 (role_id → bit)
+    · 관리자별 보유 역할 비트셋 (admin_user_id → int)
+    · 라우트 템플릿별 허용 역할 비트셋 (route.path → int)
+      admin_apis.api_path 를 경로 세그먼트 트라이로 만들고, 앱 라우트마다 가장 긴 접두 경로의 API 로 미리 해석
+  - 요청 인가 = dict 조회 2회 + 비트 AND (조인 없음, O(1))
+  - 권한 관련 쓰기(역할/API/메뉴/매핑) 후 Redis 채널로 변경 알림 → 모든 워커가 재컴파일
+    (알림 누락 대비 PERMISSION_RELOAD_INTERVAL 마다 재컴파일)
+  - 권한에서 파생된 캐시(메뉴 트리)는 subscribe 로 같은 알림을 받는다
+
+PERMISSION_ENFORCEMENT
+  off     : 검사하지 않음
+  log     : 거부 대상 요청을 로그로만 남김 (기본값, 권한 데이터 정비 기간)
+  enforce : 403 응답
+
+admin_apis 에 등록되지 않은 라우트는 검사 대상이 아니다. (인증만 확인)
+"""
+import asyncio
+import json
+import re
+import time
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from fastapi import HTTPException, Request, status
+
+from app.config.database import query
+from app.config.redis import get_redis
+from app.config.settings import settings
+from app.core.logger import logger
+
+
+# 권한 변경 이벤트 채널 (payload: {"reason", "at"})
+PERMISSION_EVENT_CHANNEL = "events:permissions_changed"
+# 변경 알림이 연달아 올 때 묶어서 1회 재컴파일 (초)
+RELOAD_DEBOUNCE_SECONDS = 0.5
+# 구독 연결 실패 시 재시도 간격 (초)
+RESUBSCRIBE_INTERVAL = 5
+# log 모드에서 같은 (라우트, 관리자) 거부 로그는 1회만
+MAX_LOGGED_DENIALS = 1000
+
+_PARAM_SEGMENT = re.compile(r"^(\{[^}]*\}|:[^/]+|\*)$")
+
+
+def split_path(path: str) -> Tuple[str, ...]:
+    """경로 → 세그먼트 (경로 파라미터 {id} / :id / * 는 '*' 로 통일)"""
+    segments = [segment for segment in path.split("?")[0].strip().split("/") if segment]
+    return tuple("*" if _PARAM_SEGMENT.match(segment) else segment for segment in segments)
+
+
+@dataclass
+class _TrieNode:
+    children: Dict[str, "_TrieNode"] = field(default_factory=dict)
+    bits: Optional[int] = None  # 이 경로로 등록된 API 의 허용 역할 비트셋 (등록 안 됐으면 None)
+
+
+@dataclass(frozen=True)
+class PermissionMatrix:
+    """컴파일된 권한 매트릭스 (불변, 재컴파일 시 통째로 교체)"""
+
+    role_bits: Dict[str, int]  # role_code → 비트
+    user_bits: Dict[str, int]  # admin_user_id → 보유 역할 비트셋
+    route_bits: Dict[str, int]  # 라우트 템플릿 → 허용 역할 비트셋 (admin_apis 등록 라우트만)
+    role_count: int
+    api_count: int
+    loaded_at: float
+
+    def user_mask(self, user_id: str, role_code: Optional[str] = None) -> int:
+        """관리자의 역할 비트셋 (admin_user_roles + 토큰 role 이 역할 코드와 같으면 포함)"""
+        return self.user_bits.get(user_id, 0) | self.role_bits.get(role_code or "", 0)
+
+    def check(self, route_path: str, mask: int) -> Optional[bool]:
+        """
+        인가 결과
+
+        Returns:
+            True(허용) / False(거부) / None(검사 대상 아님)
+        """
+        bits = self.route_bits.get(route_path)
+        if bits is None:
+            return None
+        return bool(bits & mask)
+
+
+def compile_matrix(
+    roles: Iterable[Dict[str, Any]],
+    apis: Iterable[Dict[str, Any]],
+    permissions: Iterable[Dict[str, Any]],
+    user_roles: Iterable[Dict[str, Any]],
+    route_paths: Sequence[str],
+) -> PermissionMatrix:
+    """
+    권한 행 → 매트릭스
+
+    Args:
+        roles: [{id, role_code}] (활성 역할)
+        apis: [{id, api_path}] (활성 API)
+        permissions: [{role_id, api_id}] (허가된 매핑)
+        user_roles: [{admin_user_id, role_id}]
+        route_paths: 앱 라우트 템플릿 목록 (예: /api/v1/members/{member_id})
+    """
+    role_bit: Dict[int, int] = {}
+    role_bits: Dict[str, int] = {}
+    for index, role in enumerate(roles):
+        role_bit[role["id"]] = 1 << index
+        role_bits[str(role["role_code"])] = 1 << index
+
+    api_bits: Dict[int, int] = {}
+    for permission in permissions:
+        bit = role_bit.get(permission["role_id"])
+        if bit is not None:
+            api_bits[permission["api_id"]] = api_bits.get(permission["api_id"], 0) | bit
+
+    # API 경로 트라이 (같은 경로로 여러 API 가 등록되면 허용 역할 합집합)
+    root = _TrieNode()
+    api_count = 0
+    for api in apis:
+        node = root
+        for segment in split_path(api["api_path"]):
+            node = node.children.setdefault(segment, _TrieNode())
+        node.bits = (node.bits or 0) | api_bits.get(api["id"], 0)
+        api_count += 1
+
+    # 라우트별 가장 긴 접두 경로 API 로 미리 해석
+    route_bits: Dict[str, int] = {}
+    for route_path in route_paths:
+        node, matched = root, root.bits
+        for segment in split_path(route_path):
+            node = node.children.get(segment) or (node.children.get("*") if segment != "*" else None)
+            if node is None:
+                break
+            if node.bits is not None:
+                matched = node.bits
+        if matched is not None:
+            route_bits[route_path] = matched
+
+    user_bits: Dict[str, int] = {}
+    for user_role in user_roles:
+        bit = role_bit.get(user_role["role_id"])
+        if bit is not None:
+            key = str(user_role["admin_user_id"])
+            user_bits[key] = user_bits.get(key, 0) | bit
+
+    return PermissionMatrix(
+        role_bits=role_bits,
+        user_bits=user_bits,
+        route_bits=route_bits,
+        role_count=len(role_bit),
+        api_count=api_count,
+        loaded_at=time.time(),
+    )
+
+
+class PermissionService:
+    """권한 매트릭스 로드/갱신/인가 (프로세스 단위)"""
+
+    _matrix: Optional[PermissionMatrix] = None
+    _route_paths: List[str] = []
+    _listener: Optional[asyncio.Task] = None
+    _reload_lock: Optional[asyncio.Lock] = None
+    _logged_denials: set = set()
+    _bypass_roles: frozenset = frozenset()
+    _subscribers: List[Callable[[bool], Awaitable[None]]] = []
+
+    # ============================================
+    # 시작 / 종료
+    # ============================================
+
+    @classmethod
+    async def start(cls, routes: Iterable[Any]) -> None:
+        """매트릭스 로드 + 변경 구독 시작 (lifespan 시작 시 호출)"""
+        cls._route_paths = sorted({route.path for route in routes if hasattr(route, "methods")})
+        cls._bypass_roles = frozenset(settings.permission_bypass_roles_list)
+        try:
+            await cls.reload()
+        except Exception as e:
+            # 로드 실패 시 매트릭스 없이 시작 (인가 검사 생략, 구독 루프에서 재시도)
+            logger.error(f"권한 매트릭스 로드 실패: {str(e)}", exc_info=True)
+        cls._listener = asyncio.create_task(cls._listen(), name="permission_listener")
+
+    @classmethod
+    async def stop(cls) -> None:
+        if cls._listener is None:
+            return
+        cls._listener.cancel()
+        try:
+            await cls._listener
+        except asyncio.CancelledError:
+            pass
+        cls._listener = None
+
+    # ============================================
+    # 인가
+    # ============================================
+
+    @classmethod
+    def authorize(cls, request: Request, user: Any) -> None:
+        """
+        현재 요청 라우트에 대한 관리자 권한 확인 (get_current_user 에서 호출)
+
+        Raises:
+            HTTPException: enforce 모드에서 권한이 없을 때 403
+        """
+        matrix = cls._matrix
+        mode = settings.PERMISSION_ENFORCEMENT
+        if matrix is None or mode == "off":
+            return
+        route = request.scope.get("route")
+        if route is None or user.role in cls._bypass_roles:
+            return
+
+        allowed = matrix.check(route.path, matrix.user_mask(user.sub, user.role))
+        if allowed is not False:
+            return
+
+        if mode == "enforce":
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail={"error": "FORBIDDEN", "message": "접근 권한이 없습니다."}
+            )
+        key = (route.path, user.sub)
+        if key not in cls._logged_denials and len(cls._logged_denials) < MAX_LOGGED_DENIALS:
+            cls._logged_denials.add(key)
+            logger.warning(f"권한 없음 (log 모드, 허용됨): user={user.sub}, route={route.path}")
+
+    @classmethod
+    def info(cls) -> Dict[str, Any]:
+        """현재 매트릭스 요약"""
+        matrix = cls._matrix
+        return {
+            "mode": settings.PERMISSION_ENFORCEMENT,
+            "loaded": matrix is not None,
+            "roles": matrix.role_count if matrix else 0,
+            "apis": matrix.api_count if matrix else 0,
+            "protected_routes": len(matrix.route_bits) if matrix else 0,
+            "routes": len(cls._route_paths),
+            "loaded_at": matrix.loaded_at if matrix else None,
+        }
+
+    # ============================================
+    # 로드 / 변경 알림
+    # ============================================
+
+    @classmethod
+    async def reload(cls) -> PermissionMatrix:
+        """DB 에서 권한 행을 읽어 재컴파일 후 교체"""
+        if cls._reload_lock is None:
+            cls._reload_lock = asyncio.Lock()
+        async with cls._reload_lock:
+            started = time.perf_counter()
+            roles = await query("SELECT id, role_code FROM public.roles WHERE is_active = true ORDER BY id")
+            apis = await query("SELECT id, api_path FROM public.admin_apis WHERE is_active = true")
+            permissions = await query(
+                """
+                SELECT role_id, api_id FROM public.role_api_permissions
+                WHERE is_permitted = true AND is_active = true
+                """
+            )
+            user_roles = await query("SELECT admin_user_id, role_id FROM public.admin_user_roles")
+
+            cls._matrix = compile_matrix(roles, apis, permissions, user_roles, cls._route_paths)
+            cls._logged_denials = set()
+            elapsed_ms = (time.perf_counter() - started) * 1000
+            logger.info(
+                f"권한 매트릭스 로드: 역할 {cls._matrix.role_count}, API {cls._matrix.api_count}, "
+                f"보호 라우트 {len(cls._matrix.route_bits)}/{len(cls._route_paths)}, {elapsed_ms:.1f}ms"
+            )
+            return cls._matrix
+
+    @classmethod
+    async def notify_changed(cls, reason: str) -> None:
+        """
+        권한 데이터 변경 알림 (쓰기 API 에서 커밋 후 호출)
+
+        이 워커는 즉시 재컴파일하고(구독자는 local=True 로 호출), 다른 워커는 Redis 알림으로 재컴파일한다.
+        """
+        try:
+            await cls.reload()
+        except Exception as e:
+            logger.error(f"권한 매트릭스 재로드 실패: {str(e)}", exc_info=True)
+        await cls._notify_subscribers(local=True)
+        try:
+            redis = await get_redis()
+            await redis.publish(PERMISSION_EVENT_CHANNEL, json.dumps({"reason": reason, "at": time.time()}))
+        except Exception as e:
+            logger.warning(f"권한 변경 알림 발행 실패: {str(e)}")
+
+    @classmethod
+    def subscribe(cls, callback: Callable[[bool], Awaitable[None]]) -> None:
+        """
+        권한 데이터 변경 구독 (메뉴 트리 등 권한에서 파생된 캐시)
+
+        callback(local): 이 워커에서 변경한 경우 True (DB 에서 재생성), 다른 워커 알림/주기 재로드면 False
+        """
+        if callback not in cls._subscribers:
+            cls._subscribers.append(callback)
+
+    @classmethod
+    async def _notify_subscribers(cls, local: bool) -> None:
+        for callback in cls._subscribers:
+            try:
+                await callback(local)
+            except Exception as e:
+                logger.error(f"권한 변경 구독 처리 실패: {str(e)}", exc_info=True)
+
+    @classmethod
+    async def _listen(cls) -> None:
+        """변경 알림 구독 (연결 끊기면 재구독) + 주기적 재컴파일"""
+        interval = settings.PERMISSION_RELOAD_INTERVAL
+        while True:
+            pubsub = None
+            try:
+                redis = await get_redis()
+                pubsub = redis.pubsub()
+                await pubsub.subscribe(PERMISSION_EVENT_CHANNEL)
+                reloaded_at = time.monotonic()
+                while True:
+                    message = await pubsub.get_message(ignore_subscribe_messages=True, timeout=1.0)
+                    if message is not None:
+                        # 연속 알림은 한 번에 처리
+                        await asyncio.sleep(RELOAD_DEBOUNCE_SECONDS)
+                        while await pubsub.get_message(ignore_subscribe_messages=True, timeout=0):
+                            pass
+                    elif cls._matrix is not None and time.monotonic() - reloaded_at < interval:
+                        continue
+                    await cls.reload()
+                    await cls._notify_subscribers(local=False)
+                    reloaded_at = time.monotonic()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"권한 변경 구독 오류 (재시도): {str(e)}")
+                await asyncio.sleep(RESUBSCRIBE_INTERVAL)
+                # 구독 중단 동안의 변경 반영
+                try:
+                    await cls.reload()
+                    await cls._notify_subscribers(local=False)
+                except Exception:
+                    pass
+            finally:
+                if pubsub is not None:
+                    try:
+                        await pubsub.aclose()
+                    except Exception:
+                        pass
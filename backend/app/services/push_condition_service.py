@@ -0,0 +1,215 @@
+"""
+파일: app/services/push_condition_service.py
+설명: 조건 달성 PUSH (send_type = condition_met) 수신자 평가
+  - 세부유형(send_type_detail)별 조건을 App DB 에 대한 단일 집계 쿼리로 정의
+    (회원 단위 반복 없이 조건을 만족하는 회원 집합을 한 번에 계산)
+  - 수신자 쿼리는 발송 엔진(PushDispatchService)이 서버 사이드 커서로 스트리밍
+  - 오늘 이미 같은 PUSH 를 받은 회원은 Redis SET 으로 제외 (배치당 1회 왕복)
+    SET 에는 프로바이더 발송이 성공한 회원만 추가하므로, 실패/취소된 발송을 다시 실행하면
+    아직 받지 못한 회원은 다시 대상이 된다
+
+조건별 발송 시각은 push_notifications.send_time 이 있으면 그 시각, 없으면 CONDITION_RULES 기본 시각.
+발송 시각 예약/실행은 push_scheduler.py 참조
+"""
+from datetime import date
+from typing import Any, Dict, List, Optional, Tuple
+
+from app.config.redis import get_redis
+from app.core.exceptions import ValidationError
+from app.core.logger import logger
+from app.services.push_dispatch_service import PushDispatchService
+
+
+# 조건 발송 send_type 값 (화면 저장값 condition_met, 세부유형 조회 파라미터 condition)
+CONDITION_SEND_TYPES = ("condition_met", "condition")
+
+# 오늘 발송 회원 SET 보관 기간 (초) - 자정 전후 시간대 차이를 고려해 이틀
+DEDUPE_TTL_SECONDS = 2 * 24 * 3600
+
+# 세부유형별 조건 (AUDIENCE_SQL 의 users u 에 AND 로 결합, %(today)s = 평가 기준일)
+#   - meals(user_id, meal_date), supplement_logs(user_id, is_taken, created_at)
+#   - challenge_participants(challenge_id, member_id, created_at), challenge_member_stats (챌린지 통계 집계)
+#   - daily_steps(user_id, step_date, step_count), nutrition_diagnoses(user_id)
+CONDITION_RULES: Dict[str, Dict[str, str]] = {
+    "meal_record_0": {
+        "label": "식사기록 횟수 0회",
+        "default_time": "21:00",
+        "where": """NOT EXISTS (
+            SELECT 1 FROM meals m
+            WHERE m.user_id = u.id AND m.meal_date = %(today)s::date
+        )""",
+    },
+    "supplement_routine_fail": {
+        "label": "영양제 루틴 미달성",
+        "default_time": "21:00",
+        "where": """u.id IN (
+            SELECT sl.user_id FROM supplement_logs sl
+            WHERE sl.created_at >= %(today)s::date AND sl.created_at < %(today)s::date + 1
+            GROUP BY sl.user_id
+            HAVING COUNT(*) FILTER (WHERE sl.is_taken IS NOT TRUE) > 0
+        )""",
+    },
+    "challenge_created": {
+        "label": "챌린지 생성 (노출 시작일)",
+        "default_time": "09:00",
+        "where": """EXISTS (
+            SELECT 1 FROM challenges c
+            WHERE c.is_active = true AND c.display_start_date::date = %(today)s::date
+        )""",
+    },
+    "challenge_rate_30": {
+        "label": "챌린지 달성률 30% 미만",
+        "default_time": "21:00",
+        # 달성률 = 인증 일수 / 참여 후 경과 일수 (운영 중 챌린지)
+        "where": """u.id IN (
+            SELECT p.member_id
+            FROM challenge_participants p
+            JOIN challenges c ON c.id = p.challenge_id
+                AND c.is_active = true AND c.status = 'in_progress'
+            LEFT JOIN challenge_member_stats s
+                ON s.challenge_id = p.challenge_id AND s.member_id = p.member_id
+            WHERE COALESCE(s.verified_days, 0)
+                < 0.3 * (%(today)s::date - GREATEST(c.operation_start_date::date, p.created_at::date) + 1)
+        )""",
+    },
+    "steps_30": {
+        "label": "오늘 걸음 수 30% 미만",
+        "default_time": "21:00",
+        # 목표 걸음 수 = 운영 중 걸음수 챌린지의 type_settings.target_steps
+        "where": """u.id IN (
+            SELECT p.member_id
+            FROM challenge_participants p
+            JOIN challenges c ON c.id = p.challenge_id
+                AND c.is_active = true AND c.status = 'in_progress' AND c.challenge_type = 'steps'
+            LEFT JOIN daily_steps ds ON ds.user_id = p.member_id AND ds.step_date = %(today)s::date
+            WHERE COALESCE(ds.step_count, 0) < 0.3 * (c.type_settings->>'target_steps')::int
+        )""",
+    },
+    "steps_goal_achieved": {
+        "label": "걸음수 목표달성",
+        "default_time": "21:00",
+        "where": """u.id IN (
+            SELECT p.member_id
+            FROM challenge_participants p
+            JOIN challenges c ON c.id = p.challenge_id
+                AND c.is_active = true AND c.status = 'in_progress' AND c.challenge_type = 'steps'
+            JOIN daily_steps ds ON ds.user_id = p.member_id AND ds.step_date = %(today)s::date
+            WHERE ds.step_count >= (c.type_settings->>'target_steps')::int
+        )""",
+    },
+    "nutrition_diagnosis_none": {
+        "label": "영양진단 미시행",
+        "default_time": "10:00",
+        "where": """NOT EXISTS (
+            SELECT 1 FROM nutrition_diagnoses nd WHERE nd.user_id = u.id
+        )""",
+    },
+    "content_created": {
+        "label": "컨텐츠 생성 (노출 시작일)",
+        "default_time": "09:00",
+        "where": """EXISTS (
+            SELECT 1 FROM contents ct WHERE ct.start_date::date = %(today)s::date
+        )""",
+    },
+}
+
+# 배치 회원 중 SET 에 없는 회원만 반환 (오늘 아직 받지 않은 회원)
+# ARGV = 회원 ID
+_DEDUPE_SCRIPT = """
+local fresh = {}
+for i = 1, #ARGV do
+    if redis.call('SISMEMBER', KEYS[1], ARGV[i]) == 0 then
+        fresh[#fresh + 1] = ARGV[i]
+    end
+end
+return fresh
+"""
+
+
+class PushConditionService:
+    """조건 달성 PUSH 평가"""
+
+    @staticmethod
+    def is_condition_campaign(campaign: Dict[str, Any]) -> bool:
+        return campaign.get("send_type") in CONDITION_SEND_TYPES
+
+    @classmethod
+    def build_recipient_query(
+        cls,
+        campaign: Dict[str, Any],
+        today: date
+    ) -> Tuple[str, Dict[str, Any]]:
+        """
+        전송대상 조건 + 세부유형 조건 → 수신자 쿼리
+
+        Raises:
+            ValidationError: 평가할 수 없는 세부유형
+        """
+        detail = campaign.get("send_type_detail")
+        rule = CONDITION_RULES.get(detail or "")
+        if rule is None:
+            raise ValidationError(f"지원하지 않는 조건 세부유형입니다: {detail}")
+
+        audience_sql, params = PushDispatchService.build_audience_query(
+            campaign.get("target_audience"), campaign.get("target_companies")
+        )
+        return f"{audience_sql}  AND {rule['where']}\n", {**params, "today": today}
+
+    @classmethod
+    async def evaluate(cls, campaign: Dict[str, Any], today: Optional[date] = None) -> Dict[str, Any]:
+        """
+        조건 평가 후 발송 엔진에 수신자 쿼리 전달 (오늘 이미 받은 회원 제외)
+
+        Returns:
+            생성된 발송 이력 행
+        """
+        today = today or date.today()
+        recipient_sql, params = cls.build_recipient_query(campaign, today)
+        dedupe_key = f"push:sent:{campaign['id']}:{today:%Y%m%d}"
+
+        async def exclude_already_sent(rows: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+            return await cls._exclude_already_sent(dedupe_key, rows)
+
+        async def mark_sent(rows: List[Dict[str, Any]]) -> None:
+            await cls._mark_sent(dedupe_key, rows)
+
+        return await PushDispatchService.start_dispatch(
+            campaign,
+            recipient_sql,
+            params,
+            trigger_type="condition",
+            recipient_filter=exclude_already_sent,
+            on_delivered=mark_sent,
+        )
+
+    @staticmethod
+    async def _exclude_already_sent(dedupe_key: str, rows: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        오늘 발송 SET 에 없는 회원만 남김 (SET 추가는 발송 성공 후 _mark_sent)
+
+        같은 캠페인은 동시에 한 건만 발송되므로 (push_dispatches running 유일 인덱스)
+        확인과 추가 사이에 다른 발송이 끼어들지 않는다.
+        Redis 오류 시에는 제외 없이 발송한다. (같은 날 재평가는 발송 이력으로 차단)
+        """
+        if not rows:
+            return rows
+        try:
+            redis = await get_redis()
+            fresh = await redis.eval(_DEDUPE_SCRIPT, 1, dedupe_key, *[str(row["user_id"]) for row in rows])
+        except Exception as e:
+            logger.warning(f"조건 PUSH 중복 제외 실패 (전체 발송): {dedupe_key} - {str(e)}")
+            return rows
+        fresh_ids = set(fresh)
+        return [row for row in rows if str(row["user_id"]) in fresh_ids]
+
+    @staticmethod
+    async def _mark_sent(dedupe_key: str, rows: List[Dict[str, Any]]) -> None:
+        """발송 성공 회원을 오늘 발송 SET 에 추가 (Redis 오류는 발송을 막지 않음)"""
+        try:
+            redis = await get_redis()
+            async with redis.pipeline(transaction=True) as pipe:
+                pipe.sadd(dedupe_key, *[str(row["user_id"]) for row in rows])
+                pipe.expire(dedupe_key, DEDUPE_TTL_SECONDS)
+                await pipe.execute()
+        except Exception as e:
+            logger.warning(f"조건 PUSH 발송 회원 기록 실패: {dedupe_key} - {str(e)}")
@@ -0,0 +1,423 @@
+"""
+파일: app/services/push_dispatch_service.py
+설명: PUSH 알림 발송 엔진
+  - 캠페인(push_notifications)의 전송대상/기업 조건을 App DB users 에 대한 단일 집합 쿼리로 변환
+  - 서버 사이드 커서로 수신자를 배치 단위로 스트리밍 (전체 대상 목록을 메모리에 올리지 않음)
+  - 생산자(커서) → 제한 크기 큐 → 발송 워커 N개 → 프로바이더 배치 호출
+  - 프로바이더별 발송 한도(RateLimiter), 일시 오류는 지수 백오프 재시도
+  - 발송 건별 진행 상황은 push_dispatches(Admin DB)에 주기적으로 기록
+
+수신자 쿼리는 (user_id, push_token) 컬럼을 반환하면 되므로
+조건 발송/예약 발송도 start_dispatch 에 자체 수신자 쿼리를 넘겨 같은 엔진을 사용한다.
+(recipient_filter 로 배치 단위 수신자 제외, on_delivered 로 발송 성공 수신자 기록 가능 - 조건 PUSH 의 당일 중복 제외)
+
+진행 테이블 DDL: schema.sql "37. PUSH 발송 이력 테이블" 참조
+"""
+import asyncio
+import random
+import time
+import uuid
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+from app.config.database import execute, execute_returning, get_connection, query, query_one
+from app.config.settings import settings
+from app.core.exceptions import DuplicateKeyError, NotFoundError, ValidationError
+from app.core.logger import logger
+from app.lib.push_provider import (
+    PushBatchResult,
+    PushMessage,
+    get_push_provider,
+    get_rate_limiter,
+)
+
+
+# 진행 상황 DB 반영 간격 (초)
+PROGRESS_FLUSH_INTERVAL = 1.0
+# 진행 상황 갱신이 이 시간(초) 이상 없으면 중단된 발송으로 간주 (프로세스 종료 등)
+STALE_DISPATCH_SECONDS = 300
+# 재시도 백오프 상한 (초)
+MAX_BACKOFF_SECONDS = 30.0
+
+# 발송 대상 회원 (활성 + 수신 동의 + 토큰 보유)
+# 회원유형: normal(일반) / affiliate(제휴사) / fs (members.py 회원유형 조건과 동일)
+AUDIENCE_SQL = """
+    SELECT u.id AS user_id, u.push_token
+    FROM users u
+    WHERE u.status = 'active'
+      AND u.push_agreed = true
+      AND u.push_token IS NOT NULL
+      AND (
+          %(all_members)s
+          OR (%(normal)s AND u.is_fs_member = false AND u.business_code IS NULL)
+          OR (%(affiliate)s AND u.is_fs_member = false AND u.business_code IS NOT NULL)
+          OR (%(fs)s AND u.is_fs_member = true)
+      )
+      AND (%(companies)s::text[] IS NULL OR u.business_code = ANY(%(companies)s::text[]))
+"""
+
+_CAMPAIGN_SQL = """
+    SELECT id, push_name, target_audience, target_companies, send_to_store,
+           send_type, send_type_detail, content, link_url, is_active
+    FROM push_notifications
+    WHERE id = %(push_id)s
+"""
+
+_DISPATCH_COLUMNS = """
+    id, push_id, trigger_type, status, provider, total_count, processed_count,
+    sent_count, failed_count, invalid_count, skipped_count, error_message, requested_by,
+    started_at, finished_at, updated_at
+"""
+
+# 배치 수신자 행 → 발송할 행 (user_id, push_token)
+RecipientFilter = Callable[[List[Dict[str, Any]]], Awaitable[List[Dict[str, Any]]]]
+# 발송 성공 수신자 행 (user_id, push_token) 전달 (배치별, 예외는 호출 측에서 처리)
+DeliveredCallback = Callable[[List[Dict[str, Any]]], Awaitable[None]]
+
+
+class PushDispatchService:
+    """PUSH 발송 엔진 (프로세스 내 백그라운드 태스크로 실행)"""
+
+    # 실행 중인 발송 태스크 (dispatch_id → Task)
+    _tasks: Dict[str, asyncio.Task] = {}
+
+    # ============================================
+    # 발송 시작 / 조회 / 취소
+    # ============================================
+
+    @classmethod
+    async def dispatch_campaign(cls, push_id: str, requested_by: str) -> Dict[str, Any]:
+        """
+        캠페인 발송 시작 (전송대상/기업 조건으로 수신자 결정)
+
+        Returns:
+            생성된 발송 이력 행
+        """
+        campaign = await query_one(_CAMPAIGN_SQL, {"push_id": push_id}, use_app_db=True)
+        if not campaign:
+            raise NotFoundError("푸시 알림을 찾을 수 없습니다.")
+        if not campaign.get("is_active"):
+            raise ValidationError("사용 중인 푸시 알림만 발송할 수 있습니다.")
+
+        recipient_sql, params = cls.build_audience_query(
+            campaign.get("target_audience"), campaign.get("target_companies")
+        )
+        return await cls.start_dispatch(
+            campaign, recipient_sql, params, trigger_type="manual", requested_by=requested_by
+        )
+
+    @classmethod
+    async def start_dispatch(
+        cls,
+        campaign: Dict[str, Any],
+        recipient_sql: str,
+        params: Dict[str, Any],
+        trigger_type: str,
+        requested_by: Optional[str] = None,
+        recipient_filter: Optional[RecipientFilter] = None,
+        on_delivered: Optional[DeliveredCallback] = None
+    ) -> Dict[str, Any]:
+        """
+        발송 이력 생성 후 백그라운드 발송 시작
+
+        Args:
+            campaign: push_notifications 행
+            recipient_sql: (user_id, push_token) 을 반환하는 수신자 쿼리
+            params: 수신자 쿼리 파라미터
+            trigger_type: manual / condition / schedule
+            requested_by: 요청자
+            recipient_filter: 배치별 수신자 필터 (제외된 수신자는 skipped 로 집계)
+            on_delivered: 배치 발송 후 성공한 수신자 행으로 호출
+
+        Raises:
+            DuplicateKeyError: 같은 캠페인이 발송 중인 경우
+        """
+        push_id = str(campaign["id"])
+
+        # 진행 갱신이 멈춘 이전 발송(프로세스 종료 등)은 실패 처리 후 새 발송 허용
+        await execute(
+            """
+            UPDATE push_dispatches
+            SET status = 'failed', error_message = '진행 상태 갱신 중단', finished_at = NOW()
+            WHERE push_id = %(push_id)s AND status = 'running'
+              AND updated_at < NOW() - make_interval(secs => %(stale_seconds)s)
+            """,
+            {"push_id": push_id, "stale_seconds": STALE_DISPATCH_SECONDS}
+        )
+        dispatch = await execute_returning(
+            f"""
+            INSERT INTO push_dispatches (push_id, trigger_type, status, provider, requested_by)
+            VALUES (%(push_id)s, %(trigger_type)s, 'running', %(provider)s, %(requested_by)s)
+            ON CONFLICT (push_id) WHERE status = 'running' DO NOTHING
+            RETURNING {_DISPATCH_COLUMNS}
+            """,
+            {
+                "push_id": push_id,
+                "trigger_type": trigger_type,
+                "provider": settings.PUSH_PROVIDER,
+                "requested_by": requested_by,
+            }
+        )
+        if not dispatch:
+            raise DuplicateKeyError("이미 발송 중인 푸시 알림입니다.")
+
+        dispatch_id = str(dispatch["id"])
+        message = PushMessage(
+            title=campaign["push_name"],
+            body=campaign.get("content"),
+            link_url=campaign.get("link_url"),
+            data={
+                "push_id": push_id,
+                "dispatch_id": dispatch_id,
+                "send_to_store": bool(campaign.get("send_to_store")),
+            },
+        )
+        task = asyncio.create_task(
+            cls._run(dispatch_id, message, recipient_sql, params, recipient_filter, on_delivered),
+            name=f"push_dispatch:{dispatch_id}"
+        )
+        cls._tasks[dispatch_id] = task
+        task.add_done_callback(lambda _: cls._tasks.pop(dispatch_id, None))
+
+        logger.info(f"PUSH 발송 시작: push_id={push_id}, dispatch_id={dispatch_id}, trigger={trigger_type}")
+        return dispatch
+
+    @classmethod
+    async def get_dispatch(cls, dispatch_id: str) -> Dict[str, Any]:
+        """발송 진행 상황 조회"""
+        dispatch = await query_one(
+            f"SELECT {_DISPATCH_COLUMNS} FROM push_dispatches WHERE id = %(dispatch_id)s",
+            {"dispatch_id": dispatch_id}
+        )
+        if not dispatch:
+            raise NotFoundError("발송 이력을 찾을 수 없습니다.")
+        return cls._with_progress(dispatch)
+
+    @classmethod
+    async def list_dispatches(cls, push_id: str, limit: int = 20) -> List[Dict[str, Any]]:
+        """캠페인 발송 이력 (최신순)"""
+        rows = await query(
+            f"""
+            SELECT {_DISPATCH_COLUMNS} FROM push_dispatches
+            WHERE push_id = %(push_id)s
+            ORDER BY started_at DESC
+            LIMIT %(limit)s
+            """,
+            {"push_id": push_id, "limit": limit}
+        )
+        return [cls._with_progress(row) for row in rows]
+
+    @classmethod
+    async def cancel(cls, dispatch_id: str) -> bool:
+        """
+        발송 취소 (이 프로세스에서 실행 중인 발송만)
+
+        Returns:
+            취소 여부
+        """
+        task = cls._tasks.get(dispatch_id)
+        if task is None or task.done():
+            return False
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+        return True
+
+    @classmethod
+    async def drain(cls, timeout: float = 5.0) -> None:
+        """종료 시 진행 중인 발송 중단 (진행 상황 기록 후 cancelled 처리, 커넥션 풀 종료 전 호출)"""
+        if not cls._tasks:
+            return
+        tasks = list(cls._tasks.values())
+        for task in tasks:
+            task.cancel()
+        _, pending = await asyncio.wait(tasks, timeout=timeout)
+        if pending:
+            logger.warning(f"PUSH 발송 {len(pending)}건 종료 대기 시간 초과")
+
+    # ============================================
+    # 수신자 쿼리
+    # ============================================
+
+    @staticmethod
+    def build_audience_query(
+        target_audience: Optional[List[str]],
+        target_companies: Optional[List[str]]
+    ) -> Tuple[str, Dict[str, Any]]:
+        """
+        전송대상(all/normal/affiliate/fs) + 기업(사업장 코드) 조건 → 수신자 쿼리
+
+        Returns:
+            (sql, params)
+        """
+        audiences = set(target_audience or ["all"])
+        params = {
+            "all_members": "all" in audiences,
+            "normal": "normal" in audiences,
+            "affiliate": "affiliate" in audiences,
+            "fs": "fs" in audiences,
+            "companies": list(target_companies) if target_companies else None,
+        }
+        return AUDIENCE_SQL, params
+
+    # ============================================
+    # 발송 실행
+    # ============================================
+
+    @classmethod
+    async def _run(
+        cls,
+        dispatch_id: str,
+        message: PushMessage,
+        recipient_sql: str,
+        params: Dict[str, Any],
+        recipient_filter: Optional[RecipientFilter] = None,
+        on_delivered: Optional[DeliveredCallback] = None
+    ) -> None:
+        provider = get_push_provider()
+        limiter = get_rate_limiter()
+        batch_size = min(settings.PUSH_BATCH_SIZE, provider.max_batch_size)
+        worker_count = max(settings.PUSH_CONCURRENCY, 1)
+        # 큐 크기를 워커 수의 2배로 제한 → 메모리 사용량 = 배치 크기 x 큐 크기
+        batches: asyncio.Queue = asyncio.Queue(maxsize=worker_count * 2)
+        counters = {"total": 0, "processed": 0, "sent": 0, "failed": 0, "invalid": 0, "skipped": 0}
+        started = time.perf_counter()
+        status, error_message = "completed", None
+
+        async def produce() -> None:
+            counters["total"] = await cls._count_recipients(recipient_sql, params)
+            async with get_connection(use_app_db=True) as conn:
+                # 이름 있는 커서 = 서버 사이드 커서 (fetchmany 단위로만 전송받음)
+                async with conn.cursor(name=f"push_dispatch_{uuid.UUID(dispatch_id).hex}") as cur:
+                    await cur.execute(recipient_sql, params)
+                    while True:
+                        rows = await cur.fetchmany(batch_size)
+                        if not rows:
+                            break
+                        if recipient_filter is not None:
+                            kept = await recipient_filter(rows)
+                            counters["skipped"] += len(rows) - len(kept)
+                            counters["processed"] += len(rows) - len(kept)
+                            rows = kept
+                        if rows:
+                            await batches.put(rows)
+                await conn.rollback()
+
+        async def consume() -> None:
+            while True:
+                rows = await batches.get()
+                try:
+                    if rows is None:
+                        return
+                    tokens = [row["push_token"] for row in rows]
+                    result = await cls._send_with_retry(provider, limiter, tokens, message)
+                    if on_delivered is not None and result.sent:
+                        sent = set(result.sent)
+                        await on_delivered([row for row in rows if row["push_token"] in sent])
+                    counters["sent"] += len(result.sent)
+                    counters["invalid"] += len(result.invalid)
+                    counters["failed"] += len(result.retryable)
+                    counters["processed"] += len(tokens)
+                finally:
+                    batches.task_done()
+
+        async def report() -> None:
+            while True:
+                await asyncio.sleep(PROGRESS_FLUSH_INTERVAL)
+                await cls._save_progress(dispatch_id, counters)
+
+        workers = [asyncio.create_task(consume()) for _ in range(worker_count)]
+        reporter = asyncio.create_task(report())
+        try:
+            await produce()
+            for _ in workers:
+                await batches.put(None)
+            await asyncio.gather(*workers)
+        except asyncio.CancelledError:
+            status, error_message = "cancelled", "발송 취소"
+        except Exception as e:
+            logger.error(f"PUSH 발송 오류: dispatch_id={dispatch_id}, error={str(e)}", exc_info=True)
+            status, error_message = "failed", str(e)[:500]
+        finally:
+            for task in [*workers, reporter]:
+                task.cancel()
+            await asyncio.gather(*workers, reporter, return_exceptions=True)
+            await cls._save_progress(dispatch_id, counters, status=status, error_message=error_message)
+
+        elapsed = time.perf_counter() - started
+        logger.info(
+            f"PUSH 발송 {status}: dispatch_id={dispatch_id}, total={counters['total']}, "
+            f"sent={counters['sent']}, failed={counters['failed']}, invalid={counters['invalid']}, "
+            f"skipped={counters['skipped']}, "
+            f"elapsed={elapsed:.1f}s"
+        )
+
+    @staticmethod
+    async def _send_with_retry(provider, limiter, tokens: List[str], message: PushMessage) -> PushBatchResult:
+        """
+        배치 발송 + 일시 오류 토큰만 지수 백오프(지터 포함) 재시도
+
+        Returns:
+            최종 결과 (retryable = 재시도 후에도 실패한 토큰)
+        """
+        total = PushBatchResult()
+        pending = tokens
+        for attempt in range(settings.PUSH_MAX_RETRIES + 1):
+            if attempt:
+                backoff = min(settings.PUSH_RETRY_BACKOFF * (2 ** (attempt - 1)), MAX_BACKOFF_SECONDS)
+                await asyncio.sleep(backoff * random.uniform(0.5, 1.0))
+            await limiter.acquire(len(pending))
+            try:
+                result = await provider.send_batch(pending, message)
+            except Exception as e:
+                logger.warning(f"PUSH 배치 발송 실패 (attempt={attempt + 1}): {provider.name} - {str(e)}")
+                result = PushBatchResult(retryable=list(pending))
+            total.sent.extend(result.sent)
+            total.invalid.extend(result.invalid)
+            pending = result.retryable
+            if not pending:
+                break
+        total.retryable = list(pending)
+        return total
+
+    @staticmethod
+    async def _count_recipients(recipient_sql: str, params: Dict[str, Any]) -> int:
+        row = await query_one(
+            f"SELECT COUNT(*) AS count FROM ({recipient_sql}) recipients", params, use_app_db=True
+        )
+        return int(row["count"]) if row else 0
+
+    @staticmethod
+    async def _save_progress(
+        dispatch_id: str,
+        counters: Dict[str, int],
+        status: Optional[str] = None,
+        error_message: Optional[str] = None
+    ) -> None:
+        try:
+            await execute(
+                """
+                UPDATE push_dispatches SET
+                    total_count = %(total)s,
+                    processed_count = %(processed)s,
+                    sent_count = %(sent)s,
+                    failed_count = %(failed)s,
+                    invalid_count = %(invalid)s,
+                    skipped_count = %(skipped)s,
+                    status = COALESCE(%(status)s, status),
+                    error_message = COALESCE(%(error_message)s, error_message),
+                    finished_at = CASE WHEN %(status)s IS NULL THEN finished_at ELSE NOW() END,
+                    updated_at = NOW()
+                WHERE id = %(dispatch_id)s
+                """,
+                {**counters, "dispatch_id": dispatch_id, "status": status, "error_message": error_message}
+            )
+        except Exception as e:
+            logger.warning(f"PUSH 발송 진행 상황 저장 실패: dispatch_id={dispatch_id}, error={str(e)}")
+
+    @staticmethod
+    def _with_progress(dispatch: Dict[str, Any]) -> Dict[str, Any]:
+        total = dispatch.get("total_count") or 0
+        processed = dispatch.get("processed_count") or 0
+        return {**dispatch, "progress": round(processed / total * 100, 1) if total else 0.0}
@@ -0,0 +1,301 @@
+"""
+파일: app/services/push_scheduler.py
+설명: PUSH 예약 스케줄러 (lifespan 백그라운드 태스크)
+  - 활성 PUSH 알림의 다음 발송 시각을 Redis 지연 큐(delayed:push_schedule)에 예약
+    (시간선택 / 시스템 시간 / 조건 달성 모두 매일 발송 시각 기준)
+  - 여러 워커/인스턴스 중 Redis 리더 락을 가진 하나만 발송 실행
+  - 같은 분에 몰리는 발송을 분산하도록 캠페인별 고정 지터(0 ~ PUSH_SCHEDULE_JITTER_SECONDS초) 적용
+  - 예약은 claim(CAS)으로 다음 날로 옮긴 뒤 실행 → 재시작/리더 교체 시에도 중복 발송 없음
+    (오늘 이미 실행된 캠페인은 발송 이력으로 한 번 더 확인)
+  - 생성/수정/삭제 시 해당 캠페인만 재예약 (reschedule / unschedule)
+  - 리더가 되면, 그리고 RECONCILE_INTERVAL 마다 DB 와 예약을 대조 (누락 추가 / 삭제분 제거)
+"""
+import asyncio
+import hashlib
+import time
+from datetime import date, datetime, time as dt_time, timedelta
+from typing import Any, Dict, Iterable, List, Optional, Set
+
+from app.config.database import query, query_one
+from app.config.settings import settings
+from app.core.exceptions import DuplicateKeyError
+from app.core.logger import logger
+from app.lib.delayed_queue import DelayedQueue
+from app.lib.leader_lock import LeaderLock
+from app.services.push_condition_service import CONDITION_RULES, PushConditionService
+from app.services.push_dispatch_service import PushDispatchService
+
+
+# 리더 락 TTL (초) - 틱마다 연장
+LOCK_TTL_SECONDS = 30
+# 최대 틱 간격 (초) - 다음 예약이 멀어도 이 간격으로 락 연장/예약 확인
+MAX_TICK_SECONDS = 5.0
+# DB 와 예약 대조 간격 (초)
+RECONCILE_INTERVAL = 600
+# 오류 발생 시 재시도 간격 (초)
+RETRY_INTERVAL = 10
+# 틱당 최대 실행 수
+MAX_FIRES_PER_TICK = 50
+
+# 시간선택 세부유형 기본 발송 시각 (send_time 미지정 시)
+TIME_SELECT_DEFAULTS = {
+    "breakfast_default": "09:00",
+    "lunch_default": "12:00",
+    "dinner_default": "18:00",
+}
+
+_CAMPAIGN_COLUMNS = """
+    id, push_name, target_audience, target_companies, send_to_store,
+    send_type, send_type_detail, send_time, content, link_url, is_active
+"""
+
+
+def send_time_of(campaign: Dict[str, Any]) -> Optional[dt_time]:
+    """
+    캠페인 발송 시각 (send_time 우선, 없으면 세부유형 기본 시각)
+
+    시각을 정할 수 없으면 None (예약하지 않음)
+    """
+    detail = campaign.get("send_type_detail") or ""
+    default = TIME_SELECT_DEFAULTS.get(detail)
+    if PushConditionService.is_condition_campaign(campaign) and detail in CONDITION_RULES:
+        default = CONDITION_RULES[detail]["default_time"]
+
+    value = campaign.get("send_time") or default
+    if value is None:
+        return None
+    if isinstance(value, dt_time):
+        return value
+    try:
+        return datetime.strptime(str(value)[:5], "%H:%M").time()
+    except ValueError:
+        logger.warning(f"PUSH 발송 시각 형식 오류: push_id={campaign.get('id')}, send_time={value}")
+        return None
+
+
+def jitter_of(push_id: str) -> int:
+    """캠페인별 고정 지터 (초) - 재적재해도 같은 값"""
+    limit = max(settings.PUSH_SCHEDULE_JITTER_SECONDS, 0)
+    if not limit:
+        return 0
+    digest = hashlib.sha1(str(push_id).encode()).digest()
+    return int.from_bytes(digest[:4], "big") % (limit + 1)
+
+
+def next_fire_at(campaign: Dict[str, Any], after: datetime) -> Optional[int]:
+    """after 이후 첫 발송 시각 (epoch 초, 지터 포함)"""
+    send_time = send_time_of(campaign)
+    if send_time is None or not campaign.get("is_active"):
+        return None
+    jitter = timedelta(seconds=jitter_of(campaign["id"]))
+    fire_at = datetime.combine(after.date(), send_time) + jitter
+    if fire_at <= after:
+        fire_at += timedelta(days=1)
+    return int(fire_at.timestamp())
+
+
+class PushScheduler:
+    """PUSH 예약 스케줄러 (프로세스당 1개 태스크)"""
+
+    _task: Optional[asyncio.Task] = None
+    _lock: Optional[LeaderLock] = None
+    _queue = DelayedQueue("push_schedule")
+
+    # 발송 지연 통계 (예약 시각 대비 실제 실행까지, 초)
+    _fired_count = 0
+    _last_fire_lag: Optional[float] = None
+    _max_fire_lag: float = 0.0
+
+    @classmethod
+    def start(cls) -> None:
+        """스케줄러 시작 (lifespan 시작 시 호출)"""
+        if not settings.PUSH_SCHEDULER_ENABLED or cls._task is not None:
+            return
+        cls._lock = LeaderLock("push_scheduler", ttl_seconds=LOCK_TTL_SECONDS, fallback=False)
+        cls._task = asyncio.create_task(cls._run(), name="push_scheduler")
+        logger.info("PUSH 스케줄러 시작")
+
+    @classmethod
+    async def stop(cls) -> None:
+        """스케줄러 중지 + 리더 락 해제 (lifespan 종료 시, 커넥션 풀 종료 전 호출)"""
+        if cls._task is None:
+            return
+        cls._task.cancel()
+        try:
+            await cls._task
+        except asyncio.CancelledError:
+            pass
+        cls._task = None
+        if cls._lock is not None:
+            await cls._lock.release()
+        logger.info("PUSH 스케줄러 중지")
+
+    # ============================================
+    # 예약 변경 (생성/수정/삭제 API 에서 호출, 모든 워커에서 가능)
+    # ============================================
+
+    @classmethod
+    async def reschedule(cls, push_id: str) -> None:
+        """
+        캠페인 1건 재예약 (발송 시각/사용여부 변경 반영)
+
+        예약 실패는 로그만 남긴다. (다음 대조 주기에 보정)
+        """
+        if not settings.PUSH_SCHEDULER_ENABLED:
+            return
+        try:
+            campaign = await query_one(
+                f"SELECT {_CAMPAIGN_COLUMNS} FROM push_notifications WHERE id = %(push_id)s",
+                {"push_id": push_id},
+                use_app_db=True
+            )
+            fire_at = next_fire_at(campaign, datetime.now()) if campaign else None
+            if fire_at is None:
+                await cls._queue.remove(str(push_id))
+            else:
+                await cls._queue.schedule(str(push_id), fire_at)
+        except Exception as e:
+            logger.warning(f"PUSH 재예약 실패: push_id={push_id}, error={str(e)}")
+
+    @classmethod
+    async def unschedule(cls, push_ids: Iterable[Any]) -> None:
+        """삭제된 캠페인 예약 제거"""
+        if not settings.PUSH_SCHEDULER_ENABLED:
+            return
+        try:
+            await cls._queue.remove(*[str(push_id) for push_id in push_ids])
+        except Exception as e:
+            logger.warning(f"PUSH 예약 제거 실패: {str(e)}")
+
+    @classmethod
+    async def stats(cls) -> Dict[str, Any]:
+        """예약 큐 깊이 / 지연 통계"""
+        queue = await cls._queue.stats()
+        return {
+            **queue,
+            "is_leader": bool(cls._lock and cls._lock.is_leader),
+            "fired_count": cls._fired_count,
+            "last_fire_lag_seconds": cls._last_fire_lag,
+            "max_fire_lag_seconds": round(cls._max_fire_lag, 3),
+        }
+
+    # ============================================
+    # 리더 루프
+    # ============================================
+
+    @classmethod
+    async def _run(cls) -> None:
+        reconciled_at = 0.0
+        while True:
+            wait = MAX_TICK_SECONDS
+            try:
+                was_leader = cls._lock.is_leader
+                if await cls._lock.acquire():
+                    if not was_leader or time.monotonic() - reconciled_at >= RECONCILE_INTERVAL:
+                        await cls.reconcile()
+                        reconciled_at = time.monotonic()
+                    await cls._fire_due()
+                    next_at = await cls._queue.next_at()
+                    if next_at is not None:
+                        wait = min(max(next_at - time.time(), 0.2), MAX_TICK_SECONDS)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"PUSH 스케줄러 오류: {str(e)}", exc_info=True)
+                wait = RETRY_INTERVAL
+            await asyncio.sleep(wait)
+
+    @classmethod
+    async def reconcile(cls) -> Dict[str, int]:
+        """
+        DB 와 예약 대조
+
+        - 예약이 없는 활성 캠페인: 추가 (발송 허용 시간 안의 오늘 발송분 포함)
+        - 기존 예약: 유지 (이미 다음 날로 옮겨진 예약을 되돌리지 않음)
+        - 비활성/삭제/시각 없음: 제거
+        """
+        campaigns = await query(
+            f"SELECT {_CAMPAIGN_COLUMNS} FROM push_notifications WHERE is_active = true",
+            use_app_db=True
+        )
+        after = datetime.now() - timedelta(minutes=settings.PUSH_SEND_WINDOW_MINUTES)
+        wanted: Set[str] = set()
+        added = 0
+        for campaign in campaigns:
+            fire_at = next_fire_at(campaign, after)
+            if fire_at is None:
+                continue
+            wanted.add(str(campaign["id"]))
+            if await cls._queue.schedule(str(campaign["id"]), fire_at, only_if_absent=True):
+                added += 1
+
+        stale = (await cls._queue.members()) - wanted
+        removed = await cls._queue.remove(*stale)
+        if added or removed:
+            logger.info(f"PUSH 예약 대조: 추가 {added}건, 제거 {removed}건, 전체 {len(wanted)}건")
+        return {"added": added, "removed": removed, "scheduled": len(wanted)}
+
+    @classmethod
+    async def _fire_due(cls) -> int:
+        """실행 시각이 된 예약 실행 (다음 날로 옮긴 뒤 발송 시작)"""
+        due = await cls._queue.due(limit=MAX_FIRES_PER_TICK)
+        if not due:
+            return 0
+
+        fired = 0
+        now = datetime.now()
+        started_today = await cls._started_today(now.date())
+        for push_id, score in due:
+            campaign = await query_one(
+                f"SELECT {_CAMPAIGN_COLUMNS} FROM push_notifications WHERE id = %(push_id)s",
+                {"push_id": push_id},
+                use_app_db=True
+            )
+            scheduled_at = datetime.fromtimestamp(score)
+            next_at = next_fire_at(campaign, max(now, scheduled_at)) if campaign else None
+            if not await cls._queue.claim(push_id, score, next_at):
+                continue
+
+            lag = (now - scheduled_at).total_seconds()
+            if campaign is None or next_at is None:
+                continue
+            if lag > settings.PUSH_SEND_WINDOW_MINUTES * 60:
+                logger.warning(f"PUSH 예약 발송 시간 초과로 건너뜀: push_id={push_id}, lag={lag:.0f}s")
+                continue
+            if push_id in started_today:
+                continue
+
+            try:
+                if PushConditionService.is_condition_campaign(campaign):
+                    await PushConditionService.evaluate(campaign, scheduled_at.date())
+                else:
+                    recipient_sql, params = PushDispatchService.build_audience_query(
+                        campaign.get("target_audience"), campaign.get("target_companies")
+                    )
+                    await PushDispatchService.start_dispatch(
+                        campaign, recipient_sql, params, trigger_type="schedule"
+                    )
+                fired += 1
+                cls._fired_count += 1
+                cls._last_fire_lag = round(lag, 3)
+                cls._max_fire_lag = max(cls._max_fire_lag, lag)
+            except DuplicateKeyError:
+                # 수동 발송 등으로 이미 발송 중
+                pass
+            except Exception as e:
+                logger.error(f"PUSH 예약 발송 실패: push_id={push_id}, error={str(e)}", exc_info=True)
+        return fired
+
+    @staticmethod
+    async def _started_today(today: date) -> Set[str]:
+        """오늘 예약/조건 발송이 실행 중이거나 완료된 캠페인 ID (실패/취소 건은 재실행 허용)"""
+        rows: List[Dict[str, Any]] = await query(
+            """
+            SELECT DISTINCT push_id FROM push_dispatches
+            WHERE trigger_type IN ('schedule', 'condition')
+              AND started_at >= %(today)s::date
+              AND status IN ('running', 'completed')
+            """,
+            {"today": today}
+        )
+        return {str(row["push_id"]) for row in rows}
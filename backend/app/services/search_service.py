@@ -0,0 +1,536 @@
+"""
+파일: app/services/search_service.py
+설명: 어드민 통합 검색 (회원/컨텐츠/영양제/기능성 성분/공지/문의/챌린지)
+  - App DB public.admin_search_documents 에 엔티티별 검색 문서 유지
+  - 한글은 2-gram, 그 외 단어는 원형 토큰으로 분해해 'simple' tsvector 저장
+    (형태소 분석기 없이 부분 일치 검색 지원)
+  - 제목(A) / 부제(B) / 본문(C) 가중치로 ts_rank_cd 정렬, 유형별 facet 제공
+  - 라우터의 생성/수정/삭제 후 schedule_sync() 로 증분 갱신
+  - 앱 서비스가 직접 쓰는 회원/문의는 updated_at 워터마크로 주기 동기화 (sync_changed, search_sync_scheduler.py)
+    (원본 삭제는 반영하지 않으므로 재색인으로 정리)
+  - 전체 재색인: python -m scripts.rebuild_search_index
+
+테이블 DDL: schema.sql "30. 통합 검색 문서 테이블" 참조
+"""
+import asyncio
+import re
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+from app.config.settings import settings
+from app.core.logger import logger
+from app.lib.app_db import app_db_manager
+from app.utils.masking import mask_email, mask_name
+
+
+# 본문 인덱싱 최대 길이 (tsvector 크기 제한 및 색인 비용 제한)
+MAX_BODY_LENGTH = 20000
+# 재색인 배치 크기
+REBUILD_BATCH_SIZE = 500
+# 주기 동기화 배치 크기 / 1회 최대 배치 수 (나머지는 다음 회차)
+SYNC_BATCH_SIZE = 500
+MAX_SYNC_BATCHES = 20
+
+# 단어 (밑줄 제외 문자/숫자 연속)
+_WORD = re.compile(r"[^\W_]+")
+# 한글(자모/호환 자모/음절) 및 한자 - 띄어쓰기 단위가 의미 단위가 아니므로 n-gram 분해
+_NGRAM_CHARS = re.compile(r"[ᄀ-ᇿ㄰-㆏가-힣一-鿿]")
+_HTML_TAG = re.compile(r"<[^>]+>")
+
+
+# ============================================
+# 검색 대상 정의
+# ============================================
+# 각 소스 SQL은 id, title, subtitle, body 컬럼을 반환한다.
+# where: 색인 대상 조건 (조건을 벗어나면 문서 삭제 - 예: 챌린지 소프트 삭제)
+# changed_column: 어드민 API 밖(앱 서비스)에서 쓰이는 유형의 수정 시각 컬럼 → 주기 동기화 대상
+
+SEARCH_SOURCES: Dict[str, Dict[str, str]] = {
+    "member": {
+        "label": "회원",
+        "sql": """
+            SELECT u.id::text AS id, u.name AS title, u.email AS subtitle,
+                   concat_ws(' ', u.phone, regexp_replace(COALESCE(u.phone, ''), '[^0-9]', '', 'g'), u.business_code) AS body
+            FROM users u
+        """,
+        "id_column": "u.id",
+        "changed_column": "u.updated_at",
+    },
+    "content": {
+        "label": "컨텐츠",
+        "sql": """
+            SELECT c.id::text AS id, c.title, array_to_string(c.tags, ' ') AS subtitle,
+                   concat_ws(' ', c.content, c.quote_content, c.quote_source) AS body
+            FROM public.contents c
+        """,
+        "id_column": "c.id",
+    },
+    "supplement": {
+        "label": "영양제",
+        "sql": """
+            SELECT s.id::text AS id, s.product_name AS title, s.manufacturer AS subtitle,
+                   s.product_report_number AS body
+            FROM public.supplement_products_master s
+        """,
+        "id_column": "s.id",
+    },
+    "functional_ingredient": {
+        "label": "기능성 성분",
+        "sql": """
+            SELECT fi.id::text AS id, fi.internal_name AS title, fi.external_name AS subtitle,
+                   concat_ws(' ', fi.ingredient_code, fi.indicator_component, fi.display_functionality) AS body
+            FROM public.functional_ingredients fi
+        """,
+        "id_column": "fi.id",
+    },
+    "notice": {
+        "label": "공지사항",
+        "sql": """
+            SELECT n.id::text AS id, n.title, NULL AS subtitle, n.content AS body
+            FROM notices n
+        """,
+        "id_column": "n.id",
+    },
+    "inquiry": {
+        "label": "1:1 문의",
+        "sql": """
+            SELECT i.id::text AS id, left(i.content, 100) AS title, it.name AS subtitle,
+                   concat_ws(' ', substr(i.content, 101), i.answer) AS body
+            FROM inquiries i
+            LEFT JOIN inquiry_types it ON i.inquiry_type_id = it.id
+        """,
+        "id_column": "i.id",
+        "changed_column": "i.updated_at",
+    },
+    "challenge": {
+        "label": "챌린지",
+        "sql": """
+            SELECT ch.id::text AS id, ch.title, ch.subtitle, ch.description AS body
+            FROM challenges ch
+        """,
+        "id_column": "ch.id",
+        "where": "ch.is_active = true",
+    },
+}
+
+
+# ============================================
+# 토크나이저
+# ============================================
+
+def tokenize(text: Optional[str]) -> List[str]:
+    """
+    검색 토큰 분해
+
+    - 한글/한자가 포함된 단어: 2-gram ("비타민" → 비타, 타민), 1글자는 그대로
+    - 그 외 단어: 소문자 원형 ("Vitamin-C" → vitamin, c)
+    """
+    if not text:
+        return []
+
+    tokens: List[str] = []
+    for word in _WORD.findall(text.lower()):
+        if _NGRAM_CHARS.search(word) and len(word) > 1:
+            tokens.extend(word[i:i + 2] for i in range(len(word) - 1))
+        else:
+            tokens.append(word)
+    return tokens
+
+
+def build_tsquery(q: Optional[str]) -> Optional[str]:
+    """
+    검색어를 to_tsquery('simple', ...) 문자열로 변환
+
+    - 한글 단어: 2-gram을 인접 연산자(<->)로 연결해 원문 순서 일치 요구
+    - 1글자 한글 / 그 외 단어: 접두사 일치(:*)
+    - 단어 사이: AND(&)
+
+    Returns:
+        tsquery 문자열 (검색 가능한 토큰이 없으면 None)
+    """
+    if not q:
+        return None
+
+    terms: List[str] = []
+    for word in _WORD.findall(q.lower()):
+        if _NGRAM_CHARS.search(word) and len(word) > 1:
+            grams = [word[i:i + 2] for i in range(len(word) - 1)]
+            terms.append(grams[0] if len(grams) == 1 else f"({' <-> '.join(grams)})")
+        else:
+            terms.append(f"{word}:*")
+
+    if not terms:
+        return None
+    return " & ".join(terms)
+
+
+def _strip_html(text: Optional[str]) -> Optional[str]:
+    if not text:
+        return text
+    return _HTML_TAG.sub(" ", text)
+
+
+# ============================================
+# SQL
+# ============================================
+
+_UPSERT_DOCUMENT = """
+    INSERT INTO public.admin_search_documents (
+        entity_type, entity_id, title, subtitle, search_vector, updated_at
+    ) VALUES (
+        %(entity_type)s, %(entity_id)s, %(title)s, %(subtitle)s,
+        setweight(to_tsvector('simple', %(title_tokens)s), 'A')
+        || setweight(to_tsvector('simple', %(subtitle_tokens)s), 'B')
+        || setweight(to_tsvector('simple', %(body_tokens)s), 'C'),
+        NOW()
+    )
+    ON CONFLICT (entity_type, entity_id) DO UPDATE SET
+        title = EXCLUDED.title,
+        subtitle = EXCLUDED.subtitle,
+        search_vector = EXCLUDED.search_vector,
+        updated_at = NOW()
+"""
+
+_DELETE_DOCUMENT = """
+    DELETE FROM public.admin_search_documents
+    WHERE entity_type = %(entity_type)s AND entity_id = %(entity_id)s
+"""
+
+# 주기 동기화 워터마크 (NULL = 처음부터, 행 잠금으로 동시 실행 직렬화)
+_GET_SYNC_WATERMARK = """
+    INSERT INTO public.admin_search_sync_watermarks (entity_type)
+    VALUES (%(entity_type)s)
+    ON CONFLICT (entity_type) DO UPDATE SET entity_type = EXCLUDED.entity_type
+    RETURNING last_changed_at, last_id
+"""
+
+_UPDATE_SYNC_WATERMARK = """
+    UPDATE public.admin_search_sync_watermarks
+    SET last_changed_at = %(last_changed_at)s, last_id = %(last_id)s, synced_at = NOW()
+    WHERE entity_type = %(entity_type)s
+"""
+
+
+class SearchService:
+    """어드민 통합 검색 서비스 (App DB 사용)"""
+
+    # 실행 중인 증분 갱신 태스크 (GC 방지 및 종료 시 대기용)
+    _pending: Set[asyncio.Task] = set()
+
+    # ============================================
+    # 검색
+    # ============================================
+
+    @classmethod
+    async def search(
+        cls,
+        q: str,
+        entity_types: Optional[List[str]] = None,
+        page: int = 1,
+        page_size: int = 20,
+    ) -> Dict[str, Any]:
+        """
+        통합 검색
+
+        Args:
+            q: 검색어
+            entity_types: 결과를 제한할 유형 목록 (None이면 전체)
+            page: 페이지 번호
+            page_size: 페이지 크기
+
+        Returns:
+            {"items": [...], "facets": {유형: 건수}, "total": 선택 유형 합계}
+            facets 는 유형 필터와 무관하게 전체 유형 기준으로 계산한다.
+        """
+        tsquery = build_tsquery(q)
+        facets = {entity_type: 0 for entity_type in SEARCH_SOURCES}
+        if not tsquery:
+            return {"items": [], "facets": facets, "total": 0}
+
+        types = [t for t in (entity_types or SEARCH_SOURCES.keys()) if t in SEARCH_SOURCES]
+        params = {
+            "query": tsquery,
+            "types": types,
+            "limit": page_size,
+            "offset": (page - 1) * page_size,
+        }
+
+        async with app_db_manager.get_async_conn() as conn:
+            async with conn.cursor() as cur:
+                await cur.execute(
+                    """
+                    SELECT entity_type, COUNT(*) AS count
+                    FROM public.admin_search_documents
+                    WHERE search_vector @@ to_tsquery('simple', %(query)s)
+                    GROUP BY entity_type
+                    """,
+                    params
+                )
+                for row in await cur.fetchall():
+                    facets[row["entity_type"]] = int(row["count"])
+
+                await cur.execute(
+                    """
+                    SELECT d.entity_type, d.entity_id, d.title, d.subtitle, d.updated_at,
+                           ts_rank_cd(d.search_vector, q.query) AS rank
+                    FROM public.admin_search_documents d,
+                         to_tsquery('simple', %(query)s) AS q(query)
+                    WHERE d.search_vector @@ q.query
+                      AND d.entity_type = ANY(%(types)s)
+                    ORDER BY rank DESC, d.updated_at DESC
+                    LIMIT %(limit)s OFFSET %(offset)s
+                    """,
+                    params
+                )
+                rows = await cur.fetchall()
+
+        items = [cls._format_item(row) for row in rows]
+        total = sum(facets[t] for t in types)
+        return {"items": items, "facets": facets, "total": total}
+
+    @staticmethod
+    def _format_item(row: Dict[str, Any]) -> Dict[str, Any]:
+        """검색 결과 1건 포맷 (회원은 응답 시점에 마스킹)"""
+        entity_type = row["entity_type"]
+        title = row["title"]
+        subtitle = row["subtitle"]
+        if entity_type == "member":
+            title = mask_name(title)
+            subtitle = mask_email(subtitle)
+
+        return {
+            "type": entity_type,
+            "type_label": SEARCH_SOURCES[entity_type]["label"],
+            "id": row["entity_id"],
+            "title": title,
+            "subtitle": subtitle,
+            "rank": round(float(row["rank"]), 4),
+            "updated_at": row["updated_at"],
+        }
+
+    # ============================================
+    # 증분 갱신
+    # ============================================
+
+    @classmethod
+    def schedule_sync(cls, entity_type: str, entity_ids: Iterable[Any]) -> None:
+        """
+        검색 문서 갱신 예약 (응답을 지연시키지 않도록 백그라운드 실행)
+
+        생성/수정/삭제 모두 이 메서드를 호출한다. 원본 행을 다시 읽어
+        존재하면 upsert, 없거나 색인 조건을 벗어나면 문서를 삭제한다.
+        """
+        ids = [str(entity_id) for entity_id in entity_ids if entity_id is not None]
+        if not settings.SEARCH_INDEX_ENABLED or not ids:
+            return
+
+        task = asyncio.create_task(cls.sync(entity_type, ids))
+        cls._pending.add(task)
+        task.add_done_callback(cls._pending.discard)
+
+    @classmethod
+    async def sync(cls, entity_type: str, entity_ids: List[str]) -> None:
+        """
+        지정 엔티티의 검색 문서 동기화
+
+        검색 색인 실패가 원본 쓰기를 실패시키지 않도록 오류는 로그만 남긴다.
+        (누락분은 재색인으로 복구)
+        """
+        source = SEARCH_SOURCES[entity_type]
+        where = f"{source['id_column']} = %(entity_id)s"
+        if source.get("where"):
+            where += f" AND {source['where']}"
+        select_sql = f"{source['sql']} WHERE {where}"
+
+        try:
+            async with app_db_manager.get_async_conn() as conn:
+                async with conn.cursor() as cur:
+                    for entity_id in entity_ids:
+                        await cur.execute(select_sql, {"entity_id": entity_id})
+                        row = await cur.fetchone()
+                        if row:
+                            await cur.execute(_UPSERT_DOCUMENT, cls._document_params(entity_type, row))
+                        else:
+                            await cur.execute(
+                                _DELETE_DOCUMENT,
+                                {"entity_type": entity_type, "entity_id": entity_id}
+                            )
+                await conn.commit()
+        except Exception as e:
+            logger.warning(f"검색 문서 갱신 실패: type={entity_type}, ids={entity_ids}, error={str(e)}")
+
+    @classmethod
+    async def sync_changed(cls, entity_type: str, max_batches: int = MAX_SYNC_BATCHES) -> int:
+        """
+        워터마크 (changed_column, id) 이후 수정된 행의 검색 문서 upsert
+
+        배치마다 문서 갱신과 워터마크 갱신을 한 트랜잭션으로 처리한다.
+        진행 중인 트랜잭션이 늦게 커밋되는 행을 놓치지 않도록 최근 SEARCH_SYNC_LAG_SECONDS 이내
+        수정분은 다음 회차에 처리한다.
+
+        Returns:
+            갱신한 문서 수
+        """
+        source = SEARCH_SOURCES[entity_type]
+        select_sql = cls._changed_rows_sql(source)
+
+        synced = 0
+        for _ in range(max_batches):
+            async with app_db_manager.get_async_conn() as conn:
+                async with conn.cursor() as cur:
+                    await cur.execute(_GET_SYNC_WATERMARK, {"entity_type": entity_type})
+                    watermark = await cur.fetchone()
+                    await cur.execute(select_sql, {
+                        "last_changed_at": watermark["last_changed_at"],
+                        "last_id": watermark["last_id"],
+                        "lag_seconds": settings.SEARCH_SYNC_LAG_SECONDS,
+                        "batch_size": SYNC_BATCH_SIZE,
+                    })
+                    rows = await cur.fetchall()
+                    if rows:
+                        await cur.executemany(
+                            _UPSERT_DOCUMENT,
+                            [cls._document_params(entity_type, row) for row in rows]
+                        )
+                        await cur.execute(_UPDATE_SYNC_WATERMARK, {
+                            "entity_type": entity_type,
+                            "last_changed_at": rows[-1]["changed_at"],
+                            "last_id": rows[-1]["id"],
+                        })
+                await conn.commit()
+
+            synced += len(rows)
+            if len(rows) < SYNC_BATCH_SIZE:
+                break
+        return synced
+
+    @staticmethod
+    def _changed_rows_sql(source: Dict[str, str]) -> str:
+        """소스 SQL + 수정 시각 컬럼(changed_at) / 워터마크 이후 조건 / (수정 시각, id) 정렬"""
+        changed, id_text = source["changed_column"], f"{source['id_column']}::text"
+        conditions = [
+            f"""(%(last_changed_at)s::timestamptz IS NULL
+                 OR ({changed}, {id_text}) > (%(last_changed_at)s::timestamptz, %(last_id)s::text))""",
+            f"{changed} <= NOW() - make_interval(secs => %(lag_seconds)s)",
+        ]
+        if source.get("where"):
+            conditions.append(source["where"])
+        select = source["sql"].strip()[len("SELECT"):]
+        return (
+            f"SELECT {changed} AS changed_at,{select}\n"
+            f"WHERE {' AND '.join(conditions)}\n"
+            f"ORDER BY {changed}, {id_text}\n"
+            f"LIMIT %(batch_size)s"
+        )
+
+    @classmethod
+    def sync_types(cls) -> Tuple[str, ...]:
+        """주기 동기화 대상 유형 (changed_column 지정)"""
+        return tuple(t for t, source in SEARCH_SOURCES.items() if source.get("changed_column"))
+
+    @classmethod
+    def schedule_rebuild(cls, entity_type: str) -> None:
+        """유형 단위 재색인 예약 (일괄 등록처럼 변경 건수가 많을 때)"""
+        if not settings.SEARCH_INDEX_ENABLED:
+            return
+
+        task = asyncio.create_task(cls._rebuild_quietly(entity_type))
+        cls._pending.add(task)
+        task.add_done_callback(cls._pending.discard)
+
+    @classmethod
+    async def _rebuild_quietly(cls, entity_type: str) -> None:
+        try:
+            await cls.rebuild([entity_type])
+        except Exception as e:
+            logger.warning(f"검색 재색인 실패: type={entity_type}, error={str(e)}")
+
+    @classmethod
+    async def drain(cls, timeout: float = 5.0) -> None:
+        """종료 시 진행 중인 갱신 태스크 대기 (커넥션 풀 종료 전 호출)"""
+        if not cls._pending:
+            return
+        _, pending = await asyncio.wait(set(cls._pending), timeout=timeout)
+        if pending:
+            logger.warning(f"검색 문서 갱신 {len(pending)}건 미완료 - 재색인 필요")
+
+    @staticmethod
+    def _document_params(entity_type: str, row: Dict[str, Any]) -> Dict[str, Any]:
+        """소스 행 → upsert 파라미터"""
+        body = _strip_html(row.get("body")) or ""
+        return {
+            "entity_type": entity_type,
+            "entity_id": row["id"],
+            "title": row.get("title"),
+            "subtitle": row.get("subtitle"),
+            "title_tokens": " ".join(tokenize(row.get("title"))),
+            "subtitle_tokens": " ".join(tokenize(row.get("subtitle"))),
+            "body_tokens": " ".join(tokenize(body[:MAX_BODY_LENGTH])),
+        }
+
+    # ============================================
+    # 전체 재색인
+    # ============================================
+
+    @classmethod
+    async def rebuild(
+        cls,
+        entity_types: Optional[List[str]] = None,
+        batch_size: int = REBUILD_BATCH_SIZE,
+    ) -> Dict[str, int]:
+        """
+        검색 문서 전체 재색인
+
+        원본을 서버 측 커서로 배치 조회해 upsert 하고, 이번 재색인에서
+        갱신되지 않은 문서(원본이 삭제된 문서)는 마지막에 삭제한다.
+
+        Returns:
+            {유형: 색인 건수}
+        """
+        result: Dict[str, int] = {}
+        for entity_type in entity_types or list(SEARCH_SOURCES.keys()):
+            result[entity_type] = await cls._rebuild_type(entity_type, batch_size)
+        return result
+
+    @classmethod
+    async def _rebuild_type(cls, entity_type: str, batch_size: int) -> int:
+        source = SEARCH_SOURCES[entity_type]
+        select_sql = source["sql"]
+        if source.get("where"):
+            select_sql += f" WHERE {source['where']}"
+
+        indexed = 0
+        async with app_db_manager.get_async_conn() as read_conn, \
+                app_db_manager.get_async_conn() as write_conn:
+            async with write_conn.cursor() as wcur:
+                await wcur.execute("SELECT NOW() AS started_at")
+                started_at = (await wcur.fetchone())["started_at"]
+            await write_conn.commit()
+
+            async with read_conn.cursor(name=f"search_rebuild_{entity_type}") as cur:
+                await cur.execute(select_sql)
+                while True:
+                    rows = await cur.fetchmany(batch_size)
+                    if not rows:
+                        break
+                    async with write_conn.cursor() as wcur:
+                        await wcur.executemany(
+                            _UPSERT_DOCUMENT,
+                            [cls._document_params(entity_type, row) for row in rows]
+                        )
+                    await write_conn.commit()
+                    indexed += len(rows)
+            await read_conn.rollback()
+
+            async with write_conn.cursor() as wcur:
+                await wcur.execute(
+                    """
+                    DELETE FROM public.admin_search_documents
+                    WHERE entity_type = %(entity_type)s AND updated_at < %(started_at)s
+                    """,
+                    {"entity_type": entity_type, "started_at": started_at}
+                )
+                removed = wcur.rowcount
+            await write_conn.commit()
+
+        logger.info(f"검색 재색인 완료: type={entity_type}, indexed={indexed}, removed={removed}")
+        return indexed
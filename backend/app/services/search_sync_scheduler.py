@@ -0,0 +1,72 @@
+"""
+파일: app/services/search_sync_scheduler.py
+설명: 검색 문서 주기 동기화 스케줄러 (lifespan 백그라운드 태스크)
+  - 앱 서비스가 직접 쓰는 회원/문의는 어드민 라우터의 schedule_sync 를 거치지 않으므로
+    SEARCH_SYNC_INTERVAL 마다 updated_at 워터마크 이후 수정분을 검색 문서에 반영 (SearchService.sync_changed)
+  - 여러 워커/인스턴스 중 Redis 리더 락을 가진 하나만 실행
+    (Redis 오류 시에는 각자 실행 - 워터마크 행 잠금으로 직렬화되므로 중복 반영 없음)
+  - 원본 삭제는 반영하지 않음 (python -m scripts.rebuild_search_index 로 정리)
+"""
+import asyncio
+import time
+from typing import Optional
+
+from app.config.settings import settings
+from app.core.logger import logger
+from app.lib.leader_lock import LeaderLock
+from app.services.search_service import SearchService
+
+
+# 리더 락 TTL (초) - 틱마다 연장
+LOCK_TTL_SECONDS = 60
+# 틱 간격 (초)
+TICK_SECONDS = 20
+
+
+class SearchSyncScheduler:
+    """검색 문서 주기 동기화 스케줄러 (프로세스당 1개 태스크)"""
+
+    _task: Optional[asyncio.Task] = None
+    _lock: Optional[LeaderLock] = None
+
+    @classmethod
+    def start(cls) -> None:
+        """스케줄러 시작 (lifespan 시작 시 호출)"""
+        if not (settings.SEARCH_INDEX_ENABLED and settings.SEARCH_SYNC_ENABLED) or cls._task is not None:
+            return
+        cls._lock = LeaderLock("search_sync_scheduler", ttl_seconds=LOCK_TTL_SECONDS)
+        cls._task = asyncio.create_task(cls._run(), name="search_sync_scheduler")
+        logger.info("검색 동기화 스케줄러 시작")
+
+    @classmethod
+    async def stop(cls) -> None:
+        """스케줄러 중지 + 리더 락 해제 (lifespan 종료 시, 커넥션 풀 종료 전 호출)"""
+        if cls._task is None:
+            return
+        cls._task.cancel()
+        try:
+            await cls._task
+        except (asyncio.CancelledError, Exception):
+            pass
+        cls._task = None
+        if cls._lock is not None:
+            await cls._lock.release()
+        logger.info("검색 동기화 스케줄러 중지")
+
+    @classmethod
+    async def _run(cls) -> None:
+        tick = min(TICK_SECONDS, settings.SEARCH_SYNC_INTERVAL)
+        due_at = 0.0  # 다음 동기화 시각 (monotonic)
+        while True:
+            try:
+                if await cls._lock.acquire() and time.monotonic() >= due_at:
+                    due_at = time.monotonic() + settings.SEARCH_SYNC_INTERVAL
+                    for entity_type in SearchService.sync_types():
+                        synced = await SearchService.sync_changed(entity_type)
+                        if synced:
+                            logger.info(f"검색 문서 동기화: type={entity_type}, synced={synced}")
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"검색 동기화 스케줄러 오류: {str(e)}", exc_info=True)
+            await asyncio.sleep(tick)
@@ -0,0 +1,88 @@
+"""
+파일: app/services/status_scheduler.py
+설명: 상태 스케줄러 (lifespan 백그라운드 태스크)
+  - 챌린지/공지사항 상태를 기간 경계 시각에 맞춰 재계산 (StatusService.refresh_all)
+  - 여러 워커/인스턴스 중 Redis 리더 락을 가진 하나만 실행
+  - 틱마다 리더 락을 연장하고 다음 경계 시각을 다시 조회
+    (다른 인스턴스에서 생성/수정된 일정도 한 틱 안에 반영)
+  - 경계가 없어도 STATUS_SCHEDULER_MAX_INTERVAL 마다 전체 재계산 (누락 보정)
+"""
+import asyncio
+import time
+from typing import Optional
+
+from app.config.settings import settings
+from app.core.logger import logger
+from app.lib.leader_lock import LeaderLock
+from app.services.status_service import StatusService
+
+
+# 오류 발생 시 재시도 간격 (초)
+RETRY_INTERVAL = 30
+
+
+class StatusScheduler:
+    """상태 스케줄러 (프로세스당 1개 태스크)"""
+
+    _task: Optional[asyncio.Task] = None
+    _lock: Optional[LeaderLock] = None
+
+    @classmethod
+    def start(cls) -> None:
+        """스케줄러 시작 (lifespan 시작 시 호출)"""
+        if not settings.STATUS_SCHEDULER_ENABLED or cls._task is not None:
+            return
+        cls._lock = LeaderLock("status_scheduler", ttl_seconds=settings.STATUS_SCHEDULER_LOCK_TTL)
+        cls._task = asyncio.create_task(cls._run(), name="status_scheduler")
+        logger.info("상태 스케줄러 시작")
+
+    @classmethod
+    async def stop(cls) -> None:
+        """스케줄러 중지 + 리더 락 해제 (lifespan 종료 시, 커넥션 풀 종료 전 호출)"""
+        if cls._task is None:
+            return
+        cls._task.cancel()
+        try:
+            await cls._task
+        except asyncio.CancelledError:
+            pass
+        cls._task = None
+        if cls._lock is not None:
+            await cls._lock.release()
+        logger.info("상태 스케줄러 중지")
+
+    @classmethod
+    async def _run(cls) -> None:
+        # 리더 락 TTL 안에 최소 2번은 연장하도록 틱 간격 제한
+        tick = max(settings.STATUS_SCHEDULER_LOCK_TTL / 3, 1)
+        max_interval = settings.STATUS_SCHEDULER_MAX_INTERVAL
+        due_at = 0.0  # 다음 전체 갱신 시각 (monotonic)
+
+        while True:
+            wait = tick
+            try:
+                was_leader = cls._lock.is_leader
+                if await cls._lock.acquire():
+                    now = time.monotonic()
+                    if not was_leader:
+                        # 리더가 되면 즉시 1회 전체 갱신 (이전 리더 공백 보정)
+                        due_at = now
+                    else:
+                        # 경계 시각 직후(+1초)로 앞당김 (다른 인스턴스의 일정 변경 반영)
+                        boundary_in = await StatusService.seconds_until_next_boundary()
+                        due_at = min(due_at, now + boundary_in + 1)
+
+                    if now >= due_at:
+                        changed = await StatusService.refresh_all()
+                        if any(changed.values()):
+                            logger.info(f"상태 스케줄러 갱신: {changed}")
+                        boundary_in = await StatusService.seconds_until_next_boundary()
+                        due_at = time.monotonic() + min(boundary_in + 1, max_interval)
+
+                    wait = min(tick, max(due_at - time.monotonic(), 0.5))
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"상태 스케줄러 오류: {str(e)}", exc_info=True)
+                wait = RETRY_INTERVAL
+            await asyncio.sleep(wait)
@@ -0,0 +1,169 @@
+"""
+파일: app/services/status_service.py
+설명: 챌린지 / 공지사항 상태 컬럼 관리
+  - 기간/활성 여부로 계산되는 상태를 status 컬럼에 저장 (목록 필터가 단순 등호 조건)
+  - 생성/수정 시: 같은 트랜잭션에서 해당 행만 갱신 (refresh)
+  - 기간 경계 도달 시: 상태 스케줄러가 전체 갱신 (refresh_all, status_scheduler.py)
+  - 상태가 바뀐 행은 Redis 채널로 변경 이벤트 발행
+
+상태 정의
+  챌린지: suspended(일시중지) > completed(운영 종료) > in_progress(운영 중) > recruiting(모집 중) > draft
+  공지사항: ended(비활성 또는 종료일 경과) / scheduled(시작일 전) / active
+
+컬럼/인덱스 DDL: schema.sql "35. 챌린지/공지사항 상태 컬럼" 참조
+"""
+import json
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Sequence
+
+from app.config.database import get_connection
+from app.config.redis import get_redis
+from app.core.logger import logger
+
+
+# 상태 변경 이벤트 채널 (payload: {"entity_type", "changes": [{id, from, to}], "at"})
+STATUS_EVENT_CHANNEL = "events:status_changed"
+
+# 상태 계산식 (경계 시각 계산 NEXT_BOUNDARY_SQL 과 같은 컬럼 사용)
+STATUS_SOURCES: Dict[str, Dict[str, str]] = {
+    "challenge": {
+        "table": "challenges",
+        "expression": """CASE
+            WHEN t.is_suspended THEN 'suspended'
+            WHEN t.operation_end_date < CURRENT_DATE THEN 'completed'
+            WHEN t.operation_start_date <= NOW() THEN 'in_progress'
+            WHEN t.recruitment_start_date <= NOW() THEN 'recruiting'
+            ELSE 'draft'
+        END""",
+        # 삭제(소프트 삭제)된 챌린지는 갱신 대상 제외
+        "where": "t.is_active = true",
+    },
+    "notice": {
+        "table": "notices",
+        "expression": """CASE
+            WHEN t.is_active IS NOT TRUE THEN 'ended'
+            WHEN t.start_date > CURRENT_DATE THEN 'scheduled'
+            WHEN t.end_date < CURRENT_DATE THEN 'ended'
+            ELSE 'active'
+        END""",
+        "where": "true",
+    },
+}
+
+# 다음 상태 경계까지 남은 시간 (초)
+#   - 챌린지: 가장 가까운 모집 시작 / 운영 시작 / 운영 종료일 다음 자정 (날짜 컬럼 부분 인덱스로 MIN 조회)
+#     (운영 종료일은 그날까지 운영 중이므로 다음 날 자정에 completed)
+#   - 공지사항: 날짜 단위이므로 다음 자정
+NEXT_BOUNDARY_SQL = """
+    SELECT EXTRACT(EPOCH FROM LEAST(
+        (SELECT MIN(recruitment_start_date)::timestamptz FROM challenges
+         WHERE is_active = true AND recruitment_start_date > NOW()),
+        (SELECT MIN(operation_start_date)::timestamptz FROM challenges
+         WHERE is_active = true AND operation_start_date > NOW()),
+        (SELECT (MIN(operation_end_date) + 1)::timestamptz FROM challenges
+         WHERE is_active = true AND operation_end_date >= CURRENT_DATE),
+        (CURRENT_DATE + 1)::timestamptz
+    ) - NOW()) AS seconds
+"""
+
+
+class StatusService:
+    """챌린지/공지사항 저장 상태 갱신 (App DB)"""
+
+    @classmethod
+    async def refresh(
+        cls,
+        cur,
+        entity_type: str,
+        ids: Optional[Sequence[Any]] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        상태 재계산 후 바뀐 행만 저장
+
+        Args:
+            cur: App DB 커서 (호출자 트랜잭션)
+            entity_type: challenge / notice
+            ids: 대상 ID 목록 (None 이면 전체)
+
+        Returns:
+            변경 목록 [{"id", "from", "to"}] (커밋 후 publish 로 이벤트 발행)
+        """
+        source = STATUS_SOURCES[entity_type]
+        conditions = [source["where"], f"t.status IS DISTINCT FROM {source['expression']}"]
+        params: Dict[str, Any] = {}
+        if ids is not None:
+            if not ids:
+                return []
+            conditions.append("t.id = ANY(%(ids)s::uuid[])")
+            params["ids"] = [str(id_) for id_ in ids]
+
+        # 바뀔 행만 잠근 뒤 갱신 (동시 갱신 시 먼저 끝난 쪽만 변경 이벤트 생성)
+        await cur.execute(
+            f"""
+            UPDATE {source['table']} AS u
+            SET status = s.new_status
+            FROM (
+                SELECT t.id, t.status AS old_status, {source['expression']} AS new_status
+                FROM {source['table']} t
+                WHERE {' AND '.join(conditions)}
+                FOR UPDATE
+            ) s
+            WHERE u.id = s.id
+            RETURNING u.id, s.old_status, s.new_status
+            """,
+            params
+        )
+        rows = await cur.fetchall()
+        return [{"id": str(row["id"]), "from": row["old_status"], "to": row["new_status"]} for row in rows]
+
+    @classmethod
+    async def refresh_all(cls) -> Dict[str, int]:
+        """
+        전체 상태 갱신 + 변경 이벤트 발행 (스케줄러에서 호출)
+
+        Returns:
+            {entity_type: 변경 건수}
+        """
+        changes: Dict[str, List[Dict[str, Any]]] = {}
+        async with get_connection(use_app_db=True) as conn:
+            async with conn.cursor() as cur:
+                for entity_type in STATUS_SOURCES:
+                    changes[entity_type] = await cls.refresh(cur, entity_type)
+            await conn.commit()
+
+        for entity_type, entity_changes in changes.items():
+            await cls.publish(entity_type, entity_changes)
+        return {entity_type: len(entity_changes) for entity_type, entity_changes in changes.items()}
+
+    @classmethod
+    async def seconds_until_next_boundary(cls) -> float:
+        """다음 상태 경계 시각까지 남은 시간 (초)"""
+        async with get_connection(use_app_db=True) as conn:
+            async with conn.cursor() as cur:
+                await cur.execute(NEXT_BOUNDARY_SQL)
+                row = await cur.fetchone()
+        return max(float(row["seconds"]), 0.0)
+
+    @classmethod
+    async def publish(cls, entity_type: str, changes: List[Dict[str, Any]]) -> None:
+        """
+        상태 변경 이벤트 발행 (Redis Pub/Sub)
+
+        발행 실패는 로그만 남긴다. (상태 저장은 이미 커밋됨)
+        """
+        if not changes:
+            return
+        logger.info(
+            f"상태 변경: {entity_type} {len(changes)}건 "
+            + ", ".join(f"{c['id']}({c['from']}→{c['to']})" for c in changes[:10])
+            + (" ..." if len(changes) > 10 else "")
+        )
+        try:
+            redis = await get_redis()
+            await redis.publish(STATUS_EVENT_CHANNEL, json.dumps({
+                "entity_type": entity_type,
+                "changes": changes,
+                "at": datetime.now().isoformat(),
+            }, ensure_ascii=False))
+        except Exception as e:
+            logger.warning(f"상태 변경 이벤트 발행 실패: {str(e)}")
@@ -0,0 +1,139 @@
+"""
+파일: app/services/supplement_search_index.py
+설명: 영양제 / 기능성 성분 매핑 검색 문서 (비정규화)
+  - supplement_search_documents: 영양제 → 성분명 / 기능성 내용
+  - functional_ingredient_search_documents: 기능성 성분 → 기능성 내용 / 코드
+  - 목록 필터(성분명, 기능성)를 매핑 테이블 중첩 EXISTS 대신 문서 1건 조회로 처리
+  - 매핑 저장/삭제와 같은 트랜잭션에서 갱신 (커서를 받아 실행, 커밋은 호출자)
+
+테이블 DDL: schema.sql "31. 영양제/기능성 성분 검색 문서 테이블" 참조
+"""
+from typing import Any, Dict, List, Sequence
+
+
+# 영양제 문서 조회 (성분명은 표시 순서, 기능성은 중복 제거)
+_PRODUCT_DOCUMENT_SELECT = """
+    SELECT p.id AS product_id,
+        COALESCE((
+            SELECT string_agg(concat_ws(' ', fi.internal_name, fi.external_name), E'\\n' ORDER BY pim.display_order)
+            FROM public.product_ingredient_mapping pim
+            JOIN public.functional_ingredients fi ON pim.ingredient_id = fi.id
+            WHERE pim.product_id = p.id
+        ), '') AS ingredient_names,
+        COALESCE((
+            SELECT string_agg(DISTINCT fc.content, E'\\n')
+            FROM public.product_ingredient_mapping pim
+            JOIN public.ingredient_functionality_mapping ifm ON pim.ingredient_id = ifm.ingredient_id
+            JOIN public.functionality_contents fc ON ifm.functionality_id = fc.id
+            WHERE pim.product_id = p.id
+        ), '') AS functionality_texts
+    FROM public.supplement_products_master p
+"""
+
+_UPSERT_PRODUCT_DOCUMENTS = f"""
+    INSERT INTO public.supplement_search_documents (product_id, ingredient_names, functionality_texts, updated_at)
+    SELECT d.product_id, d.ingredient_names, d.functionality_texts, NOW()
+    FROM ({_PRODUCT_DOCUMENT_SELECT} {{where}}) d
+    ON CONFLICT (product_id) DO UPDATE SET
+        ingredient_names = EXCLUDED.ingredient_names,
+        functionality_texts = EXCLUDED.functionality_texts,
+        updated_at = NOW()
+"""
+
+# 기능성 성분 문서 조회 (매핑이 없으면 빈 문자열)
+_INGREDIENT_DOCUMENT_SELECT = """
+    SELECT fi.id AS ingredient_id,
+        COALESCE(string_agg(fc.content, E'\\n' ORDER BY fc.functionality_code), '') AS functionality_texts,
+        COALESCE(string_agg(fc.functionality_code, E'\\n' ORDER BY fc.functionality_code), '') AS functionality_codes
+    FROM public.functional_ingredients fi
+    LEFT JOIN public.ingredient_functionality_mapping ifm ON ifm.ingredient_id = fi.id
+    LEFT JOIN public.functionality_contents fc ON ifm.functionality_id = fc.id
+"""
+
+_UPSERT_INGREDIENT_DOCUMENTS = f"""
+    INSERT INTO public.functional_ingredient_search_documents (
+        ingredient_id, functionality_texts, functionality_codes, updated_at
+    )
+    SELECT d.ingredient_id, d.functionality_texts, d.functionality_codes, NOW()
+    FROM ({_INGREDIENT_DOCUMENT_SELECT} {{where}} GROUP BY fi.id) d
+    ON CONFLICT (ingredient_id) DO UPDATE SET
+        functionality_texts = EXCLUDED.functionality_texts,
+        functionality_codes = EXCLUDED.functionality_codes,
+        updated_at = NOW()
+"""
+
+
+class SupplementSearchIndex:
+    """영양제/기능성 성분 매핑 검색 문서 관리 (App DB)"""
+
+    @classmethod
+    async def refresh_products(cls, cur, product_ids: Sequence[Any]) -> None:
+        """
+        영양제 문서 갱신 (성분 매핑 저장/삭제 후 호출)
+
+        Args:
+            cur: App DB 커서 (호출자 트랜잭션)
+            product_ids: 영양제 ID 목록
+        """
+        ids = [str(product_id) for product_id in product_ids]
+        if not ids:
+            return
+        await cur.execute(
+            _UPSERT_PRODUCT_DOCUMENTS.format(where="WHERE p.id = ANY(%(product_ids)s::uuid[])"),
+            {"product_ids": ids}
+        )
+
+    @classmethod
+    async def refresh_ingredients(cls, cur, ingredient_ids: Sequence[int]) -> None:
+        """
+        기능성 성분 문서 + 해당 성분을 포함한 영양제 문서 갱신
+        (기능성 매핑 저장/삭제, 성분명 수정 후 호출)
+
+        Args:
+            cur: App DB 커서 (호출자 트랜잭션)
+            ingredient_ids: 기능성 성분 ID 목록
+        """
+        ids = [int(ingredient_id) for ingredient_id in ingredient_ids]
+        if not ids:
+            return
+        params = {"ingredient_ids": ids}
+        await cur.execute(
+            _UPSERT_INGREDIENT_DOCUMENTS.format(where="WHERE fi.id = ANY(%(ingredient_ids)s::int[])"),
+            params
+        )
+        await cur.execute(
+            _UPSERT_PRODUCT_DOCUMENTS.format(where="""
+                WHERE p.id IN (
+                    SELECT pim.product_id FROM public.product_ingredient_mapping pim
+                    WHERE pim.ingredient_id = ANY(%(ingredient_ids)s::int[])
+                )
+            """),
+            params
+        )
+
+    @classmethod
+    async def products_containing(cls, cur, ingredient_ids: Sequence[int]) -> List[str]:
+        """성분을 포함한 영양제 ID 목록 (성분 삭제 전 영향 범위 확인용)"""
+        ids = [int(ingredient_id) for ingredient_id in ingredient_ids]
+        if not ids:
+            return []
+        await cur.execute(
+            """SELECT DISTINCT product_id FROM public.product_ingredient_mapping
+               WHERE ingredient_id = ANY(%(ingredient_ids)s::int[])""",
+            {"ingredient_ids": ids}
+        )
+        return [str(row["product_id"]) for row in await cur.fetchall()]
+
+    @classmethod
+    async def rebuild(cls, cur) -> Dict[str, int]:
+        """
+        전체 문서 재생성 (도입 시 / 매핑 테이블 직접 수정 후)
+
+        Returns:
+            {"products": 건수, "ingredients": 건수}
+        """
+        await cur.execute(_UPSERT_INGREDIENT_DOCUMENTS.format(where=""))
+        ingredients = cur.rowcount
+        await cur.execute(_UPSERT_PRODUCT_DOCUMENTS.format(where=""))
+        products = cur.rowcount
+        return {"products": products, "ingredients": ingredients}
@@ -0,0 +1,295 @@
+# ============================================
+# 파일 업로드 서비스
+# ============================================
+# 청크 단위 스트리밍 업로드 처리
+# - 첫 청크에서 매직 바이트 검증
+# - 누적 크기로 MAX_FILE_SIZE 초과 시 즉시 중단
+# - 수신과 동시에 SHA-256 해시 계산
+# - 임시 파일에 스레드풀로 기록 후 원자적 rename
+
+import asyncio
+import hashlib
+import os
+import uuid
+from datetime import datetime
+from pathlib import Path
+from typing import Any, BinaryIO, Dict, Optional
+
+from fastapi import UploadFile
+
+from app.config.settings import settings
+from app.core.exceptions import ValidationError
+from app.core.logger import logger
+from app.services.image_service import ImageService
+from app.services.upload_store import ContentAddressedStore, OBJECTS_FOLDER
+
+
+# 허용 MIME 타입
+ALLOWED_TYPES = {"image/jpeg", "image/png", "image/gif", "image/webp"}
+# 허용 확장자 (MIME과 별도로 확장자도 검증 - 보안 취약점 대응)
+ALLOWED_EXTENSIONS = {"jpg", "jpeg", "png", "gif", "webp"}
+# 같은 형식의 확장자 표기 통일 (저장 파일명 / 콘텐츠 주소 오브젝트 확장자)
+EXTENSION_ALIASES = {"jpeg": "jpg"}
+# 최대 파일 크기 (5MB)
+MAX_FILE_SIZE = 5 * 1024 * 1024
+# 청크 크기 (업로드 1건당 메모리 사용량 상한)
+CHUNK_SIZE = 64 * 1024
+# 이미지 매직 바이트 시그니처
+IMAGE_SIGNATURES = {
+    b'\xff\xd8\xff': "jpg",
+    b'\x89PNG': "png",
+    b'GIF87a': "gif",
+    b'GIF89a': "gif",
+    b'RIFF': "webp",
+}
+# 임시 파일 접미사 (정적 서빙 대상에서 제외되도록 숨김 파일로 생성)
+TEMP_SUFFIX = ".part"
+
+
+def get_upload_dir() -> Path:
+    """업로드 디렉토리 경로 반환"""
+    # backend/uploads 디렉토리 사용
+    return Path(__file__).parent.parent.parent / "uploads"
+
+
+def detect_image_type(head: bytes) -> Optional[str]:
+    """
+    매직 바이트로 이미지 형식 판별
+
+    Args:
+        head: 파일 앞부분 바이트
+
+    Returns:
+        형식(jpg/png/gif/webp) 또는 None
+    """
+    for signature, image_type in IMAGE_SIGNATURES.items():
+        if head[:len(signature)] == signature:
+            return image_type
+    return None
+
+
+class UploadService:
+    """파일 업로드 서비스 클래스"""
+
+    @classmethod
+    def validate_file_meta(cls, file: UploadFile) -> str:
+        """
+        MIME 타입 / 확장자 검증
+
+        Returns:
+            검증된 확장자 (소문자, jpeg → jpg)
+
+        Raises:
+            ValidationError: 허용되지 않는 형식일 때
+        """
+        if file.content_type not in ALLOWED_TYPES:
+            raise ValidationError("허용되지 않는 파일 형식입니다. (jpg, png, gif, webp만 허용)")
+
+        # 확장자 검증 (MIME과 별도 - 클라이언트가 MIME을 조작할 수 있으므로)
+        original_ext = ""
+        if file.filename and "." in file.filename:
+            original_ext = file.filename.rsplit(".", 1)[-1].lower()
+        if original_ext not in ALLOWED_EXTENSIONS:
+            raise ValidationError("허용되지 않는 파일 확장자입니다. (jpg, png, gif, webp만 허용)")
+
+        return EXTENSION_ALIASES.get(original_ext, original_ext)
+
+    @classmethod
+    def resolve_folder(cls, folder: str) -> tuple:
+        """
+        업로드 폴더 경로 검증 및 생성
+
+        Returns:
+            (safe_folder, upload_dir)
+
+        Raises:
+            ValidationError: 업로드 루트 밖을 가리킬 때
+        """
+        # 폴더 경로 조작 방지 (상위 디렉토리 이동 차단)
+        safe_folder = folder.replace("..", "").replace("\\", "/").strip("/")
+        if not safe_folder or "/" in safe_folder.replace(safe_folder.split("/")[0], "", 1).lstrip("/"):
+            safe_folder = "contents"
+
+        upload_dir = get_upload_dir() / safe_folder
+        resolved = upload_dir.resolve()
+        if not str(resolved).startswith(str(get_upload_dir().resolve())):
+            raise ValidationError("유효하지 않은 업로드 경로입니다.")
+        upload_dir.mkdir(parents=True, exist_ok=True)
+
+        return safe_folder, upload_dir
+
+    @classmethod
+    async def stream_to_temp(cls, file: UploadFile, target_dir: Path) -> Dict[str, Any]:
+        """
+        업로드 파일을 청크 단위로 읽어 임시 파일에 기록
+
+        메모리 사용량은 CHUNK_SIZE로 제한되며, 디스크 I/O는
+        스레드풀에서 실행되어 이벤트 루프를 블로킹하지 않는다.
+
+        Returns:
+            temp_path: 임시 파일 경로
+            size: 파일 크기
+            sha256: 내용 해시 (hex)
+            image_type: 매직 바이트로 판별된 형식
+
+        Raises:
+            ValidationError: 유효하지 않은 이미지 또는 크기 초과 시
+        """
+        temp_path = target_dir / f".{uuid.uuid4().hex}{TEMP_SUFFIX}"
+        hasher = hashlib.sha256()
+        size = 0
+        image_type = None
+
+        fp: BinaryIO = await asyncio.to_thread(open, temp_path, "wb")
+        try:
+            while True:
+                chunk = await file.read(CHUNK_SIZE)
+                if not chunk:
+                    break
+
+                # 매직 바이트 검증 (첫 청크에서 실제 이미지 파일인지 확인)
+                if size == 0:
+                    image_type = detect_image_type(chunk)
+                    if image_type is None:
+                        raise ValidationError("유효한 이미지 파일이 아닙니다.")
+
+                # 파일 크기 검증 (누적 크기 기준 조기 중단)
+                size += len(chunk)
+                if size > MAX_FILE_SIZE:
+                    raise ValidationError("파일 크기는 5MB를 초과할 수 없습니다.")
+
+                hasher.update(chunk)
+                await asyncio.to_thread(fp.write, chunk)
+
+            if size == 0:
+                raise ValidationError("파일이 없습니다.")
+
+            await asyncio.to_thread(fp.flush)
+            await asyncio.to_thread(os.fsync, fp.fileno())
+        except BaseException:
+            await asyncio.to_thread(fp.close)
+            await asyncio.to_thread(cls._remove_quietly, temp_path)
+            raise
+        await asyncio.to_thread(fp.close)
+
+        return {
+            "temp_path": temp_path,
+            "size": size,
+            "sha256": hasher.hexdigest(),
+            "image_type": image_type,
+        }
+
+    @classmethod
+    async def save(cls, file: UploadFile, folder: str = "contents") -> Dict[str, Any]:
+        """
+        이미지 업로드 저장
+
+        UPLOAD_STORAGE_MODE 설정에 따라 저장 방식이 달라진다.
+            - legacy: uploads/{folder}/{timestamp}_{uuid8}.{ext}
+            - cas: uploads/objects/{h0:2}/{h2:4}/{sha256}.{ext} (중복 제거)
+
+        Returns:
+            url, filename, originalName, size, mimeType, sha256, derivatives
+            (cas 모드는 immutable, deduplicated 추가)
+
+        Raises:
+            ValidationError: 검증 실패 시
+        """
+        if not file:
+            raise ValidationError("파일이 없습니다.")
+
+        original_ext = cls.validate_file_meta(file)
+        # 확장자는 검증된 값만 사용
+        ext = original_ext if original_ext in ALLOWED_EXTENSIONS else "jpg"
+
+        if settings.UPLOAD_STORAGE_MODE == "cas":
+            return await cls._save_content_addressed(file, ext)
+
+        safe_folder, upload_dir = cls.resolve_folder(folder)
+
+        result = await cls.stream_to_temp(file, upload_dir)
+
+        # 고유한 파일명 생성
+        timestamp = datetime.now().strftime("%Y%m%d%H%M%S")
+        random_str = uuid.uuid4().hex[:8]
+        filename = f"{timestamp}_{random_str}.{ext}"
+
+        # 원자적 rename (같은 디렉토리 내 이동이므로 부분 파일 노출 없음)
+        file_path = upload_dir / filename
+        try:
+            await asyncio.to_thread(os.replace, result["temp_path"], file_path)
+        except BaseException:
+            await asyncio.to_thread(cls._remove_quietly, result["temp_path"])
+            raise
+
+        logger.info(f"파일 업로드 완료: {file_path} ({result['size']} bytes)")
+
+        # 파생본 생성 (thumbnail / medium / WebP) - 프로세스 풀에서 실행
+        url_prefix = f"/uploads/{safe_folder}"
+        derivatives = await ImageService.create_derivatives(file_path, url_prefix)
+
+        return {
+            "url": f"{url_prefix}/{filename}",
+            "filename": filename,
+            "originalName": file.filename,
+            "size": result["size"],
+            "mimeType": file.content_type,
+            "sha256": result["sha256"],
+            "derivatives": derivatives,
+        }
+
+    @classmethod
+    async def _save_content_addressed(cls, file: UploadFile, ext: str) -> Dict[str, Any]:
+        """콘텐츠 주소 기반 저장 (SHA-256 중복 제거)"""
+        upload_root = get_upload_dir()
+        staging_dir = upload_root / OBJECTS_FOLDER
+        staging_dir.mkdir(parents=True, exist_ok=True)
+
+        result = await cls.stream_to_temp(file, staging_dir)
+        try:
+            # 같은 내용이면 같은 확장자가 되도록 매직 바이트로 판별한 형식 사용
+            stored = await ContentAddressedStore.put(
+                upload_root,
+                result["temp_path"],
+                result["sha256"],
+                result["image_type"] or ext,
+                result["size"],
+                file.content_type,
+            )
+        except BaseException:
+            await asyncio.to_thread(cls._remove_quietly, result["temp_path"])
+            raise
+
+        object_path: Path = stored["path"]
+        url_prefix = stored["url"].rsplit("/", 1)[0]
+
+        # 기존 오브젝트는 저장된 매니페스트의 파생본을 재사용
+        derivatives = None
+        if stored["deduplicated"]:
+            manifest = ImageService.load_manifest(object_path)
+            if manifest:
+                derivatives = ImageService.to_urls(manifest["variants"], url_prefix)
+        if derivatives is None:
+            derivatives = await ImageService.create_derivatives(object_path, url_prefix)
+
+        logger.info(f"파일 업로드 완료: {object_path} ({result['size']} bytes)")
+
+        return {
+            "url": stored["url"],
+            "filename": object_path.name,
+            "originalName": file.filename,
+            "size": result["size"],
+            "mimeType": file.content_type,
+            "sha256": result["sha256"],
+            "derivatives": derivatives,
+            "immutable": True,
+            "deduplicated": stored["deduplicated"],
+        }
+
+    @staticmethod
+    def _remove_quietly(path: Path) -> None:
+        """임시 파일 삭제 (없으면 무시)"""
+        try:
+            os.unlink(path)
+        except FileNotFoundError:
+            pass
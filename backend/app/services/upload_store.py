@@ -0,0 +1,234 @@
+# ============================================
+# 콘텐츠 주소 기반 업로드 저장소
+# ============================================
+# SHA-256 해시로 파일명을 정하는 중복 제거 저장소
+# - uploads/objects/{h[0:2]}/{h[2:4]}/{sha256}.{ext} 샤딩 디렉토리
+# - 동일 내용은 한 번만 저장하고 참조 카운트만 증가
+# - 내용이 바뀌면 URL도 바뀌므로 immutable 캐시 가능
+# - 저장(put)과 해제(release)는 해시별 advisory lock 으로 직렬화
+#   (삭제 중인 파일에 중복 제거로 참조가 붙지 않도록, 파일 작업까지 잠금 안에서 수행)
+
+import asyncio
+import os
+from contextlib import asynccontextmanager
+from pathlib import Path
+from typing import Any, AsyncGenerator, Dict, Optional
+
+import psycopg
+
+from app.config.database import get_connection, query_one
+from app.core.logger import logger
+
+
+# 오브젝트 저장 루트 (uploads 하위 폴더명)
+OBJECTS_FOLDER = "objects"
+
+
+class ContentAddressedStore:
+    """SHA-256 기반 업로드 오브젝트 저장소"""
+
+    @classmethod
+    def object_relpath(cls, sha256: str, ext: str) -> str:
+        """오브젝트 상대 경로 (uploads 기준)"""
+        return f"{OBJECTS_FOLDER}/{sha256[:2]}/{sha256[2:4]}/{sha256}.{ext}"
+
+    @classmethod
+    def object_url(cls, sha256: str, ext: str) -> str:
+        """오브젝트 공개 URL (내용이 바뀌지 않는 immutable URL)"""
+        return f"/uploads/{cls.object_relpath(sha256, ext)}"
+
+    @classmethod
+    async def put(
+        cls,
+        upload_root: Path,
+        temp_path: Path,
+        sha256: str,
+        ext: str,
+        size: int,
+        mime_type: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """
+        임시 파일을 오브젝트로 저장
+
+        같은 해시의 오브젝트가 이미 있으면 임시 파일을 버리고
+        기존 오브젝트를 재사용한다. 경로/URL 은 처음 저장된 확장자(file_ext)를 따른다.
+        (요청 확장자가 달라도 오브젝트 파일은 하나)
+        참조 기록이나 파일 이동에 실패하면 참조 증가를 롤백하고 예외를 그대로 전달한다.
+
+        Returns:
+            path: 오브젝트 파일 경로
+            url: 오브젝트 URL
+            deduplicated: 기존 오브젝트 재사용 여부
+            ref_count: 증가 후 참조 카운트
+        """
+        async with cls._object_lock(sha256) as conn:
+            # 참조 증가는 파일을 놓은 뒤 커밋 (실패 시 잠금 해제 전에 롤백)
+            row = await cls._add_reference(conn, sha256, ext, size, mime_type)
+            ext = row["file_ext"]
+            object_path = upload_root / cls.object_relpath(sha256, ext)
+            deduplicated = await asyncio.to_thread(cls._place, temp_path, object_path)
+            try:
+                await conn.commit()
+            except BaseException:
+                if not deduplicated:
+                    await asyncio.to_thread(cls._remove_object_files, object_path)
+                raise
+        ref_count = int(row["ref_count"])
+
+        if deduplicated:
+            logger.info(f"업로드 중복 제거: {sha256[:12]} (ref_count={ref_count})")
+
+        return {
+            "path": object_path,
+            "url": cls.object_url(sha256, ext),
+            "deduplicated": deduplicated,
+            "ref_count": ref_count,
+        }
+
+    @staticmethod
+    def _place(temp_path: Path, object_path: Path) -> bool:
+        """
+        임시 파일을 오브젝트 경로로 이동 (동기, 스레드풀에서 실행)
+
+        Returns:
+            기존 오브젝트가 있어 재사용했으면 True
+        """
+        if object_path.exists():
+            os.unlink(temp_path)
+            return True
+
+        object_path.parent.mkdir(parents=True, exist_ok=True)
+        # 동시 업로드로 같은 내용이 경쟁해도 결과 파일은 동일하므로 안전
+        os.replace(temp_path, object_path)
+        return False
+
+    @classmethod
+    async def add_reference(
+        cls,
+        sha256: str,
+        ext: str,
+        size: int,
+        mime_type: Optional[str] = None,
+    ) -> int:
+        """참조 카운트 증가 (없으면 생성, DB 오류는 그대로 전달)"""
+        async with cls._object_lock(sha256) as conn:
+            row = await cls._add_reference(conn, sha256, ext, size, mime_type)
+            await conn.commit()
+        return int(row["ref_count"])
+
+    @staticmethod
+    async def _add_reference(
+        conn: psycopg.AsyncConnection,
+        sha256: str,
+        ext: str,
+        size: int,
+        mime_type: Optional[str],
+    ) -> Dict[str, Any]:
+        """참조 카운트 증가 (커밋은 호출 측), 기존 행이면 저장된 file_ext 반환"""
+        async with conn.cursor() as cur:
+            await cur.execute(
+                """
+                INSERT INTO public.upload_objects (sha256, file_ext, file_size, mime_type, ref_count)
+                VALUES (%(sha256)s, %(ext)s, %(size)s, %(mime_type)s, 1)
+                ON CONFLICT (sha256) DO UPDATE
+                SET ref_count = public.upload_objects.ref_count + 1,
+                    last_referenced_at = NOW()
+                RETURNING ref_count, file_ext
+                """,
+                {"sha256": sha256, "ext": ext, "size": size, "mime_type": mime_type},
+            )
+            return await cur.fetchone()
+
+    @classmethod
+    async def release(cls, upload_root: Path, sha256: str) -> Optional[int]:
+        """
+        참조 카운트 감소
+
+        0이 되면 감소와 행 삭제를 한 트랜잭션으로 커밋한 뒤,
+        삭제된 행이 있을 때만 오브젝트 파일과 파생본을 삭제한다.
+
+        Returns:
+            감소 후 참조 카운트 (존재하지 않는 오브젝트면 None)
+        """
+        async with cls._object_lock(sha256) as conn:
+            async with conn.cursor() as cur:
+                await cur.execute(
+                    """
+                    UPDATE public.upload_objects
+                    SET ref_count = GREATEST(ref_count - 1, 0),
+                        last_referenced_at = NOW()
+                    WHERE sha256 = %(sha256)s
+                    RETURNING ref_count, file_ext
+                    """,
+                    {"sha256": sha256},
+                )
+                row = await cur.fetchone()
+                if not row:
+                    await conn.rollback()
+                    return None
+
+                ref_count = int(row["ref_count"])
+                deleted = None
+                if ref_count == 0:
+                    await cur.execute(
+                        """
+                        DELETE FROM public.upload_objects
+                        WHERE sha256 = %(sha256)s AND ref_count = 0
+                        RETURNING file_ext
+                        """,
+                        {"sha256": sha256},
+                    )
+                    deleted = await cur.fetchone()
+            await conn.commit()
+
+            # 행 삭제가 커밋된 뒤에만 파일 삭제 (잠금은 유지 → 그 사이 put 이 끼어들지 못함)
+            if deleted:
+                object_path = upload_root / cls.object_relpath(sha256, deleted["file_ext"])
+                await asyncio.to_thread(cls._remove_object_files, object_path)
+                logger.info(f"업로드 오브젝트 삭제: {sha256[:12]}")
+
+        return ref_count
+
+    @classmethod
+    async def get(cls, sha256: str) -> Optional[Dict[str, Any]]:
+        """오브젝트 메타데이터 조회"""
+        return await query_one(
+            """
+            SELECT sha256, file_ext, file_size, mime_type, ref_count,
+                   created_at, last_referenced_at
+            FROM public.upload_objects
+            WHERE sha256 = %(sha256)s
+            """,
+            {"sha256": sha256},
+        )
+
+    @staticmethod
+    @asynccontextmanager
+    async def _object_lock(sha256: str) -> AsyncGenerator[psycopg.AsyncConnection, None]:
+        """
+        해시별 세션 advisory lock (커밋 후 파일 작업까지 잡고 있도록 트랜잭션이 아닌 세션 단위)
+
+        연결이 끊기면 서버가 잠금을 자동으로 해제한다.
+        """
+        async with get_connection() as conn:
+            params = {"sha256": sha256}
+            await conn.execute("SELECT pg_advisory_lock(hashtextextended(%(sha256)s, 0))", params)
+            await conn.commit()
+            try:
+                yield conn
+            finally:
+                if not conn.closed:
+                    await conn.rollback()
+                    await conn.execute("SELECT pg_advisory_unlock(hashtextextended(%(sha256)s, 0))", params)
+                    await conn.commit()
+
+    @staticmethod
+    def _remove_object_files(object_path: Path) -> None:
+        """오브젝트 원본 및 같은 stem의 파생본/매니페스트 삭제"""
+        if not object_path.parent.exists():
+            return
+        for path in object_path.parent.glob(f"{object_path.stem}*"):
+            try:
+                os.unlink(path)
+            except FileNotFoundError:
+                pass
@@ -0,0 +1,73 @@
+# ============================================
+# 텍스트 검색 필터 빌더
+# ============================================
+# pg_trgm GIN 인덱스(gin_trgm_ops)를 탈 수 있는 ILIKE 조건 생성
+# - 3자 이상: '%term%' 부분 일치 (트라이그램 인덱스 사용)
+# - 3자 미만: 'term%' 접두사 일치 (부분 일치는 트라이그램을 추출할 수
+#   없어 순차 스캔이 되므로, 인덱스를 탈 수 있는 접두사 검색으로 대체)
+# - LIKE 와일드카드(%, _)와 이스케이프 문자는 리터럴로 처리
+#
+# 인덱스 DDL: schema.sql "29. 텍스트 검색 pg_trgm 인덱스" 참조
+
+from typing import Optional, Sequence, Union
+
+
+# 트라이그램 부분 일치가 인덱스를 사용할 수 있는 최소 길이
+MIN_TRIGRAM_LENGTH = 3
+
+
+def escape_like(term: str) -> str:
+    """LIKE 패턴 특수문자 이스케이프 (기본 이스케이프 문자 '\\')"""
+    return term.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+def search_pattern(term: Optional[str]) -> str:
+    """
+    검색어를 ILIKE 패턴으로 변환
+
+    Args:
+        term: 사용자 입력 검색어
+
+    Returns:
+        '%term%' (3자 이상) / 'term%' (3자 미만) / '%' (공백뿐인 입력)
+    """
+    term = (term or "").strip()
+    if not term:
+        return "%"
+
+    escaped = escape_like(term)
+    if len(term) >= MIN_TRIGRAM_LENGTH:
+        return f"%{escaped}%"
+    return f"{escaped}%"
+
+
+def contains_pattern(term: Optional[str]) -> str:
+    """
+    검색어를 항상 '%term%' 부분 일치 패턴으로 변환
+
+    여러 값을 이어 붙인 비정규화 검색 문서(예: 영양제 성분명 목록)용.
+    접두사 검색은 첫 번째 값에만 일치하므로 길이와 관계없이 부분 일치를 사용한다.
+    """
+    return f"%{escape_like((term or '').strip())}%"
+
+
+def ilike_condition(columns: Union[str, Sequence[str]], placeholder: str) -> str:
+    """
+    ILIKE 조건절 생성 (여러 컬럼이면 OR 결합)
+
+    컬럼은 가공 없이 그대로 비교해야 인덱스를 사용할 수 있다.
+    (예: LOWER(col), col::text 는 인덱스 미사용)
+
+    Args:
+        columns: 컬럼명 또는 컬럼명 목록
+        placeholder: 파라미터 자리표시자 (예: "%(name)s", "%s")
+
+    Returns:
+        "col ILIKE %(name)s" / "(a ILIKE %(q)s OR b ILIKE %(q)s)"
+    """
+    if isinstance(columns, str):
+        return f"{columns} ILIKE {placeholder}"
+    parts = [f"{column} ILIKE {placeholder}" for column in columns]
+    if len(parts) == 1:
+        return parts[0]
+    return f"({' OR '.join(parts)})"
@@ -0,0 +1,4 @@
+# ============================================
+# 성능 벤치마크 스크립트
+# ============================================
+# 실행: python -m benchmarks.<모듈명>
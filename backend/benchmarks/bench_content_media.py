@@ -0,0 +1,210 @@
+# ============================================
+# 컨텐츠 상세 이미지 저장 벤치마크
+# ============================================
+# 상세 이미지 30장 이상 컨텐츠의 등록/수정 비교
+# - 기존: 이미지마다 INSERT + 커밋 (execute 1회 = 커넥션 획득 + 커밋)
+#         수정 시 전체 DELETE 후 재등록
+# - 개선: 하나의 트랜잭션에서 unnest 단일 INSERT
+#         수정 시 변경분만 반영 (DELETE / UPDATE / INSERT 각 최대 1회)
+#
+# 실행 (PostgreSQL 필요):
+#   cd backend
+#   python -m benchmarks.bench_content_media [--images 40] [--repeat 50] [--dsn postgresql://...]
+#
+# 임시 테이블(bench_contents, bench_content_media)을 만들고 종료 시 삭제한다.
+
+import argparse
+import time
+
+import psycopg
+from psycopg.rows import dict_row
+
+from app.config.settings import settings
+
+
+CONTENTS = "bench_contents"
+MEDIA = "bench_content_media"
+
+
+def setup_tables(conn: psycopg.Connection) -> None:
+    """schema.sql 21, 23번 테이블과 같은 구조의 벤치마크 테이블 생성"""
+    with conn.cursor() as cur:
+        cur.execute(f"DROP TABLE IF EXISTS {MEDIA}, {CONTENTS}")
+        cur.execute(f"""
+            CREATE TABLE {CONTENTS} (
+                id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
+                title VARCHAR(500) NOT NULL,
+                updated_at TIMESTAMP WITH TIME ZONE DEFAULT NOW()
+            )
+        """)
+        cur.execute(f"""
+            CREATE TABLE {MEDIA} (
+                id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
+                content_id UUID REFERENCES {CONTENTS}(id) ON DELETE CASCADE,
+                media_type VARCHAR(20) NOT NULL,
+                media_url TEXT NOT NULL,
+                display_order INT DEFAULT 0,
+                created_at TIMESTAMP WITH TIME ZONE DEFAULT NOW()
+            )
+        """)
+        cur.execute(f"CREATE INDEX ON {MEDIA}(content_id, display_order)")
+    conn.commit()
+
+
+def image_urls(count: int, seed: int) -> list:
+    return [f"/uploads/contents/{seed}/detail_{i}.jpg" for i in range(count)]
+
+
+def edited_urls(urls: list) -> list:
+    """일반적인 수정: 앞 두 장 순서 변경, 중간 1장 삭제, 마지막에 1장 추가"""
+    edited = [urls[1], urls[0]] + urls[2:]
+    del edited[len(edited) // 2]
+    return edited + [urls[0].replace("detail_0", "detail_new")]
+
+
+# ============================================
+# 기존 방식
+# ============================================
+
+def legacy_create(conn: psycopg.Connection, urls: list) -> str:
+    with conn.cursor() as cur:
+        cur.execute(f"INSERT INTO {CONTENTS} (title) VALUES ('bench') RETURNING id")
+        content_id = cur.fetchone()["id"]
+        conn.commit()
+        for i, url in enumerate(urls):
+            cur.execute(
+                f"INSERT INTO {MEDIA} (content_id, media_type, media_url, display_order) "
+                f"VALUES (%(content_id)s, 'image', %(media_url)s, %(display_order)s)",
+                {"content_id": content_id, "media_url": url, "display_order": i + 1}
+            )
+            conn.commit()
+    return content_id
+
+
+def legacy_update(conn: psycopg.Connection, content_id: str, urls: list) -> None:
+    with conn.cursor() as cur:
+        cur.execute(f"UPDATE {CONTENTS} SET updated_at = NOW() WHERE id = %(id)s", {"id": content_id})
+        conn.commit()
+        cur.execute(
+            f"DELETE FROM {MEDIA} WHERE content_id = %(content_id)s AND media_type = 'image'",
+            {"content_id": content_id}
+        )
+        conn.commit()
+        for i, url in enumerate(urls):
+            cur.execute(
+                f"INSERT INTO {MEDIA} (content_id, media_type, media_url, display_order) "
+                f"VALUES (%(content_id)s, 'image', %(media_url)s, %(display_order)s)",
+                {"content_id": content_id, "media_url": url, "display_order": i + 1}
+            )
+            conn.commit()
+
+
+# ============================================
+# 개선 방식 (ContentService._insert_media / _sync_media 와 같은 SQL)
+# ============================================
+
+def insert_media(cur, content_id: str, urls: list, orders: list) -> None:
+    if not urls:
+        return
+    cur.execute(
+        f"INSERT INTO {MEDIA} (content_id, media_type, media_url, display_order) "
+        f"SELECT %(content_id)s, 'image', u.media_url, u.display_order "
+        f"FROM unnest(%(media_urls)s::text[], %(display_orders)s::int[]) AS u(media_url, display_order)",
+        {"content_id": content_id, "media_urls": urls, "display_orders": orders}
+    )
+
+
+def batched_create(conn: psycopg.Connection, urls: list) -> str:
+    with conn.transaction(), conn.cursor() as cur:
+        cur.execute(f"INSERT INTO {CONTENTS} (title) VALUES ('bench') RETURNING id")
+        content_id = cur.fetchone()["id"]
+        insert_media(cur, content_id, urls, list(range(1, len(urls) + 1)))
+    return content_id
+
+
+def diff_update(conn: psycopg.Connection, content_id: str, urls: list) -> None:
+    with conn.transaction(), conn.cursor() as cur:
+        cur.execute(f"UPDATE {CONTENTS} SET updated_at = NOW() WHERE id = %(id)s", {"id": content_id})
+        cur.execute(
+            f"SELECT id, media_url, display_order FROM {MEDIA} "
+            f"WHERE content_id = %(content_id)s AND media_type = 'image' "
+            f"ORDER BY display_order, created_at FOR UPDATE",
+            {"content_id": content_id}
+        )
+        existing = {}
+        for row in cur.fetchall():
+            existing.setdefault(row["media_url"], []).append(row)
+
+        added_urls, added_orders, reorder_ids, reorder_orders = [], [], [], []
+        for order, url in enumerate(urls, start=1):
+            rows = existing.get(url)
+            if not rows:
+                added_urls.append(url)
+                added_orders.append(order)
+                continue
+            row = rows.pop(0)
+            if row["display_order"] != order:
+                reorder_ids.append(row["id"])
+                reorder_orders.append(order)
+        removed_ids = [row["id"] for rows in existing.values() for row in rows]
+
+        if removed_ids:
+            cur.execute(f"DELETE FROM {MEDIA} WHERE id = ANY(%(ids)s::uuid[])", {"ids": removed_ids})
+        if reorder_ids:
+            cur.execute(
+                f"UPDATE {MEDIA} AS cm SET display_order = u.display_order "
+                f"FROM unnest(%(ids)s::uuid[], %(display_orders)s::int[]) AS u(id, display_order) "
+                f"WHERE cm.id = u.id",
+                {"ids": reorder_ids, "display_orders": reorder_orders}
+            )
+        insert_media(cur, content_id, added_urls, added_orders)
+
+
+def measure(label: str, func, repeat: int) -> float:
+    started = time.perf_counter()
+    for i in range(repeat):
+        func(i)
+    elapsed_ms = (time.perf_counter() - started) * 1000 / repeat
+    print(f"{label:<28} {elapsed_ms:>9.2f} ms")
+    return elapsed_ms
+
+
+def main(dsn: str, images: int, repeat: int) -> None:
+    with psycopg.connect(dsn, row_factory=dict_row) as conn:
+        setup_tables(conn)
+        try:
+            print(f"상세 이미지 {images}장, {repeat}회 평균")
+            print()
+            legacy_ids, batched_ids = [], []
+            legacy = measure("등록 - 이미지별 INSERT/커밋", lambda i: legacy_ids.append(legacy_create(conn, image_urls(images, i))), repeat)
+            batched = measure("등록 - 트랜잭션 단일 INSERT", lambda i: batched_ids.append(batched_create(conn, image_urls(images, i))), repeat)
+            print(f"{'':<28} {legacy / batched:>8.1f}x")
+            print()
+            legacy = measure("수정 - 전체 삭제 후 재등록", lambda i: legacy_update(conn, legacy_ids[i], edited_urls(image_urls(images, i))), repeat)
+            batched = measure("수정 - 변경분만 반영", lambda i: diff_update(conn, batched_ids[i], edited_urls(image_urls(images, i))), repeat)
+            print(f"{'':<28} {legacy / batched:>8.1f}x")
+
+            # 두 방식의 최종 결과가 같은지 확인
+            with conn.cursor() as cur:
+                for legacy_id, batched_id in zip(legacy_ids, batched_ids):
+                    orders = []
+                    for content_id in (legacy_id, batched_id):
+                        cur.execute(
+                            f"SELECT array_agg(media_url ORDER BY display_order) AS urls FROM {MEDIA} WHERE content_id = %(id)s",
+                            {"id": content_id}
+                        )
+                        orders.append(cur.fetchone()["urls"])
+                    assert orders[0] == orders[1], "수정 결과 불일치"
+        finally:
+            with conn.cursor() as cur:
+                cur.execute(f"DROP TABLE IF EXISTS {MEDIA}, {CONTENTS}")
+            conn.commit()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="컨텐츠 상세 이미지 저장 벤치마크")
+    parser.add_argument("--dsn", default=settings.app_db_dsn, help="PostgreSQL DSN (기본: App DB)")
+    parser.add_argument("--images", type=int, default=40, help="컨텐츠당 상세 이미지 수 (30 이상 권장)")
+    parser.add_argument("--repeat", type=int, default=50, help="반복 횟수")
+    args = parser.parse_args()
+    main(args.dsn, args.images, args.repeat)
@@ -0,0 +1,151 @@
+# ============================================
+# 로깅 파이프라인 벤치마크
+# ============================================
+# 요청당 로그 호출이 있는 엔드포인트의 지연 시간 비교
+# - off   : 로깅 비활성화 (기준)
+# - sync  : 콘솔 + app/error 파일 핸들러를 로거에 직접 연결 (이전 방식, 이벤트 루프에서 포맷/쓰기)
+# - queue : QueueHandler → 백그라운드 QueueListener (현재 방식)
+#
+# 실행:
+#   cd backend
+#   python -m benchmarks.bench_logging [--requests 5000] [--logs-per-request 10] [--json]
+#
+# ASGI 앱을 직접 호출하므로 네트워크/서버 오버헤드는 포함되지 않는다.
+# 로그 파일은 임시 디렉토리에, 콘솔 출력은 /dev/null 로 보낸다.
+
+import argparse
+import asyncio
+import importlib
+import logging
+import os
+import queue
+import statistics
+import tempfile
+import time
+from logging.handlers import QueueListener
+from pathlib import Path
+
+from fastapi import FastAPI
+
+from app.config.settings import settings
+from app.middleware.request_context import RequestContextMiddleware
+
+# app.core 패키지가 logger 객체를 다시 내보내므로 모듈은 import_module 로 가져온다
+logger_module = importlib.import_module("app.core.logger")
+
+
+bench_logger = logging.getLogger("bench_logging")
+
+
+def build_app(logs_per_request: int) -> FastAPI:
+    """로그를 남기는 라우터와 같은 형태의 엔드포인트"""
+    app = FastAPI()
+    app.add_middleware(RequestContextMiddleware)
+
+    @app.get("/items/{item_id}")
+    async def get_item(item_id: int):
+        for index in range(logs_per_request):
+            if index % 2:
+                bench_logger.debug(f"항목 조회 단계 {index}: item_id={item_id}")
+            else:
+                bench_logger.info(f"항목 조회 단계 {index}: item_id={item_id}")
+        return {"success": True, "data": {"id": item_id}}
+
+    return app
+
+
+async def call_asgi(app, path: str) -> None:
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0", "spec_version": "2.4"},
+        "method": "GET",
+        "path": path,
+        "root_path": "",
+        "query_string": b"",
+        "headers": [],
+        "http_version": "1.1",
+        "scheme": "http",
+        "server": ("bench", 80),
+    }
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        pass
+
+    await app(scope, receive, send)
+
+
+async def run_case(app, requests: int) -> list:
+    """요청별 지연 시간 (마이크로초)"""
+    for index in range(50):
+        await call_asgi(app, f"/items/{index}")
+    latencies = []
+    for index in range(requests):
+        started = time.perf_counter()
+        await call_asgi(app, f"/items/{index}")
+        latencies.append((time.perf_counter() - started) * 1e6)
+    return latencies
+
+
+def configure(mode: str, log_dir: Path, devnull) -> QueueListener:
+    """벤치마크 로거에 모드별 핸들러 연결"""
+    bench_logger.handlers.clear()
+    bench_logger.setLevel(logging.DEBUG)
+    bench_logger.propagate = False
+    bench_logger.disabled = mode == "off"
+
+    logger_module.LOG_DIR = log_dir
+    handlers = logger_module._build_handlers()
+    handlers[0].setStream(devnull)
+
+    if mode == "sync":
+        for handler in handlers:
+            bench_logger.addHandler(handler)
+        return None
+    if mode == "queue":
+        queue_handler = logger_module._AsyncQueueHandler(queue.SimpleQueue(), settings.LOG_QUEUE_SIZE)
+        bench_logger.addHandler(queue_handler)
+        listener = logger_module._YieldingQueueListener(queue_handler.queue, *handlers, respect_handler_level=True)
+        listener.start()
+        return listener
+    return None
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="로깅 파이프라인 벤치마크")
+    parser.add_argument("--requests", type=int, default=5000)
+    parser.add_argument("--logs-per-request", type=int, default=10)
+    parser.add_argument("--json", action="store_true", help="JSON 포맷으로 측정 (LOG_JSON)")
+    args = parser.parse_args()
+    settings.LOG_JSON = args.json
+
+    app = build_app(args.logs_per_request)
+    print(f"요청 {args.requests}회, 요청당 로그 {args.logs_per_request}건, 포맷 {'JSON' if args.json else '텍스트'}")
+    print(f"{'mode':<8} {'mean(us)':>10} {'p50(us)':>10} {'p99(us)':>10} {'flush(ms)':>10}")
+
+    with tempfile.TemporaryDirectory() as temp_dir, open(os.devnull, "w") as devnull:
+        for mode in ("off", "sync", "queue"):
+            listener = configure(mode, Path(temp_dir), devnull)
+            latencies = asyncio.run(run_case(app, args.requests))
+
+            # 큐 방식은 남은 레코드를 쓰는 시간 별도 표시 (요청 지연에는 포함되지 않음)
+            flush_ms = 0.0
+            if listener is not None:
+                started = time.perf_counter()
+                listener.stop()
+                flush_ms = (time.perf_counter() - started) * 1000
+            for handler in (listener.handlers if listener else bench_logger.handlers):
+                handler.close()
+
+            latencies.sort()
+            p99 = latencies[int(len(latencies) * 0.99) - 1]
+            print(
+                f"{mode:<8} {statistics.mean(latencies):>10.1f} {statistics.median(latencies):>10.1f}"
+                f" {p99:>10.1f} {flush_ms:>10.1f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
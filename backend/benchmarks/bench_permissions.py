@@ -0,0 +1,95 @@
+# ============================================
+# 권한 매트릭스 인가 벤치마크
+# ============================================
+# 역할/API 권한 행을 메모리 매트릭스로 컴파일한 뒤 요청당 인가 비용 측정
+# - 컴파일: 전체 권한 행 → 라우트/관리자 비트셋 (변경 알림 시 1회)
+# - 인가: 라우트 조회 + 관리자 비트셋 조회 + 비트 AND (요청마다)
+# - 비교: 요청마다 권한 테이블을 조인하던 방식의 메모리 상 등가 연산 (역할 목록 × 권한 집합 조회)
+#
+# 실행 (DB/Redis 불필요, 합성 데이터):
+#   cd backend
+#   python -m benchmarks.bench_permissions [--roles 64] [--apis 500] [--users 1000] [--checks 1000000]
+
+import argparse
+import random
+import time
+
+from app.services.permission_service import compile_matrix
+
+
+def build_rows(role_count: int, api_count: int, user_count: int, seed: int = 42):
+    """합성 권한 데이터 (API 경로 = /api/v1/admin/{리소스}/{id}/{하위})"""
+    rng = random.Random(seed)
+    roles = [{"id": index + 1, "role_code": str(1001 + index)} for index in range(role_count)]
+
+    apis = []
+    route_paths = []
+    for index in range(api_count):
+        resource = f"resource{index // 5}"
+        suffix = ["", "/{item_id}", "/{item_id}/detail", "/bulk", "/{item_id}/history"][index % 5]
+        route_paths.append(f"/api/v1/admin/{resource}{suffix}")
+        apis.append({"id": index + 1, "api_path": f"/api/v1/admin/{resource}{suffix.replace('{item_id}', ':id')}"})
+
+    permissions = [
+        {"role_id": role["id"], "api_id": api["id"]}
+        for role in roles for api in apis
+        if rng.random() < 0.3
+    ]
+    user_roles = [
+        {"admin_user_id": user_id, "role_id": role_id}
+        for user_id in range(1, user_count + 1)
+        for role_id in rng.sample(range(1, role_count + 1), k=min(2, role_count))
+    ]
+    return roles, apis, permissions, user_roles, route_paths
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="권한 매트릭스 인가 벤치마크")
+    parser.add_argument("--roles", type=int, default=64)
+    parser.add_argument("--apis", type=int, default=500)
+    parser.add_argument("--users", type=int, default=1000)
+    parser.add_argument("--checks", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    roles, apis, permissions, user_roles, route_paths = build_rows(args.roles, args.apis, args.users)
+    print(f"역할 {len(roles)}, API {len(apis)}, 권한 {len(permissions)}, 관리자-역할 {len(user_roles)}")
+
+    started = time.perf_counter()
+    matrix = compile_matrix(roles, apis, permissions, user_roles, route_paths)
+    print(f"컴파일: {(time.perf_counter() - started) * 1000:.1f}ms (보호 라우트 {len(matrix.route_bits)})")
+
+    rng = random.Random(7)
+    samples = [
+        (rng.choice(route_paths), str(rng.randint(1, args.users)))
+        for _ in range(1024)
+    ]
+
+    # 매트릭스 인가 (요청 경로와 동일: user_mask + check)
+    allowed = 0
+    started = time.perf_counter()
+    for index in range(args.checks):
+        route_path, user_id = samples[index & 1023]
+        if matrix.check(route_path, matrix.user_mask(user_id)):
+            allowed += 1
+    elapsed = time.perf_counter() - started
+    print(f"매트릭스 인가: {elapsed / args.checks * 1e9:.0f}ns/회 (허용 {allowed / args.checks:.1%})")
+
+    # 비교: 관리자 역할 목록 → API 조회 → (역할, API) 권한 집합 조회
+    user_role_ids = {}
+    for row in user_roles:
+        user_role_ids.setdefault(str(row["admin_user_id"]), []).append(row["role_id"])
+    api_by_path = {path: api["id"] for path, api in zip(route_paths, apis)}
+    permitted = {(row["role_id"], row["api_id"]) for row in permissions}
+
+    checks = args.checks // 10
+    started = time.perf_counter()
+    for index in range(checks):
+        route_path, user_id = samples[index & 1023]
+        api_id = api_by_path[route_path]
+        any((role_id, api_id) in permitted for role_id in user_role_ids.get(user_id, ()))
+    elapsed = time.perf_counter() - started
+    print(f"조인 방식(메모리 등가): {elapsed / checks * 1e9:.0f}ns/회 (DB 왕복 제외)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,169 @@
+# ============================================
+# 요청 추적 오버헤드 벤치마크
+# ============================================
+# 대시보드처럼 요청당 쿼리가 많은 엔드포인트에서 추적 설정별 지연 시간 비교
+# - off     : TRACING_ENABLED=false
+# - ratio=r : 샘플링 비율 r (기본 0.01, 1.0)
+#
+# 실행:
+#   cd backend
+#   python -m benchmarks.bench_tracing [--requests 3000] [--queries 25] [--query-us 0] [--ratios 0.01,1.0]
+#
+# DB 는 가짜 커넥션 풀로 대체한다 (쿼리마다 --query-us 만큼 await, 기본 0 = 이벤트 루프 양보만).
+# 기본값은 추적의 CPU 비용만 측정한다 - added(us) 를 실제 요청 지연 시간과 비교해 오버헤드를 판단.
+# (asyncio.sleep 타이머 오차가 수백 us 라 --query-us 를 주면 편차가 커진다)
+# ASGI 앱을 직접 호출하므로 네트워크/서버 오버헤드는 포함되지 않는다.
+# span 은 임시 디렉토리의 파일로 내보낸다.
+
+import argparse
+import asyncio
+import importlib
+import logging
+import os
+import statistics
+import tempfile
+import time
+from contextlib import asynccontextmanager
+
+from fastapi import FastAPI
+
+from app.config import database
+from app.config.settings import settings
+from app.middleware.request_context import RequestContextMiddleware
+from app.middleware.tracing import TracingMiddleware
+
+# app.core 패키지와 이름이 겹치지 않도록 모듈로 가져온다
+tracing = importlib.import_module("app.core.tracing")
+
+
+class FakeCursor:
+    def __init__(self, delay: float):
+        self.delay = delay
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    async def execute(self, sql, params):
+        await asyncio.sleep(self.delay)
+
+    async def fetchall(self):
+        return [{"id": 1, "count": 10}]
+
+
+class FakeConnection:
+    def __init__(self, delay: float):
+        self.delay = delay
+
+    def cursor(self):
+        return FakeCursor(self.delay)
+
+
+class FakePool:
+    def __init__(self, delay: float):
+        self.conn = FakeConnection(delay)
+
+    @asynccontextmanager
+    async def connection(self):
+        yield self.conn
+
+
+def build_app(queries: int) -> FastAPI:
+    app = FastAPI()
+    app.add_middleware(TracingMiddleware)
+    app.add_middleware(RequestContextMiddleware)
+
+    @app.get("/dashboard/{item_id}")
+    async def dashboard(item_id: int):
+        total = 0
+        for index in range(queries):
+            rows = await database.query(
+                "SELECT COUNT(*) AS count FROM members WHERE created_at >= %(since)s",
+                {"since": index},
+            )
+            total += rows[0]["count"]
+        return {"success": True, "data": {"total": total}}
+
+    return app
+
+
+async def call_asgi(app, path: str) -> None:
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0", "spec_version": "2.4"},
+        "method": "GET",
+        "path": path,
+        "root_path": "",
+        "query_string": b"",
+        "headers": [],
+        "http_version": "1.1",
+        "scheme": "http",
+        "server": ("bench", 80),
+    }
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        pass
+
+    await app(scope, receive, send)
+
+
+async def run_case(app, requests: int) -> list:
+    """요청별 지연 시간 (마이크로초)"""
+    for index in range(300):
+        await call_asgi(app, f"/dashboard/{index}")
+    latencies = []
+    for index in range(requests):
+        started = time.perf_counter()
+        await call_asgi(app, f"/dashboard/{index}")
+        latencies.append((time.perf_counter() - started) * 1e6)
+    return latencies
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="요청 추적 오버헤드 벤치마크")
+    parser.add_argument("--requests", type=int, default=3000)
+    parser.add_argument("--queries", type=int, default=25, help="요청당 쿼리 수")
+    parser.add_argument("--query-us", type=int, default=0, help="쿼리당 대기 시간 (마이크로초)")
+    parser.add_argument("--ratios", default="0.01,1.0", help="측정할 샘플링 비율 (콤마 구분)")
+    args = parser.parse_args()
+
+    logging.getLogger("oni_care").setLevel(logging.WARNING)
+    database.db_pool = FakePool(args.query_us / 1e6)
+    app = build_app(args.queries)
+    ratios = [float(value) for value in args.ratios.split(",") if value.strip()]
+
+    print(f"요청 {args.requests}회, 요청당 쿼리 {args.queries}건 (쿼리당 {args.query_us}us)")
+    print(f"{'mode':<12} {'mean(us)':>10} {'p50(us)':>10} {'p99(us)':>10} {'added(us)':>10} {'spans':>8}")
+
+    baseline = None
+    with tempfile.TemporaryDirectory() as temp_dir:
+        settings.TRACING_FILE_PATH = os.path.join(temp_dir, "traces.jsonl")
+        settings.TRACING_EXPORTER = "file"
+        for mode in ["off"] + [f"ratio={ratio}" for ratio in ratios]:
+            settings.TRACING_ENABLED = mode != "off"
+            if settings.TRACING_ENABLED:
+                settings.TRACING_SAMPLE_RATIO = float(mode.split("=")[1])
+                tracing.setup_tracing()
+
+            latencies = asyncio.run(run_case(app, args.requests))
+            stats = tracing.tracing_stats()
+            tracing.shutdown_tracing()
+
+            mean = statistics.mean(latencies)
+            baseline = baseline or mean
+            latencies.sort()
+            p99 = latencies[int(len(latencies) * 0.99) - 1]
+            spans = stats["pending"] + stats["exported"]
+            print(
+                f"{mode:<12} {mean:>10.1f} {statistics.median(latencies):>10.1f} {p99:>10.1f}"
+                f" {mean - baseline:>10.1f} {spans:>8}"
+            )
+
+
+if __name__ == "__main__":
+    main()
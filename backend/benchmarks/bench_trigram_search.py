@@ -0,0 +1,129 @@
+# ============================================
+# pg_trgm 텍스트 검색 벤치마크
+# ============================================
+# 100만+ 행 테이블에서 ILIKE 검색의 인덱스 전/후 성능 비교
+# - 부분 일치 '%term%' (3자 이상)
+# - 접두사 'te%' (3자 미만 대체 검색)
+#
+# 실행 (PostgreSQL 필요, pg_trgm 확장 생성 권한 필요):
+#   cd backend
+#   python -m benchmarks.bench_trigram_search [--rows 1000000] [--dsn postgresql://...]
+#
+# 임시 테이블(bench_trgm_users)을 만들고 종료 시 삭제한다.
+
+import argparse
+import time
+
+import psycopg
+
+from app.config.settings import settings
+from app.utils.search_filter import ilike_condition, search_pattern
+
+
+TABLE = "bench_trgm_users"
+
+# (라벨, 컬럼, 검색어)
+CASES = [
+    ("name 3자 부분일치", "name", "김민준"),
+    ("name 2자 접두사", "name", "이서"),
+    ("email 부분일치", "email", "user12345"),
+    ("phone 부분일치", "phone", "5678"),
+]
+
+
+def setup_table(conn: psycopg.Connection, rows: int) -> None:
+    """테스트 데이터 생성 (성씨 + 이름 조합, 이메일, 전화번호)"""
+    with conn.cursor() as cur:
+        cur.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+        cur.execute(f"DROP TABLE IF EXISTS {TABLE}")
+        cur.execute(f"""
+            CREATE TABLE {TABLE} (
+                id BIGSERIAL PRIMARY KEY,
+                name TEXT,
+                email TEXT,
+                phone TEXT
+            )
+        """)
+        cur.execute(f"""
+            INSERT INTO {TABLE} (name, email, phone)
+            SELECT
+                (ARRAY['김','이','박','최','정','강','조','윤','장','임'])[1 + (g % 10)]
+                || (ARRAY['민준','서연','도윤','하은','시우','지유','예준','서윤','주원','지민'])[1 + ((g / 10) % 10)]
+                || (g % 97)::text,
+                'user' || g || '@example.com',
+                '010' || lpad((g * 7919 % 100000000)::text, 8, '0')
+            FROM generate_series(1, %(rows)s) AS g
+        """, {"rows": rows})
+        cur.execute(f"ANALYZE {TABLE}")
+    conn.commit()
+
+
+def create_indexes(conn: psycopg.Connection) -> None:
+    """트라이그램 GIN 인덱스 생성"""
+    with conn.cursor() as cur:
+        for column in ("name", "email", "phone"):
+            cur.execute(
+                f"CREATE INDEX IF NOT EXISTS idx_{TABLE}_{column}_trgm "
+                f"ON {TABLE} USING GIN ({column} gin_trgm_ops)"
+            )
+        cur.execute(f"ANALYZE {TABLE}")
+    conn.commit()
+
+
+def run_case(conn: psycopg.Connection, column: str, term: str, repeat: int) -> tuple:
+    """COUNT 쿼리 평균 실행 시간(ms)과 실행 계획 최상위 스캔 방식 반환"""
+    sql = f"SELECT COUNT(*) FROM {TABLE} WHERE {ilike_condition(column, '%(q)s')}"
+    params = {"q": search_pattern(term)}
+
+    with conn.cursor() as cur:
+        cur.execute(f"EXPLAIN (FORMAT JSON) {sql}", params)
+        plan = cur.fetchone()[0][0]["Plan"]
+        while plan.get("Plans") and plan["Node Type"] in ("Aggregate", "Gather", "Finalize Aggregate", "Partial Aggregate"):
+            plan = plan["Plans"][0]
+
+        started = time.perf_counter()
+        for _ in range(repeat):
+            cur.execute(sql, params)
+            cur.fetchone()
+        elapsed_ms = (time.perf_counter() - started) * 1000 / repeat
+
+    return elapsed_ms, plan["Node Type"]
+
+
+def main(dsn: str, rows: int, repeat: int) -> None:
+    with psycopg.connect(dsn) as conn:
+        print(f"테스트 데이터 생성 중... ({rows:,} rows)")
+        setup_table(conn, rows)
+
+        try:
+            before = {label: run_case(conn, column, term, repeat) for label, column, term in CASES}
+
+            print("트라이그램 인덱스 생성 중...")
+            started = time.perf_counter()
+            create_indexes(conn)
+            print(f"인덱스 생성: {time.perf_counter() - started:.1f}s")
+
+            after = {label: run_case(conn, column, term, repeat) for label, column, term in CASES}
+
+            print()
+            print(f"{'case':<20} {'before':>12} {'after':>12} {'speedup':>9}  plan")
+            for label, _, term in CASES:
+                b_ms, b_plan = before[label]
+                a_ms, a_plan = after[label]
+                print(
+                    f"{label:<20} {b_ms:>9.1f} ms {a_ms:>9.1f} ms {b_ms / a_ms:>8.1f}x"
+                    f"  {b_plan} → {a_plan} ({search_pattern(term)})"
+                )
+        finally:
+            with conn.cursor() as cur:
+                cur.execute(f"DROP TABLE IF EXISTS {TABLE}")
+            conn.commit()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="pg_trgm 텍스트 검색 벤치마크")
+    parser.add_argument("--dsn", default=settings.admin_db_dsn, help="PostgreSQL DSN (기본: Admin DB)")
+    parser.add_argument("--rows", type=int, default=1_000_000, help="테스트 행 수")
+    parser.add_argument("--repeat", type=int, default=5, help="케이스별 반복 횟수")
+    args = parser.parse_args()
+    main(args.dsn, args.rows, args.repeat)
@@ -0,0 +1,105 @@
+# ============================================
+# 업로드 정적 서빙 벤치마크
+# ============================================
+# 기존 StaticFiles 마운트와 UploadStaticFiles 비교
+# - 작은 파일(LRU 대상) / 큰 파일 / 304 재검증 / Range 요청
+#
+# 실행:
+#   cd backend
+#   python -m benchmarks.bench_upload_static [--requests 3000]
+#
+# ASGI 앱을 직접 호출하므로 네트워크/서버 오버헤드는 포함되지 않는다.
+
+import argparse
+import asyncio
+import os
+import tempfile
+import time
+from pathlib import Path
+
+from starlette.staticfiles import StaticFiles
+
+from app.lib.upload_static import UploadStaticFiles
+
+
+async def call_asgi(app, path: str, headers: dict) -> tuple:
+    """ASGI 앱 1회 호출 후 (status, headers, body 크기) 반환"""
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0", "spec_version": "2.4"},
+        "method": "GET",
+        "path": path,
+        "root_path": "",
+        "query_string": b"",
+        "headers": [(k.lower().encode(), v.encode()) for k, v in headers.items()],
+        "http_version": "1.1",
+        "scheme": "http",
+        "server": ("bench", 80),
+    }
+    result = {"status": None, "headers": [], "size": 0}
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        if message["type"] == "http.response.start":
+            result["status"] = message["status"]
+            result["headers"] = message["headers"]
+        elif message["type"] == "http.response.body":
+            result["size"] += len(message.get("body", b""))
+
+    await app(scope, receive, send)
+    return result["status"], dict(result["headers"]), result["size"]
+
+
+async def run_case(app, path: str, headers: dict, requests: int) -> float:
+    """요청 반복 후 초당 처리량 반환"""
+    # 워밍업 (LRU 적재 포함)
+    for _ in range(10):
+        await call_asgi(app, path, headers)
+
+    started = time.perf_counter()
+    for _ in range(requests):
+        await call_asgi(app, path, headers)
+    elapsed = time.perf_counter() - started
+    return requests / elapsed
+
+
+async def main(requests: int) -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        small_name = "20260101000000_abcdef12.png"
+        large_name = "20260101000000_12345678.jpg"
+        (root / small_name).write_bytes(os.urandom(16 * 1024))
+        (root / large_name).write_bytes(os.urandom(2 * 1024 * 1024))
+
+        baseline = StaticFiles(directory=str(root))
+        optimized = UploadStaticFiles(directory=str(root))
+
+        _, small_headers, _ = await call_asgi(optimized, f"/{small_name}", {})
+        small_etag = small_headers[b"etag"].decode()
+
+        cases = [
+            ("small 16KB", f"/{small_name}", {}),
+            ("large 2MB", f"/{large_name}", {}),
+            ("small 304 (If-None-Match)", f"/{small_name}", {"If-None-Match": small_etag}),
+            ("large Range 0-65535", f"/{large_name}", {"Range": "bytes=0-65535"}),
+        ]
+
+        print(f"{'case':<30} {'StaticFiles':>14} {'UploadStatic':>14} {'ratio':>8}")
+        for label, path, headers in cases:
+            base_rps = await run_case(baseline, path, headers, requests)
+            opt_rps = await run_case(optimized, path, headers, requests)
+            print(f"{label:<30} {base_rps:>10.0f} r/s {opt_rps:>10.0f} r/s {opt_rps / base_rps:>7.2f}x")
+
+        status, headers, _ = await call_asgi(optimized, f"/{small_name}", {})
+        print()
+        print(f"Cache-Control: {headers[b'cache-control'].decode()} (status={status})")
+        print(f"LRU hits={optimized.cache.hits} misses={optimized.cache.misses} bytes={optimized.cache.size}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="업로드 정적 서빙 벤치마크")
+    parser.add_argument("--requests", type=int, default=3000, help="케이스별 요청 수")
+    args = parser.parse_args()
+    asyncio.run(main(args.requests))
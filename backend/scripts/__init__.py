@@ -0,0 +1,4 @@
+# ============================================
+# 운영 스크립트 (CLI)
+# ============================================
+# 실행: python -m scripts.<모듈명>
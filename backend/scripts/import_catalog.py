@@ -0,0 +1,79 @@
+# ============================================
+# 카탈로그 일괄 등록 (CSV / XLSX)
+# ============================================
+# 영양제 / 기능성 성분 파일을 App DB에 일괄 반영한다.
+# - 영양제: 품목제조번호가 같으면 수정, 그 외 신규 등록
+# - 기능성 성분: 성분코드가 같으면 수정, 코드가 없으면 새 코드 할당
+# - 오류 행은 건너뛰고 --error-report 경로에 행 번호/필드/사유를 CSV로 기록
+#
+# 실행:
+#   cd backend
+#   python -m scripts.import_catalog supplement products.csv [--dry-run] [--error-report errors.csv]
+#   python -m scripts.import_catalog functional_ingredient ingredients.xlsx
+
+import argparse
+import asyncio
+import csv
+import sys
+
+from app.core.exceptions import ValidationError
+from app.lib.app_db import app_db_manager
+from app.services.catalog_import_service import IMPORT_BATCH_SIZE, IMPORT_TARGETS, CatalogImportService
+from app.services.search_service import SearchService
+
+
+def write_error_report(path: str, errors) -> None:
+    with open(path, "w", newline="", encoding="utf-8-sig") as f:
+        writer = csv.writer(f)
+        writer.writerow(["row", "field", "message"])
+        for error in errors:
+            writer.writerow([error["row"], error["field"], error["message"]])
+
+
+async def main(args) -> int:
+    if not args.dry_run:
+        await app_db_manager.init_async_pool()
+    try:
+        report = await CatalogImportService.import_file(
+            args.path, args.target,
+            dry_run=args.dry_run,
+            batch_size=args.batch_size,
+            max_errors=None,
+        )
+        # 일괄 등록 후 예약된 검색 재색인 완료 대기
+        await SearchService.drain(timeout=600)
+    except ValidationError as e:
+        print(f"오류: {e.message}", file=sys.stderr)
+        return 1
+    finally:
+        if not args.dry_run:
+            await app_db_manager.close()
+
+    print(f"대상        {IMPORT_TARGETS[args.target]['label']}{' (dry-run)' if args.dry_run else ''}")
+    print(f"전체 행     {report['total_rows']:,}")
+    print(f"정상 행     {report['valid_rows']:,}")
+    print(f"신규 등록   {report['inserted']:,}")
+    print(f"수정        {report['updated']:,}")
+    print(f"오류        {report['error_count']:,}")
+    print(f"소요 시간   {report['elapsed_ms'] / 1000:.1f}s")
+
+    if report["errors"]:
+        if args.error_report:
+            write_error_report(args.error_report, report["errors"])
+            print(f"오류 리포트 {args.error_report}")
+        else:
+            for error in report["errors"][:20]:
+                print(f"  {error['row']}행 {error['field']}: {error['message']}")
+            if report["error_count"] > 20:
+                print(f"  ... 외 {report['error_count'] - 20:,}건 (--error-report 로 전체 저장)")
+    return 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="카탈로그 일괄 등록 (CSV / XLSX)")
+    parser.add_argument("target", choices=list(IMPORT_TARGETS), help="등록 대상")
+    parser.add_argument("path", help="CSV / XLSX 파일 경로")
+    parser.add_argument("--dry-run", action="store_true", help="DB 반영 없이 검증만 수행")
+    parser.add_argument("--batch-size", type=int, default=IMPORT_BATCH_SIZE, help="배치 크기")
+    parser.add_argument("--error-report", help="오류 리포트 CSV 저장 경로")
+    sys.exit(asyncio.run(main(parser.parse_args())))
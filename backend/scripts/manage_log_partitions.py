@@ -0,0 +1,53 @@
+# ============================================
+# 접속/개인정보 접근 로그 파티션 관리
+# ============================================
+# 스케줄러(LOG_PARTITION_ENABLED)와 같은 작업을 수동으로 실행한다.
+# - 이번 달 ~ LOG_PARTITION_PREMAKE_MONTHS 개월 뒤 파티션 생성
+# - LOG_RETENTION_MONTHS 지난 파티션 분리 → LOG_ARCHIVE_DIR 에 csv.gz 로 내보내기 → 삭제
+# - 파티션 전환(schema.sql 39) 직후, 스케줄러를 끈 환경, 보관 정책 변경 시 실행
+#
+# 실행:
+#   cd backend
+#   python -m scripts.manage_log_partitions [--dry-run] [--list]
+
+import argparse
+import asyncio
+import sys
+
+from app.config.database import close_db_pool, create_db_pool
+from app.services.log_partition_service import LogPartitionService
+
+
+async def main(dry_run: bool, list_only: bool) -> int:
+    await create_db_pool()
+    try:
+        if list_only:
+            for partition in await LogPartitionService.list_partitions():
+                state = "연결" if partition["attached"] else "분리됨"
+                print(f"{partition['name']:<40} {state:<6} {partition['estimated_rows']:>12,}")
+            return 0
+
+        result = await LogPartitionService.maintain(dry_run=dry_run)
+    finally:
+        await close_db_pool()
+
+    if result is None:
+        print("다른 곳에서 파티션 관리가 실행 중입니다.")
+        return 1
+    prefix = "[dry-run] " if dry_run else ""
+    for name in result["created"]:
+        print(f"{prefix}생성      {name}")
+    for item in result["archived"]:
+        print(f"{prefix}내보내기  {item['partition']:<40} {item['rows']:>12,}  {item.get('file', '')}")
+    if not result["created"] and not result["archived"]:
+        print("변경 없음")
+    return 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="로그 파티션 생성 / 보관 기간 경과분 내보내기")
+    parser.add_argument("--dry-run", action="store_true", help="변경 없이 대상만 출력")
+    parser.add_argument("--list", action="store_true", help="파티션 목록 출력")
+    args = parser.parse_args()
+
+    sys.exit(asyncio.run(main(args.dry_run, args.list)))
@@ -0,0 +1,57 @@
+# ============================================
+# 통합 검색 인덱스 재색인
+# ============================================
+# App DB 원본 테이블에서 public.admin_search_documents 를 다시 생성한다.
+# 영양제/기능성 성분 유형 재색인 시 매핑 검색 문서
+# (supplement_search_documents, functional_ingredient_search_documents)도 함께 재생성.
+# - 최초 도입 시, 증분 갱신 누락 복구 시, 토크나이저 변경 시 실행
+# - 재색인 중에도 검색/증분 갱신은 계속 동작 (원본 삭제분은 마지막에 정리)
+#
+# 실행:
+#   cd backend
+#   python -m scripts.rebuild_search_index [--types member,content] [--batch-size 500]
+
+import argparse
+import asyncio
+import sys
+
+from app.lib.app_db import app_db_manager
+from app.services.search_service import REBUILD_BATCH_SIZE, SEARCH_SOURCES, SearchService
+from app.services.supplement_search_index import SupplementSearchIndex
+
+
+# 매핑 검색 문서를 함께 재생성하는 유형
+MAPPING_DOCUMENT_TYPES = {"supplement", "functional_ingredient"}
+
+
+async def main(entity_types, batch_size: int) -> None:
+    await app_db_manager.init_async_pool()
+    try:
+        result = await SearchService.rebuild(entity_types, batch_size)
+
+        if entity_types is None or MAPPING_DOCUMENT_TYPES.intersection(entity_types):
+            async with app_db_manager.get_async_conn() as conn:
+                async with conn.cursor() as cur:
+                    mapping_result = await SupplementSearchIndex.rebuild(cur)
+                await conn.commit()
+            result["supplement_mapping_docs"] = mapping_result["products"]
+            result["ingredient_mapping_docs"] = mapping_result["ingredients"]
+    finally:
+        await app_db_manager.close()
+
+    for entity_type, count in result.items():
+        print(f"{entity_type:<24} {count:>10,}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="통합 검색 인덱스 재색인")
+    parser.add_argument("--types", help=f"재색인 유형 (쉼표 구분, 기본: 전체) - {', '.join(SEARCH_SOURCES)}")
+    parser.add_argument("--batch-size", type=int, default=REBUILD_BATCH_SIZE, help="배치 크기")
+    args = parser.parse_args()
+
+    types = [t.strip() for t in args.types.split(",")] if args.types else None
+    invalid = [t for t in types or [] if t not in SEARCH_SOURCES]
+    if invalid:
+        sys.exit(f"지원하지 않는 유형: {', '.join(invalid)}")
+
+    asyncio.run(main(types, args.batch_size))
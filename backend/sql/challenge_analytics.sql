@@ -0,0 +1,163 @@
+-- ============================================
+-- 챌린지 통계 SQL 쿼리
+-- 대상 DB: oni_care (App DB)
+-- ============================================
+-- 원천 테이블 (앱 서비스 소유)
+--   challenge_participants  (id, challenge_id, member_id, created_at) : 챌린지 참여
+--   challenge_verifications (id, challenge_id, member_id, created_at) : 인증 기록
+-- 집계 테이블 (schema.sql "36. 챌린지 통계 집계 테이블" 참조)
+--   challenge_daily_stats         : 챌린지 x 일자 (참여/인증 건수/인증 회원 수)
+--   challenge_member_daily_stats  : 챌린지 x 회원 x 일자 (일자별 인증 회원 중복 제거용)
+--   challenge_member_stats        : 챌린지 x 회원 (인증 일수 = 스탬프 수)
+--   challenge_analytics_watermarks: 원천별 마지막 처리 위치 (created_at, id)
+--
+-- 증분 집계: 워터마크 이후 행만 (created_at, id) 순으로 배치 처리하고, (워터마크 NULL = 처음부터)
+-- 집계 반영과 워터마크 갱신을 한 트랜잭션에서 수행한다. (advisory lock 으로 동시 실행 차단)
+-- 진행 중인 트랜잭션이 늦게 커밋되는 행을 놓치지 않도록 최근 lag_seconds 이내 행은 다음 회차에 처리한다.
+
+-- name: try_lock_refresh
+SELECT pg_try_advisory_xact_lock(hashtext('challenge_analytics_refresh')) AS locked;
+
+-- name: get_watermark
+INSERT INTO challenge_analytics_watermarks (source)
+VALUES (%(source)s)
+ON CONFLICT (source) DO UPDATE SET source = EXCLUDED.source
+RETURNING last_created_at, last_id, refreshed_at;
+
+-- name: update_watermark
+UPDATE challenge_analytics_watermarks
+SET last_created_at = COALESCE(%(last_created_at)s::timestamptz, last_created_at),
+    last_id = COALESCE(%(last_id)s::uuid, last_id),
+    refreshed_at = NOW()
+WHERE source = %(source)s;
+
+-- name: apply_participant_batch
+WITH batch AS (
+    SELECT p.id, p.challenge_id, p.created_at, p.created_at::date AS stat_date
+    FROM challenge_participants p
+    WHERE (%(last_created_at)s::timestamptz IS NULL
+           OR (p.created_at, p.id) > (%(last_created_at)s::timestamptz, %(last_id)s::uuid))
+      AND p.created_at <= NOW() - make_interval(secs => %(lag_seconds)s)
+    ORDER BY p.created_at, p.id
+    LIMIT %(batch_size)s
+),
+daily AS (
+    INSERT INTO challenge_daily_stats (challenge_id, stat_date, joined_count)
+    SELECT challenge_id, stat_date, COUNT(*)
+    FROM batch
+    GROUP BY challenge_id, stat_date
+    ON CONFLICT (challenge_id, stat_date) DO UPDATE SET
+        joined_count = challenge_daily_stats.joined_count + EXCLUDED.joined_count,
+        updated_at = NOW()
+)
+SELECT
+    (SELECT COUNT(*) FROM batch) AS processed,
+    last.created_at AS last_created_at,
+    last.id AS last_id
+FROM (SELECT 1) one
+LEFT JOIN LATERAL (
+    SELECT created_at, id FROM batch ORDER BY created_at DESC, id DESC LIMIT 1
+) last ON true;
+
+-- name: apply_verification_batch
+WITH batch AS (
+    SELECT v.id, v.challenge_id, v.member_id, v.created_at, v.created_at::date AS stat_date
+    FROM challenge_verifications v
+    WHERE (%(last_created_at)s::timestamptz IS NULL
+           OR (v.created_at, v.id) > (%(last_created_at)s::timestamptz, %(last_id)s::uuid))
+      AND v.created_at <= NOW() - make_interval(secs => %(lag_seconds)s)
+    ORDER BY v.created_at, v.id
+    LIMIT %(batch_size)s
+),
+member_days AS (
+    -- 회원의 해당 일자 첫 인증이면 신규 행 (xmax = 0)
+    INSERT INTO challenge_member_daily_stats (challenge_id, member_id, stat_date, verification_count)
+    SELECT challenge_id, member_id, stat_date, COUNT(*)
+    FROM batch
+    GROUP BY challenge_id, member_id, stat_date
+    ON CONFLICT (challenge_id, member_id, stat_date) DO UPDATE SET
+        verification_count = challenge_member_daily_stats.verification_count + EXCLUDED.verification_count
+    RETURNING challenge_id, member_id, stat_date, (xmax = 0) AS is_new_day
+),
+daily AS (
+    INSERT INTO challenge_daily_stats (challenge_id, stat_date, verification_count, verified_members)
+    SELECT b.challenge_id, b.stat_date, b.verification_count, COALESCE(n.new_members, 0)
+    FROM (
+        SELECT challenge_id, stat_date, COUNT(*) AS verification_count
+        FROM batch GROUP BY challenge_id, stat_date
+    ) b
+    LEFT JOIN (
+        SELECT challenge_id, stat_date, COUNT(*) AS new_members
+        FROM member_days WHERE is_new_day GROUP BY challenge_id, stat_date
+    ) n USING (challenge_id, stat_date)
+    ON CONFLICT (challenge_id, stat_date) DO UPDATE SET
+        verification_count = challenge_daily_stats.verification_count + EXCLUDED.verification_count,
+        verified_members = challenge_daily_stats.verified_members + EXCLUDED.verified_members,
+        updated_at = NOW()
+),
+members AS (
+    INSERT INTO challenge_member_stats (challenge_id, member_id, verified_days, verification_count, last_verified_at)
+    SELECT b.challenge_id, b.member_id, COALESCE(d.new_days, 0), b.verification_count, b.last_verified_at
+    FROM (
+        SELECT challenge_id, member_id, COUNT(*) AS verification_count, MAX(created_at) AS last_verified_at
+        FROM batch GROUP BY challenge_id, member_id
+    ) b
+    LEFT JOIN (
+        SELECT challenge_id, member_id, COUNT(*) AS new_days
+        FROM member_days WHERE is_new_day GROUP BY challenge_id, member_id
+    ) d USING (challenge_id, member_id)
+    ON CONFLICT (challenge_id, member_id) DO UPDATE SET
+        verified_days = challenge_member_stats.verified_days + EXCLUDED.verified_days,
+        verification_count = challenge_member_stats.verification_count + EXCLUDED.verification_count,
+        last_verified_at = GREATEST(challenge_member_stats.last_verified_at, EXCLUDED.last_verified_at)
+)
+SELECT
+    (SELECT COUNT(*) FROM batch) AS processed,
+    last.created_at AS last_created_at,
+    last.id AS last_id
+FROM (SELECT 1) one
+LEFT JOIN LATERAL (
+    SELECT created_at, id FROM batch ORDER BY created_at DESC, id DESC LIMIT 1
+) last ON true;
+
+-- name: get_watermarks
+SELECT source, last_created_at, refreshed_at
+FROM challenge_analytics_watermarks;
+
+-- name: get_challenge_goal
+SELECT id, title, operation_start_date, operation_end_date,
+    COALESCE(NULLIF(total_achievement_days, 0), NULLIF(total_stamp_count, 0), challenge_duration_days) AS goal_days
+FROM challenges
+WHERE id = %(challenge_id)s::uuid;
+
+-- name: get_timeseries
+-- 기간 내 일자별 통계 (집계가 없는 날은 0), 누적 참여자는 기간 이전 참여 수부터 누적
+SELECT
+    d::date AS date,
+    COALESCE(s.joined_count, 0) AS joined,
+    COALESCE(s.verification_count, 0) AS verifications,
+    COALESCE(s.verified_members, 0) AS verified_members,
+    (SELECT COALESCE(SUM(joined_count), 0) FROM challenge_daily_stats
+     WHERE challenge_id = %(challenge_id)s::uuid AND stat_date < %(date_from)s::date)
+    + SUM(COALESCE(s.joined_count, 0)) OVER (ORDER BY d) AS cumulative_participants
+FROM generate_series(%(date_from)s::date, %(date_to)s::date, interval '1 day') AS d
+LEFT JOIN challenge_daily_stats s
+    ON s.challenge_id = %(challenge_id)s::uuid AND s.stat_date = d::date
+ORDER BY d;
+
+-- name: get_funnel
+SELECT
+    (SELECT COALESCE(SUM(joined_count), 0) FROM challenge_daily_stats
+     WHERE challenge_id = %(challenge_id)s::uuid) AS participants,
+    COUNT(*) AS verified_members,
+    COUNT(*) FILTER (WHERE verified_days >= %(half_days)s) AS half_achieved_members,
+    COUNT(*) FILTER (WHERE verified_days >= %(goal_days)s) AS achieved_members
+FROM challenge_member_stats
+WHERE challenge_id = %(challenge_id)s::uuid;
+
+-- name: get_stamp_distribution
+SELECT verified_days AS stamps, COUNT(*) AS members
+FROM challenge_member_stats
+WHERE challenge_id = %(challenge_id)s::uuid
+GROUP BY verified_days
+ORDER BY verified_days;
@@ -2,20 +2,25 @@
 -- 챌린지 관리 SQL 쿼리
 -- 대상 DB: oni_care (App DB)
 -- ============================================
+-- 상태(status)는 저장 컬럼을 사용한다. (app/services/status_service.py 에서 계산/저장)
+--   생성/수정 시 해당 행을 즉시 갱신하고, 기간 경계 도달 시 상태 스케줄러가 전체 갱신한다.
+-- 관련 인덱스: schema.sql "34. 챌린지 목록 필터 인덱스", "35. 챌린지/공지사항 상태 컬럼" 참조
 
 -- name: count_challenges
 SELECT COUNT(*) as total
-FROM challenges
-WHERE is_active = true
-  AND (%(title)s::text IS NULL OR title ILIKE '%%' || %(title)s::text || '%%')
-  AND (%(challenge_type)s::text IS NULL OR challenge_type = %(challenge_type)s::text)
-  AND (%(verification_method)s::text IS NULL OR verification_method = %(verification_method)s::text)
-  AND (%(operation_from)s::date IS NULL OR operation_start_date >= %(operation_from)s::date)
-  AND (%(operation_to)s::date IS NULL OR operation_end_date <= %(operation_to)s::date)
-  AND (%(recruitment_from)s::date IS NULL OR recruitment_start_date >= %(recruitment_from)s::date)
-  AND (%(recruitment_to)s::date IS NULL OR recruitment_end_date <= %(recruitment_to)s::date)
-  AND (%(display_from)s::date IS NULL OR display_start_date >= %(display_from)s::date)
-  AND (%(display_to)s::date IS NULL OR display_end_date <= %(display_to)s::date);
+FROM challenges c
+WHERE c.is_active = true
+  AND (%(title)s::text IS NULL OR c.title ILIKE '%%' || %(title)s::text || '%%')
+  AND (%(challenge_type)s::text IS NULL OR c.challenge_type = %(challenge_type)s::text)
+  AND (%(verification_method)s::text IS NULL OR c.verification_method = %(verification_method)s::text)
+  AND (%(operation_from)s::date IS NULL OR c.operation_start_date >= %(operation_from)s::date)
+  AND (%(operation_to)s::date IS NULL OR c.operation_end_date <= %(operation_to)s::date)
+  AND (%(recruitment_from)s::date IS NULL OR c.recruitment_start_date >= %(recruitment_from)s::date)
+  AND (%(recruitment_to)s::date IS NULL OR c.recruitment_end_date <= %(recruitment_to)s::date)
+  AND (%(display_from)s::date IS NULL OR c.display_start_date >= %(display_from)s::date)
+  AND (%(display_to)s::date IS NULL OR c.display_end_date <= %(display_to)s::date)
+  AND (%(visibility_scope)s::text[] IS NULL OR c.visibility_scope && %(visibility_scope)s::text[])
+  AND (%(statuses)s::text[] IS NULL OR c.status = ANY(%(statuses)s::text[]));
 
 -- name: get_challenges_list
 SELECT 
@@ -31,6 +36,8 @@ WHERE c.is_active = true
   AND (%(recruitment_to)s::date IS NULL OR c.recruitment_end_date <= %(recruitment_to)s::date)
   AND (%(display_from)s::date IS NULL OR c.display_start_date >= %(display_from)s::date)
   AND (%(display_to)s::date IS NULL OR c.display_end_date <= %(display_to)s::date)
+  AND (%(visibility_scope)s::text[] IS NULL OR c.visibility_scope && %(visibility_scope)s::text[])
+  AND (%(statuses)s::text[] IS NULL OR c.status = ANY(%(statuses)s::text[]))
 ORDER BY c.display_order ASC, c.created_at DESC
 LIMIT %(limit)s::integer OFFSET %(offset)s::integer;
 
@@ -340,4 +347,6 @@ WHERE c.is_active = true
   AND (%(recruitment_to)s::date IS NULL OR c.recruitment_end_date <= %(recruitment_to)s::date)
   AND (%(display_from)s::date IS NULL OR c.display_start_date >= %(display_from)s::date)
   AND (%(display_to)s::date IS NULL OR c.display_end_date <= %(display_to)s::date)
+  AND (%(visibility_scope)s::text[] IS NULL OR c.visibility_scope && %(visibility_scope)s::text[])
+  AND (%(statuses)s::text[] IS NULL OR c.status = ANY(%(statuses)s::text[]))
 ORDER BY c.display_order ASC, c.created_at DESC;
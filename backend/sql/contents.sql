@@ -9,17 +9,40 @@ FROM public.contents c
 {where_clause};
 
 -- query_name: list_contents
--- 컨텐츠 목록 조회
+-- 컨텐츠 목록 조회 (페이지 행에 대해서만 카테고리/첫 번째 미디어 집계)
 SELECT 
     c.id, c.title, c.category_id, cat.category_name,
+    COALESCE(cats.category_ids, '{}') as category_ids,
+    COALESCE(cats.category_names, '{}') as category_names,
+    COALESCE(c.thumbnail_url, media.media_url) as thumbnail_url,
     c.tags, c.visibility_scope,
     c.start_date, c.end_date, c.updated_at, c.updated_by,
     COALESCE(c.has_quote, false) as has_quote
-FROM public.contents c
+FROM (
+    SELECT c.id, c.title, c.category_id, c.thumbnail_url, c.tags, c.visibility_scope,
+        c.start_date, c.end_date, c.created_at, c.updated_at, c.updated_by, c.has_quote
+    FROM public.contents c
+    {where_clause}
+    ORDER BY {order_by}, c.id
+    LIMIT %(limit)s OFFSET %(offset)s
+) c
 LEFT JOIN public.content_categories cat ON c.category_id = cat.id
-{where_clause}
-ORDER BY {order_by}
-LIMIT %(limit)s OFFSET %(offset)s;
+LEFT JOIN LATERAL (
+    SELECT
+        array_agg(mc.id ORDER BY mc.display_order, mc.id) as category_ids,
+        array_agg(mc.category_name ORDER BY mc.display_order, mc.id) as category_names
+    FROM public.content_category_mapping ccm
+    JOIN public.content_categories mc ON ccm.category_id = mc.id
+    WHERE ccm.content_id = c.id
+) cats ON true
+LEFT JOIN LATERAL (
+    SELECT cm.media_url
+    FROM public.content_media cm
+    WHERE cm.content_id = c.id AND cm.media_type IN ('thumbnail', 'image')
+    ORDER BY cm.display_order, cm.created_at
+    LIMIT 1
+) media ON true
+ORDER BY {order_by}, c.id;
 
 -- query_name: get_content_by_id
 -- ID로 컨텐츠 조회
@@ -52,14 +75,28 @@ INSERT INTO public.contents (
 RETURNING id;
 
 -- query_name: insert_content_media
--- 컨텐츠 미디어 등록
+-- 컨텐츠 미디어 일괄 등록 (unnest 단일 INSERT)
 INSERT INTO public.content_media (content_id, media_type, media_url, display_order)
-VALUES (%(content_id)s, 'image', %(media_url)s, %(display_order)s);
+SELECT %(content_id)s, 'image', u.media_url, u.display_order
+FROM unnest(%(media_urls)s::text[], %(display_orders)s::int[]) AS u(media_url, display_order);
+
+-- query_name: select_content_media_for_update
+-- 컨텐츠 미디어 조회 (수정 시 변경분 계산, 행 잠금)
+SELECT id, media_url, display_order FROM public.content_media
+WHERE content_id = %(content_id)s AND media_type = 'image'
+ORDER BY display_order, created_at
+FOR UPDATE;
 
 -- query_name: delete_content_media
--- 컨텐츠 미디어 삭제
-DELETE FROM public.content_media 
-WHERE content_id = %(content_id)s AND media_type = 'image';
+-- 컨텐츠 미디어 삭제 (변경분)
+DELETE FROM public.content_media WHERE id = ANY(%(ids)s::uuid[]);
+
+-- query_name: reorder_content_media
+-- 컨텐츠 미디어 표시 순서 변경
+UPDATE public.content_media AS cm
+SET display_order = u.display_order
+FROM unnest(%(ids)s::uuid[], %(display_orders)s::int[]) AS u(id, display_order)
+WHERE cm.id = u.id;
 
 -- query_name: delete_content
 -- 컨텐츠 삭제
@@ -0,0 +1,135 @@
+"""
+챌린지 통계 증분 집계 (app/services/challenge_analytics_service.py)
+
+DB 없이 워터마크 흐름만 검증: 처음 생성된 워터마크 행(NULL)에서 시작해 원천 행을 모두 처리하는지
+"""
+import asyncio
+import uuid
+from contextlib import asynccontextmanager
+from datetime import datetime, timedelta, timezone
+
+import app.core.logger  # noqa: F401  (app.config.redis 순환 import 방지)
+from app.services import challenge_analytics_service as analytics
+from app.services.challenge_analytics_service import SOURCES, ChallengeAnalyticsService
+
+
+class FakeAppDb:
+    """워터마크 테이블 + 원천 행 (schema.sql 기본값 그대로 생성되는 워터마크)"""
+
+    def __init__(self, rows_per_source: int):
+        base = datetime(2026, 1, 1, tzinfo=timezone.utc)
+        self.rows = {
+            source: [(base + timedelta(minutes=i), uuid.uuid4()) for i in range(rows_per_source)]
+            for source in SOURCES
+        }
+        self.watermarks = {}
+        self.batch_sql = []
+
+    def connection(self):
+        db = self
+
+        class Cursor:
+            async def __aenter__(self):
+                return self
+
+            async def __aexit__(self, *exc):
+                return False
+
+            async def execute(self, sql, params=None):
+                self.result = db.run(sql, params or {})
+
+            async def fetchone(self):
+                return self.result[0] if self.result else None
+
+            async def fetchall(self):
+                return self.result
+
+        class Connection:
+            def cursor(self):
+                return Cursor()
+
+            async def commit(self):
+                pass
+
+            async def rollback(self):
+                pass
+
+        return Connection()
+
+    def run(self, sql, params):
+        sql_map = ChallengeAnalyticsService().sql
+        if sql == sql_map.get("try_lock_refresh"):
+            return [{"locked": True}]
+        if sql == sql_map.get("get_watermark"):
+            row = self.watermarks.setdefault(
+                params["source"],
+                {"source": params["source"], "last_created_at": None, "last_id": None, "refreshed_at": None},
+            )
+            return [dict(row)]
+        if sql == sql_map.get("update_watermark"):
+            row = self.watermarks[params["source"]]
+            if params["last_created_at"] is not None:
+                row["last_created_at"] = params["last_created_at"]
+            if params["last_id"] is not None:
+                row["last_id"] = uuid.UUID(params["last_id"])
+            return []
+        if sql == sql_map.get("get_watermarks"):
+            return [dict(row) for row in self.watermarks.values()]
+        for source, query_name in SOURCES.items():
+            if sql == sql_map.get(query_name):
+                self.batch_sql.append(sql)
+                return [self._batch(source, params)]
+        raise AssertionError(f"unexpected sql: {sql[:60]}")
+
+    def _batch(self, source, params):
+        # %(last_id)s::uuid 캐스트와 같이 잘못된 값은 오류
+        last_at = params["last_created_at"]
+        last_id = uuid.UUID(params["last_id"]) if params["last_id"] is not None else None
+        rows = sorted(self.rows[source])
+        if last_at is not None:
+            rows = [row for row in rows if row > (last_at, last_id)]
+        batch = rows[:params["batch_size"]]
+        last = batch[-1] if batch else (None, None)
+        return {"processed": len(batch), "last_created_at": last[0], "last_id": last[1]}
+
+
+def _run_refresh(db, monkeypatch, **kwargs):
+    @asynccontextmanager
+    async def get_connection(use_app_db=False):
+        yield db.connection()
+
+    monkeypatch.setattr(analytics, "get_connection", get_connection)
+    return asyncio.run(ChallengeAnalyticsService().refresh(**kwargs))
+
+
+def test_refresh_from_freshly_seeded_watermark(monkeypatch):
+    db = FakeAppDb(rows_per_source=7)
+    monkeypatch.setattr(analytics, "REFRESH_BATCH_SIZE", 3)
+
+    result = _run_refresh(db, monkeypatch)
+
+    assert result == {"skipped": False, "processed": {source: 7 for source in SOURCES}}
+    for source in SOURCES:
+        assert db.watermarks[source]["last_created_at"] == max(db.rows[source])[0]
+    # NULL 워터마크는 SQL 에서 "처음부터" 로 처리
+    assert all("%(last_created_at)s::timestamptz IS NULL" in sql for sql in db.batch_sql)
+
+
+def test_refresh_without_source_rows_keeps_null_watermark(monkeypatch):
+    db = FakeAppDb(rows_per_source=0)
+
+    result = _run_refresh(db, monkeypatch)
+
+    assert result["processed"] == {source: 0 for source in SOURCES}
+    assert all(row["last_created_at"] is None for row in db.watermarks.values())
+
+
+def test_as_of_is_none_until_every_source_processed(monkeypatch):
+    db = FakeAppDb(rows_per_source=0)
+    _run_refresh(db, monkeypatch)
+
+    async def as_of():
+        async with db.connection().cursor() as cur:
+            return await ChallengeAnalyticsService()._as_of(cur)
+
+    assert asyncio.run(as_of()) is None
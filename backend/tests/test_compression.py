@@ -0,0 +1,67 @@
+"""
+응답 압축 미들웨어 (app/middleware/compression.py) ASGI 메시지 순서
+"""
+import asyncio
+import gzip
+
+from app.middleware.compression import CompressionMiddleware
+
+
+def _scope(accept_encoding: str = "gzip") -> dict:
+    return {
+        "type": "http",
+        "method": "GET",
+        "path": "/files/report.csv",
+        "headers": [(b"accept-encoding", accept_encoding.encode())],
+        "extensions": {"http.response.pathsend": {}},
+    }
+
+
+def _run(app, scope) -> list:
+    sent = []
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        sent.append(message)
+
+    asyncio.run(CompressionMiddleware(app, minimum_size=10)(scope, receive, send))
+    return sent
+
+
+def test_pathsend_is_sent_after_uncompressed_start():
+    start = {
+        "type": "http.response.start",
+        "status": 200,
+        "headers": [(b"content-type", b"text/csv"), (b"content-length", b"5000")],
+    }
+
+    async def app(scope, receive, send):
+        await send(start)
+        await send({"type": "http.response.pathsend", "path": "/tmp/report.csv"})
+
+    sent = _run(app, _scope())
+
+    assert [message["type"] for message in sent] == ["http.response.start", "http.response.pathsend"]
+    headers = dict(sent[0]["headers"])
+    assert b"content-encoding" not in headers
+    assert headers[b"content-length"] == b"5000"
+
+
+def test_body_response_is_still_compressed():
+    body = b"a" * 2000
+
+    async def app(scope, receive, send):
+        await send({
+            "type": "http.response.start",
+            "status": 200,
+            "headers": [(b"content-type", b"text/plain"), (b"content-length", str(len(body)).encode())],
+        })
+        await send({"type": "http.response.body", "body": body})
+
+    sent = _run(app, _scope())
+
+    assert [message["type"] for message in sent] == ["http.response.start", "http.response.body"]
+    assert dict(sent[0]["headers"])[b"content-encoding"] == b"gzip"
+    assert gzip.decompress(sent[1]["body"]) == body
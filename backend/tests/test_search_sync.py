@@ -0,0 +1,103 @@
+"""
+검색 문서 주기 동기화 (SearchService.sync_changed)
+
+DB 없이 워터마크 흐름만 검증: NULL 워터마크에서 시작해 수정분을 배치로 모두 반영하고,
+다음 회차에는 이후 수정분만 반영하는지
+"""
+import asyncio
+from contextlib import asynccontextmanager
+from datetime import datetime, timedelta, timezone
+
+import app.core.logger  # noqa: F401  (app.config.redis 순환 import 방지)
+from app.services import search_service
+from app.services.search_service import SearchService
+
+
+class FakeAppDb:
+    """inquiries 원본 행 + 워터마크 + 검색 문서"""
+
+    def __init__(self, count: int):
+        self.base = datetime(2026, 1, 1, tzinfo=timezone.utc)
+        self.rows = [self._row(i, self.base + timedelta(minutes=i)) for i in range(count)]
+        self.watermarks = {}
+        self.documents = {}
+
+    @staticmethod
+    def _row(i, changed_at):
+        return {"changed_at": changed_at, "id": f"{i:04d}", "title": f"문의 {i}", "subtitle": None, "body": "본문"}
+
+    def connection(self):
+        db = self
+
+        class Cursor:
+            async def __aenter__(self):
+                return self
+
+            async def __aexit__(self, *exc):
+                return False
+
+            async def execute(self, sql, params=None):
+                self.result = db.run(sql, params or {})
+
+            async def executemany(self, sql, params_seq):
+                for params in params_seq:
+                    db.documents[(params["entity_type"], params["entity_id"])] = params["title"]
+
+            async def fetchone(self):
+                return self.result[0]
+
+            async def fetchall(self):
+                return self.result
+
+        class Connection:
+            def cursor(self):
+                return Cursor()
+
+            async def commit(self):
+                pass
+
+        return Connection()
+
+    def run(self, sql, params):
+        if "admin_search_sync_watermarks" in sql and sql.lstrip().startswith("INSERT"):
+            row = self.watermarks.setdefault(params["entity_type"], {"last_changed_at": None, "last_id": None})
+            return [dict(row)]
+        if "admin_search_sync_watermarks" in sql:
+            self.watermarks[params["entity_type"]] = {
+                "last_changed_at": params["last_changed_at"], "last_id": params["last_id"],
+            }
+            return []
+        assert "%(last_changed_at)s::timestamptz IS NULL" in sql
+        rows = sorted(self.rows, key=lambda row: (row["changed_at"], row["id"]))
+        if params["last_changed_at"] is not None:
+            last = (params["last_changed_at"], params["last_id"])
+            rows = [row for row in rows if (row["changed_at"], row["id"]) > last]
+        return rows[:params["batch_size"]]
+
+
+def _sync(db, monkeypatch):
+    @asynccontextmanager
+    async def get_async_conn():
+        yield db.connection()
+
+    monkeypatch.setattr(search_service.app_db_manager, "get_async_conn", get_async_conn)
+    return asyncio.run(SearchService.sync_changed("inquiry"))
+
+
+def test_sync_types_cover_rows_written_outside_admin_api():
+    assert set(SearchService.sync_types()) == {"member", "inquiry"}
+
+
+def test_sync_changed_from_null_watermark_then_only_new_changes(monkeypatch):
+    db = FakeAppDb(count=7)
+    monkeypatch.setattr(search_service, "SYNC_BATCH_SIZE", 3)
+
+    assert _sync(db, monkeypatch) == 7
+    assert len(db.documents) == 7
+    assert db.watermarks["inquiry"]["last_id"] == "0006"
+
+    # 수정된 행만 다음 회차에 반영
+    db.rows[2] = dict(db.rows[2], changed_at=db.base + timedelta(hours=1), title="수정된 문의")
+    assert _sync(db, monkeypatch) == 1
+    assert db.documents[("inquiry", "0002")] == "수정된 문의"
+    assert _sync(db, monkeypatch) == 0
@@ -739,3 +739,360 @@ COMMENT ON COLUMN public.coupon_master.discount_type IS '할인 타입 (정액/
 -- 어드민에서는 app_db_manager를 통해 접근합니다.
 -- 테이블 정의: oni_care/backend/db/schema.sql 참조
 
+
+-- ============================================
+-- 28. 업로드 오브젝트 테이블 (콘텐츠 주소 기반 저장소)
+-- ============================================
+-- UPLOAD_STORAGE_MODE=cas 일 때 SHA-256 오브젝트의 참조 카운트 관리
+CREATE TABLE IF NOT EXISTS public.upload_objects (
+  sha256 CHAR(64) PRIMARY KEY,
+  file_ext VARCHAR(10) NOT NULL,
+  file_size BIGINT NOT NULL,
+  mime_type VARCHAR(100),
+  ref_count INTEGER NOT NULL DEFAULT 1 CHECK (ref_count >= 0),
+  created_at TIMESTAMP WITH TIME ZONE DEFAULT NOW(),
+  last_referenced_at TIMESTAMP WITH TIME ZONE DEFAULT NOW()
+);
+
+CREATE INDEX IF NOT EXISTS idx_upload_objects_ref_count ON public.upload_objects(ref_count) WHERE ref_count = 0;
+
+COMMENT ON TABLE public.upload_objects IS '업로드 오브젝트 (콘텐츠 주소 기반 저장소)';
+COMMENT ON COLUMN public.upload_objects.sha256 IS '파일 내용 SHA-256 해시 (hex)';
+COMMENT ON COLUMN public.upload_objects.file_ext IS '파일 확장자';
+COMMENT ON COLUMN public.upload_objects.file_size IS '파일 크기 (bytes)';
+COMMENT ON COLUMN public.upload_objects.mime_type IS 'MIME 타입';
+COMMENT ON COLUMN public.upload_objects.ref_count IS '참조 카운트';
+COMMENT ON COLUMN public.upload_objects.last_referenced_at IS '마지막 참조 변경 시간';
+
+-- ============================================
+-- 29. 텍스트 검색 pg_trgm 인덱스
+-- ============================================
+-- 목록 화면의 ILIKE '%검색어%' 필터가 순차 스캔 대신 GIN 인덱스를 사용하도록 함.
+-- (app/utils/search_filter.py: 3자 미만 검색어는 접두사 검색으로 대체)
+-- 운영 DB 적용 시에는 CREATE INDEX CONCURRENTLY 로 개별 실행 권장.
+
+-- [Admin DB] 접속/개인정보 로그
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+CREATE INDEX IF NOT EXISTS idx_admin_access_logs_user_id_trgm ON public.admin_access_logs USING GIN (user_id gin_trgm_ops);
+CREATE INDEX IF NOT EXISTS idx_admin_access_logs_user_name_trgm ON public.admin_access_logs USING GIN (user_name gin_trgm_ops);
+CREATE INDEX IF NOT EXISTS idx_admin_access_logs_device_type_trgm ON public.admin_access_logs USING GIN (device_type gin_trgm_ops);
+
+CREATE INDEX IF NOT EXISTS idx_personal_info_logs_user_id_trgm ON public.personal_info_access_logs USING GIN (user_id gin_trgm_ops);
+CREATE INDEX IF NOT EXISTS idx_personal_info_logs_user_name_trgm ON public.personal_info_access_logs USING GIN (user_name gin_trgm_ops);
+CREATE INDEX IF NOT EXISTS idx_personal_info_logs_business_code_trgm ON public.personal_info_access_logs USING GIN (business_code gin_trgm_ops);
+CREATE INDEX IF NOT EXISTS idx_personal_info_logs_survey_id_trgm ON public.personal_info_access_logs USING GIN (survey_id gin_trgm_ops);
+CREATE INDEX IF NOT EXISTS idx_personal_info_logs_device_type_trgm ON public.personal_info_access_logs USING GIN (device_type gin_trgm_ops);
+
+-- [App DB] 회원 / 컨텐츠 / 영양제 / 기능성 성분 / 1:1 문의
+-- ⚠️ 아래 인덱스는 oni_care(앱) DB에서 실행합니다.
+-- CREATE EXTENSION IF NOT EXISTS pg_trgm;
+-- CREATE INDEX IF NOT EXISTS idx_users_name_trgm ON public.users USING GIN (name gin_trgm_ops);
+-- CREATE INDEX IF NOT EXISTS idx_users_email_trgm ON public.users USING GIN (email gin_trgm_ops);
+-- CREATE INDEX IF NOT EXISTS idx_users_phone_trgm ON public.users USING GIN (phone gin_trgm_ops);
+-- CREATE INDEX IF NOT EXISTS idx_users_business_code_trgm ON public.users USING GIN (business_code gin_trgm_ops);
+-- CREATE INDEX IF NOT EXISTS idx_contents_title_trgm ON public.contents USING GIN (title gin_trgm_ops);
+-- CREATE INDEX IF NOT EXISTS idx_supplement_products_product_name_trgm ON public.supplement_products_master USING GIN (product_name gin_trgm_ops);
+-- CREATE INDEX IF NOT EXISTS idx_supplement_products_manufacturer_trgm ON public.supplement_products_master USING GIN (manufacturer gin_trgm_ops);
+-- CREATE INDEX IF NOT EXISTS idx_supplement_products_report_number_trgm ON public.supplement_products_master USING GIN (product_report_number gin_trgm_ops);
+-- CREATE INDEX IF NOT EXISTS idx_functional_ingredients_code_trgm ON public.functional_ingredients USING GIN (ingredient_code gin_trgm_ops);
+-- CREATE INDEX IF NOT EXISTS idx_functional_ingredients_internal_name_trgm ON public.functional_ingredients USING GIN (internal_name gin_trgm_ops);
+-- CREATE INDEX IF NOT EXISTS idx_functional_ingredients_external_name_trgm ON public.functional_ingredients USING GIN (external_name gin_trgm_ops);
+-- CREATE INDEX IF NOT EXISTS idx_functional_ingredients_indicator_trgm ON public.functional_ingredients USING GIN (indicator_component gin_trgm_ops);
+-- CREATE INDEX IF NOT EXISTS idx_inquiries_content_trgm ON public.inquiries USING GIN (content gin_trgm_ops);
+
+-- ============================================
+-- 30. 통합 검색 문서 테이블 (App DB)
+-- ============================================
+-- 어드민 통합 검색(/api/v1/admin/search) 색인.
+-- search_vector 는 애플리케이션에서 한글 2-gram 토큰으로 분해한 뒤 'simple' 구성으로 저장.
+-- (app/services/search_service.py, 초기 적재: python -m scripts.rebuild_search_index)
+-- ⚠️ 아래 DDL은 oni_care(앱) DB에서 실행합니다.
+-- CREATE TABLE IF NOT EXISTS public.admin_search_documents (
+--   entity_type VARCHAR(30) NOT NULL,
+--   entity_id TEXT NOT NULL,
+--   title TEXT,
+--   subtitle TEXT,
+--   search_vector TSVECTOR NOT NULL,
+--   updated_at TIMESTAMP WITH TIME ZONE DEFAULT NOW(),
+--   PRIMARY KEY (entity_type, entity_id)
+-- );
+-- CREATE INDEX IF NOT EXISTS idx_admin_search_documents_vector ON public.admin_search_documents USING GIN (search_vector);
+-- CREATE INDEX IF NOT EXISTS idx_admin_search_documents_type_updated ON public.admin_search_documents(entity_type, updated_at);
+-- 회원/문의는 앱 서비스가 직접 쓰므로 updated_at 워터마크로 주기 동기화 (app/services/search_sync_scheduler.py)
+-- CREATE TABLE IF NOT EXISTS public.admin_search_sync_watermarks (
+--   entity_type VARCHAR(30) PRIMARY KEY,
+--   last_changed_at TIMESTAMPTZ,  -- NULL = 처음부터
+--   last_id TEXT,
+--   synced_at TIMESTAMPTZ
+-- );
+-- CREATE INDEX IF NOT EXISTS idx_users_updated_id ON public.users(updated_at, (id::text));
+-- CREATE INDEX IF NOT EXISTS idx_inquiries_updated_id ON public.inquiries(updated_at, (id::text));
+-- COMMENT ON TABLE public.admin_search_documents IS '어드민 통합 검색 문서';
+-- COMMENT ON COLUMN public.admin_search_documents.entity_type IS '유형 (member, content, supplement, functional_ingredient, notice, inquiry, challenge)';
+-- COMMENT ON COLUMN public.admin_search_documents.entity_id IS '원본 행 ID (text)';
+-- COMMENT ON COLUMN public.admin_search_documents.search_vector IS '검색 벡터 (제목 A / 부제 B / 본문 C 가중치)';
+
+-- ============================================
+-- 31. 영양제/기능성 성분 검색 문서 테이블 (App DB)
+-- ============================================
+-- 영양제 목록의 성분명/기능성 필터, 기능성 성분 목록의 기능성 내용/코드 필터를
+-- 매핑 테이블 중첩 EXISTS 대신 비정규화 문서 + 트라이그램 인덱스 조회로 처리.
+-- 매핑 저장/삭제 API가 같은 트랜잭션에서 갱신 (app/services/supplement_search_index.py)
+-- 초기 적재: python -m scripts.rebuild_search_index --types supplement,functional_ingredient
+-- ⚠️ 아래 DDL은 oni_care(앱) DB에서 실행합니다.
+-- CREATE EXTENSION IF NOT EXISTS pg_trgm;
+-- CREATE TABLE IF NOT EXISTS public.supplement_search_documents (
+--   product_id UUID PRIMARY KEY REFERENCES public.supplement_products_master(id) ON DELETE CASCADE,
+--   ingredient_names TEXT NOT NULL DEFAULT '',
+--   functionality_texts TEXT NOT NULL DEFAULT '',
+--   updated_at TIMESTAMP WITH TIME ZONE DEFAULT NOW()
+-- );
+-- CREATE INDEX IF NOT EXISTS idx_supplement_search_docs_ingredients_trgm ON public.supplement_search_documents USING GIN (ingredient_names gin_trgm_ops);
+-- CREATE INDEX IF NOT EXISTS idx_supplement_search_docs_functionalities_trgm ON public.supplement_search_documents USING GIN (functionality_texts gin_trgm_ops);
+-- COMMENT ON TABLE public.supplement_search_documents IS '영양제 성분/기능성 검색 문서';
+-- COMMENT ON COLUMN public.supplement_search_documents.ingredient_names IS '성분명 (내부명 외부명, 줄바꿈 구분)';
+-- COMMENT ON COLUMN public.supplement_search_documents.functionality_texts IS '성분을 통해 연결된 기능성 내용 (줄바꿈 구분)';
+--
+-- CREATE TABLE IF NOT EXISTS public.functional_ingredient_search_documents (
+--   ingredient_id INTEGER PRIMARY KEY REFERENCES public.functional_ingredients(id) ON DELETE CASCADE,
+--   functionality_texts TEXT NOT NULL DEFAULT '',
+--   functionality_codes TEXT NOT NULL DEFAULT '',
+--   updated_at TIMESTAMP WITH TIME ZONE DEFAULT NOW()
+-- );
+-- CREATE INDEX IF NOT EXISTS idx_ingredient_search_docs_functionalities_trgm ON public.functional_ingredient_search_documents USING GIN (functionality_texts gin_trgm_ops);
+-- CREATE INDEX IF NOT EXISTS idx_ingredient_search_docs_codes_trgm ON public.functional_ingredient_search_documents USING GIN (functionality_codes gin_trgm_ops);
+-- COMMENT ON TABLE public.functional_ingredient_search_documents IS '기능성 성분 기능성 검색 문서';
+
+-- ============================================
+-- 32. 매핑 테이블 유니크 인덱스 (App DB)
+-- ============================================
+-- 매핑 일괄 저장(app/services/mapping_service.py)의 INSERT ... ON CONFLICT DO NOTHING 이
+-- 동시 요청에서도 중복 행을 만들지 않도록 (소유자, 대상) 유니크 인덱스 추가.
+-- 기존 중복 행이 있으면 생성이 실패하므로 먼저 정리 후 실행.
+-- ⚠️ 아래 인덱스는 oni_care(앱) DB에서 실행합니다.
+-- CREATE UNIQUE INDEX IF NOT EXISTS uq_product_ingredient_mapping ON public.product_ingredient_mapping(product_id, ingredient_id);
+-- CREATE UNIQUE INDEX IF NOT EXISTS uq_ingredient_functionality_mapping ON public.ingredient_functionality_mapping(ingredient_id, functionality_id);
+-- CREATE UNIQUE INDEX IF NOT EXISTS uq_supplement_corner_products ON public.supplement_corner_products(corner_id, product_id);
+
+-- ============================================
+-- 33. 컨텐츠 목록 카테고리/썸네일 집계 인덱스 (App DB)
+-- ============================================
+-- 컨텐츠 목록(app/services/content_service.py)이 매핑 테이블로 카테고리 필터링하고,
+-- 페이지 행마다 LATERAL 로 전체 카테고리와 첫 번째 미디어를 함께 조회한다.
+--   - (category_id, content_id): 카테고리 필터 IN (...) 을 인덱스만으로 처리
+--   - (content_id, display_order): 컨텐츠별 첫 번째 미디어를 정렬 없이 1건 조회
+-- 카테고리 매핑 도입 전 데이터는 대표 카테고리(contents.category_id)로 매핑을 채운다.
+-- ⚠️ 아래 인덱스/백필은 oni_care(앱) DB에서 실행합니다.
+-- CREATE INDEX IF NOT EXISTS idx_content_category_mapping_category_content ON public.content_category_mapping(category_id, content_id);
+-- CREATE INDEX IF NOT EXISTS idx_content_media_content_order ON public.content_media(content_id, display_order);
+-- INSERT INTO public.content_category_mapping (content_id, category_id)
+-- SELECT c.id, c.category_id FROM public.contents c
+-- WHERE c.category_id IS NOT NULL
+-- ON CONFLICT (content_id, category_id) DO NOTHING;
+
+-- ============================================
+-- 34. 챌린지 목록 필터 인덱스 (App DB)
+-- ============================================
+-- 챌린지 목록(sql/challenges.sql)의 공개범위/상태 필터를 SQL에서 처리하기 위한 인덱스.
+--   - 공개범위: visibility_scope && 배열 겹침 → GIN
+--   - 상태: 운영 종료일/운영 시작일/모집 시작일 범위 조건 → 날짜별 B-tree
+--   - 정렬: display_order, created_at DESC (LIMIT 페이지 조회)
+-- 삭제(is_active = false)된 챌린지는 목록 대상이 아니므로 부분 인덱스로 생성한다.
+-- ⚠️ 아래 인덱스는 oni_care(앱) DB에서 실행합니다.
+-- CREATE INDEX IF NOT EXISTS idx_challenges_active_visibility_scope ON public.challenges USING GIN(visibility_scope) WHERE is_active = true;
+-- CREATE INDEX IF NOT EXISTS idx_challenges_active_operation_end ON public.challenges(operation_end_date) WHERE is_active = true;
+-- CREATE INDEX IF NOT EXISTS idx_challenges_active_operation_start ON public.challenges(operation_start_date) WHERE is_active = true;
+-- CREATE INDEX IF NOT EXISTS idx_challenges_active_recruitment_start ON public.challenges(recruitment_start_date) WHERE is_active = true;
+-- CREATE INDEX IF NOT EXISTS idx_challenges_active_display_order ON public.challenges(display_order, created_at DESC) WHERE is_active = true;
+
+-- ============================================
+-- 35. 챌린지/공지사항 상태 컬럼 (App DB)
+-- ============================================
+-- 기간/활성 여부로 계산하던 상태를 status 컬럼에 저장한다. (app/services/status_service.py)
+--   - 생성/수정 시 같은 트랜잭션에서 해당 행 갱신
+--   - 기간 경계 도달 시 상태 스케줄러(app/services/status_scheduler.py)가 전체 갱신
+--   - 목록 상태 필터/정렬은 status 등호 조건으로 인덱스 사용
+-- 챌린지: draft / recruiting / in_progress / completed / suspended
+-- 공지사항: scheduled / active / ended
+-- 컬럼 추가 후 첫 스케줄러 실행(리더 획득 시 즉시 1회)에서 기존 행 상태가 채워진다.
+-- ⚠️ 아래 DDL은 oni_care(앱) DB에서 실행합니다.
+-- ALTER TABLE public.challenges ADD COLUMN IF NOT EXISTS status VARCHAR(20) NOT NULL DEFAULT 'draft';
+-- ALTER TABLE public.notices ADD COLUMN IF NOT EXISTS status VARCHAR(20) NOT NULL DEFAULT 'active';
+-- CREATE INDEX IF NOT EXISTS idx_challenges_active_status ON public.challenges(status, display_order, created_at DESC) WHERE is_active = true;
+-- CREATE INDEX IF NOT EXISTS idx_notices_status ON public.notices(status, created_at DESC);
+-- COMMENT ON COLUMN public.challenges.status IS '상태 (draft, recruiting, in_progress, completed, suspended) - 상태 스케줄러 갱신';
+-- COMMENT ON COLUMN public.notices.status IS '상태 (scheduled, active, ended) - 상태 스케줄러 갱신';
+
+-- ============================================
+-- 36. 챌린지 통계 집계 테이블 (App DB)
+-- ============================================
+-- 챌린지 참여/인증 통계(app/services/challenge_analytics_service.py)의 증분 집계 테이블.
+--   - 원천(challenge_participants, challenge_verifications)을 워터마크 (created_at, id) 이후만 배치 처리
+--   - 집계 반영 + 워터마크 갱신은 한 트랜잭션 (advisory lock 으로 동시 실행 차단)
+--   - 원천 테이블에는 (created_at, id) 인덱스가 필요하다. (워터마크 이후 범위 스캔)
+-- 기존 데이터는 첫 새로고침부터 배치 단위로 채워진다. (워터마크 기본값 = 처음부터)
+-- ⚠️ 아래 DDL은 oni_care(앱) DB에서 실행합니다.
+-- CREATE TABLE IF NOT EXISTS public.challenge_daily_stats (
+--     challenge_id UUID NOT NULL,
+--     stat_date DATE NOT NULL,
+--     joined_count INTEGER NOT NULL DEFAULT 0,
+--     verification_count INTEGER NOT NULL DEFAULT 0,
+--     verified_members INTEGER NOT NULL DEFAULT 0,
+--     updated_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+--     PRIMARY KEY (challenge_id, stat_date)
+-- );
+-- CREATE TABLE IF NOT EXISTS public.challenge_member_daily_stats (
+--     challenge_id UUID NOT NULL,
+--     member_id UUID NOT NULL,
+--     stat_date DATE NOT NULL,
+--     verification_count INTEGER NOT NULL DEFAULT 0,
+--     PRIMARY KEY (challenge_id, member_id, stat_date)
+-- );
+-- CREATE TABLE IF NOT EXISTS public.challenge_member_stats (
+--     challenge_id UUID NOT NULL,
+--     member_id UUID NOT NULL,
+--     verified_days INTEGER NOT NULL DEFAULT 0,
+--     verification_count INTEGER NOT NULL DEFAULT 0,
+--     last_verified_at TIMESTAMPTZ,
+--     PRIMARY KEY (challenge_id, member_id)
+-- );
+-- CREATE TABLE IF NOT EXISTS public.challenge_analytics_watermarks (
+--     source VARCHAR(50) PRIMARY KEY,
+--     last_created_at TIMESTAMPTZ,  -- NULL = 아직 처리한 행 없음 (처음부터 집계)
+--     last_id UUID,
+--     refreshed_at TIMESTAMPTZ
+-- );
+-- 기존 '-infinity' 워터마크 변환 (psycopg 가 datetime 으로 읽을 수 없는 값)
+-- ALTER TABLE public.challenge_analytics_watermarks ALTER COLUMN last_created_at DROP NOT NULL, ALTER COLUMN last_created_at DROP DEFAULT;
+-- ALTER TABLE public.challenge_analytics_watermarks ALTER COLUMN last_id DROP NOT NULL, ALTER COLUMN last_id DROP DEFAULT;
+-- UPDATE public.challenge_analytics_watermarks SET last_created_at = NULL, last_id = NULL WHERE last_created_at = '-infinity';
+-- CREATE INDEX IF NOT EXISTS idx_challenge_member_stats_days ON public.challenge_member_stats(challenge_id, verified_days);
+-- CREATE INDEX IF NOT EXISTS idx_challenge_participants_created_id ON public.challenge_participants(created_at, id);
+-- CREATE INDEX IF NOT EXISTS idx_challenge_verifications_created_id ON public.challenge_verifications(created_at, id);
+
+-- ============================================
+-- 37. PUSH 발송 이력 테이블
+-- ============================================
+-- PUSH 발송 엔진(app/services/push_dispatch_service.py)의 발송 건별 진행 상황.
+-- 발송 중 PROGRESS_FLUSH_INTERVAL 마다 카운터/updated_at 갱신, 종료 시 status/finished_at 기록.
+-- 캠페인당 running 발송은 1건 (부분 유니크 인덱스, 갱신이 멈춘 running 건은 다음 발송 시 failed 처리)
+-- 수신자 쿼리는 oni_care(앱) DB users 의 push_agreed / push_token 컬럼을 사용한다.
+CREATE TABLE IF NOT EXISTS public.push_dispatches (
+  id UUID DEFAULT gen_random_uuid() PRIMARY KEY,
+  push_id UUID NOT NULL,
+  trigger_type VARCHAR(20) NOT NULL DEFAULT 'manual',
+  status VARCHAR(20) NOT NULL DEFAULT 'running',
+  provider VARCHAR(50) NOT NULL,
+  total_count INTEGER NOT NULL DEFAULT 0,
+  processed_count INTEGER NOT NULL DEFAULT 0,
+  sent_count INTEGER NOT NULL DEFAULT 0,
+  failed_count INTEGER NOT NULL DEFAULT 0,
+  invalid_count INTEGER NOT NULL DEFAULT 0,
+  skipped_count INTEGER NOT NULL DEFAULT 0,
+  error_message TEXT,
+  requested_by VARCHAR(100),
+  started_at TIMESTAMP WITH TIME ZONE DEFAULT NOW(),
+  finished_at TIMESTAMP WITH TIME ZONE,
+  updated_at TIMESTAMP WITH TIME ZONE DEFAULT NOW()
+);
+
+CREATE UNIQUE INDEX IF NOT EXISTS uq_push_dispatches_running ON public.push_dispatches(push_id) WHERE status = 'running';
+CREATE INDEX IF NOT EXISTS idx_push_dispatches_push_started ON public.push_dispatches(push_id, started_at DESC);
+
+COMMENT ON TABLE public.push_dispatches IS 'PUSH 발송 이력';
+COMMENT ON COLUMN public.push_dispatches.push_id IS 'PUSH 알림 ID (App DB push_notifications.id)';
+COMMENT ON COLUMN public.push_dispatches.trigger_type IS '발송 계기 (manual, condition, schedule)';
+COMMENT ON COLUMN public.push_dispatches.status IS '상태 (running, completed, failed, cancelled)';
+COMMENT ON COLUMN public.push_dispatches.total_count IS '발송 대상 수';
+COMMENT ON COLUMN public.push_dispatches.processed_count IS '처리 수';
+COMMENT ON COLUMN public.push_dispatches.sent_count IS '발송 성공 수';
+COMMENT ON COLUMN public.push_dispatches.failed_count IS '재시도 후 실패 수';
+COMMENT ON COLUMN public.push_dispatches.invalid_count IS '무효 토큰 수';
+COMMENT ON COLUMN public.push_dispatches.skipped_count IS '제외 수 (조건 PUSH 당일 중복 등)';
+
+-- ============================================
+-- 38. 조건 달성 PUSH 평가 인덱스 (App DB)
+-- ============================================
+-- 조건 PUSH(app/services/push_condition_service.py)는 세부유형마다 users 전체에 대한
+-- 단일 집계 쿼리(anti-join / 일자 범위 GROUP BY)로 수신자를 계산한다.
+-- 일자 조건 컬럼 선두 인덱스로 당일 행만 읽도록 한다.
+-- ⚠️ 아래 인덱스는 oni_care(앱) DB에서 실행합니다.
+-- CREATE INDEX IF NOT EXISTS idx_users_push_audience ON public.users(business_code) WHERE status = 'active' AND push_agreed = true AND push_token IS NOT NULL;
+-- CREATE INDEX IF NOT EXISTS idx_meals_date_user ON public.meals(meal_date, user_id);
+-- CREATE INDEX IF NOT EXISTS idx_supplement_logs_created_user ON public.supplement_logs(created_at, user_id);
+-- CREATE INDEX IF NOT EXISTS idx_daily_steps_date_user ON public.daily_steps(step_date, user_id);
+-- CREATE INDEX IF NOT EXISTS idx_nutrition_diagnoses_user ON public.nutrition_diagnoses(user_id);
+
+-- ============================================
+-- 39. 접속/개인정보 접근 로그 월별 파티션
+-- ============================================
+-- admin_access_logs / personal_info_access_logs 를 login_at 월별 RANGE 파티션으로 전환한다.
+--   - 파티션 이름: {테이블}_pYYYYMM, 범위 밖 행은 {테이블}_default
+--   - 이후 파티션 생성 / 보관 기간(LOG_RETENTION_MONTHS) 경과 파티션 내보내기·삭제는
+--     app/services/log_partition_service.py (스케줄러 또는 scripts/manage_log_partitions.py)
+--   - 목록 조회는 login_at 범위 조건으로 해당 월 파티션만 읽는다. (파티션 프루닝)
+--   - login_at: BRIN (넓은 기간 COUNT), B-tree (login_at DESC, id DESC) (최신순 페이지 / 키셋 페이지)
+-- 파티션 테이블의 PK 는 파티션 키를 포함해야 하므로 (id, login_at) 로 바뀌고 login_at 은 NOT NULL 이 된다.
+-- 기존 테이블은 {테이블}_legacy 로 이름을 바꿔 데이터를 옮긴 뒤 남겨 둔다. 건수 확인 후 직접 삭제한다.
+--   DROP TABLE public.admin_access_logs_legacy;
+--   DROP TABLE public.personal_info_access_logs_legacy;
+-- 이미 파티션 테이블이면 건너뛴다. 전환 중에는 로그 테이블 쓰기가 잠기므로 점검 시간에 실행한다.
+DO $$
+DECLARE
+  t TEXT;
+  idx TEXT;
+  m DATE;
+  last_month DATE := (date_trunc('month', NOW()) + interval '3 months')::date;
+BEGIN
+  FOREACH t IN ARRAY ARRAY['admin_access_logs', 'personal_info_access_logs'] LOOP
+    IF EXISTS (
+      SELECT 1 FROM pg_partitioned_table pt
+      WHERE pt.partrelid = format('public.%I', t)::regclass
+    ) THEN
+      CONTINUE;
+    END IF;
+
+    EXECUTE format('ALTER TABLE public.%I RENAME TO %I', t, t || '_legacy');
+    EXECUTE format('ALTER TABLE public.%I DROP CONSTRAINT IF EXISTS %I', t || '_legacy', t || '_pkey');
+    FOR idx IN SELECT indexname FROM pg_indexes WHERE schemaname = 'public' AND tablename = t || '_legacy' LOOP
+      EXECUTE format('DROP INDEX public.%I', idx);
+    END LOOP;
+    EXECUTE format('UPDATE public.%I SET login_at = COALESCE(created_at, NOW()) WHERE login_at IS NULL', t || '_legacy');
+
+    EXECUTE format(
+      'CREATE TABLE public.%I (LIKE public.%I INCLUDING DEFAULTS INCLUDING COMMENTS) PARTITION BY RANGE (login_at)',
+      t, t || '_legacy'
+    );
+    EXECUTE format('ALTER TABLE public.%I ALTER COLUMN login_at SET NOT NULL, ADD PRIMARY KEY (id, login_at)', t);
+    EXECUTE format('CREATE TABLE public.%I PARTITION OF public.%I DEFAULT', t || '_default', t);
+
+    EXECUTE format('SELECT date_trunc(''month'', COALESCE(MIN(login_at), NOW()))::date FROM public.%I', t || '_legacy') INTO m;
+    WHILE m <= last_month LOOP
+      EXECUTE format(
+        'CREATE TABLE public.%I PARTITION OF public.%I FOR VALUES FROM (%L) TO (%L)',
+        t || '_p' || to_char(m, 'YYYYMM'), t, m, (m + interval '1 month')::date
+      );
+      m := (m + interval '1 month')::date;
+    END LOOP;
+
+    EXECUTE format('INSERT INTO public.%I SELECT * FROM public.%I', t, t || '_legacy');
+  END LOOP;
+END $$;
+
+CREATE INDEX IF NOT EXISTS idx_admin_access_logs_login_at_brin ON public.admin_access_logs USING BRIN (login_at) WITH (pages_per_range = 32);
+CREATE INDEX IF NOT EXISTS idx_admin_access_logs_login_at_id ON public.admin_access_logs(login_at DESC, id DESC);
+CREATE INDEX IF NOT EXISTS idx_admin_access_logs_user_id ON public.admin_access_logs(user_id);
+CREATE INDEX IF NOT EXISTS idx_admin_access_logs_user_id_trgm ON public.admin_access_logs USING GIN (user_id gin_trgm_ops);
+CREATE INDEX IF NOT EXISTS idx_admin_access_logs_user_name_trgm ON public.admin_access_logs USING GIN (user_name gin_trgm_ops);
+CREATE INDEX IF NOT EXISTS idx_admin_access_logs_device_type_trgm ON public.admin_access_logs USING GIN (device_type gin_trgm_ops);
+
+CREATE INDEX IF NOT EXISTS idx_personal_info_logs_login_at_brin ON public.personal_info_access_logs USING BRIN (login_at) WITH (pages_per_range = 32);
+CREATE INDEX IF NOT EXISTS idx_personal_info_logs_login_at_id ON public.personal_info_access_logs(login_at DESC, id DESC);
+CREATE INDEX IF NOT EXISTS idx_personal_info_logs_user_id ON public.personal_info_access_logs(user_id);
+CREATE INDEX IF NOT EXISTS idx_personal_info_logs_business_code ON public.personal_info_access_logs(business_code);
+CREATE INDEX IF NOT EXISTS idx_personal_info_logs_user_id_trgm ON public.personal_info_access_logs USING GIN (user_id gin_trgm_ops);
+CREATE INDEX IF NOT EXISTS idx_personal_info_logs_user_name_trgm ON public.personal_info_access_logs USING GIN (user_name gin_trgm_ops);
+CREATE INDEX IF NOT EXISTS idx_personal_info_logs_business_code_trgm ON public.personal_info_access_logs USING GIN (business_code gin_trgm_ops);
+CREATE INDEX IF NOT EXISTS idx_personal_info_logs_survey_id_trgm ON public.personal_info_access_logs USING GIN (survey_id gin_trgm_ops);
+CREATE INDEX IF NOT EXISTS idx_personal_info_logs_device_type_trgm ON public.personal_info_access_logs USING GIN (device_type gin_trgm_ops);